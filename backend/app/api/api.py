@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.endpoints import auth, bookmarks, bookmarks_public, logs
+from app.api.endpoints import auth, bookmarks, bookmarks_public, logs, resummarize, summary_jobs
 
 api_router = APIRouter()
 
@@ -8,4 +8,7 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(bookmarks_public.router, prefix="/public/bookmarks")
 # 인증용 북마크 API
 api_router.include_router(bookmarks.router, prefix="/bookmarks", tags=["bookmarks"])
-api_router.include_router(logs.router, prefix="/logs", tags=["logs"]) 
\ No newline at end of file
+api_router.include_router(logs.router, prefix="/logs", tags=["logs"])
+api_router.include_router(summary_jobs.router, prefix="/summary-jobs", tags=["summary-jobs"])
+# 관리자 API (ADMIN_USERNAME 계정만)
+api_router.include_router(resummarize.router, prefix="/admin/resummarize", tags=["admin"])
@@ -1,19 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Any, Optional
+import json
 import logging
 from app.core.security import get_current_user
 from app.db.session import get_db
 from app.models.user import User
 from app.models.bookmark import Bookmark
-from app.schemas.bookmark import BookmarkCreate, BookmarkUpdate, BookmarkResponse, BookmarkListResponse, ShareRequest, ShareResponse
+from app.schemas.bookmark import (
+    BookmarkCreate, BookmarkUpdate, BookmarkResponse, BookmarkListResponse, ShareRequest, ShareResponse,
+    SemanticSearchItem, SemanticSearchResponse, RelatedBookmarksResponse,
+)
 from uuid import UUID
 from datetime import datetime
 from app.models.log import Log
 from app.crud.crud_bookmark import bookmark as crud_bookmark
 from app.services.scraping_service import ScrapingService
-from app.tasks.summary_tasks import submit_summary_task
+from app.tasks.summary_tasks import submit_summary_task, SUMMARY_PLACEHOLDER
+from app.tasks.title_translation import submit_title_translation
+from app.tasks.summary_queue import cancel_bookmark_jobs
+from app.tasks.summary_stream import iter_summary_events
 from app.services.share_service import share_to_slack, share_to_notion
+from app.services.summary_translation import SummaryTranslationError, summary_translator
+from app.services.semantic_index import semantic_index
+from app.tasks.embedding_tasks import submit_embedding
+from app.utils.embeddings import embed_query
 from app.core.config import settings
 
 router = APIRouter()
@@ -45,9 +57,10 @@ async def create_bookmark(
     """
     try:
         bookmark_data = bookmark.model_dump(exclude_unset=True)
-        summary_model = bookmark_data.pop("summary_model", None) or settings.OLLAMA_MODEL
+        # 모델 미선택(또는 목록에 없는 모델)이면 None → 본문 길이/언어/큐 적체로 자동 선택
+        summary_model = (bookmark_data.pop("summary_model", None) or "").strip() or None
         if summary_model not in settings.OLLAMA_SUMMARY_MODEL_LIST:
-            summary_model = settings.OLLAMA_MODEL
+            summary_model = None
 
         url_str = (bookmark.url and str(bookmark.url).strip()) or ""
         content_input = (bookmark.content or "").strip()
@@ -62,8 +75,12 @@ async def create_bookmark(
                         status_code=status.HTTP_409_CONFLICT,
                         detail="이미 동일한 URL이 저장되어 있습니다.",
                     )
-            scraped_data = scraping_service.scrape(url_str)
-            title = (bookmark_data.get("title") or "").strip() or scraped_data["title"]
+            # 영어 제목은 원문으로 바로 저장하고 번역은 생성 경로 밖에서 처리
+            # (SUMMARY_TRANSLATE_TITLE이면 요약 호출에서 함께, 아니면 제목 번역 보강 작업)
+            scraped_data = scraping_service.scrape(url_str, translate_title=False)
+            user_title = (bookmark_data.get("title") or "").strip()
+            title = user_title or scraped_data["title"]
+            title_translation_pending = not user_title and scraped_data.get("title_needs_translation", False)
             content_to_summarize = scraped_data["content"]
             source_name = scraped_data["source_name"]
         else:
@@ -77,6 +94,7 @@ async def create_bookmark(
             content_to_summarize = content_input
             source_name = "직접 입력"
             url_str = ""
+            title_translation_pending = False
 
         tags = bookmark_data.get("tags") or []
         if isinstance(tags, str):
@@ -87,15 +105,18 @@ async def create_bookmark(
             url=url_str,
             source_name=source_name,
             content=content_to_summarize,
-            summary="요약 생성 중...",
+            summary=SUMMARY_PLACEHOLDER,
             tags=tags,
             user_id=current_user.id,
+            title_translation_pending=title_translation_pending,
         )
         db.add(db_bookmark)
         db.commit()
         db.refresh(db_bookmark)
 
-        submit_summary_task(str(db_bookmark.id), content_to_summarize, model=summary_model)
+        submit_summary_task(str(db_bookmark.id), model=summary_model, db=db)
+        if title_translation_pending and not settings.SUMMARY_TRANSLATE_TITLE:
+            submit_title_translation(db_bookmark.id)
         logger.info(f"북마크 생성 완료 - ID: {db_bookmark.id}")
         return db_bookmark
 
@@ -168,8 +189,58 @@ def get_bookmarks(
 
 @router.get("/summary-models")
 def get_summary_models(current_user: User = Depends(get_current_user)):
-    """요약에 사용 가능한 모델 목록 반환 (OLLAMA_MODEL_LISTS 기반)."""
-    return {"models": settings.OLLAMA_SUMMARY_MODEL_LIST}
+    """요약에 사용 가능한 모델 목록 반환 (OLLAMA_MODEL_LISTS 기반). auto_routing이면 모델 미선택 시 자동 선택."""
+    return {
+        "models": settings.OLLAMA_SUMMARY_MODEL_LIST,
+        "default_model": settings.OLLAMA_MODEL,
+        "auto_routing": settings.SUMMARY_ROUTING_ENABLED,
+    }
+
+
+@router.get("/search/semantic", response_model=SemanticSearchResponse)
+def semantic_search(
+    q: str = Query(..., min_length=1, max_length=500, description="검색어 (자연어 문장/키워드)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    의미 검색: 검색어 임베딩과 북마크 임베딩(제목+태그+요약)의 코사인 유사도 순으로 반환.
+    본인 소유 + is_public=True 북마크만 대상. SEMANTIC_SEARCH_MIN_SCORE 미만은 제외.
+    임베딩이 아직 없는 북마크(요약 생성 중, 보강 대기)는 검색되지 않음.
+    """
+    if not settings.EMBEDDING_ENABLED:
+        raise HTTPException(status_code=503, detail="의미 검색이 비활성화되어 있습니다.")
+    query = q.strip()
+    if not query:
+        raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
+    try:
+        vector = embed_query(query)
+    except Exception as e:
+        logger.error(f"검색어 임베딩 실패: {str(e)}")
+        raise HTTPException(status_code=502, detail="검색어 임베딩에 실패했습니다. 잠시 후 다시 시도해주세요.")
+
+    semantic_index.sync(db)
+    # 인덱스의 공개 여부가 늦게 반영된 항목은 DB 확인에서 빠지므로 조금 더 가져옴
+    hits = semantic_index.search(vector, current_user.id, limit + 10, settings.SEMANTIC_SEARCH_MIN_SCORE)
+    items = _visible_scored_items(db, current_user.id, hits)[:limit]
+    return {"query": query, "items": items, "total": len(items)}
+
+
+def _visible_scored_items(db: Session, owner_id, hits) -> List[SemanticSearchItem]:
+    """인덱스 결과 [(북마크 ID, 점수)] 중 DB 기준으로 볼 수 있는 북마크만 점수 순서대로 응답 항목으로 변환"""
+    visible = {
+        bookmark.id: bookmark
+        for bookmark in crud_bookmark.get_visible_by_ids(db, owner_id=owner_id, ids=[bid for bid, _ in hits])
+    }
+    return [
+        SemanticSearchItem(
+            **BookmarkResponse.model_validate(visible[bid], from_attributes=True).model_dump(),
+            score=round(score, 4),
+        )
+        for bid, score in hits
+        if bid in visible
+    ]
 
 
 @router.get("/{bookmark_id}", response_model=BookmarkResponse)
@@ -186,6 +257,104 @@ def read_bookmark(
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
     return bookmark
 
+@router.get("/{bookmark_id}/summary")
+def get_translated_summary(
+    bookmark_id: UUID,
+    lang: str = Query(..., description="번역 언어 (SUMMARY_TRANSLATION_LANGUAGES, 예: en)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    요약을 lang으로 번역해 반환. 본인 소유 또는 is_public=True인 경우만 허용.
+    요약 버전(본문 해시)별로 한 번만 번역해 저장하고 이후 요청은 저장된 번역 사용 (cached=true).
+    """
+    lang = lang.strip().lower()
+    if lang not in settings.SUMMARY_TRANSLATION_LANGUAGE_LIST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 언어입니다. 사용 가능: {', '.join(settings.SUMMARY_TRANSLATION_LANGUAGE_LIST)}",
+        )
+    bookmark = crud_bookmark.get(db, bookmark_id)
+    if not bookmark:
+        raise HTTPException(status_code=404, detail="Bookmark not found")
+    if bookmark.user_id != current_user.id and not bookmark.is_public:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    summary = bookmark.summary
+    if not summary or not summary.strip() or summary == SUMMARY_PLACEHOLDER:
+        raise HTTPException(status_code=409, detail="요약이 아직 생성되지 않았습니다.")
+    # 번역 중 DB 연결을 점유하지 않도록 요청 세션은 먼저 반환
+    db.close()
+
+    try:
+        result = summary_translator.translate(bookmark_id, summary, lang)
+    except SummaryTranslationError:
+        raise HTTPException(status_code=502, detail="요약 번역에 실패했습니다. 잠시 후 다시 시도해주세요.")
+    return {
+        "bookmark_id": str(bookmark_id),
+        "lang": lang,
+        "source_lang": result.source_lang,
+        "summary": result.summary,
+        "summary_version": result.summary_version,
+        "cached": result.cached,
+    }
+
+@router.get("/{bookmark_id}/related", response_model=RelatedBookmarksResponse)
+def related_bookmarks(
+    bookmark_id: UUID,
+    limit: int = Query(5, ge=1, le=20, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    관련 글: 북마크 임베딩과 가까운 다른 북마크를 유사도 순으로 반환. 본인 소유 또는 is_public=True인 경우만 허용.
+    후보도 본인 소유 + is_public=True 북마크만 대상. RELATED_BOOKMARKS_MIN_SCORE 미만은 제외.
+    임베딩이 아직 없는 북마크는 빈 목록.
+    """
+    if not settings.EMBEDDING_ENABLED:
+        raise HTTPException(status_code=503, detail="의미 검색이 비활성화되어 있습니다.")
+    bookmark = crud_bookmark.get(db, bookmark_id)
+    if not bookmark:
+        raise HTTPException(status_code=404, detail="Bookmark not found")
+    if bookmark.user_id != current_user.id and not bookmark.is_public:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+
+    semantic_index.sync(db)
+    hits = semantic_index.related(bookmark_id, current_user.id, limit + 10, settings.RELATED_BOOKMARKS_MIN_SCORE)
+    items = _visible_scored_items(db, current_user.id, hits)[:limit]
+    return {"bookmark_id": bookmark_id, "items": items, "total": len(items)}
+
+@router.get("/{bookmark_id}/summary/stream")
+def stream_bookmark_summary(
+    bookmark_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    요약 생성 과정을 Server-Sent Events로 전송. 본인 소유 또는 is_public=True인 경우만 허용.
+    이벤트: delta(추가된 텍스트), reset(처음부터 다시 생성된 전체 텍스트), done(최종 요약), failed(요약 실패),
+    title(영어 제목 번역 완료)
+    """
+    bookmark = crud_bookmark.get(db, bookmark_id)
+    if not bookmark:
+        raise HTTPException(status_code=404, detail="Bookmark not found")
+    if bookmark.user_id != current_user.id and not bookmark.is_public:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+
+    def event_stream():
+        for item in iter_summary_events(str(bookmark_id)):
+            if item is None:
+                yield ": ping\n\n"  # 연결 유지용 주석
+                continue
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # nginx 프록시 버퍼링 비활성화 (토큰 즉시 전달)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.put("/{bookmark_id}", response_model=BookmarkResponse)
 async def update_bookmark(
     bookmark_id: UUID,
@@ -225,7 +394,9 @@ async def update_bookmark(
                     detail="올바른 URL 형식이 아닙니다."
                 )
 
-        # 4. 북마크 업데이트
+        # 4. 북마크 업데이트 (사용자가 제목을 바꾸면 요약 작업에서 제목을 번역해 덮어쓰지 않음)
+        if bookmark_in.title is not None and bookmark_in.title != bookmark.title:
+            bookmark.title_translation_pending = False
         updated_bookmark = crud_bookmark.update(
             db,
             db_obj=bookmark,
@@ -254,6 +425,8 @@ async def update_bookmark(
             # 로그 저장 실패는 북마크 수정 실패로 처리하지 않음
             
         logger.info(f"북마크 수정 성공 - ID: {bookmark_id}")
+        # 제목/태그/요약이 바뀌었으면 임베딩 다시 계산 (바뀌지 않았으면 작업에서 건너뜀)
+        submit_embedding(bookmark_id)
         return updated_bookmark
         
     except HTTPException:
@@ -281,8 +454,11 @@ async def delete_bookmark(
         logger.warning(f"북마크 삭제 권한 없음 - ID: {bookmark_id}, 요청 사용자: {current_user.username}")
         raise HTTPException(status_code=403, detail="권한 없음")
     
+    # 진행 중인 요약 작업을 먼저 취소 (삭제된 북마크에 결과가 저장되거나 LLM 시간이 낭비되지 않도록)
+    cancel_bookmark_jobs(db, bookmark.id)
     db.delete(bookmark)
     db.commit()
+    semantic_index.remove(bookmark_id)
     
     logger.info(f"북마크 삭제 성공 - ID: {bookmark_id}")
     return {"message": "Bookmark deleted successfully"}
@@ -0,0 +1,118 @@
+"""
+일괄 재요약 관리자 API (ADMIN_USERNAME 계정만 사용 가능).
+- 필터로 대상 북마크를 골라 속도 제한을 두고 요약 큐에 적재 (API 프로세스 백그라운드 쓰레드에서 실행)
+- 진행률/처리량/ETA 조회, 일시 중지/재개/취소
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+import logging
+import uuid as uuid_module
+
+from app.core.config import settings
+from app.core.security import get_current_admin_user
+from app.db.session import get_db
+from app.models.resummarize_run import ResummarizeRun
+from app.models.user import User
+from app.schemas.resummarize import ResummarizeRequest
+from app.tasks.resummarize import (
+    RESUMABLE_STATUSES, RUN_CANCELLED, RUN_PAUSED, RUN_RUNNING,
+    RUN_DONE, build_run, count_targets, create_run, get_run_progress, set_run_status, start_in_background,
+)
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def _get_run(db: Session, run_id: str) -> ResummarizeRun:
+    try:
+        rid = uuid_module.UUID(run_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="재요약 실행을 찾을 수 없습니다.")
+    run = db.query(ResummarizeRun).filter(ResummarizeRun.id == rid).first()
+    if not run:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="재요약 실행을 찾을 수 없습니다.")
+    return run
+
+
+@router.post("/")
+def create_resummarize_run(
+    request: ResummarizeRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """재요약 실행 생성 후 바로 시작. dry_run이면 대상 수만 반환."""
+    target_model = (request.target_model or "").strip()
+    if target_model and target_model not in settings.OLLAMA_SUMMARY_MODEL_LIST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"사용할 수 없는 요약 모델입니다: {target_model} (가능: {', '.join(settings.OLLAMA_SUMMARY_MODEL_LIST)})",
+        )
+    params = request.model_dump(exclude={"dry_run"})
+    if request.dry_run:
+        return {"dry_run": True, "total": count_targets(db, build_run(**params))}
+    run = create_run(db, created_by=current_user.username, **params)
+    start_in_background(run.id)
+    return get_run_progress(db, run)
+
+
+@router.get("/")
+def list_resummarize_runs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """최근 재요약 실행 목록 (진행률 포함)"""
+    runs = db.query(ResummarizeRun).order_by(ResummarizeRun.created_at.desc()).limit(limit).all()
+    return {"items": [get_run_progress(db, run) for run in runs]}
+
+
+@router.get("/{run_id}")
+def get_resummarize_run(
+    run_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """적재/완료/실패 수, 처리량(건/분), 남은 시간(eta_seconds)"""
+    return get_run_progress(db, _get_run(db, run_id))
+
+
+@router.post("/{run_id}/pause")
+def pause_resummarize_run(
+    run_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """적재 일시 중지 (이미 적재된 작업은 계속 처리됨). resume으로 마지막 위치부터 재개."""
+    run = _get_run(db, run_id)
+    if run.status != RUN_RUNNING:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"실행 중이 아닙니다 (상태: {run.status}).")
+    set_run_status(db, run, RUN_PAUSED)
+    return get_run_progress(db, run)
+
+
+@router.post("/{run_id}/resume")
+def resume_resummarize_run(
+    run_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """마지막 적재 위치부터 이어서 실행 (서버 재시작 등으로 heartbeat가 끊긴 running 실행도 재개 가능)"""
+    run = _get_run(db, run_id)
+    if run.status not in RESUMABLE_STATUSES and run.status != RUN_RUNNING:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"재개할 수 없는 상태입니다: {run.status}")
+    start_in_background(run.id)
+    return get_run_progress(db, run)
+
+
+@router.post("/{run_id}/cancel")
+def cancel_resummarize_run(
+    run_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """실행 취소 (아직 처리되지 않은 대기 작업도 큐에서 제거)"""
+    run = _get_run(db, run_id)
+    if run.status in (RUN_CANCELLED, RUN_DONE):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"이미 종료된 실행입니다 (상태: {run.status}).")
+    set_run_status(db, run, RUN_CANCELLED)
+    return get_run_progress(db, run)
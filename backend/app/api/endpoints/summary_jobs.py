@@ -0,0 +1,182 @@
+"""
+요약 작업 큐 상태 API (관리자 전용: 내부 Ollama 노드 주소와 호출 지표 포함).
+- 모델별 대기/실행 중 작업 수, 동시 요청 상한, 스케줄링 가중치 조회
+- 우선순위 레인별 대기/실행 중 작업 수와 사용자별 공정 분배 설정 조회
+- 최근 24시간 요약 모델 자동 선택 결과(모델·이유별 건수) 조회
+- Ollama 엔드포인트 풀 상태, 모델 로딩/생성 시간 통계 조회
+- 요약 결과 캐시 적중/미스 지표 조회
+- 번역 결과 캐시 적중/미스 지표 조회
+- LLM 호출 지표(llm_calls) 기반 모델별 초당 토큰 수, p50/p95 지연 집계
+- 현재 프롬프트 버전과 버전별 북마크 수 조회
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Optional
+import logging
+
+from app.core.config import settings
+from app.core.security import get_current_admin_user
+from app.db.session import get_db
+from app.models.bookmark import Bookmark
+from app.models.bookmark_embedding import BookmarkEmbedding
+from app.models.user import User
+from app.services.summary_cache import summary_cache
+from app.services.semantic_index import semantic_index
+from app.services.summary_translation import summary_translator
+from app.services.translation_cache import translation_cache
+from app.tasks.model_scheduler import max_in_flight, weight
+from app.tasks.fair_scheduler import LANES
+from app.tasks.summary_queue import get_lane_stats, get_queue_stats, get_route_stats
+from app.utils.embeddings import embedding_model_id
+from app.utils.llm_telemetry import llm_telemetry, parse_window
+from app.utils.ollama_client import ollama_client
+from app.utils.ollama_pool import ollama_pool
+from app.utils.summerise_openai import current_prompt_versions, get_prompt_version
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/stats")
+def get_summary_job_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """모델별/레인별 요약 큐 깊이(queued)와 실행 중 작업 수(in_flight) 조회."""
+    stats = get_queue_stats(db)
+    model_names = list(dict.fromkeys(settings.OLLAMA_SUMMARY_MODEL_LIST + list(stats.keys())))
+    models = []
+    for model in model_names:
+        entry = stats.get(model, {"queued": 0, "in_flight": 0})
+        models.append({
+            "model": model,
+            "queued": entry["queued"],
+            "in_flight": entry["in_flight"],
+            "max_in_flight": max_in_flight(model),
+            "weight": weight(model),
+        })
+    lane_stats = get_lane_stats(db)
+    lanes = [
+        {"lane": lane, **lane_stats.get(lane, {"queued": 0, "in_flight": 0, "users": 0})}
+        for lane in list(dict.fromkeys(list(LANES) + list(lane_stats.keys())))
+    ]
+    return {
+        "models": models,
+        "lanes": lanes,
+        "fair_share": {
+            "user_max_in_flight": settings.SUMMARY_USER_MAX_IN_FLIGHT,
+            "quantum": settings.SUMMARY_FAIR_QUANTUM,
+            "bulk_reserved_slots": settings.SUMMARY_BULK_RESERVED_SLOTS,
+        },
+        "routing": {
+            "enabled": settings.SUMMARY_ROUTING_ENABLED,
+            "small_model": settings.SUMMARY_ROUTING_SMALL_MODEL,
+            "last_24h": get_route_stats(db, datetime.utcnow() - timedelta(hours=24)),
+        },
+        "total_queued": sum(m["queued"] for m in models),
+        "total_in_flight": sum(m["in_flight"] for m in models),
+    }
+
+
+@router.get("/ollama-endpoints")
+def get_ollama_endpoints(current_user: User = Depends(get_current_admin_user)):
+    """
+    이 프로세스의 Ollama 엔드포인트 풀 상태 (정상 여부, 제외 여부, 처리 중 요청 수, 보유 모델)와
+    모델별 콜드 로드 횟수·로딩 시간·생성 시간 통계, 시작 시 워밍업 결과.
+    """
+    return {"endpoints": ollama_pool.status(), "client": ollama_client.stats()}
+
+
+@router.get("/cache")
+def get_summary_cache_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """이 프로세스의 요약 캐시 지표 (LRU/DB 적중, 미스, 적중률)와 summary_cache 전체 항목 수."""
+    return summary_cache.stats(db)
+
+
+@router.get("/translation-cache")
+def get_translation_cache_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    이 프로세스의 번역 캐시 지표 (LRU/DB 적중, 미스, 적중률)와 translation_cache 전체 항목 수.
+    summary_translations: 요약 번역(GET /api/bookmarks/{id}/summary?lang=) 저장분 적중/번역/합쳐진 요청 수
+    """
+    result = translation_cache.stats(db)
+    result["summary_translations"] = summary_translator.stats()
+    return result
+
+
+@router.get("/embeddings")
+def get_embedding_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """이 프로세스의 의미 검색 인덱스 상태(모델, 차원, 항목 수, 행렬 메모리)와 현재 모델로 임베딩된 북마크 수."""
+    model = embedding_model_id()
+    embedded = (
+        db.query(func.count(BookmarkEmbedding.bookmark_id)).filter(BookmarkEmbedding.model == model).scalar() or 0
+    )
+    return {
+        "enabled": settings.EMBEDDING_ENABLED,
+        "model": model,
+        "embedded": embedded,
+        "index": semantic_index.stats(),
+    }
+
+
+@router.get("/prompt-versions")
+def get_prompt_versions(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    현재 prompt.conf 버전과 요약 프롬프트 버전별 북마크 수 (이전 버전으로 요약된 북마크 파악용, 버전 없음은 null).
+    구조화 출력으로 만든 요약(`<버전>-json`)도 현재 버전으로 집계.
+    """
+    current = get_prompt_version()
+    current_versions = set(current_prompt_versions())
+    rows = (
+        db.query(Bookmark.summary_prompt_version, func.count(Bookmark.id))
+        .filter(Bookmark.is_deleted == False)
+        .group_by(Bookmark.summary_prompt_version)
+        .all()
+    )
+    versions = [
+        {"prompt_version": version, "bookmarks": count, "current": version in current_versions}
+        for version, count in sorted(rows, key=lambda r: -r[1])
+    ]
+    return {
+        "current": current,
+        "current_versions": sorted(current_versions),
+        "versions": versions,
+        "outdated": sum(v["bookmarks"] for v in versions if not v["current"]),
+    }
+
+
+@router.get("/llm-stats")
+def get_llm_stats(
+    windows: str = Query("15m,1h,24h", description="집계 구간 (쉼표 구분, 예: 15m,1h,24h,7d)"),
+    model: Optional[str] = Query(None, description="특정 모델만 집계"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    구간별·모델별·용도별 LLM 호출 집계: 호출/오류/타임아웃 수, 입력/출력 토큰 수,
+    초당 토큰 수(eval_count / eval_duration), 성공 호출의 p50/p95 지연, 평균 큐 대기, 콜드 로드 수.
+    """
+    try:
+        parsed = [(w.strip(), parse_window(w)) for w in windows.split(",") if w.strip()]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not parsed:
+        raise HTTPException(status_code=400, detail="집계 구간을 하나 이상 지정하세요.")
+    return {
+        "windows": {label: llm_telemetry.aggregate(db, window, model) for label, window in parsed},
+        "recorder": llm_telemetry.stats(),
+    }
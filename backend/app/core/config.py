@@ -1,9 +1,22 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List
 from functools import lru_cache
 from urllib.parse import quote_plus
 import os
 
+def _parse_model_int_map(value: str) -> Dict[str, int]:
+    """'모델=정수' 쉼표 구분 문자열을 dict로 변환 (모델명에 ':'가 포함되므로 구분자는 '=')"""
+    result = {}
+    for item in value.split(","):
+        name, sep, num = item.strip().rpartition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            result[name.strip()] = int(num)
+        except ValueError:
+            continue
+    return result
+
 class Settings(BaseSettings):
     """
     애플리케이션 설정 클래스
@@ -80,15 +93,159 @@ class Settings(BaseSettings):
         """요약에 사용 가능한 모델 목록 (OLLAMA_MODEL_LISTS 파싱)"""
         return [m.strip() for m in self.OLLAMA_MODEL_LISTS.split(",") if m.strip()]
 
+    @property
+    def SUMMARY_TRANSLATION_LANGUAGE_LIST(self) -> List[str]:
+        """요약 번역 요청 가능 언어 목록 (SUMMARY_TRANSLATION_LANGUAGES 파싱)"""
+        return [lang.strip().lower() for lang in self.SUMMARY_TRANSLATION_LANGUAGES.split(",") if lang.strip()]
+
+    @property
+    def OLLAMA_API_URL_LIST(self) -> List[str]:
+        """Ollama /api/chat 엔드포인트 목록 (OLLAMA_API_URLS 파싱, 미설정 시 OLLAMA_API_URL 하나)"""
+        urls = [u.strip() for u in self.OLLAMA_API_URLS.split(",") if u.strip()]
+        return urls or [self.OLLAMA_API_URL]
+
+    @property
+    def OLLAMA_STRUCTURED_OUTPUT_EXCLUDE_MODEL_LIST(self) -> List[str]:
+        """구조화(JSON) 출력을 쓰지 않을 모델 목록 (format 미지원 구형 모델)"""
+        return [m.strip() for m in self.OLLAMA_STRUCTURED_OUTPUT_EXCLUDE_MODELS.split(",") if m.strip()]
+
+    @property
+    def OLLAMA_MODEL_MAX_IN_FLIGHT_MAP(self) -> Dict[str, int]:
+        """모델별 최대 동시 요약 요청 수 (OLLAMA_MODEL_MAX_IN_FLIGHT 파싱, 예: 'gpt-oss:120b-cloud=2')"""
+        return _parse_model_int_map(self.OLLAMA_MODEL_MAX_IN_FLIGHT)
+
+    @property
+    def OLLAMA_MODEL_WEIGHT_MAP(self) -> Dict[str, int]:
+        """모델별 스케줄링 가중치 (OLLAMA_MODEL_WEIGHTS 파싱, 예: 'emma3:27b-cloud=3')"""
+        return _parse_model_int_map(self.OLLAMA_MODEL_WEIGHTS)
+
     # OpenAI 설정
     OPENAI_API_KEY: str = ""
     
     # Ollama 설정
     OLLAMA_API_URL: str = "http://localhost:11434/api/chat"
+    # 여러 Ollama 노드 사용 시 /api/chat 주소를 쉼표로 구분 (설정 시 OLLAMA_API_URL 대신 사용)
+    OLLAMA_API_URLS: str = ""
+    OLLAMA_HEALTH_CHECK_INTERVAL: int = 30  # /api/tags 헬스 체크 주기(초)
+    OLLAMA_EJECT_FAILURES: int = 3  # 연속 실패 시 노드 제외 기준 횟수
+    OLLAMA_EJECT_SECONDS: int = 60  # 노드 제외 유지 시간(초). 이후 헬스 체크 성공 시 재투입
     OLLAMA_MODEL: str = "gpt-oss:120b-cloud"
     OLLAMA_MODEL_LISTS: str = "gpt-oss:120b-cloud,emma3:27b-cloud"  # 요약용 선택 가능 모델 (쉼표 구분)
     TRANSLATE_MODEL: str = "translategemma:4b"
-    
+    TRANSLATE_BATCH_SIZE: int = 20  # 일괄 번역 시 번역 모델 1회 호출에 묶는 최대 문장 수
+    # 공용 Ollama 클라이언트 (연결 풀링, 모델 상주, 시작 시 워밍업)
+    OLLAMA_KEEP_ALIVE: str = "30m"  # 요청마다 전달하는 keep_alive (예: 30m, 1h, -1=계속 유지)
+    OLLAMA_HTTP_POOL_SIZE: int = 20  # 노드당 재사용 HTTP 연결 수
+    OLLAMA_WARMUP_ON_STARTUP: bool = True  # 시작 시 OLLAMA_MODEL, TRANSLATE_MODEL 미리 로드
+    OLLAMA_WARMUP_TIMEOUT: int = 300  # 워밍업 요청 타임아웃(초)
+    OLLAMA_COLD_LOAD_THRESHOLD: float = 1.0  # load_duration이 이 값(초) 이상이면 콜드 로드로 집계
+    # LLM 호출 마감 시간/재시도/헤지 (고정 300초 타임아웃 대신 입력 길이와 모델별 관측 지연으로 계산)
+    LLM_CONNECT_TIMEOUT: float = 5.0  # 노드 연결 타임아웃(초)
+    LLM_DEADLINE_BASE: float = 120.0  # 관측 지연이 없을 때 기본 마감 시간(초, 입력 길이 보정 전)
+    LLM_DEADLINE_P95_MULTIPLIER: float = 2.0  # 관측 응답 시간 p95에 곱하는 배수
+    LLM_DEADLINE_CHARS_PER_SECOND: float = 400.0  # 입력 길이 보정: 이 글자 수마다 1초 추가 (0이면 보정 안 함)
+    LLM_DEADLINE_MIN: float = 30.0
+    LLM_DEADLINE_MAX: float = 600.0
+    LLM_MAX_RETRIES: int = 2  # 연결 오류/타임아웃/5xx 재시도 횟수
+    LLM_RETRY_BACKOFF_BASE: float = 1.0  # 재시도 대기 상한 = min(MAX, BASE × 2^시도), 0~상한 무작위
+    LLM_RETRY_BACKOFF_MAX: float = 20.0
+    LLM_HEDGE_ENABLED: bool = True  # 첫 토큰이 p95보다 늦으면 비어 있는 다른 노드에 같은 요청 전송 (다중 노드일 때만)
+    LLM_HEDGE_MIN_SAMPLES: int = 20  # 헤지 기준 p95 계산에 필요한 최소 표본 수
+    # LLM 호출 지표 (llm_calls 테이블: 토큰 수, 생성/로딩 시간, 지연, 큐 대기, 결과)
+    LLM_TELEMETRY_ENABLED: bool = True
+    LLM_TELEMETRY_FLUSH_INTERVAL: float = 5.0  # 버퍼 일괄 저장 주기(초)
+    LLM_TELEMETRY_BATCH_SIZE: int = 200  # 버퍼가 이 건수에 도달하면 즉시 저장
+    LLM_TELEMETRY_MAX_BUFFER: int = 5000  # DB 저장 실패 시 메모리에 보관할 최대 건수 (초과분은 오래된 것부터 버림)
+    LLM_TELEMETRY_RETENTION_DAYS: int = 30  # 보관 기간(일). 0이면 삭제하지 않음
+    # 모델별 동시 요청 상한/가중치 ("모델=값" 쉼표 구분). 목록에 없는 모델은 기본값 사용
+    OLLAMA_MODEL_MAX_IN_FLIGHT: str = ""
+    OLLAMA_MODEL_DEFAULT_MAX_IN_FLIGHT: int = 3
+    OLLAMA_MODEL_WEIGHTS: str = ""
+
+    # 요약 작업 큐/워커 설정 (summary_jobs 테이블을 큐로 사용)
+    SUMMARY_WORKER_CONCURRENCY: int = 3  # 워커 프로세스당 동시 요약 작업 수
+    SUMMARY_WORKER_POLL_INTERVAL: float = 1.0  # 대기 작업이 없을 때 큐 폴링 간격(초)
+    SUMMARY_EMBEDDED_WORKER: bool = True  # API 프로세스 내장 워커 실행 여부 (python -m app.worker 별도 운영 시 False)
+    # 우선순위 레인/사용자별 공정 분배 (interactive 우선, 레인 안에서는 사용자별 deficit round-robin)
+    SUMMARY_USER_MAX_IN_FLIGHT: int = 2  # 사용자별 실행 중 요약 작업 상한 (0이면 무제한)
+    SUMMARY_FAIR_QUANTUM: int = 2  # DRR 차례마다 사용자에게 주는 비용 한도 (작업 비용 = 본문 청크 수)
+    SUMMARY_BULK_RESERVED_SLOTS: int = 1  # bulk 작업이 쓰지 않고 남겨 두는 모델별 동시 요청 슬롯 수
+    # 요약 모델 자동 선택 (사용자가 모델을 고르지 않은 경우 본문 길이/언어/큐 적체로 결정)
+    SUMMARY_ROUTING_ENABLED: bool = True
+    SUMMARY_ROUTING_SMALL_MODEL: str = "emma3:27b-cloud"  # 짧은/단순 본문용 소형 모델 (OLLAMA_MODEL_LISTS에 있어야 함)
+    SUMMARY_ROUTING_SHORT_CHARS: int = 2000  # 이 글자 수 이하 본문은 소형 모델
+    SUMMARY_ROUTING_KOREAN_MAX_CHARS: int = 6000  # 한국어 본문은 이 글자 수 이하까지 소형 모델
+    SUMMARY_ROUTING_QUEUE_THRESHOLD: int = 6  # 기본 모델 대기+실행 중 작업이 이 수 이상이면 소형 모델로 분산 (0이면 사용 안 함)
+    SUMMARY_ROUTING_OFFLOAD_MAX_CHARS: int = 12000  # 큐 적체 시 소형 모델로 보낼 최대 본문 길이
+    # 구조화 출력: format에 JSON 스키마를 넘겨 분류/키워드/요약을 한 번에 파싱 (실패 시 정규식 추출)
+    OLLAMA_STRUCTURED_OUTPUT: bool = True
+    OLLAMA_STRUCTURED_OUTPUT_EXCLUDE_MODELS: str = ""  # 쉼표 구분, 정규식 추출을 계속 쓸 모델
+    # 영어 제목 번역을 요약 호출(JSON title 필드)에 합침: 스크랩 시 번역 모델 호출 생략
+    # (구조화 출력을 쓰지 않는 모델/요약 캐시 적중 시에는 요약 후 TRANSLATE_MODEL로 번역)
+    SUMMARY_TRANSLATE_TITLE: bool = True
+    # 제목 번역 보강 작업 (스크랩 시 번역하지 않고 북마크 저장 후 별도 쓰레드에서 번역)
+    TITLE_TRANSLATION_CONCURRENCY: int = 2  # 프로세스당 동시 제목 번역 수
+    TITLE_TRANSLATION_SWEEP_AGE: int = 600  # 생성 후 이 시간(초)이 지나도 번역 대기 중이면 복구 스위퍼가 다시 번역
+    TITLE_TRANSLATION_SWEEP_BATCH_SIZE: int = 20  # 스위프 1회당 다시 번역할 최대 북마크 수
+    OLLAMA_STREAM_SUMMARY: bool = True  # 요약을 스트리밍으로 받아 중간 결과를 저장/전송
+    SUMMARY_STREAM_FLUSH_INTERVAL: float = 1.0  # 스트리밍 중간 결과 DB 저장 간격(초)
+    SUMMARY_STREAM_MAX_SECONDS: int = 600  # SSE 요약 스트림 최대 유지 시간(초)
+    SUMMARY_JOB_HEARTBEAT_INTERVAL: int = 30  # 워커가 실행 중 작업의 heartbeat_at을 갱신하는 간격(초)
+    SUMMARY_JOB_TIMEOUT: int = 300  # 이 시간(초) 동안 heartbeat가 없는 running 작업은 실패 처리 (워커 비정상 종료 대비)
+
+    # 긴 문서 map-reduce 요약 (본문이 임계값 이상이면 청크별 정리 후 prompt.conf 형식으로 최종 요약)
+    SUMMARY_CHUNK_THRESHOLD: int = 24000  # 긴 문서 모드 전환 기준 글자 수 (0이면 사용 안 함)
+    SUMMARY_CHUNK_SIZE: int = 8000  # 청크 최대 글자 수 (문단/문장 경계 기준으로 분할)
+    SUMMARY_CHUNK_CONCURRENCY: int = 2  # 사용 가능한 Ollama 노드당 청크 동시 요청 수
+    SUMMARY_CHUNK_MAX_DEPTH: int = 2  # 청크 메모가 여전히 길 때 다시 map 하는 최대 단계 수
+
+    # 요약 결과 캐시 (본문+모델+프롬프트 버전 해시 기준, summary_cache 테이블 + 프로세스 내 LRU)
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_LRU_SIZE: int = 256  # 프로세스 내 LRU 최대 항목 수 (0이면 LRU 미사용, DB만 조회)
+
+    # 번역 결과 캐시 (원문+언어+번역 모델 해시 기준, translation_cache 테이블 + 프로세스 내 LRU)
+    TRANSLATION_CACHE_ENABLED: bool = True
+    TRANSLATION_CACHE_LRU_SIZE: int = 1024  # 프로세스 내 LRU 최대 항목 수 (0이면 LRU 미사용, DB만 조회)
+
+    # 요약 번역 (GET /api/bookmarks/{id}/summary?lang=en, 요약 버전별로 summary_translations에 저장)
+    SUMMARY_TRANSLATION_LANGUAGES: str = "en"  # 요청 가능한 언어 (쉼표 구분)
+
+    # 임베딩/의미 검색 (bookmark_embeddings 테이블, GET /api/bookmarks/search/semantic)
+    EMBEDDING_ENABLED: bool = True
+    EMBEDDING_PROVIDER: str = "ollama"  # ollama: Ollama /api/embed, local: 해시 기반 로컬 임베딩 (Ollama 없이 개발/테스트)
+    EMBEDDING_MODEL: str = "nomic-embed-text"  # ollama 임베딩 모델
+    EMBEDDING_LOCAL_DIM: int = 512  # local 임베딩 차원
+    EMBEDDING_MAX_CHARS: int = 4000  # 임베딩 입력(제목+태그+요약) 최대 글자 수
+    EMBEDDING_BATCH_SIZE: int = 16  # /api/embed 1회 요청에 묶는 북마크 수
+    EMBEDDING_CONCURRENCY: int = 1  # 프로세스당 동시 임베딩 작업 수
+    EMBEDDING_SWEEP_BATCH_SIZE: int = 64  # 복구 스위퍼 1회당 임베딩할 최대 북마크 수 (임베딩 없는 북마크 보강)
+    SEMANTIC_SEARCH_MIN_SCORE: float = 0.3  # 이 코사인 유사도 미만 결과 제외
+    SEMANTIC_INDEX_REFRESH_SECONDS: int = 60  # 메모리 인덱스의 삭제/공개 여부 전체 재확인 주기(초)
+
+    # 관련 글 (GET /api/bookmarks/{id}/related, 의미 검색 인덱스 위의 IVF 근사 최근접 탐색)
+    RELATED_BOOKMARKS_MIN_SCORE: float = 0.5  # 이 코사인 유사도 미만 관련 글 제외
+    ANN_IVF_MIN_SIZE: int = 1000  # 임베딩 수가 이 값 이상이면 IVF 학습 (미만은 전체 비교)
+    ANN_IVF_LISTS: int = 0  # IVF 중심(클러스터) 수, 0이면 √(임베딩 수)
+    ANN_IVF_NPROBE: int = 8  # 관련 글 조회 시 비교할 가까운 클러스터 수 (클수록 정확, 느림)
+    ANN_IVF_ITERATIONS: int = 10  # k-means 반복 횟수
+    ANN_INDEX_PATH: str = "data/semantic_index.npz"  # 인덱스 저장 파일 (빈 값이면 저장/복원 안 함)
+    ANN_INDEX_SAVE_INTERVAL: int = 300  # 변경이 있을 때 인덱스 저장 주기(초), 종료 시에도 저장
+
+    # 일괄 재요약 (POST /api/admin/resummarize, python -m app.resummarize)
+    RESUMMARIZE_DEFAULT_RATE: float = 1.0  # 초당 큐 적재 작업 수
+    RESUMMARIZE_BATCH_SIZE: int = 20  # 한 번에 조회/적재하는 북마크 수 (배치마다 진행 위치 저장)
+    RESUMMARIZE_MAX_PENDING: int = 50  # 실행별 대기 작업이 이 수 이상이면 적재 일시 중지
+    RESUMMARIZE_BACKLOG_WAIT: float = 5.0  # 대기 작업이 많을 때 다시 확인하는 간격(초)
+    RESUMMARIZE_STALE_SECONDS: int = 120  # running 상태에서 heartbeat가 이 시간(초) 없으면 다른 곳에서 재개 가능
+
+    # 요약 복구 스위퍼 ('요약 생성 중...' 상태로 남은 북마크 재적재)
+    SUMMARY_RECOVERY_ENABLED: bool = True
+    SUMMARY_RECOVERY_INTERVAL: int = 300  # 스위프 주기(초). 서버/워커 시작 시 1회 즉시 실행
+    SUMMARY_RECOVERY_DEADLINE: int = 600  # 생성 후 이 시간(초)이 지나도 요약이 없으면 복구 대상
+    SUMMARY_RECOVERY_BATCH_SIZE: int = 20  # 스위프 1회당 재적재할 최대 북마크 수
+    SUMMARY_RECOVERY_MAX_ATTEMPTS: int = 3  # 북마크당 최대 요약 시도 횟수 (최초 시도 포함)
+    SUMMARY_RECOVERY_BACKOFF: int = 300  # 재시도 간 최소 대기(초). 시도마다 2배씩 증가
+
     # 초기 관리자 계정 설정 (db_init.py에서 사용)
     ADMIN_USERNAME: str = "admin"
     ADMIN_EMAIL: str = "admin@example.com"
@@ -168,4 +168,14 @@ async def get_current_user(
         )
     except Exception as e:
         logger.error(f"Authentication error: {e}")
-        raise credentials_exception 
\ No newline at end of file
+        raise credentials_exception 
+
+
+async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+    """관리자 전용 API용. users ORM 모델에 is_superuser가 없어 초기 관리자 계정(ADMIN_USERNAME)으로 판별"""
+    if current_user.username != settings.ADMIN_USERNAME:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 사용할 수 있습니다."
+        )
+    return current_user
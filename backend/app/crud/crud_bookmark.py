@@ -109,6 +109,15 @@ class CRUDBookmark(CRUDBase[Bookmark, BookmarkCreate, BookmarkUpdate]):
             .filter(self._visible_to_user_filter(owner_id))\
             .count()
 
+    def get_visible_by_ids(self, db: Session, *, owner_id: int, ids: List) -> List[Bookmark]:
+        """ids 중 로그인 사용자에게 보이는 북마크 (본인 소유 + is_public=True, 순서 보장 안 함)."""
+        if not ids:
+            return []
+        return db.query(self.model)\
+            .filter(Bookmark.id.in_(ids), Bookmark.is_deleted == False)\
+            .filter(self._visible_to_user_filter(owner_id))\
+            .all()
+
     def get_multi_public(
         self, db: Session, *, skip: int = 0, limit: int = 100
     ) -> List[Bookmark]:
@@ -2,4 +2,11 @@ from app.db.base_class import Base
 from app.models.user import User
 from app.models.session import Session
 from app.models.bookmark import Bookmark
-from app.models.log import Log 
\ No newline at end of file
+from app.models.log import Log
+from app.models.summary_job import SummaryJob
+from app.models.summary_cache import SummaryCache
+from app.models.translation_cache import TranslationCache
+from app.models.summary_translation import SummaryTranslation
+from app.models.bookmark_embedding import BookmarkEmbedding
+from app.models.resummarize_run import ResummarizeRun
+from app.models.llm_call import LlmCall
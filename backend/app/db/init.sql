@@ -3,6 +3,13 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 -- Drop existing tables if they exist
+DROP TABLE IF EXISTS llm_calls CASCADE;
+DROP TABLE IF EXISTS summary_cache CASCADE;
+DROP TABLE IF EXISTS translation_cache CASCADE;
+DROP TABLE IF EXISTS summary_translations CASCADE;
+DROP TABLE IF EXISTS bookmark_embeddings CASCADE;
+DROP TABLE IF EXISTS summary_jobs CASCADE;
+DROP TABLE IF EXISTS resummarize_runs CASCADE;
 DROP TABLE IF EXISTS logs CASCADE;
 DROP TABLE IF EXISTS bookmarks CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
@@ -36,9 +43,125 @@ CREATE TABLE IF NOT EXISTS bookmarks (
     read_count INTEGER DEFAULT 0,
     is_deleted BOOLEAN DEFAULT FALSE,
     is_public BOOLEAN DEFAULT FALSE,
+    summary_prompt_version VARCHAR(32),
+    summary_model VARCHAR(100),
+    title_translation_pending BOOLEAN NOT NULL DEFAULT FALSE,
     CONSTRAINT fk_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- Create resummarize_runs table (일괄 재요약 실행: 필터, 속도 제한, 진행 위치)
+CREATE TABLE IF NOT EXISTS resummarize_runs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    model_filter VARCHAR(100),
+    prompt_version_filter VARCHAR(32),
+    outdated_only BOOLEAN NOT NULL DEFAULT FALSE,
+    category_filter VARCHAR(100),
+    created_from TIMESTAMP,
+    created_to TIMESTAMP,
+    target_model VARCHAR(100),
+    rate FLOAT NOT NULL,
+    batch_size INTEGER NOT NULL,
+    max_pending INTEGER NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    enqueued INTEGER NOT NULL DEFAULT 0,
+    cursor_created_at TIMESTAMP,
+    cursor_id UUID,
+    created_by VARCHAR(50),
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Create summary_jobs table (요약 작업 큐: API 서버와 워커 프로세스가 공유)
+CREATE TABLE IF NOT EXISTS summary_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    bookmark_id UUID NOT NULL REFERENCES bookmarks(id) ON DELETE CASCADE,
+    model VARCHAR(100),
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id VARCHAR(100),
+    error TEXT,
+    partial_summary TEXT,
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    lane VARCHAR(20) NOT NULL DEFAULT 'interactive',
+    cost INTEGER NOT NULL DEFAULT 1,
+    route_reason VARCHAR(30),
+    map_slots INTEGER NOT NULL DEFAULT 0,
+    run_id UUID REFERENCES resummarize_runs(id) ON DELETE SET NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Create summary_cache table (요약 결과 메모: 같은 본문/모델/프롬프트는 LLM 재호출 없이 재사용)
+CREATE TABLE IF NOT EXISTS summary_cache (
+    key VARCHAR(64) PRIMARY KEY,
+    model VARCHAR(100) NOT NULL,
+    prompt_version VARCHAR(32) NOT NULL,
+    summary TEXT NOT NULL,
+    category VARCHAR(100),
+    tags TEXT[],
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_hit_at TIMESTAMP
+);
+
+-- Create translation_cache table (번역 결과 메모: 같은 원문/언어/모델은 번역 모델 재호출 없이 재사용)
+CREATE TABLE IF NOT EXISTS translation_cache (
+    key VARCHAR(64) PRIMARY KEY,
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(10) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_hit_at TIMESTAMP
+);
+
+-- Create summary_translations table (요약 번역: 북마크/언어당 1건, 요약 본문 해시가 같을 때만 재사용)
+CREATE TABLE IF NOT EXISTS summary_translations (
+    bookmark_id UUID NOT NULL REFERENCES bookmarks(id) ON DELETE CASCADE,
+    lang VARCHAR(10) NOT NULL,
+    summary_version VARCHAR(32) NOT NULL,
+    translated_summary TEXT NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (bookmark_id, lang)
+);
+
+-- Create bookmark_embeddings table (북마크 임베딩: float32 바이트, 의미 검색용 메모리 인덱스의 원본)
+CREATE TABLE IF NOT EXISTS bookmark_embeddings (
+    bookmark_id UUID PRIMARY KEY REFERENCES bookmarks(id) ON DELETE CASCADE,
+    model VARCHAR(100) NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BYTEA NOT NULL,
+    text_hash VARCHAR(32) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create llm_calls table (LLM 호출별 토큰 수/처리 시간/대기 시간, 모델별 처리량·지연 집계용)
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id BIGSERIAL PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    model VARCHAR(100) NOT NULL,
+    endpoint VARCHAR(255),
+    purpose VARCHAR(20) NOT NULL,
+    job_id UUID,
+    queue_wait_ms INTEGER,
+    prompt_eval_count INTEGER,
+    eval_count INTEGER,
+    eval_duration_ms INTEGER,
+    load_duration_ms INTEGER,
+    latency_ms INTEGER NOT NULL,
+    outcome VARCHAR(16) NOT NULL,
+    error VARCHAR(255)
+);
+
 -- Create logs table for system logging
 CREATE TABLE IF NOT EXISTS logs (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -78,6 +201,16 @@ CREATE INDEX IF NOT EXISTS idx_bookmarks_created_at ON bookmarks(created_at);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_url ON bookmarks(url);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_title ON bookmarks(title);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_tags ON bookmarks USING gin (tags);
+CREATE INDEX IF NOT EXISTS idx_summary_jobs_bookmark_id ON summary_jobs(bookmark_id);
+CREATE INDEX IF NOT EXISTS idx_summary_jobs_status_created_at ON summary_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS ix_summary_jobs_run_id ON summary_jobs(run_id);
+CREATE INDEX IF NOT EXISTS ix_bookmark_embeddings_updated_at ON bookmark_embeddings(updated_at);
+-- 북마크당 대기 작업은 1개 (새 작업 적재 시 기존 대기 작업은 superseded)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_summary_jobs_pending_bookmark ON summary_jobs(bookmark_id) WHERE status = 'pending';
+-- 레인/사용자별 대기 작업 선택 (interactive 우선, 사용자별 공정 분배)
+CREATE INDEX IF NOT EXISTS idx_summary_jobs_pending_lane_user ON summary_jobs(model, lane, user_id, created_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at ON llm_calls(created_at);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_model_created_at ON llm_calls(model, created_at);
 CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level);
 CREATE INDEX IF NOT EXISTS idx_logs_source ON logs(source);
@@ -115,4 +248,11 @@ WHERE NOT b.is_deleted;
 COMMENT ON TABLE users IS '사용자 정보를 저장하는 테이블';
 COMMENT ON TABLE bookmarks IS '북마크 정보를 저장하는 테이블';
 COMMENT ON TABLE logs IS '시스템 로그를 저장하는 테이블';
-COMMENT ON TABLE sessions IS '사용자 세션 정보를 저장하는 테이블'; 
\ No newline at end of file
+COMMENT ON TABLE sessions IS '사용자 세션 정보를 저장하는 테이블';
+COMMENT ON TABLE summary_jobs IS '요약 작업 큐 테이블';
+COMMENT ON TABLE resummarize_runs IS '일괄 재요약 실행 테이블';
+COMMENT ON TABLE summary_cache IS '요약 결과 캐시 테이블 (본문 해시 기준)';
+COMMENT ON TABLE translation_cache IS '번역 결과 캐시 테이블 (원문 해시/언어/모델 기준)';
+COMMENT ON TABLE summary_translations IS '요약 번역 테이블 (북마크/언어/요약 버전 기준)';
+COMMENT ON TABLE bookmark_embeddings IS '북마크 임베딩 테이블 (의미 검색용 float32 벡터)';
+COMMENT ON TABLE llm_calls IS 'LLM 호출 지표 테이블'; 
\ No newline at end of file
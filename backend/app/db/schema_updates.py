@@ -0,0 +1,52 @@
+"""
+기존 테이블 컬럼/인덱스 추가 (마이그레이션 도구 없이 운영 중인 DB 보정)
+
+create_all은 새 테이블만 만들고 기존 테이블에 컬럼/인덱스를 추가하지 않으므로,
+모델에 컬럼을 추가하면 여기에 ADD COLUMN IF NOT EXISTS 문을 함께 등록합니다.
+모든 문은 여러 번 실행해도 결과가 같아야 합니다.
+API 서버/워커 시작 시 create_all 직후 실행 (init.sql에도 같은 컬럼 반영).
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMN_UPDATES = [
+    "ALTER TABLE bookmarks ADD COLUMN IF NOT EXISTS summary_prompt_version VARCHAR(32)",
+    "ALTER TABLE bookmarks ADD COLUMN IF NOT EXISTS summary_model VARCHAR(100)",
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS run_id UUID REFERENCES resummarize_runs(id) ON DELETE SET NULL",
+    "CREATE INDEX IF NOT EXISTS ix_summary_jobs_run_id ON summary_jobs(run_id)",
+    # 북마크당 대기 작업은 1개: 기존 중복 대기 작업은 가장 최근 것만 남기고 superseded 처리 후 부분 유니크 인덱스 생성
+    """UPDATE summary_jobs j SET status = 'superseded', finished_at = CURRENT_TIMESTAMP
+       WHERE j.status = 'pending' AND EXISTS (
+           SELECT 1 FROM summary_jobs n
+           WHERE n.bookmark_id = j.bookmark_id AND n.status = 'pending'
+             AND (n.created_at, n.id) > (j.created_at, j.id))""",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_summary_jobs_pending_bookmark ON summary_jobs(bookmark_id) WHERE status = 'pending'",
+    # 우선순위 레인/사용자별 공정 분배: 기존 대기/실행 중 작업은 북마크 사용자로 채우고 일괄 재요약 작업은 bulk 레인으로
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS user_id UUID REFERENCES users(id) ON DELETE CASCADE",
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS lane VARCHAR(20) NOT NULL DEFAULT 'interactive'",
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS cost INTEGER NOT NULL DEFAULT 1",
+    """UPDATE summary_jobs j SET user_id = b.user_id FROM bookmarks b
+       WHERE j.bookmark_id = b.id AND j.user_id IS NULL AND j.status IN ('pending', 'running')""",
+    "UPDATE summary_jobs SET lane = 'bulk' WHERE run_id IS NOT NULL AND status = 'pending' AND lane <> 'bulk'",
+    """CREATE INDEX IF NOT EXISTS idx_summary_jobs_pending_lane_user
+       ON summary_jobs(model, lane, user_id, created_at) WHERE status = 'pending'""",
+    # 요약 모델 자동 선택 이유
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS route_reason VARCHAR(30)",
+    # 영어 제목 번역 대기 (요약 호출에서 제목 번역을 함께 처리)
+    "ALTER TABLE bookmarks ADD COLUMN IF NOT EXISTS title_translation_pending BOOLEAN NOT NULL DEFAULT FALSE",
+    # 긴 문서 map 단계에서 빌린 모델 슬롯 (모델별 동시 요청 상한에 합산)
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS map_slots INTEGER NOT NULL DEFAULT 0",
+    # 실행 중 작업 heartbeat (워커 비정상 종료 감지)
+    "ALTER TABLE summary_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP",
+]
+
+
+def apply_column_updates(engine: Engine):
+    """등록된 컬럼 추가문 실행 (이미 있으면 변경 없음)"""
+    with engine.begin() as conn:
+        for statement in COLUMN_UPDATES:
+            conn.execute(text(statement))
+    logger.info(f"테이블 컬럼 보정 완료 ({len(COLUMN_UPDATES)}건 확인)")
@@ -3,9 +3,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.api import api_router
 from app.db.session import engine
+from app.db.schema_updates import apply_column_updates
 from app.models import Base
 from app.middleware.logging import LoggingMiddleware
 from app.core.logging import setup_root_logger
+from app.tasks.summary_worker import SummaryWorker
+from app.tasks.summary_recovery import SummaryRecoverySweeper
+from app.tasks.resummarize import stop_background_runs
+from app.services.semantic_index import semantic_index
+from app.utils.ollama_client import ollama_client
+from app.utils.llm_telemetry import llm_telemetry
 from datetime import datetime
 import logging
 
@@ -16,6 +23,7 @@ logger = logging.getLogger(__name__)
 # Create database tables (연결 실패 시에도 서버 시작 가능하도록 예외 처리)
 try:
     Base.metadata.create_all(bind=engine)
+    apply_column_updates(engine)
     logger.info("데이터베이스 테이블 생성 완료")
 except Exception as e:
     logger.warning(f"데이터베이스 테이블 생성 실패 (서버는 계속 시작됩니다): {str(e)}")
@@ -45,6 +53,33 @@ app.add_middleware(LoggingMiddleware)
 # API 라우터
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# 내장 요약 워커 (별도 python -m app.worker 운영 시 SUMMARY_EMBEDDED_WORKER=False로 비활성화)
+summary_worker = SummaryWorker() if settings.SUMMARY_EMBEDDED_WORKER else None
+# '요약 생성 중...' 상태로 남은 북마크 복구 (여러 프로세스에서 실행돼도 한 곳에서만 스위프)
+summary_recovery = SummaryRecoverySweeper() if settings.SUMMARY_RECOVERY_ENABLED else None
+
+@app.on_event("startup")
+def start_summary_worker():
+    if settings.OLLAMA_WARMUP_ON_STARTUP:
+        ollama_client.warmup_in_background()
+    if summary_worker:
+        summary_worker.start()
+    if summary_recovery:
+        summary_recovery.start()
+
+@app.on_event("shutdown")
+def stop_summary_worker():
+    # 진행 중인 일괄 재요약은 paused로 남겨 다음에 resume
+    stop_background_runs()
+    if summary_recovery:
+        summary_recovery.stop()
+    if summary_worker:
+        summary_worker.stop(wait=False)
+    # 버퍼에 남은 LLM 호출 지표 저장
+    llm_telemetry.flush()
+    # 의미 검색/관련 글 인덱스 저장 (다음 시작 시 DB 전체 로드 없이 복원)
+    semantic_index.save_if_dirty()
+
 # CORS 디버깅 미들웨어 (디버그 모드에서만 활성화)
 if settings.DEBUG:
     @app.middleware("http")
@@ -1,3 +1,10 @@
 from .user import User, Base
 from .bookmark import Bookmark
-from .log import Log 
\ No newline at end of file
+from .log import Log
+from .summary_job import SummaryJob
+from .summary_cache import SummaryCache
+from .translation_cache import TranslationCache
+from .summary_translation import SummaryTranslation
+from .bookmark_embedding import BookmarkEmbedding
+from .resummarize_run import ResummarizeRun
+from .llm_call import LlmCall
@@ -21,4 +21,8 @@ class Bookmark(Base):
     tags = Column(ARRAY(String))
     category = Column(String(100))
     read_count = Column(Integer, default=0, nullable=False)
-    is_public = Column(Boolean, default=False, nullable=False)
\ No newline at end of file
+    is_public = Column(Boolean, default=False, nullable=False)
+    summary_prompt_version = Column(String(32))  # 요약 생성에 사용한 프롬프트 버전 (prompt.conf 내용 해시)
+    summary_model = Column(String(100))  # 요약 생성에 사용한 모델
+    # 영어 제목을 아직 번역하지 않음 (요약 작업에서 '한글(English)' 형태로 바꾼 뒤 False)
+    title_translation_pending = Column(Boolean, default=False, nullable=False, server_default="false")
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from .user import Base
+
+class BookmarkEmbedding(Base):
+    """
+    북마크 임베딩 (북마크당 1건). vector = float32 리틀 엔디언 바이트 (dim * 4 bytes)
+    text_hash = 임베딩한 텍스트(제목+태그+요약) 해시: 같으면 다시 임베딩하지 않음
+    """
+    __tablename__ = "bookmark_embeddings"
+
+    bookmark_id = Column(UUID(as_uuid=True), ForeignKey("bookmarks.id", ondelete="CASCADE"), primary_key=True)
+    model = Column(String(100), nullable=False)  # 임베딩 모델 식별자 (예: ollama:nomic-embed-text, local:hash-512)
+    dim = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)
+    text_hash = Column(String(32), nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -0,0 +1,32 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from .user import Base
+
+class LlmCall(Base):
+    """
+    LLM 호출 1건의 지표 (Ollama 응답의 토큰 수/시간 + 클라이언트 측 지연/대기 시간).
+    시간 값은 모두 밀리초. outcome: ok, error, timeout, cancelled
+    """
+    __tablename__ = "llm_calls"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    model = Column(String(100), nullable=False)
+    endpoint = Column(String(255))
+    purpose = Column(String(20), nullable=False)  # summary, summary_map, translate, warmup
+    job_id = Column(UUID(as_uuid=True))  # 요약 작업에서 호출한 경우 summary_jobs.id
+    queue_wait_ms = Column(Integer)  # 요약 작업 적재 → 실행 시작 대기 시간
+    prompt_eval_count = Column(Integer)
+    eval_count = Column(Integer)
+    eval_duration_ms = Column(Integer)
+    load_duration_ms = Column(Integer)
+    latency_ms = Column(Integer, nullable=False)  # 요청 전송 → 응답 완료 (클라이언트 측)
+    outcome = Column(String(16), nullable=False)
+    error = Column(String(255))
+
+    __table_args__ = (
+        Index("idx_llm_calls_created_at", "created_at"),
+        Index("idx_llm_calls_model_created_at", "model", "created_at"),
+    )
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+
+from .user import Base
+
+class ResummarizeRun(Base):
+    """
+    일괄 재요약 실행 (필터로 고른 북마크를 속도 제한을 두고 요약 큐에 적재).
+    status: pending, running, paused, done, cancelled, failed
+    cursor_created_at/cursor_id: 마지막으로 적재한 북마크 위치 (중단 후 이어서 실행)
+    """
+    __tablename__ = "resummarize_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    status = Column(String(20), nullable=False, default="pending")
+    # 대상 필터 (None이면 조건 없음)
+    model_filter = Column(String(100))
+    prompt_version_filter = Column(String(32))
+    outdated_only = Column(Boolean, default=False, nullable=False)  # 현재 프롬프트 버전이 아닌 요약만
+    category_filter = Column(String(100))
+    created_from = Column(DateTime)
+    created_to = Column(DateTime)
+    # 실행 설정
+    target_model = Column(String(100))  # 재요약 모델 (None이면 북마크의 기존 모델 또는 기본 모델)
+    rate = Column(Float, nullable=False)  # 초당 적재 작업 수
+    batch_size = Column(Integer, nullable=False)
+    max_pending = Column(Integer, nullable=False)  # 이 실행의 대기 작업이 이 수 이상이면 적재 일시 중지
+    # 진행 상황
+    total = Column(Integer, default=0, nullable=False)
+    enqueued = Column(Integer, default=0, nullable=False)
+    cursor_created_at = Column(DateTime)
+    cursor_id = Column(UUID(as_uuid=True))
+    created_by = Column(String(50))
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+    finished_at = Column(DateTime)
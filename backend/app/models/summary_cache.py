@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, ARRAY
+from datetime import datetime
+
+from .user import Base
+
+class SummaryCache(Base):
+    """요약 결과 메모 테이블. key = sha256(정규화된 본문, 모델, 프롬프트 버전)"""
+    __tablename__ = "summary_cache"
+
+    key = Column(String(64), primary_key=True)
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(String(32), nullable=False)
+    summary = Column(Text, nullable=False)
+    category = Column(String(100))
+    tags = Column(ARRAY(String))
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_hit_at = Column(DateTime)
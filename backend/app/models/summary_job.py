@@ -0,0 +1,49 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+
+from .user import Base
+
+class SummaryJob(Base):
+    """
+    요약 작업 큐 (API 서버와 워커 프로세스가 공유).
+    status: pending, running, done, failed, superseded(같은 북마크의 새 작업으로 대체), cancelled(북마크 삭제)
+    북마크당 pending 작업은 최대 1개 (uq_summary_jobs_pending_bookmark)
+    lane: interactive(등록/수동 재요약) | bulk(일괄 재요약, 복구). user_id/cost는 사용자별 공정 분배용
+    route_reason: 북마크 등록 시 모델 자동 선택 결과 (model_router)
+    map_slots: 긴 문서 map 단계에서 작업 자신의 슬롯 외에 추가로 빌린 모델 슬롯 수 (모델별 동시 요청 상한에 합산)
+    heartbeat_at: 워커가 SUMMARY_JOB_HEARTBEAT_INTERVAL마다 갱신. SUMMARY_JOB_TIMEOUT 동안 갱신이 없으면 죽은 워커의 작업으로 보고 실패 처리
+    """
+    __tablename__ = "summary_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    bookmark_id = Column(UUID(as_uuid=True), ForeignKey("bookmarks.id", ondelete="CASCADE"), nullable=False, index=True)
+    model = Column(String(100))
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, default=0, nullable=False)
+    worker_id = Column(String(100))
+    error = Column(Text)
+    partial_summary = Column(Text)  # 스트리밍 중 생성된 중간 요약 (SSE 전송용)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))  # 북마크 등록 사용자
+    lane = Column(String(20), nullable=False, default="interactive", server_default="interactive")
+    cost = Column(Integer, nullable=False, default=1, server_default="1")  # 예상 처리 비용 (본문 청크 수)
+    route_reason = Column(String(30))  # 모델 선택 이유 (user, short, korean, queue_offload, long, default)
+    map_slots = Column(Integer, nullable=False, default=0, server_default="0")  # map 단계 추가 동시 요청 슬롯
+    run_id = Column(UUID(as_uuid=True), ForeignKey("resummarize_runs.id", ondelete="SET NULL"), index=True)  # 일괄 재요약으로 적재된 작업
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_summary_jobs_status_created_at", "status", "created_at"),
+        Index(
+            "uq_summary_jobs_pending_bookmark", "bookmark_id",
+            unique=True, postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "idx_summary_jobs_pending_lane_user", "model", "lane", "user_id", "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
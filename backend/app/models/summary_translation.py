@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+from .user import Base
+
+class SummaryTranslation(Base):
+    """
+    요약 번역 저장 테이블 (북마크/언어당 1건).
+    summary_version = 번역한 요약 본문 해시: 재요약/수정으로 요약이 바뀌면 다음 요청 때 다시 번역해 교체
+    """
+    __tablename__ = "summary_translations"
+
+    bookmark_id = Column(UUID(as_uuid=True), ForeignKey("bookmarks.id", ondelete="CASCADE"), primary_key=True)
+    lang = Column(String(10), primary_key=True)
+    summary_version = Column(String(32), nullable=False)
+    translated_summary = Column(Text, nullable=False)
+    model = Column(String(100), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
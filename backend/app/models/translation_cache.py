@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from datetime import datetime
+
+from .user import Base
+
+class TranslationCache(Base):
+    """번역 결과 메모 테이블. key = sha256(정규화된 원문, 원문 언어, 목표 언어, 모델)"""
+    __tablename__ = "translation_cache"
+
+    key = Column(String(64), primary_key=True)
+    source_lang = Column(String(10), nullable=False)
+    target_lang = Column(String(10), nullable=False)
+    model = Column(String(100), nullable=False)
+    source_text = Column(Text, nullable=False)
+    translated_text = Column(Text, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_hit_at = Column(DateTime)
@@ -0,0 +1,148 @@
+"""
+일괄 재요약 CLI
+
+실행 방법 (backend 디렉터리에서):
+  # 이전 프롬프트로 만든 요약 전체를 초당 2건씩 재요약
+  python -m app.resummarize --outdated --rate 2
+  # 특정 모델/분류/기간만 대상 수 확인
+  python -m app.resummarize --model gpt-oss:120b-cloud --category 블로그 --from 2026-01-01 --to 2026-07-01 --dry-run
+  # 중단된 실행을 마지막 위치부터 재개
+  python -m app.resummarize --resume <run_id>
+
+적재만 담당하므로 요약은 워커(API 내장 워커 또는 python -m app.worker)가 처리합니다.
+Ctrl+C / SIGTERM 시 현재 배치까지 적재하고 paused 상태로 저장합니다.
+"""
+from datetime import datetime
+import argparse
+import logging
+import signal
+import sys
+import threading
+
+from app.core.config import settings
+from app.core.logging import setup_root_logger
+from app.db.schema_updates import apply_column_updates
+from app.db.session import SessionLocal, engine
+from app.models import Base
+from app.models.resummarize_run import ResummarizeRun
+from app.tasks.resummarize import (
+    RUN_FAILED, build_run, count_targets, create_run, get_run_progress, run_resummarize,
+)
+
+logger = logging.getLogger("app.resummarize")
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _format_progress(progress: dict) -> str:
+    eta = progress["eta_seconds"]
+    eta_text = f"{eta // 60}분 {eta % 60}초" if eta is not None else "-"
+    return (
+        f"[{progress['status']}] 적재 {progress['enqueued']}/{progress['total']}, "
+        f"완료 {progress['done']}, 실패 {progress['failed']}, 대기 {progress['pending']}, "
+        f"처리량 {progress['throughput_per_minute']}건/분, ETA {eta_text}"
+    )
+
+
+def _report_loop(run_id, stop: threading.Event, interval: float):
+    """진행 상황을 주기적으로 출력"""
+    while not stop.wait(interval):
+        db = SessionLocal()
+        try:
+            run = db.query(ResummarizeRun).filter(ResummarizeRun.id == run_id).first()
+            if run:
+                logger.info(_format_progress(get_run_progress(db, run)))
+        except Exception as e:
+            logger.debug(f"진행 상황 조회 실패: {e}")
+        finally:
+            db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LinkDigest 일괄 재요약")
+    parser.add_argument("--resume", metavar="RUN_ID", help="중단된 실행을 마지막 위치부터 재개")
+    parser.add_argument("--model", help="기존 요약에 사용된 모델")
+    parser.add_argument("--prompt-version", help="기존 요약의 프롬프트 버전")
+    parser.add_argument("--outdated", action="store_true", help="현재 프롬프트 버전이 아닌 요약만")
+    parser.add_argument("--category", help="분류")
+    parser.add_argument("--from", dest="created_from", type=_parse_date, help="등록일 시작 (YYYY-MM-DD, 이상)")
+    parser.add_argument("--to", dest="created_to", type=_parse_date, help="등록일 끝 (YYYY-MM-DD, 미만)")
+    parser.add_argument("--target-model", help="재요약에 사용할 모델 (미지정 시 기존 모델)")
+    parser.add_argument(
+        "--rate", type=float, default=settings.RESUMMARIZE_DEFAULT_RATE,
+        help=f"초당 큐 적재 수 (기본값: {settings.RESUMMARIZE_DEFAULT_RATE})",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.RESUMMARIZE_BATCH_SIZE, help="배치 크기")
+    parser.add_argument("--max-pending", type=int, default=settings.RESUMMARIZE_MAX_PENDING, help="대기 작업 상한")
+    parser.add_argument("--dry-run", action="store_true", help="대상 수만 출력")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="진행 상황 출력 간격(초)")
+    args = parser.parse_args(argv)
+    if args.target_model and args.target_model.strip() not in settings.OLLAMA_SUMMARY_MODEL_LIST:
+        parser.error(
+            f"--target-model은 요약 모델 목록 중 하나여야 합니다: {', '.join(settings.OLLAMA_SUMMARY_MODEL_LIST)}"
+        )
+
+    setup_root_logger()
+    Base.metadata.create_all(bind=engine)
+    apply_column_updates(engine)
+
+    db = SessionLocal()
+    try:
+        if args.resume:
+            run_id = args.resume
+        else:
+            params = dict(
+                model=args.model,
+                prompt_version=args.prompt_version,
+                outdated_only=args.outdated,
+                category=args.category,
+                created_from=args.created_from,
+                created_to=args.created_to,
+                target_model=args.target_model,
+                rate=args.rate,
+                batch_size=args.batch_size,
+                max_pending=args.max_pending,
+                created_by="cli",
+            )
+            if args.dry_run:
+                print(f"대상 북마크: {count_targets(db, build_run(**params))}건")
+                return 0
+            run = create_run(db, **params)
+            run_id = run.id
+            print(f"재요약 실행 생성: {run_id} (대상 {run.total}건) - 중단 시 --resume {run_id}")
+    finally:
+        db.close()
+
+    stop = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info(f"종료 신호 수신 ({signum}) - 현재 배치까지 적재 후 일시 중지합니다.")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    reporter_stop = threading.Event()
+    reporter = threading.Thread(
+        target=_report_loop, args=(run_id, reporter_stop, args.report_interval), daemon=True
+    )
+    reporter.start()
+    final_status = run_resummarize(run_id, stop)
+    reporter_stop.set()
+
+    if final_status is None:
+        print("실행할 수 없습니다 (다른 곳에서 실행 중이거나 이미 종료된 실행).")
+        return 1
+    db = SessionLocal()
+    try:
+        run = db.query(ResummarizeRun).filter(ResummarizeRun.id == run_id).first()
+        print(_format_progress(get_run_progress(db, run)))
+    finally:
+        db.close()
+    return 1 if final_status == RUN_FAILED else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,6 +56,21 @@ class BookmarkResponse(BaseModel):
     tags: Optional[List[str]]
     read_count: int
     is_public: Optional[bool] = False
+    summary_prompt_version: Optional[str] = None  # 요약에 사용한 프롬프트 버전
+    title_translation_pending: bool = False  # 영어 제목 번역 대기 중 (완료 시 '한글(English)' 형태로 변경)
+
+class SemanticSearchItem(BookmarkResponse):
+    score: float  # 검색어와의 코사인 유사도
+
+class SemanticSearchResponse(BaseModel):
+    query: str
+    items: List[SemanticSearchItem]
+    total: int
+
+class RelatedBookmarksResponse(BaseModel):
+    bookmark_id: UUID
+    items: List[SemanticSearchItem]  # score: 기준 북마크와의 코사인 유사도
+    total: int
 
 class BookmarkListResponse(BaseModel):
     items: List[BookmarkResponse]
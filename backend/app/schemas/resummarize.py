@@ -0,0 +1,17 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+class ResummarizeRequest(BaseModel):
+    """일괄 재요약 요청 (필터는 모두 선택, 지정한 조건을 모두 만족하는 북마크 대상)"""
+    model: Optional[str] = Field(None, description="기존 요약에 사용된 모델")
+    prompt_version: Optional[str] = Field(None, description="기존 요약의 프롬프트 버전")
+    outdated_only: bool = Field(False, description="현재 프롬프트 버전이 아닌 요약만")
+    category: Optional[str] = Field(None, description="분류")
+    created_from: Optional[datetime] = Field(None, description="등록일 시작 (이상)")
+    created_to: Optional[datetime] = Field(None, description="등록일 끝 (미만)")
+    target_model: Optional[str] = Field(None, description="재요약에 사용할 모델 (미지정 시 기존 모델)")
+    rate: Optional[float] = Field(None, gt=0, description="초당 큐 적재 수")
+    batch_size: Optional[int] = Field(None, gt=0, le=500, description="배치 크기")
+    max_pending: Optional[int] = Field(None, gt=0, description="대기 작업 상한")
+    dry_run: bool = Field(False, description="대상 수만 집계하고 실행하지 않음")
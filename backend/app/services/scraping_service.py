@@ -2,11 +2,12 @@ from bs4 import BeautifulSoup, NavigableString
 import requests
 import logging
 from urllib.parse import urlparse, urljoin, parse_qs
-from typing import Dict, Optional, Tuple, List
+from typing import Callable, ContextManager, Dict, Optional, Tuple, List
 import re
 import urllib3
 from ..utils.summerise_openai import summarize_article
-from ..utils.translate import translate_text, detect_language
+from ..utils.translate import bilingual_title, translate_text, detect_language
+from ..utils.ollama_pool import RequestCancelled
 
 logger = logging.getLogger(__name__)
 
@@ -196,8 +197,12 @@ class ScrapingService:
         return domain.replace('www.', '')
 
 
-    def scrape(self, url: str) -> Dict[str, str]:
-        """URL에서 컨텐츠를 스크랩"""
+    def scrape(self, url: str, translate_title: bool = True) -> Dict[str, str]:
+        """
+        URL에서 컨텐츠를 스크랩.
+        translate_title=False면 외국어(영어/일본어/중국어 등) 제목을 번역하지 않고 title_needs_translation=True로 표시
+        (요약 호출에서 제목 번역을 함께 처리하는 경우)
+        """
         try:
             url = self._normalize_boannews_url(url)
             response = requests.get(url, headers=self.headers, timeout=10)
@@ -205,17 +210,20 @@ class ScrapingService:
             soup = BeautifulSoup(response.text, 'html.parser')
 
             title = self._extract_title(soup)
-            
-            # title이 있으면 영어인 경우에만 한글로 번역하여 한글(영문) 형태로 변환
-            if title:
+            title_needs_translation = False
+
+            if title and not translate_title:
+                title_needs_translation = detect_language(title) != 'ko'
+            # title이 있으면 한국어가 아닌 경우에만 한글로 번역하여 한글(원문) 형태로 변환
+            elif title:
                 try:
                     detected_lang = detect_language(title)
-                    # 영어인 경우에만 한글로 번역
-                    if detected_lang == 'en':
-                        translated_title = translate_text(title, source_lang='en', target_lang='ko')
+                    # 한국어가 아닌 경우에만 한글로 번역 (감지한 언어를 원본 언어로 지정)
+                    if detected_lang != 'ko':
+                        translated_title = translate_text(title, source_lang=detected_lang, target_lang='ko')
                         # 번역 성공 시 한글(영문) 형태로 변환
                         if translated_title and translated_title != title:
-                            title = f"{translated_title}({title})"
+                            title = bilingual_title(title, translated_title)
                             logger.info(f"제목 번역 완료: {title}")
                     # 한글인 경우는 그대로 유지
                     else:
@@ -230,7 +238,8 @@ class ScrapingService:
                 'title': title,
                 'content': content,
                 'source_name': source_name,
-                'reference_links': reference_links
+                'reference_links': reference_links,
+                'title_needs_translation': title_needs_translation,
             }
 
         except Exception as e:
@@ -239,13 +248,32 @@ class ScrapingService:
                 'title': '',
                 'content': '',
                 'source_name': '',
-                'reference_links': []
+                'reference_links': [],
+                'title_needs_translation': False,
             }
 
-def generate_summary(text: str, model: str = None) -> str:
-    """텍스트 요약 생성 (model 미지정 시 기본 모델 사용)."""
+def generate_summary(
+    text: str,
+    model: str = None,
+    on_partial: Optional[Callable[[str], None]] = None,
+    structured: bool = False,
+    translate_title: Optional[str] = None,
+    cancel_check: Optional[Callable[[], None]] = None,
+    map_slots: Optional[Callable[[str, int], ContextManager[int]]] = None,
+) -> str:
+    """
+    텍스트 요약 생성 (model 미지정 시 기본 모델 사용). on_partial 지정 시 스트리밍 중간 결과 전달.
+    structured=True면 JSON(category/keywords/summary) 문자열 반환.
+    translate_title 지정 시(structured=True) 같은 호출에서 한국어 제목(title)도 함께 생성.
+    cancel_check/map_slots: 긴 문서 map 단계의 작업 취소 확인과 추가 동시 요청 슬롯 (summarize_article 참고)
+    """
     try:
-        return summarize_article(text, model=model)
+        return summarize_article(
+            text, model=model, on_partial=on_partial, structured=structured, translate_title=translate_title,
+            cancel_check=cancel_check, map_slots=map_slots,
+        )
+    except RequestCancelled:
+        raise
     except Exception as e:
         logger.error(f"요약 생성 실패: {str(e)}")
         return "" 
\ No newline at end of file
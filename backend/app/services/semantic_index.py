@@ -0,0 +1,447 @@
+"""
+의미 검색용 메모리 인덱스 (프로세스당 1개)
+
+- bookmark_embeddings의 현재 모델(embedding_model_id) 벡터를 정규화된 float32 행렬 하나로 메모리에 유지하고
+  검색은 행렬-벡터 곱(코사인 유사도) 한 번 + argpartition으로 상위 k개 선택
+- 행렬은 용량을 2배씩 늘려 두고 추가/교체/삭제를 행 단위로 반영 (삭제는 마지막 행을 빈자리로 옮김)
+- 동기화:
+  * 같은 프로세스의 임베딩 작업은 저장 직후 upsert로 바로 반영
+  * 검색 때마다 updated_at이 마지막으로 본 시각 이후인 행만 읽어 반영 (다른 프로세스/워커에서 만든 임베딩)
+  * SEMANTIC_INDEX_REFRESH_SECONDS마다 ID/소유자/공개 여부만 전체 조회해 삭제된 북마크 제거, 공개 여부 갱신,
+    누락된 벡터 보충
+- 소유자/공개 여부로 검색 전에 거르고(본인 + 공개), 응답 직전에 DB의 _visible_to_user_filter로 한 번 더 확인
+- 관련 글(related)은 같은 행렬 위의 IVF 근사 최근접 탐색:
+  * 항목 수가 ANN_IVF_MIN_SIZE 이상이면 표본으로 구면 k-means 중심(ANN_IVF_LISTS, 0이면 √N개)을 학습하고
+    행마다 가장 가까운 중심 번호를 유지 (추가/교체 시 바로 배정, 삭제 시 행과 함께 이동)
+  * 조회는 기준 벡터와 가까운 중심 ANN_IVF_NPROBE개에 배정된 행만 정확히 비교 (미학습 상태는 전체 비교)
+  * 항목 수가 학습 시점의 2배가 되면 다시 학습
+- ANN_INDEX_PATH에 행렬/ID/공개 여부/중심/기준 시각을 저장해 재시작 시 DB 전체 로드와 재학습 없이 복원하고
+  기준 시각 이후 변경분 + 전체 재확인으로 따라잡음 (변경이 있으면 ANN_INDEX_SAVE_INTERVAL마다, 종료 시 저장)
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import logging
+import os
+import threading
+import time
+import uuid as uuid_module
+
+import numpy as np
+
+from ..core.config import settings
+from ..models.bookmark import Bookmark
+from ..models.bookmark_embedding import BookmarkEmbedding
+from ..utils.embeddings import embedding_model_id, from_bytes
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 256
+# k-means 학습 표본: 중심 1개당 행 수
+_TRAIN_POINTS_PER_LIST = 64
+# 중심 배정 시 한 번에 곱하는 행 수
+_ASSIGN_CHUNK = 8192
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """행별로 내적(코사인 유사도)이 가장 큰 중심 번호"""
+    assign = np.empty(vectors.shape[0], dtype=np.int32)
+    for start in range(0, vectors.shape[0], _ASSIGN_CHUNK):
+        chunk = vectors[start:start + _ASSIGN_CHUNK]
+        assign[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assign
+
+
+def train_centroids(sample: np.ndarray, nlist: int, iterations: int, seed: int = 0) -> np.ndarray:
+    """정규화된 표본으로 구면 k-means 중심 학습 (빈 클러스터는 임의의 표본으로 다시 시작)"""
+    rng = np.random.default_rng(seed)
+    nlist = max(1, min(nlist, sample.shape[0]))
+    centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+    for _ in range(max(1, iterations)):
+        assign = _nearest_centroids(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            sums[empty] = sample[rng.choice(sample.shape[0], len(empty), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = (sums / np.where(norms > 0, norms, 1.0)).astype(np.float32)
+    return centroids
+
+
+class SemanticIndex:
+    """북마크 ID ↔ 행 번호 매핑 + 정규화 벡터 행렬 + 소유자/공개 여부 배열"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, model: Optional[str]):
+        self.model = model
+        self.dim: Optional[int] = None
+        self._size = 0
+        self._ids: List = []
+        self._pos: Dict = {}
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._owners = np.zeros(0, dtype=np.int32)
+        self._public = np.zeros(0, dtype=bool)
+        self._owner_codes: Dict = {}
+        self._watermark: Optional[datetime] = None
+        self._last_full: Optional[float] = None
+        # IVF: 중심 행렬과 행별 배정 중심 번호 (-1: 미배정)
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        # 저장 상태
+        self._dirty = False
+        self._saving = False
+        self._last_save: Optional[float] = None
+        self._saved_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _owner_code(self, owner_id) -> int:
+        code = self._owner_codes.get(owner_id)
+        if code is None:
+            code = self._owner_codes[owner_id] = len(self._owner_codes)
+        return code
+
+    def _grow(self, dim: int):
+        capacity = max(_INITIAL_CAPACITY, len(self._ids) * 2, self._matrix.shape[0] * 2)
+        matrix = np.zeros((capacity, dim), dtype=np.float32)
+        owners = np.full(capacity, -1, dtype=np.int32)
+        public = np.zeros(capacity, dtype=bool)
+        assign = np.full(capacity, -1, dtype=np.int32)
+        if self._size:
+            matrix[:self._size] = self._matrix[:self._size]
+            owners[:self._size] = self._owners[:self._size]
+            public[:self._size] = self._public[:self._size]
+            assign[:self._size] = self._assign[:self._size]
+        self._matrix, self._owners, self._public, self._assign = matrix, owners, public, assign
+
+    def _upsert_locked(self, bookmark_id, vector: np.ndarray, owner_id, is_public: bool) -> bool:
+        if self.dim is None:
+            self.dim = int(vector.shape[0])
+        if vector.shape[0] != self.dim:
+            logger.warning(f"임베딩 차원 불일치로 인덱스 반영 생략 - 북마크 ID: {bookmark_id} ({vector.shape[0]} != {self.dim})")
+            return False
+        row = self._pos.get(bookmark_id)
+        if row is None:
+            if self._size >= self._matrix.shape[0] or self._matrix.shape[1] != self.dim:
+                self._grow(self.dim)
+            row = self._size
+            self._size += 1
+            self._ids.append(bookmark_id)
+            self._pos[bookmark_id] = row
+        self._matrix[row] = vector
+        self._owners[row] = self._owner_code(owner_id)
+        self._public[row] = bool(is_public)
+        if self._centroids is not None:
+            self._assign[row] = _nearest_centroids(self._matrix[row:row + 1], self._centroids)[0]
+        else:
+            self._assign[row] = -1
+        self._dirty = True
+        return True
+
+    def _remove_locked(self, bookmark_id) -> bool:
+        row = self._pos.pop(bookmark_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._owners[row] = self._owners[last]
+            self._public[row] = self._public[last]
+            self._assign[row] = self._assign[last]
+            self._ids[row] = moved
+            self._pos[moved] = row
+        self._ids.pop()
+        self._size = last
+        self._dirty = True
+        return True
+
+    def upsert(self, bookmark_id, vector: np.ndarray, owner_id, is_public: bool, model: Optional[str] = None):
+        """벡터 추가/교체 (다른 모델의 벡터는 무시. 인덱스가 아직 로드되지 않았으면 다음 동기화 때 로드)"""
+        with self._lock:
+            if self.model is None or (model or embedding_model_id()) != self.model:
+                return
+            self._upsert_locked(bookmark_id, vector, owner_id, is_public)
+
+    def remove(self, bookmark_id):
+        with self._lock:
+            self._remove_locked(bookmark_id)
+
+    def _query(self, db, model: str):
+        return (
+            db.query(
+                BookmarkEmbedding.bookmark_id, BookmarkEmbedding.vector, BookmarkEmbedding.updated_at,
+                Bookmark.user_id, Bookmark.is_public,
+            )
+            .join(Bookmark, Bookmark.id == BookmarkEmbedding.bookmark_id)
+            .filter(BookmarkEmbedding.model == model, Bookmark.is_deleted == False)
+        )
+
+    def _apply_rows(self, rows):
+        with self._lock:
+            for row in rows:
+                self._upsert_locked(row.bookmark_id, from_bytes(row.vector), row.user_id, row.is_public)
+                if self._watermark is None or row.updated_at > self._watermark:
+                    self._watermark = row.updated_at
+
+    def sync(self, db, force_full: bool = False):
+        """DB 변경분 반영 (모델이 바뀌었으면 처음부터 다시 로드)"""
+        model = embedding_model_id()
+        with self._sync_lock:
+            if model != self.model:
+                with self._lock:
+                    self._reset(model)
+                    self._restore_locked(model)
+            query = self._query(db, model)
+            # 같은 시각에 저장된 행을 놓치지 않도록 마지막 시각 포함 (다시 반영해도 결과 같음)
+            if self._watermark is not None:
+                query = query.filter(BookmarkEmbedding.updated_at >= self._watermark)
+            loaded_all = self._watermark is None
+            self._apply_rows(query.all())
+
+            now = time.monotonic()
+            if loaded_all:
+                self._last_full = now
+            elif force_full or self._last_full is None or now - self._last_full >= settings.SEMANTIC_INDEX_REFRESH_SECONDS:
+                self._refresh_membership(db, model)
+                self._last_full = now
+            self._maybe_train()
+            self._maybe_save()
+
+    def _refresh_membership(self, db, model: str):
+        """ID/소유자/공개 여부 전체 확인: 삭제된 북마크 제거, 공개 여부 변경 반영, 누락된 벡터 보충"""
+        rows = (
+            db.query(BookmarkEmbedding.bookmark_id, Bookmark.user_id, Bookmark.is_public)
+            .join(Bookmark, Bookmark.id == BookmarkEmbedding.bookmark_id)
+            .filter(BookmarkEmbedding.model == model, Bookmark.is_deleted == False)
+            .all()
+        )
+        present = {row.bookmark_id for row in rows}
+        missing = []
+        with self._lock:
+            for bookmark_id in [bid for bid in self._ids if bid not in present]:
+                self._remove_locked(bookmark_id)
+            for row in rows:
+                index = self._pos.get(row.bookmark_id)
+                if index is None:
+                    missing.append(row.bookmark_id)
+                    continue
+                owner, is_public = self._owner_code(row.user_id), bool(row.is_public)
+                if self._owners[index] != owner or self._public[index] != is_public:
+                    self._owners[index] = owner
+                    self._public[index] = is_public
+                    self._dirty = True
+        if missing:
+            self._apply_rows(self._query(db, model).filter(BookmarkEmbedding.bookmark_id.in_(missing)).all())
+
+    def _top_locked(self, query: np.ndarray, rows: Optional[np.ndarray], owner_id, limit: int, min_score: float,
+                    exclude: Optional[int] = None) -> List[Tuple[object, float]]:
+        """rows(None이면 전체) 중 본인 소유 또는 공개 행의 코사인 유사도 상위 limit개"""
+        n = self._size
+        if rows is None:
+            rows = np.arange(n)
+            scores = self._matrix[:n] @ query
+        else:
+            scores = self._matrix[rows] @ query
+        if len(rows) == 0:
+            return []
+        owner = self._owner_codes.get(owner_id, -2)
+        mask = (self._public[rows] | (self._owners[rows] == owner)) & (scores >= min_score)
+        if exclude is not None:
+            mask &= rows != exclude
+        scores = np.where(mask, scores, -np.inf)
+        k = min(limit, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+    def search(self, query: np.ndarray, owner_id, limit: int, min_score: float = -1.0) -> List[Tuple[object, float]]:
+        """본인 소유 또는 공개 북마크 중 코사인 유사도 상위 limit개 [(북마크 ID, 점수)] (점수 내림차순)"""
+        with self._lock:
+            if self._size == 0 or limit <= 0 or query.shape[0] != self.dim:
+                return []
+            return self._top_locked(query.astype(np.float32, copy=False), None, owner_id, limit, min_score)
+
+    def related(self, bookmark_id, owner_id, limit: int, min_score: float = -1.0) -> List[Tuple[object, float]]:
+        """
+        북마크와 가까운 본인 소유 또는 공개 북마크 상위 limit개 [(북마크 ID, 점수)] (자기 자신 제외).
+        IVF 학습 후에는 가까운 중심 ANN_IVF_NPROBE개의 행만 비교하는 근사 결과. 인덱스에 없는 북마크는 []
+        """
+        with self._lock:
+            row = self._pos.get(bookmark_id)
+            if row is None or limit <= 0:
+                return []
+            query = self._matrix[row].copy()
+            rows = None
+            if self._centroids is not None:
+                nprobe = max(1, min(settings.ANN_IVF_NPROBE, self._centroids.shape[0]))
+                probe = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+                # 미배정(-1) 행도 후보에 포함
+                rows = np.flatnonzero(np.isin(self._assign[:self._size], np.append(probe, -1)))
+            return self._top_locked(query, rows, owner_id, limit, min_score, exclude=row)
+
+    def _maybe_train(self):
+        """항목 수가 ANN_IVF_MIN_SIZE 이상이고 미학습이거나 학습 시점의 2배가 되면 IVF 중심 (재)학습"""
+        with self._lock:
+            n = self._size
+            if n < max(1, settings.ANN_IVF_MIN_SIZE):
+                return
+            if self._centroids is not None and n < self._trained_size * 2:
+                return
+            nlist = settings.ANN_IVF_LISTS or int(round(np.sqrt(n)))
+            nlist = max(1, min(nlist, n))
+            rng = np.random.default_rng(n)
+            sample_rows = rng.choice(n, min(n, nlist * _TRAIN_POINTS_PER_LIST), replace=False)
+            sample = self._matrix[sample_rows].copy()
+            model = self.model
+        started = time.monotonic()
+        centroids = train_centroids(sample, nlist, settings.ANN_IVF_ITERATIONS)
+        with self._lock:
+            if self.model != model or centroids.shape[1] != self.dim:
+                return
+            self._centroids = centroids
+            self._assign[:self._size] = _nearest_centroids(self._matrix[:self._size], centroids)
+            self._trained_size = self._size
+            self._dirty = True
+        logger.info(
+            f"IVF 인덱스 학습 - 항목 {n}건, 중심 {nlist}개, 표본 {len(sample_rows)}건 "
+            f"({time.monotonic() - started:.2f}초)"
+        )
+
+    def _restore_locked(self, model: str, path: Optional[str] = None) -> bool:
+        """저장 파일이 같은 모델이면 복원 (기준 시각 이후 변경분과 삭제/공개 여부는 다음 동기화에서 반영)"""
+        path = path if path is not None else settings.ANN_INDEX_PATH
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["model"]) != model:
+                    logger.info(f"의미 검색 인덱스 파일 모델 불일치로 복원 생략 ({data['model']} != {model})")
+                    return False
+                ids = [uuid_module.UUID(bid) for bid in data["ids"]]
+                owners = [uuid_module.UUID(owner) for owner in data["owners"]]
+                matrix = data["matrix"].astype(np.float32, copy=False)
+                public = data["public"].astype(bool)
+                assign = data["assign"].astype(np.int32)
+                centroids = data["centroids"].astype(np.float32)
+                trained_size = int(data["trained_size"])
+                watermark = str(data["watermark"])
+        except Exception as e:
+            logger.warning(f"의미 검색 인덱스 파일 복원 실패 ({path}): {e}")
+            return False
+
+        n = len(ids)
+        self.dim = int(matrix.shape[1]) if n else None
+        self._ids = ids
+        self._pos = {bid: row for row, bid in enumerate(ids)}
+        if n:
+            self._grow(self.dim)
+            self._matrix[:n] = matrix
+            self._public[:n] = public
+            self._assign[:n] = assign
+            self._owners[:n] = [self._owner_code(owner) for owner in owners]
+        self._size = n
+        if centroids.size and centroids.shape[1] == self.dim:
+            self._centroids = centroids
+            self._trained_size = trained_size
+        else:
+            self._assign[:n] = -1
+        self._watermark = datetime.fromisoformat(watermark) if watermark else None
+        # 저장 이후 삭제/공개 여부 변경은 다음 동기화의 전체 재확인으로 반영
+        self._last_full = None
+        self._dirty = False
+        logger.info(f"의미 검색 인덱스 복원 - {n}건 (모델: {model}, 기준 시각: {watermark or '-'})")
+        return True
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """인덱스를 ANN_INDEX_PATH에 저장 (임시 파일에 쓴 뒤 교체). 로드 전이거나 경로가 없으면 False"""
+        path = path if path is not None else settings.ANN_INDEX_PATH
+        with self._lock:
+            if not path or self.model is None:
+                return False
+            n = self._size
+            owners_by_code = {code: owner for owner, code in self._owner_codes.items()}
+            data = {
+                "model": np.array(self.model),
+                "ids": np.array([str(bid) for bid in self._ids], dtype=str),
+                "owners": np.array([str(owners_by_code[code]) for code in self._owners[:n]], dtype=str),
+                "matrix": self._matrix[:n].copy(),
+                "public": self._public[:n].copy(),
+                "assign": self._assign[:n].copy(),
+                "centroids": self._centroids if self._centroids is not None else np.zeros((0, 0), dtype=np.float32),
+                "trained_size": np.array(self._trained_size),
+                "watermark": np.array(self._watermark.isoformat() if self._watermark else ""),
+            }
+            self._dirty = False
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"의미 검색 인덱스 저장 실패 ({path}): {e}")
+            with self._lock:
+                self._dirty = True
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        with self._lock:
+            self._last_save = time.monotonic()
+            self._saved_at = datetime.utcnow()
+        logger.info(f"의미 검색 인덱스 저장 - {n}건 ({path})")
+        return True
+
+    def save_if_dirty(self) -> bool:
+        return self._dirty and self.save()
+
+    def _maybe_save(self):
+        """변경이 있고 마지막 저장 후 ANN_INDEX_SAVE_INTERVAL이 지났으면 백그라운드 쓰레드에서 저장"""
+        if not settings.ANN_INDEX_PATH:
+            return
+        with self._lock:
+            if not self._dirty or self._saving:
+                return
+            if self._last_save is not None and time.monotonic() - self._last_save < settings.ANN_INDEX_SAVE_INTERVAL:
+                return
+            self._saving = True
+        threading.Thread(target=self._save_in_background, name="semantic-index-save", daemon=True).start()
+
+    def _save_in_background(self):
+        try:
+            self.save()
+        finally:
+            with self._lock:
+                self._saving = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "model": self.model or embedding_model_id(),
+                "dim": self.dim,
+                "size": self._size,
+                "capacity": int(self._matrix.shape[0]),
+                "memory_bytes": int(self._matrix.nbytes),
+                "watermark": self._watermark.isoformat() if self._watermark else None,
+                "ivf": {
+                    "trained": self._centroids is not None,
+                    "lists": int(self._centroids.shape[0]) if self._centroids is not None else 0,
+                    "trained_size": self._trained_size,
+                    "nprobe": settings.ANN_IVF_NPROBE,
+                },
+                "saved_at": self._saved_at.isoformat() if self._saved_at else None,
+                "unsaved_changes": self._dirty,
+            }
+
+
+# 프로세스 전역 인덱스
+semantic_index = SemanticIndex()
@@ -0,0 +1,145 @@
+"""
+요약 결과 메모 캐시
+
+- 키: sha256(정규화된 본문, 모델, 프롬프트 버전). 같은 본문을 다시 등록하거나 재시도해도 LLM을 다시 호출하지 않음
+- 저장소: summary_cache 테이블(프로세스 간 공유) + 앞단의 프로세스 내 LRU (SUMMARY_CACHE_LRU_SIZE)
+- 적중/미스 지표는 프로세스 단위로 집계 (GET /api/summary-jobs/cache)
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.summary_cache import SummaryCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedSummary(NamedTuple):
+    summary: str
+    category: str
+    tags: List[str]
+
+
+def normalize_content(text: str) -> str:
+    """캐시 키용 본문 정규화: 유니코드 NFC, 공백/줄바꿈 연속을 공백 하나로, 앞뒤 공백 제거"""
+    if not text:
+        return ""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(content: str, model: str, prompt_version: str) -> str:
+    raw = "\x00".join([model or "", prompt_version or "", normalize_content(content)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SummaryCacheStore:
+    """summary_cache 테이블 앞단 LRU + 적중/미스 지표"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lru: "OrderedDict[str, CachedSummary]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.lru_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def _remember(self, key: str, value: CachedSummary):
+        if self.max_size <= 0:
+            return
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def get(self, db: Session, key: str) -> Optional[CachedSummary]:
+        """LRU → DB 순으로 조회. DB 적중 시 hit_count 갱신 후 LRU에 적재."""
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.lru_hits += 1
+                return value
+
+        row = db.query(SummaryCache).filter(SummaryCache.key == key).first()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        value = CachedSummary(row.summary, row.category or "", list(row.tags or []))
+        try:
+            row.hit_count = (row.hit_count or 0) + 1
+            row.last_hit_at = datetime.utcnow()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.debug(f"요약 캐시 적중 기록 실패 - key: {key[:12]}, 오류: {e}")
+        with self._lock:
+            self.db_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, db: Session, key: str, model: str, prompt_version: str, value: CachedSummary):
+        """요약 결과 저장 (같은 키가 이미 있으면 최신 결과로 교체)"""
+        stmt = insert(SummaryCache).values(
+            key=key,
+            model=model,
+            prompt_version=prompt_version,
+            summary=value.summary,
+            category=value.category,
+            tags=value.tags,
+            hit_count=0,
+            created_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SummaryCache.key],
+            set_={
+                "summary": stmt.excluded.summary,
+                "category": stmt.excluded.category,
+                "tags": stmt.excluded.tags,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"요약 캐시 저장 실패 - key: {key[:12]}, 오류: {e}")
+            return
+        with self._lock:
+            self.stores += 1
+            self._remember(key, value)
+
+    def stats(self, db: Optional[Session] = None) -> dict:
+        with self._lock:
+            hits = self.lru_hits + self.db_hits
+            lookups = hits + self.misses
+            result = {
+                "enabled": settings.SUMMARY_CACHE_ENABLED,
+                "lru_size": len(self._lru),
+                "lru_max_size": self.max_size,
+                "lru_hits": self.lru_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        if db is not None:
+            result["entries"] = db.query(func.count(SummaryCache.key)).scalar() or 0
+        return result
+
+
+# 프로세스 전역 캐시
+summary_cache = SummaryCacheStore(settings.SUMMARY_CACHE_LRU_SIZE)
@@ -0,0 +1,198 @@
+"""
+요약 번역 (GET /api/bookmarks/{id}/summary?lang=en)
+
+- 요약 본문 해시(summary_version)가 같으면 summary_translations에 저장된 번역을 그대로 반환 (LLM 호출 없음)
+- 저장된 번역이 없거나 요약이 바뀌었으면 TRANSLATE_MODEL로 한 번 번역해 (북마크, 언어) 행을 교체
+- 같은 (북마크, 언어, 요약 버전) 동시 요청은 프로세스 안에서 하나로 합침: 첫 요청만 번역하고 나머지는 결과를 기다림
+- 번역 실패는 저장하지 않음 (다음 요청에서 다시 번역)
+- 지표는 프로세스 단위로 집계 (GET /api/summary-jobs/translation-cache 의 summary_translations)
+"""
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+import hashlib
+import logging
+import threading
+
+from sqlalchemy.dialects.postgresql import insert
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.summary_translation import SummaryTranslation
+from ..utils.ollama_client import ollama_client
+from ..utils.translate import LANGUAGE_NAMES, detect_language
+from .summary_cache import normalize_content
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryTranslationError(Exception):
+    """요약 번역 실패 (번역 모델 오류/빈 응답)"""
+
+
+class TranslatedSummary(NamedTuple):
+    summary: str
+    summary_version: str
+    source_lang: str
+    cached: bool  # 저장된 번역 사용(또는 번역 불필요) 여부
+
+
+def summary_version(summary: str) -> str:
+    """요약 버전: 정규화된 요약 본문 sha256 앞 32자 (공백만 다른 요약은 같은 버전)"""
+    return hashlib.sha256(normalize_content(summary).encode("utf-8")).hexdigest()[:32]
+
+
+def _load_translation(bookmark_id, lang: str, version: str) -> Optional[str]:
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(SummaryTranslation.translated_summary)
+            .filter(
+                SummaryTranslation.bookmark_id == bookmark_id,
+                SummaryTranslation.lang == lang,
+                SummaryTranslation.summary_version == version,
+            )
+            .first()
+        )
+        return row.translated_summary if row is not None else None
+    finally:
+        db.close()
+
+
+def _store_translation(bookmark_id, lang: str, version: str, translated: str):
+    stmt = insert(SummaryTranslation).values(
+        bookmark_id=bookmark_id,
+        lang=lang,
+        summary_version=version,
+        translated_summary=translated,
+        model=settings.TRANSLATE_MODEL,
+        created_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SummaryTranslation.bookmark_id, SummaryTranslation.lang],
+        set_={
+            "summary_version": stmt.excluded.summary_version,
+            "translated_summary": stmt.excluded.translated_summary,
+            "model": stmt.excluded.model,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    db = SessionLocal()
+    try:
+        db.execute(stmt)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _translate_summary(summary: str, source_lang: str, target_lang: str) -> str:
+    """요약 마크다운 번역 (📌 항목/목록/줄바꿈 구조 유지)"""
+    source_name = LANGUAGE_NAMES.get(source_lang)
+    target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+    source_text = f"{source_name} markdown summary" if source_name else "markdown summary"
+    system_prompt = (
+        f"You are a professional translator. Translate the given {source_text} into {target_name}. "
+        "Keep the markdown structure, line breaks, list markers, emoji and URLs exactly as they are. "
+        "Provide only the translated text without any additional explanations or notes."
+    )
+    result = ollama_client.chat(
+        settings.TRANSLATE_MODEL,
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": summary},
+        ],
+        purpose="translate",
+    )
+    translated = (result.content or "").strip()
+    if not translated:
+        raise SummaryTranslationError("번역 모델 응답이 비어 있습니다.")
+    return translated
+
+
+class SummaryTranslator:
+    """요약 번역 조회/생성 + 동시 요청 합치기 (같은 키는 프로세스 안에서 한 번만 번역)"""
+
+    def __init__(self):
+        self._in_flight: Dict[Tuple[str, str, str], Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def translate(self, bookmark_id, summary: str, lang: str) -> TranslatedSummary:
+        """
+        요약을 lang으로 번역해 반환. 요약이 이미 lang이면 그대로 반환.
+        번역 실패 시 SummaryTranslationError (같은 번역을 기다리던 요청도 같은 오류)
+        """
+        version = summary_version(summary)
+        source_lang = detect_language(summary)
+        if source_lang == lang:
+            return TranslatedSummary(summary, version, source_lang, True)
+
+        stored = _load_translation(bookmark_id, lang, version)
+        if stored is not None:
+            with self._lock:
+                self.hits += 1
+            return TranslatedSummary(stored, version, source_lang, True)
+
+        key = (str(bookmark_id), lang, version)
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return TranslatedSummary(future.result(), version, source_lang, False)
+
+        try:
+            translated = self._translate_and_store(bookmark_id, summary, source_lang, lang, version)
+            future.set_result(translated)
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+            error = e if isinstance(e, SummaryTranslationError) else SummaryTranslationError(str(e))
+            future.set_exception(error)
+            logger.error(f"요약 번역 실패 - 북마크 ID: {bookmark_id}, 언어: {lang}, 오류: {e}")
+            raise error from e
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+        return TranslatedSummary(translated, version, source_lang, False)
+
+    def _translate_and_store(self, bookmark_id, summary: str, source_lang: str, lang: str, version: str) -> str:
+        # 조회 후 합치기 전에 다른 요청/프로세스가 저장했을 수 있으므로 한 번 더 확인
+        stored = _load_translation(bookmark_id, lang, version)
+        if stored is not None:
+            return stored
+        translated = _translate_summary(summary, source_lang, lang)
+        try:
+            _store_translation(bookmark_id, lang, version, translated)
+        except Exception as e:
+            # 저장 실패여도 번역 결과는 반환 (다음 요청에서 다시 번역)
+            logger.warning(f"요약 번역 저장 실패 - 북마크 ID: {bookmark_id}, 언어: {lang}, 오류: {e}")
+        logger.info(f"요약 번역 완료 - 북마크 ID: {bookmark_id}, {source_lang} -> {lang}")
+        return translated
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+                "in_flight": len(self._in_flight),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# 프로세스 전역 번역기
+summary_translator = SummaryTranslator()
@@ -0,0 +1,148 @@
+"""
+번역 결과 메모 캐시
+
+- 키: sha256(정규화된 원문, 원문 언어, 목표 언어, 번역 모델). 같은 기사 재등록, 여러 매체에 실린 같은 제목 등은
+  번역 모델을 다시 호출하지 않음
+- 저장소: translation_cache 테이블(프로세스 간 공유) + 앞단의 프로세스 내 LRU (TRANSLATION_CACHE_LRU_SIZE)
+- translate_text(translate_to_korean/translate_to_english 포함)에서 사용. 호출 측에 DB 세션이 없으므로 자체 세션 사용
+- 캐시 조회/저장 실패는 미스로 처리 (번역은 계속 진행)
+- 적중/미스 지표는 프로세스 단위로 집계 (GET /api/summary-jobs/translation-cache)
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+import hashlib
+import logging
+import threading
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.translation_cache import TranslationCache
+from .summary_cache import normalize_content
+
+logger = logging.getLogger(__name__)
+
+
+def make_translation_key(text: str, source_lang: str, target_lang: str, model: str) -> str:
+    raw = "\x00".join([source_lang or "", target_lang or "", model or "", normalize_content(text)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TranslationCacheStore:
+    """translation_cache 테이블 앞단 LRU + 적중/미스 지표"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lru: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.lru_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    def _remember(self, key: str, value: str):
+        if self.max_size <= 0:
+            return
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def get(self, text: str, source_lang: str, target_lang: str, model: str) -> Optional[str]:
+        """LRU → DB 순으로 조회. DB 적중 시 hit_count 갱신 후 LRU에 적재."""
+        key = make_translation_key(text, source_lang, target_lang, model)
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.lru_hits += 1
+                return value
+
+        db = SessionLocal()
+        try:
+            row = db.query(TranslationCache).filter(TranslationCache.key == key).first()
+            value = row.translated_text if row is not None else None
+            if row is not None:
+                row.hit_count = (row.hit_count or 0) + 1
+                row.last_hit_at = datetime.utcnow()
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.debug(f"번역 캐시 조회 실패 - key: {key[:12]}, 오류: {e}")
+            with self._lock:
+                self.errors += 1
+            value = None
+        finally:
+            db.close()
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.db_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, text: str, source_lang: str, target_lang: str, model: str, translated: str):
+        """번역 결과 저장 (같은 키가 이미 있으면 최신 결과로 교체)"""
+        key = make_translation_key(text, source_lang, target_lang, model)
+        stmt = insert(TranslationCache).values(
+            key=key,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            model=model,
+            source_text=text,
+            translated_text=translated,
+            hit_count=0,
+            created_at=datetime.utcnow(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TranslationCache.key],
+            set_={
+                "translated_text": stmt.excluded.translated_text,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        db = SessionLocal()
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"번역 캐시 저장 실패 - key: {key[:12]}, 오류: {e}")
+            with self._lock:
+                self.errors += 1
+            return
+        finally:
+            db.close()
+        with self._lock:
+            self.stores += 1
+            self._remember(key, translated)
+
+    def stats(self, db: Optional[Session] = None) -> dict:
+        with self._lock:
+            hits = self.lru_hits + self.db_hits
+            lookups = hits + self.misses
+            result = {
+                "enabled": settings.TRANSLATION_CACHE_ENABLED,
+                "lru_size": len(self._lru),
+                "lru_max_size": self.max_size,
+                "lru_hits": self.lru_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "errors": self.errors,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        if db is not None:
+            result["entries"] = db.query(func.count(TranslationCache.key)).scalar() or 0
+        return result
+
+
+# 프로세스 전역 캐시
+translation_cache = TranslationCacheStore(settings.TRANSLATION_CACHE_LRU_SIZE)
@@ -0,0 +1,184 @@
+"""
+북마크 임베딩 보강 작업 (요약 저장 후 실행)
+
+- 요약이 저장되거나 제목/태그/요약이 수정되면 이 모듈의 쓰레드 풀(EMBEDDING_CONCURRENCY)에서 임베딩을 계산해
+  bookmark_embeddings에 저장하고 같은 프로세스의 의미 검색 인덱스(semantic_index)에 바로 반영
+- 임베딩 텍스트(제목+태그+요약) 해시와 모델이 같으면 다시 계산하지 않음
+- 요약이 아직 없는 북마크('요약 생성 중...')는 건너뜀 (요약 저장 후 다시 제출됨)
+- 복구 스위퍼가 요약은 있는데 현재 모델 임베딩이 없는 북마크(기존 북마크, 프로세스 재시작, 모델 변경)를 보강
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Sequence, Set
+import logging
+import threading
+import uuid as uuid_module
+
+from sqlalchemy import or_, text
+from sqlalchemy.dialects.postgresql import insert
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..models.bookmark_embedding import BookmarkEmbedding
+from ..services.semantic_index import semantic_index
+from ..utils.embeddings import bookmark_embedding_text, embed_texts, embedding_model_id, text_hash, to_bytes
+from .summary_queue import SUMMARY_PLACEHOLDER
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock 키 (임베딩 스위프 전용)
+_SWEEP_LOCK_KEY = 7_302_049
+
+
+def _summary_ready():
+    return (Bookmark.summary.isnot(None)) & (Bookmark.summary != "") & (Bookmark.summary != SUMMARY_PLACEHOLDER)
+
+
+def embed_bookmarks(bookmark_ids: Sequence) -> int:
+    """북마크 임베딩 계산/저장 (바뀌지 않은 북마크는 건너뜀). 저장한 수 반환. 임베딩 요청 오류는 예외로 전달"""
+    ids = [uuid_module.UUID(bid) if isinstance(bid, str) else bid for bid in bookmark_ids]
+    if not ids:
+        return 0
+    model = embedding_model_id()
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(
+                Bookmark.id, Bookmark.title, Bookmark.tags, Bookmark.summary, Bookmark.user_id, Bookmark.is_public,
+                BookmarkEmbedding.model, BookmarkEmbedding.text_hash,
+            )
+            .outerjoin(BookmarkEmbedding, BookmarkEmbedding.bookmark_id == Bookmark.id)
+            .filter(Bookmark.id.in_(ids), Bookmark.is_deleted == False, _summary_ready())
+            .all()
+        )
+    finally:
+        db.close()
+
+    targets = []
+    for row in rows:
+        content = bookmark_embedding_text(row.title, row.tags, row.summary)
+        digest = text_hash(content)
+        if content and (row.model != model or row.text_hash != digest):
+            targets.append((row, content, digest))
+    if not targets:
+        return 0
+
+    vectors = embed_texts([content for _, content, _ in targets])
+    now = datetime.utcnow()
+    values = [
+        {
+            "bookmark_id": row.id,
+            "model": model,
+            "dim": int(vector.shape[0]),
+            "vector": to_bytes(vector),
+            "text_hash": digest,
+            "updated_at": now,
+        }
+        for (row, _, digest), vector in zip(targets, vectors)
+    ]
+    stmt = insert(BookmarkEmbedding).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BookmarkEmbedding.bookmark_id],
+        set_={
+            "model": stmt.excluded.model,
+            "dim": stmt.excluded.dim,
+            "vector": stmt.excluded.vector,
+            "text_hash": stmt.excluded.text_hash,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db = SessionLocal()
+    try:
+        db.execute(stmt)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    for (row, _, _), vector in zip(targets, vectors):
+        semantic_index.upsert(row.id, vector, row.user_id, row.is_public, model=model)
+    logger.info(f"북마크 임베딩 저장 - {len(targets)}건 (모델: {model})")
+    return len(targets)
+
+
+class EmbeddingWorker:
+    """임베딩 쓰레드 풀 (같은 북마크는 동시에 한 번만 실행)"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.EMBEDDING_CONCURRENCY),
+                    thread_name_prefix="embedding",
+                )
+            return self._executor
+
+    def submit(self, bookmark_ids: Sequence) -> int:
+        """임베딩 작업 제출 (이미 진행 중인 북마크 제외). 제출 수 반환"""
+        with self._lock:
+            keys = [key for key in dict.fromkeys(str(bid) for bid in bookmark_ids) if key not in self._in_flight]
+            self._in_flight.update(keys)
+        if keys:
+            self._get_executor().submit(self._run, keys)
+        return len(keys)
+
+    def _run(self, keys: List[str]):
+        try:
+            embed_bookmarks(keys)
+        except Exception as e:
+            logger.error(f"북마크 임베딩 실패 ({len(keys)}건): {e}")
+        finally:
+            with self._lock:
+                self._in_flight.difference_update(keys)
+
+
+# 프로세스 전역 임베딩 작업자
+embedding_worker = EmbeddingWorker()
+
+
+def submit_embedding(bookmark_id) -> bool:
+    if not settings.EMBEDDING_ENABLED:
+        return False
+    return embedding_worker.submit([bookmark_id]) > 0
+
+
+def sweep_missing_embeddings() -> int:
+    """요약은 있는데 현재 모델 임베딩이 없는 북마크를 EMBEDDING_SWEEP_BATCH_SIZE개까지 제출하고 제출 수 반환"""
+    if not settings.EMBEDDING_ENABLED:
+        return 0
+    db = SessionLocal()
+    try:
+        locked = db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _SWEEP_LOCK_KEY}).scalar()
+        if not locked:
+            return 0
+        rows = (
+            db.query(Bookmark.id)
+            .outerjoin(BookmarkEmbedding, BookmarkEmbedding.bookmark_id == Bookmark.id)
+            .filter(
+                Bookmark.is_deleted == False,
+                _summary_ready(),
+                or_(BookmarkEmbedding.bookmark_id.is_(None), BookmarkEmbedding.model != embedding_model_id()),
+            )
+            .order_by(Bookmark.created_at.desc())
+            .limit(settings.EMBEDDING_SWEEP_BATCH_SIZE)
+            .all()
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"임베딩 스위프 실패: {str(e)}")
+        return 0
+    finally:
+        db.close()
+    submitted = embedding_worker.submit([row.id for row in rows])
+    if submitted:
+        logger.info(f"임베딩 보강 제출 - {submitted}건")
+    return submitted
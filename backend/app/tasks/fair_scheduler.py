@@ -0,0 +1,148 @@
+"""
+요약 작업 우선순위 레인 + 사용자별 공정 분배
+
+- 레인: interactive(북마크 등록/수동 재요약)가 항상 bulk(일괄 재요약, 복구 재적재)보다 먼저 처리됨.
+  bulk 작업은 모델 동시 요청 상한에서 SUMMARY_BULK_RESERVED_SLOTS만큼을 비워 두어
+  대량 작업이 실행 중이어도 새 북마크 요약이 바로 시작될 수 있도록 함
+- 같은 레인 안에서는 사용자별 deficit round-robin(DRR)으로 분배. 작업 비용은 본문 길이 기준
+  (청크 수)이라 긴 문서를 대량으로 넣은 사용자가 처리 시간을 독점하지 못함
+- 사용자별 실행 중 작업 수 상한(SUMMARY_USER_MAX_IN_FLIGHT)
+"""
+from collections import deque
+from typing import AbstractSet, Dict, Hashable, Optional
+import threading
+
+from ..core.config import settings
+
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+# 앞에 있을수록 우선 (엄격한 우선순위)
+LANES = (LANE_INTERACTIVE, LANE_BULK)
+
+# 차례인 사용자가 없음 (사용자 키로 None(등록 사용자 없는 작업)을 쓰므로 별도 표식 사용)
+_NO_TURN = object()
+
+
+def lane_rank(lane: Optional[str]) -> int:
+    """레인 우선순위 (작을수록 먼저). 알 수 없는 레인은 가장 뒤"""
+    return LANES.index(lane) if lane in LANES else len(LANES)
+
+
+def estimate_job_cost(content_length: Optional[int]) -> int:
+    """작업 비용 추정: 본문을 SUMMARY_CHUNK_SIZE로 나눈 청크 수 (최소 1)"""
+    if not content_length or settings.SUMMARY_CHUNK_SIZE <= 0:
+        return 1
+    return 1 + content_length // settings.SUMMARY_CHUNK_SIZE
+
+
+def lane_slot_limit(lane: str, model_limit: int) -> int:
+    """레인별 모델 동시 실행 상한 (bulk는 interactive용 예약 슬롯을 제외, 최소 1)"""
+    if lane == LANE_INTERACTIVE:
+        return model_limit
+    return max(1, model_limit - settings.SUMMARY_BULK_RESERVED_SLOTS)
+
+
+def user_has_capacity(running: int) -> bool:
+    """사용자별 실행 중 작업 수 상한 확인 (0이면 무제한)"""
+    limit = settings.SUMMARY_USER_MAX_IN_FLIGHT
+    return limit <= 0 or running < limit
+
+
+class DeficitRoundRobin:
+    """
+    deficit round-robin. 차례가 온 사용자의 deficit에 quantum을 더하고, 다음 작업 비용 이하이면
+    그 사용자 작업을 처리(deficit 차감)하며 차례를 유지. 대기 작업이 없어진 사용자는 deficit 초기화.
+    작업을 실제로 가져온 뒤에만 차감하도록 선택(peek)과 차감(charge)을 나눠 사용할 수 있음.
+    프로세스 단위로 상태를 유지 (레플리카 간 공유 안 함).
+    """
+
+    def __init__(self, quantum: Optional[int] = None):
+        self._quantum = quantum
+        self._deficit: Dict[Hashable, int] = {}
+        self._ring = deque()
+        self._turn: Hashable = _NO_TURN
+        self._lock = threading.Lock()
+
+    @property
+    def quantum(self) -> int:
+        return max(1, self._quantum if self._quantum is not None else settings.SUMMARY_FAIR_QUANTUM)
+
+    def pick(self, heads: Dict[Hashable, int]) -> Optional[Hashable]:
+        """
+        heads: {사용자: 다음 작업 비용} (대기 작업이 있는 사용자만).
+        이번에 처리할 사용자를 고르고 작업 비용만큼 deficit 차감 (없으면 None)
+        """
+        if not heads:
+            return None
+        key = self.peek(heads)
+        self.charge(key, heads[key])
+        return key
+
+    def peek(self, heads: Dict[Hashable, int], skip: AbstractSet[Hashable] = frozenset()) -> Optional[Hashable]:
+        """
+        이번에 처리할 사용자를 고르되 deficit은 차감하지 않음 (작업을 가져온 뒤 charge 호출).
+        skip: 이번 선택에서 제외할 사용자 (사용자 상한/잠금으로 거절됨). 대기 작업은 남아 있으므로
+        deficit은 유지하고 차례만 넘김. 선택할 사용자가 없으면 None
+        """
+        if all(k in skip for k in heads):
+            return None
+        with self._lock:
+            for key in [k for k in self._ring if k not in heads]:
+                self._ring.remove(key)
+                del self._deficit[key]
+                if self._turn == key:
+                    self._turn = _NO_TURN
+            for key in sorted((k for k in heads if k not in self._deficit), key=str):
+                self._deficit[key] = 0
+                self._ring.append(key)
+            quantum = self.quantum
+            while True:
+                key = self._ring[0]
+                if key not in skip:
+                    cost = max(1, heads[key])
+                    if self._turn != key:
+                        self._turn = key
+                        # 상한/잠금으로 거절이 반복돼도 deficit이 무한정 쌓여 나중에 몰아 처리하지 않도록 제한
+                        self._deficit[key] = min(self._deficit[key] + quantum, cost + quantum)
+                    if cost <= self._deficit[key]:
+                        return key
+                # 이번 차례에 쓸 deficit이 부족(또는 거절됨) → 다음 사용자 (남은 deficit은 다음 차례로 이월)
+                self._ring.rotate(-1)
+                self._turn = _NO_TURN
+
+    def charge(self, key: Hashable, cost: int) -> None:
+        """peek으로 고른 사용자의 작업을 실제로 가져온 뒤 비용만큼 deficit 차감"""
+        with self._lock:
+            if key in self._deficit:
+                self._deficit[key] -= max(1, cost)
+
+    def snapshot(self) -> Dict[str, int]:
+        """사용자별 현재 deficit (상태 조회용)"""
+        with self._lock:
+            return {str(k): v for k, v in self._deficit.items()}
+
+
+class FairShareScheduler:
+    """레인별 DRR 묶음"""
+
+    def __init__(self):
+        self._lanes = {lane: DeficitRoundRobin() for lane in LANES}
+
+    def pick(self, lane: str, heads: Dict[Hashable, int]) -> Optional[Hashable]:
+        return self._drr(lane).pick(heads)
+
+    def peek(self, lane: str, heads: Dict[Hashable, int], skip: AbstractSet[Hashable] = frozenset()) -> Optional[Hashable]:
+        return self._drr(lane).peek(heads, skip)
+
+    def charge(self, lane: str, key: Hashable, cost: int) -> None:
+        self._drr(lane).charge(key, cost)
+
+    def _drr(self, lane: str) -> DeficitRoundRobin:
+        return self._lanes.get(lane) or self._lanes[LANE_BULK]
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {lane: drr.snapshot() for lane, drr in self._lanes.items()}
+
+
+# 프로세스 전역 스케줄러
+fair_scheduler = FairShareScheduler()
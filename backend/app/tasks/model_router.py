@@ -0,0 +1,77 @@
+"""
+요약 모델 자동 선택 (사용자가 모델을 고르지 않은 경우)
+
+- 짧은 본문(SUMMARY_ROUTING_SHORT_CHARS 이하) → 소형 모델(SUMMARY_ROUTING_SMALL_MODEL)
+- 한국어 본문(SUMMARY_ROUTING_KOREAN_MAX_CHARS 이하) → 소형 모델 (번역 없이 요약하므로 부담이 적음)
+- 기본 모델 적체: 기본 모델의 대기+실행 중 작업이 SUMMARY_ROUTING_QUEUE_THRESHOLD 이상이고
+  소형 모델이 덜 밀려 있으면 SUMMARY_ROUTING_OFFLOAD_MAX_CHARS 이하 본문을 소형 모델로 보냄
+- 그 외(긴 문서 등) → 기본 모델(OLLAMA_MODEL)
+선택 결과와 이유는 summary_jobs.model / route_reason에 기록됩니다.
+"""
+from typing import Dict, NamedTuple, Optional
+
+from ..core.config import settings
+from ..utils.translate import detect_language
+
+ROUTE_USER = "user"
+ROUTE_DEFAULT = "default"
+ROUTE_SHORT = "short"
+ROUTE_KOREAN = "korean"
+ROUTE_QUEUE = "queue_offload"
+ROUTE_LONG = "long"
+
+# 언어 판별에 사용하는 본문 앞부분 길이
+_LANGUAGE_SAMPLE_CHARS = 2000
+
+
+class RouteDecision(NamedTuple):
+    model: str
+    reason: str
+
+
+def _backlog(queue_stats: Optional[Dict[str, Dict[str, int]]], model: str) -> int:
+    entry = (queue_stats or {}).get(model) or {}
+    return entry.get("queued", 0) + entry.get("in_flight", 0)
+
+
+def small_model() -> Optional[str]:
+    """자동 선택에 쓸 소형 모델 (요약 모델 목록에 없거나 기본 모델과 같으면 None)"""
+    model = (settings.SUMMARY_ROUTING_SMALL_MODEL or "").strip()
+    if not model or model == settings.OLLAMA_MODEL or model not in settings.OLLAMA_SUMMARY_MODEL_LIST:
+        return None
+    return model
+
+
+def route_summary_model(
+    content: Optional[str],
+    requested_model: Optional[str] = None,
+    queue_stats: Optional[Dict[str, Dict[str, int]]] = None,
+) -> RouteDecision:
+    """
+    요약 모델 선택. requested_model이 있으면 그대로 사용.
+    queue_stats: summary_queue.get_queue_stats() 결과 ({모델: {"queued", "in_flight"}})
+    """
+    if requested_model:
+        return RouteDecision(requested_model, ROUTE_USER)
+    default = settings.OLLAMA_MODEL
+    small = small_model()
+    if not settings.SUMMARY_ROUTING_ENABLED or small is None:
+        return RouteDecision(default, ROUTE_DEFAULT)
+
+    length = len(content or "")
+    if length <= settings.SUMMARY_ROUTING_SHORT_CHARS:
+        return RouteDecision(small, ROUTE_SHORT)
+    if (
+        length <= settings.SUMMARY_ROUTING_KOREAN_MAX_CHARS
+        and detect_language((content or "")[:_LANGUAGE_SAMPLE_CHARS]) == "ko"
+    ):
+        return RouteDecision(small, ROUTE_KOREAN)
+    if length <= settings.SUMMARY_ROUTING_OFFLOAD_MAX_CHARS and settings.SUMMARY_ROUTING_QUEUE_THRESHOLD > 0:
+        default_backlog = _backlog(queue_stats, default)
+        if (
+            default_backlog >= settings.SUMMARY_ROUTING_QUEUE_THRESHOLD
+            and _backlog(queue_stats, small) < default_backlog
+        ):
+            return RouteDecision(small, ROUTE_QUEUE)
+        return RouteDecision(default, ROUTE_DEFAULT)
+    return RouteDecision(default, ROUTE_LONG)
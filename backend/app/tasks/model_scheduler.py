@@ -0,0 +1,50 @@
+"""
+모델별 요약 작업 스케줄러
+
+- 모델별 최대 동시 요청 수(OLLAMA_MODEL_MAX_IN_FLIGHT)를 넘지 않는 모델만 후보로 사용
+- 후보 모델 간에는 가중치(OLLAMA_MODEL_WEIGHTS) 기반 smooth weighted round-robin으로 공정 분배
+  (느린 120b 모델 작업이 쌓여 있어도 가벼운 모델 작업이 가중치 비율만큼 계속 처리됨)
+"""
+from typing import Dict, Iterable, Optional
+import threading
+
+from ..core.config import settings
+
+
+def max_in_flight(model: str) -> int:
+    """모델별 최대 동시 요청 수"""
+    return settings.OLLAMA_MODEL_MAX_IN_FLIGHT_MAP.get(model, settings.OLLAMA_MODEL_DEFAULT_MAX_IN_FLIGHT)
+
+
+def weight(model: str) -> int:
+    """모델별 스케줄링 가중치 (최소 1)"""
+    return max(1, settings.OLLAMA_MODEL_WEIGHT_MAP.get(model, 1))
+
+
+class WeightedModelScheduler:
+    """smooth weighted round-robin (nginx upstream 방식). 프로세스 단위로 상태를 유지."""
+
+    def __init__(self):
+        self._current: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def pick(self, candidates: Iterable[str]) -> Optional[str]:
+        """후보 모델 중 이번 차례 모델 선택 (후보가 없으면 None)"""
+        candidates = sorted(set(candidates))
+        if not candidates:
+            return None
+        with self._lock:
+            total = 0
+            best = None
+            for model in candidates:
+                w = weight(model)
+                self._current[model] = self._current.get(model, 0) + w
+                total += w
+                if best is None or self._current[model] > self._current[best]:
+                    best = model
+            self._current[best] -= total
+            return best
+
+
+# 프로세스 전역 스케줄러
+model_scheduler = WeightedModelScheduler()
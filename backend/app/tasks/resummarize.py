@@ -0,0 +1,346 @@
+"""
+일괄 재요약 (모델/프롬프트 변경 후 기존 요약 재생성)
+
+- 필터(요약 모델, 프롬프트 버전, 이전 프롬프트 여부, 분류, 등록일 범위)로 고른 북마크를
+  등록일 순으로 배치 조회해 요약 큐(summary_jobs)에 초당 rate개 속도로 적재
+- 배치마다 마지막 북마크 위치(cursor)를 resummarize_runs에 저장 → 중단/재시작 후 이어서 실행
+- 이 실행의 대기 작업이 max_pending 이상이면 적재를 멈춰 일반 요약 요청이 밀리지 않도록 함
+- 진행률: 적재 수, 완료/실패 수(summary_jobs.run_id 기준), 처리량, 남은 시간(ETA)
+
+실행: 관리자 API(POST /api/admin/resummarize) 또는 CLI(python -m app.resummarize)
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+import logging
+import threading
+import uuid as uuid_module
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..models.resummarize_run import ResummarizeRun
+from ..models.summary_job import SummaryJob
+from ..utils.summerise_openai import current_prompt_versions
+from .summary_queue import (
+    JOB_DONE, JOB_FAILED, JOB_PENDING, JOB_RUNNING, SUMMARY_PLACEHOLDER,
+    enqueue_summary_job, notify_workers,
+)
+
+logger = logging.getLogger(__name__)
+
+RUN_PENDING = "pending"
+RUN_RUNNING = "running"
+RUN_PAUSED = "paused"
+RUN_DONE = "done"
+RUN_CANCELLED = "cancelled"
+RUN_FAILED = "failed"
+
+# 다시 시작할 수 있는 상태 (running은 heartbeat가 끊긴 경우만)
+RESUMABLE_STATUSES = (RUN_PENDING, RUN_PAUSED, RUN_FAILED)
+
+
+def _summary_model_expr():
+    """북마크 요약 모델 (summary_model이 없는 기존 북마크는 마지막 완료 작업의 모델)"""
+    last_job_model = (
+        select(SummaryJob.model)
+        .where(SummaryJob.bookmark_id == Bookmark.id, SummaryJob.status == JOB_DONE)
+        .order_by(SummaryJob.finished_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return func.coalesce(Bookmark.summary_model, last_job_model)
+
+
+def _target_query(db: Session, run: ResummarizeRun):
+    """실행 필터에 해당하는 북마크 쿼리 (요약이 있는 북마크만. 요약 대기 중인 북마크는 복구 스위퍼가 담당)"""
+    query = db.query(Bookmark).filter(
+        Bookmark.is_deleted == False,
+        Bookmark.content.isnot(None),
+        Bookmark.content != "",
+        Bookmark.summary.isnot(None),
+        Bookmark.summary != SUMMARY_PLACEHOLDER,
+    )
+    if run.model_filter:
+        query = query.filter(_summary_model_expr() == run.model_filter)
+    if run.prompt_version_filter:
+        query = query.filter(Bookmark.summary_prompt_version == run.prompt_version_filter)
+    if run.outdated_only:
+        query = query.filter(or_(
+            Bookmark.summary_prompt_version.is_(None),
+            Bookmark.summary_prompt_version.notin_(current_prompt_versions()),
+        ))
+    if run.category_filter:
+        query = query.filter(Bookmark.category == run.category_filter)
+    if run.created_from:
+        query = query.filter(Bookmark.created_at >= run.created_from)
+    if run.created_to:
+        query = query.filter(Bookmark.created_at < run.created_to)
+    return query
+
+
+def build_run(
+    *,
+    model: Optional[str] = None,
+    prompt_version: Optional[str] = None,
+    outdated_only: bool = False,
+    category: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    target_model: Optional[str] = None,
+    rate: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    created_by: Optional[str] = None,
+) -> ResummarizeRun:
+    """재요약 실행 객체 생성 (저장 전). 미지정 설정은 RESUMMARIZE_* 기본값 사용."""
+    return ResummarizeRun(
+        status=RUN_PENDING,
+        model_filter=(model or "").strip() or None,
+        prompt_version_filter=(prompt_version or "").strip() or None,
+        outdated_only=outdated_only,
+        category_filter=(category or "").strip() or None,
+        created_from=created_from,
+        created_to=created_to,
+        target_model=(target_model or "").strip() or None,
+        rate=rate if rate and rate > 0 else settings.RESUMMARIZE_DEFAULT_RATE,
+        batch_size=batch_size if batch_size and batch_size > 0 else settings.RESUMMARIZE_BATCH_SIZE,
+        max_pending=max_pending if max_pending and max_pending > 0 else settings.RESUMMARIZE_MAX_PENDING,
+        created_by=created_by,
+    )
+
+
+def count_targets(db: Session, run: ResummarizeRun) -> int:
+    """필터에 해당하는 대상 북마크 수"""
+    return _target_query(db, run).count()
+
+
+def create_run(db: Session, **params) -> ResummarizeRun:
+    """재요약 실행 저장 (대상 수 집계). 실제 적재는 run_resummarize에서 수행."""
+    run = build_run(**params)
+    run.total = count_targets(db, run)
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    logger.info(f"일괄 재요약 생성 - run: {run.id}, 대상: {run.total}건, 속도: {run.rate}/초")
+    return run
+
+
+def _acquire_run(db: Session, run_id) -> bool:
+    """실행 상태를 running으로 전환 (다른 프로세스가 실행 중이면 False)"""
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.RESUMMARIZE_STALE_SECONDS)
+    updated = (
+        db.query(ResummarizeRun)
+        .filter(
+            ResummarizeRun.id == run_id,
+            or_(
+                ResummarizeRun.status.in_(RESUMABLE_STATUSES),
+                and_(ResummarizeRun.status == RUN_RUNNING, ResummarizeRun.heartbeat_at < stale_before),
+            ),
+        )
+        .update(
+            {"status": RUN_RUNNING, "heartbeat_at": now, "error": None,
+             "started_at": func.coalesce(ResummarizeRun.started_at, now)},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return updated == 1
+
+
+def _pending_count(db: Session, run_id) -> int:
+    return (
+        db.query(func.count(SummaryJob.id))
+        .filter(SummaryJob.run_id == run_id, SummaryJob.status == JOB_PENDING)
+        .scalar()
+    ) or 0
+
+
+def _enqueue_batch(db: Session, run: ResummarizeRun) -> int:
+    """cursor 다음 북마크 batch_size개를 적재하고 cursor 갱신. 적재 수 반환."""
+    query = _target_query(db, run)
+    if run.cursor_created_at is not None:
+        query = query.filter(or_(
+            Bookmark.created_at > run.cursor_created_at,
+            and_(Bookmark.created_at == run.cursor_created_at, Bookmark.id > run.cursor_id),
+        ))
+    rows = (
+        query.with_entities(Bookmark.id, Bookmark.created_at, _summary_model_expr())
+        .order_by(Bookmark.created_at, Bookmark.id)
+        .limit(run.batch_size)
+        .all()
+    )
+    for bookmark_id, _, summary_model in rows:
+        enqueue_summary_job(db, bookmark_id, model=run.target_model or summary_model, commit=False, run_id=run.id)
+    if rows:
+        last_id, last_created_at, _ = rows[-1]
+        run.cursor_created_at = last_created_at
+        run.cursor_id = last_id
+        run.enqueued = (run.enqueued or 0) + len(rows)
+    run.heartbeat_at = datetime.utcnow()
+    db.commit()
+    if rows:
+        notify_workers()
+    return len(rows)
+
+
+def run_resummarize(run_id, stop_event: Optional[threading.Event] = None) -> Optional[str]:
+    """
+    재요약 실행 (블로킹). cursor부터 이어서 적재하고 종료 시 최종 상태 반환.
+    stop_event가 설정되거나 API로 일시 중지/취소되면 현재 배치까지만 적재하고 멈춤.
+    이미 다른 곳에서 실행 중이면 None.
+    """
+    run_id = uuid_module.UUID(str(run_id))
+    stop_event = stop_event or threading.Event()
+    db = SessionLocal()
+    try:
+        if not _acquire_run(db, run_id):
+            logger.warning(f"일괄 재요약 시작 불가 (실행 중이거나 종료됨) - run: {run_id}")
+            return None
+        logger.info(f"일괄 재요약 시작 - run: {run_id}")
+        final_status = RUN_DONE
+        while True:
+            run = db.query(ResummarizeRun).filter(ResummarizeRun.id == run_id).first()
+            if run is None:
+                return None
+            if run.status != RUN_RUNNING:
+                # API로 일시 중지/취소됨
+                final_status = run.status
+                break
+            if stop_event.is_set():
+                final_status = RUN_PAUSED
+                break
+            # 이 실행의 대기 작업이 많으면 적재를 멈추고 워커가 따라잡기를 기다림
+            if _pending_count(db, run_id) >= run.max_pending:
+                run.heartbeat_at = datetime.utcnow()
+                db.commit()
+                stop_event.wait(settings.RESUMMARIZE_BACKLOG_WAIT)
+                continue
+            count = _enqueue_batch(db, run)
+            if count == 0:
+                break
+            logger.info(f"일괄 재요약 적재 - run: {run_id}, {run.enqueued}/{run.total}")
+            # 초당 rate개 속도 유지
+            stop_event.wait(count / run.rate)
+
+        if final_status in (RUN_DONE, RUN_PAUSED):
+            db.query(ResummarizeRun).filter(
+                ResummarizeRun.id == run_id, ResummarizeRun.status == RUN_RUNNING
+            ).update({
+                "status": final_status,
+                "heartbeat_at": datetime.utcnow(),
+                "finished_at": datetime.utcnow() if final_status == RUN_DONE else None,
+            }, synchronize_session=False)
+            db.commit()
+        logger.info(f"일괄 재요약 종료 - run: {run_id}, 상태: {final_status}")
+        return final_status
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"일괄 재요약 실패 - run: {run_id}")
+        db.query(ResummarizeRun).filter(ResummarizeRun.id == run_id).update(
+            {"status": RUN_FAILED, "error": str(e)}, synchronize_session=False
+        )
+        db.commit()
+        return RUN_FAILED
+    finally:
+        db.close()
+
+
+def set_run_status(db: Session, run: ResummarizeRun, status: str):
+    """일시 중지/취소 (실행 중인 루프는 다음 배치 전에 상태를 확인하고 멈춤). 취소 시 대기 작업도 제거."""
+    run.status = status
+    if status == RUN_CANCELLED:
+        run.finished_at = datetime.utcnow()
+        db.query(SummaryJob).filter(
+            SummaryJob.run_id == run.id, SummaryJob.status == JOB_PENDING
+        ).delete(synchronize_session=False)
+    db.commit()
+
+
+def get_run_progress(db: Session, run: ResummarizeRun) -> dict:
+    """적재/완료/실패 수, 완료 처리량(건/분), 남은 시간(초)"""
+    counts = dict(
+        db.query(SummaryJob.status, func.count(SummaryJob.id))
+        .filter(SummaryJob.run_id == run.id)
+        .group_by(SummaryJob.status)
+        .all()
+    )
+    done = counts.get(JOB_DONE, 0)
+    failed = counts.get(JOB_FAILED, 0)
+    elapsed = 0.0
+    if run.started_at:
+        elapsed = ((run.finished_at or datetime.utcnow()) - run.started_at).total_seconds()
+    per_minute = done / elapsed * 60 if elapsed > 0 else 0.0
+    remaining = max(0, (run.total or 0) - done - failed)
+    eta = remaining / per_minute * 60 if per_minute > 0 and run.status != RUN_CANCELLED else None
+    return {
+        "id": str(run.id),
+        "status": run.status,
+        "filters": {
+            "model": run.model_filter,
+            "prompt_version": run.prompt_version_filter,
+            "outdated_only": run.outdated_only,
+            "category": run.category_filter,
+            "created_from": run.created_from,
+            "created_to": run.created_to,
+        },
+        "target_model": run.target_model,
+        "rate": run.rate,
+        "total": run.total,
+        "enqueued": run.enqueued,
+        "pending": counts.get(JOB_PENDING, 0),
+        "running": counts.get(JOB_RUNNING, 0),
+        "done": done,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 1),
+        "throughput_per_minute": round(per_minute, 2),
+        "eta_seconds": round(eta) if eta is not None else None,
+        "created_by": run.created_by,
+        "created_at": run.created_at,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "error": run.error,
+    }
+
+
+# API에서 백그라운드로 실행 중인 재요약 (run_id → 중지 이벤트). 서버 종료 시 일시 중지 상태로 남김.
+_background_runs = {}
+_background_lock = threading.Lock()
+
+
+def start_in_background(run_id) -> bool:
+    """API 프로세스의 백그라운드 쓰레드에서 실행. 이 프로세스에서 이미 실행 중이면 False."""
+    key = str(run_id)
+    with _background_lock:
+        thread_info = _background_runs.get(key)
+        if thread_info and thread_info[0].is_alive():
+            return False
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=_run_and_forget, args=(key, stop_event), name=f"resummarize-{key[:8]}", daemon=True
+        )
+        _background_runs[key] = (thread, stop_event)
+        thread.start()
+    return True
+
+
+def _run_and_forget(run_id: str, stop_event: threading.Event):
+    try:
+        run_resummarize(run_id, stop_event)
+    finally:
+        with _background_lock:
+            _background_runs.pop(run_id, None)
+
+
+def stop_background_runs():
+    """서버 종료 시 백그라운드 실행을 일시 중지 상태로 정리 (다음에 resume으로 이어서 실행)"""
+    with _background_lock:
+        runs = list(_background_runs.values())
+    for _, stop_event in runs:
+        stop_event.set()
+    for thread, _ in runs:
+        thread.join(timeout=5)
+
@@ -0,0 +1,485 @@
+"""
+요약 작업 큐 (summary_jobs 테이블 기반)
+
+API 서버는 작업을 적재(enqueue)만 하고, 워커(app.worker 또는 API 내장 워커)가
+SELECT ... FOR UPDATE SKIP LOCKED로 작업을 나눠 가져가므로 워커 레플리카를 여러 개 띄워도
+같은 작업이 중복 실행되지 않습니다.
+
+북마크당 대기 작업은 1개만 유지합니다. 같은 북마크에 새 작업을 적재하면 기존 대기 작업은
+superseded가 되고, 실행 중인 이전 작업은 결과를 저장하지 않고 중단됩니다(is_job_stale).
+북마크 삭제 시 대기/실행 중 작업은 cancelled로 전환됩니다(cancel_bookmark_jobs).
+
+모델을 고른 뒤에는 우선순위 레인(interactive > bulk)과 사용자별 deficit round-robin으로
+해당 모델의 작업을 고릅니다(fair_scheduler). 한 사용자의 대량 적재가 다른 사용자의 요약을 막지 않습니다.
+
+모델별 동시 요청 상한은 실행 중 작업 수 + 긴 문서 map 단계에서 빌린 슬롯(summary_jobs.map_slots)으로 계산합니다.
+map 단계는 작업 자신의 슬롯 1개 외에 남은 슬롯만 빌려 병렬 호출합니다(borrow_map_slots).
+"""
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+import logging
+import threading
+import uuid as uuid_module
+
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..models.summary_job import SummaryJob
+from ..utils.ollama_pool import RequestCancelled
+from .fair_scheduler import (
+    LANE_BULK, LANE_INTERACTIVE, estimate_job_cost, fair_scheduler, lane_rank, lane_slot_limit,
+    user_has_capacity,
+)
+from .model_scheduler import max_in_flight, model_scheduler
+
+logger = logging.getLogger(__name__)
+
+# 요약 대기 중인 북마크의 summary 값 (요약 실패 시에도 유지됨)
+SUMMARY_PLACEHOLDER = "요약 생성 중..."
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_SUPERSEDED = "superseded"
+JOB_CANCELLED = "cancelled"
+
+# 같은 프로세스의 워커를 즉시 깨우기 위한 이벤트 (다른 프로세스는 폴링으로 감지)
+_job_event = threading.Event()
+
+# 이 프로세스에서 취소 요청된 실행 중 작업 ID (스트리밍 토큰마다 확인, 다른 프로세스는 DB 확인)
+_cancelled_jobs = set()
+_cancelled_lock = threading.Lock()
+
+
+class SummaryJobCancelled(RequestCancelled):
+    """작업이 취소되었거나(북마크 삭제) 같은 북마크의 새 작업으로 대체됨. status: JOB_CANCELLED | JOB_SUPERSEDED"""
+
+    def __init__(self, status: str):
+        super().__init__(status)
+        self.status = status
+
+
+class ClaimedJob(NamedTuple):
+    """워커가 가져간 작업 정보 (세션과 분리된 값 객체)"""
+    id: uuid_module.UUID
+    bookmark_id: uuid_module.UUID
+    model: Optional[str]
+    attempts: int
+    queue_wait_seconds: float = 0.0  # 적재 → 실행 시작 대기 시간
+
+
+def notify_workers():
+    """같은 프로세스에서 대기 중인 워커를 깨움"""
+    _job_event.set()
+
+
+def wait_for_jobs(timeout: float):
+    """새 작업 적재 또는 작업 완료 알림을 최대 timeout초 동안 대기"""
+    _job_event.wait(timeout)
+    _job_event.clear()
+
+
+def enqueue_summary_job(
+    db: Session,
+    bookmark_id,
+    model: Optional[str] = None,
+    commit: bool = True,
+    run_id=None,
+    lane: Optional[str] = None,
+    route_reason: Optional[str] = None,
+) -> SummaryJob:
+    """
+    요약 작업을 큐에 적재 (호출자의 세션 사용).
+    commit=False면 flush만 하고 커밋/notify_workers()는 호출자가 수행.
+    run_id: 일괄 재요약 실행으로 적재하는 경우 실행 ID (진행률 집계용)
+    lane: LANE_INTERACTIVE | LANE_BULK (미지정 시 run_id가 있으면 bulk, 없으면 interactive)
+    route_reason: 모델 자동 선택 이유 (model_router.RouteDecision.reason)
+    """
+    bid = uuid_module.UUID(bookmark_id) if isinstance(bookmark_id, str) else bookmark_id
+    # 모델별 스케줄링을 위해 기본 모델도 명시적으로 저장
+    model = (model or "").strip() or settings.OLLAMA_MODEL
+    # 같은 북마크의 동시 적재 직렬화 후 기존 대기 작업 대체 (북마크당 pending 1개)
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": f"summary_bookmark:{bid}"})
+    superseded = (
+        db.query(SummaryJob)
+        .filter(SummaryJob.bookmark_id == bid, SummaryJob.status == JOB_PENDING)
+        .update({"status": JOB_SUPERSEDED, "finished_at": datetime.utcnow()}, synchronize_session=False)
+    )
+    if superseded:
+        logger.info(f"기존 대기 작업 대체 - 북마크 ID: {bid}, {superseded}건")
+    lane = lane or (LANE_BULK if run_id else LANE_INTERACTIVE)
+    # 사용자별 공정 분배를 위해 등록 사용자와 본문 길이 기준 비용을 함께 저장
+    owner = db.query(Bookmark.user_id, func.length(Bookmark.content)).filter(Bookmark.id == bid).first()
+    user_id, content_length = owner if owner else (None, None)
+    job = SummaryJob(
+        bookmark_id=bid, model=model, status=JOB_PENDING, run_id=run_id,
+        user_id=user_id, lane=lane, cost=estimate_job_cost(content_length), route_reason=route_reason,
+    )
+    db.add(job)
+    if not commit:
+        db.flush()
+        return job
+    db.commit()
+    db.refresh(job)
+    logger.info(f"요약 작업 적재 - job: {job.id}, 북마크 ID: {bid}, 모델: {model}, 레인: {lane}")
+    notify_workers()
+    return job
+
+
+def get_queue_stats(db: Session) -> Dict[str, Dict[str, int]]:
+    """모델별 대기(queued)/실행 중(in_flight) 작업 수 (전체 워커 합산)"""
+    rows = (
+        db.query(SummaryJob.model, SummaryJob.status, func.count(SummaryJob.id))
+        .filter(SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING]))
+        .group_by(SummaryJob.model, SummaryJob.status)
+        .all()
+    )
+    stats: Dict[str, Dict[str, int]] = {}
+    for model, status, count in rows:
+        entry = stats.setdefault(model or settings.OLLAMA_MODEL, {"queued": 0, "in_flight": 0})
+        entry["queued" if status == JOB_PENDING else "in_flight"] += count
+    return stats
+
+
+def get_route_stats(db: Session, since: datetime) -> List[Dict]:
+    """since 이후 적재된 작업의 모델·선택 이유별 건수 (모델 자동 선택 현황)"""
+    rows = (
+        db.query(SummaryJob.model, SummaryJob.route_reason, func.count(SummaryJob.id))
+        .filter(SummaryJob.created_at >= since, SummaryJob.route_reason.isnot(None))
+        .group_by(SummaryJob.model, SummaryJob.route_reason)
+        .order_by(SummaryJob.model, SummaryJob.route_reason)
+        .all()
+    )
+    return [{"model": model, "reason": reason, "jobs": count} for model, reason, count in rows]
+
+
+def get_lane_stats(db: Session) -> Dict[str, Dict[str, int]]:
+    """레인별 대기(queued)/실행 중(in_flight) 작업 수와 대기 작업이 있는 사용자 수(users)"""
+    rows = (
+        db.query(
+            SummaryJob.lane, SummaryJob.status,
+            func.count(SummaryJob.id), func.count(func.distinct(SummaryJob.user_id)),
+        )
+        .filter(SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING]))
+        .group_by(SummaryJob.lane, SummaryJob.status)
+        .all()
+    )
+    stats: Dict[str, Dict[str, int]] = {}
+    for lane, status, count, users in rows:
+        entry = stats.setdefault(lane or LANE_INTERACTIVE, {"queued": 0, "in_flight": 0, "users": 0})
+        if status == JOB_PENDING:
+            entry["queued"] += count
+            entry["users"] += users
+        else:
+            entry["in_flight"] += count
+    return stats
+
+
+def _user_running_count(db: Session, user_id) -> int:
+    user_filter = SummaryJob.user_id.is_(None) if user_id is None else SummaryJob.user_id == user_id
+    return (
+        db.query(func.count(SummaryJob.id))
+        .filter(SummaryJob.status == JOB_RUNNING, user_filter)
+        .scalar()
+    )
+
+
+def _fair_candidates(db: Session, model: str, running: int, limit: int) -> Dict[str, Dict[object, int]]:
+    """
+    레인별 {사용자: 다음 작업 비용}. bulk 레인은 예약 슬롯을 남길 수 있을 때만,
+    사용자 실행 중 작업 수가 상한 미만인 사용자만 포함
+    """
+    heads = (
+        db.query(SummaryJob.lane, SummaryJob.user_id, SummaryJob.cost)
+        .filter(SummaryJob.status == JOB_PENDING, SummaryJob.model == model)
+        .distinct(SummaryJob.lane, SummaryJob.user_id)
+        .order_by(SummaryJob.lane, SummaryJob.user_id, SummaryJob.created_at)
+        .all()
+    )
+    user_ids = {user_id for _, user_id, _ in heads}
+    user_running = dict(
+        db.query(SummaryJob.user_id, func.count(SummaryJob.id))
+        .filter(SummaryJob.status == JOB_RUNNING)
+        .group_by(SummaryJob.user_id)
+        .all()
+    ) if user_ids else {}
+    candidates: Dict[str, Dict[object, int]] = {}
+    for lane, user_id, cost in heads:
+        lane = lane or LANE_INTERACTIVE
+        if running >= lane_slot_limit(lane, limit):
+            continue
+        if not user_has_capacity(user_running.get(user_id, 0)):
+            continue
+        candidates.setdefault(lane, {})[user_id] = cost or 1
+    return candidates
+
+
+def _lock_user(db: Session, user_id) -> bool:
+    """
+    사용자별 실행 중 작업 수 확인을 직렬화 (모델이 달라도 같은 사용자 상한 유지).
+    여러 사용자를 차례로 시도하므로 대기하지 않는 try lock 사용 (교착 방지)
+    """
+    return bool(db.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"), {"key": f"summary_user:{user_id}"}
+    ).scalar())
+
+
+def _lock_model(db: Session, model: str):
+    """모델별 슬롯 계산/변경 직렬화 (트랜잭션 끝까지 유지)"""
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": f"summary_model:{model}"})
+
+
+def _model_slots_in_use(db: Session, model: str) -> int:
+    """모델의 사용 중 슬롯 수: 실행 중 작업 수 + map 단계에서 빌린 슬롯 수 (전체 워커 합산)"""
+    running, borrowed = (
+        db.query(func.count(SummaryJob.id), func.coalesce(func.sum(SummaryJob.map_slots), 0))
+        .filter(SummaryJob.status == JOB_RUNNING, SummaryJob.model == model)
+        .one()
+    )
+    return int(running) + int(borrowed)
+
+
+def _claim_one(db: Session, worker_id: str, model: str) -> Optional[ClaimedJob]:
+    """
+    지정 모델의 대기 작업 1개를 가져옴. 모델별 advisory lock 안에서 사용 중 슬롯 수를 다시 확인해
+    여러 워커 레플리카가 동시에 가져가도 모델별 상한을 넘지 않도록 함.
+    작업은 우선순위가 높은 레인부터, 레인 안에서는 사용자별 DRR 순서로 선택.
+    DRR deficit은 작업을 실제로 가져온 사용자만 차감 (상한/잠금으로 거절된 사용자는 차례만 넘김).
+    """
+    _lock_model(db, model)
+    running = _model_slots_in_use(db, model)
+    limit = max_in_flight(model)
+    if running >= limit:
+        db.rollback()
+        return None
+    job = None
+    candidates = _fair_candidates(db, model, running, limit)
+    for lane in sorted(candidates, key=lane_rank):
+        heads = candidates[lane]
+        rejected = set()
+        while len(rejected) < len(heads) and job is None:
+            user_id = fair_scheduler.peek(lane, heads, rejected)
+            rejected.add(user_id)
+            if not _lock_user(db, user_id) or not user_has_capacity(_user_running_count(db, user_id)):
+                continue
+            user_filter = SummaryJob.user_id.is_(None) if user_id is None else SummaryJob.user_id == user_id
+            job = (
+                db.query(SummaryJob)
+                .filter(
+                    SummaryJob.status == JOB_PENDING, SummaryJob.model == model,
+                    SummaryJob.lane == lane, user_filter,
+                )
+                .order_by(SummaryJob.created_at)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if job is not None:
+                fair_scheduler.charge(lane, user_id, heads[user_id])
+        if job is not None:
+            break
+    if not job:
+        db.rollback()
+        return None
+    job.status = JOB_RUNNING
+    job.worker_id = worker_id
+    job.started_at = datetime.utcnow()
+    job.heartbeat_at = job.started_at
+    job.attempts = (job.attempts or 0) + 1
+    queue_wait = (job.started_at - job.created_at).total_seconds() if job.created_at else 0.0
+    claimed = ClaimedJob(job.id, job.bookmark_id, job.model, job.attempts, max(0.0, queue_wait))
+    db.commit()
+    return claimed
+
+
+def claim_jobs(worker_id: str, limit: int) -> List[ClaimedJob]:
+    """
+    대기 중인 작업을 최대 limit개 가져와 running 상태로 전환.
+    모델별 동시 요청 상한 안에서 가중치 기반으로 모델을 번갈아 선택 (model_scheduler)한 뒤
+    해당 모델 안에서 레인/사용자별로 공정하게 작업 선택 (fair_scheduler).
+    """
+    if limit <= 0:
+        return []
+    db = SessionLocal()
+    try:
+        stats = get_queue_stats(db)
+        db.commit()
+        claimed = []
+        while len(claimed) < limit:
+            candidates = [
+                model for model, entry in stats.items()
+                if entry["queued"] > 0 and entry["in_flight"] < max_in_flight(model)
+            ]
+            model = model_scheduler.pick(candidates)
+            if model is None:
+                break
+            job = _claim_one(db, worker_id, model)
+            if job is None:
+                # 다른 워커가 먼저 가져갔거나 모델/사용자 상한 도달 → 이번 라운드에서 제외
+                stats[model]["queued"] = 0
+                continue
+            stats[model]["queued"] -= 1
+            stats[model]["in_flight"] += 1
+            claimed.append(job)
+        return claimed
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def borrow_map_slots(job_id, model: str, wanted: int) -> int:
+    """
+    실행 중 작업의 map 단계 추가 슬롯을 모델의 남은 슬롯 안에서 최대 wanted개 빌려 기록하고 빌린 수 반환.
+    작업 자신의 슬롯 1개는 claim 시 이미 차지하므로 0이면 청크를 하나씩 순서대로 처리
+    """
+    if wanted <= 0:
+        return 0
+    db = SessionLocal()
+    try:
+        _lock_model(db, model)
+        free = max_in_flight(model) - _model_slots_in_use(db, model)
+        granted = max(0, min(wanted, free))
+        if granted:
+            updated = (
+                db.query(SummaryJob)
+                .filter(SummaryJob.id == job_id, SummaryJob.status == JOB_RUNNING)
+                .update({"map_slots": granted}, synchronize_session=False)
+            )
+            granted = granted if updated else 0
+        db.commit()
+        return granted
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"map 단계 슬롯 확보 실패 - job: {job_id}, 오류: {e}")
+        return 0
+    finally:
+        db.close()
+
+
+def heartbeat_jobs(worker_id: str, job_ids) -> int:
+    """이 워커가 실행 중인 작업의 heartbeat_at 갱신 (복구 스위퍼가 죽은 워커의 작업과 구분)"""
+    if not job_ids:
+        return 0
+    db = SessionLocal()
+    try:
+        count = (
+            db.query(SummaryJob)
+            .filter(
+                SummaryJob.id.in_(list(job_ids)), SummaryJob.worker_id == worker_id,
+                SummaryJob.status == JOB_RUNNING,
+            )
+            .update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+        )
+        db.commit()
+        return count
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"요약 작업 heartbeat 실패 - worker: {worker_id}, 오류: {e}")
+        return 0
+    finally:
+        db.close()
+
+
+def release_map_slots(job_id):
+    """map 단계에서 빌린 슬롯 반환 (워커를 깨워 다음 작업을 가져가도록)"""
+    db = SessionLocal()
+    try:
+        db.query(SummaryJob).filter(SummaryJob.id == job_id, SummaryJob.map_slots != 0).update(
+            {"map_slots": 0}, synchronize_session=False
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"map 단계 슬롯 반환 실패 - job: {job_id}, 오류: {e}")
+    finally:
+        db.close()
+    notify_workers()
+
+
+def cancel_bookmark_jobs(db: Session, bookmark_id) -> int:
+    """
+    북마크의 대기/실행 중 작업을 cancelled로 전환 (북마크 삭제 전 호출, 커밋은 호출자).
+    실행 중 작업은 다음 스트리밍 토큰 또는 중간 저장 시점에 중단되고 결과를 저장하지 않음.
+    """
+    jobs = (
+        db.query(SummaryJob.id)
+        .filter(SummaryJob.bookmark_id == bookmark_id, SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING]))
+        .all()
+    )
+    job_ids = [job_id for (job_id,) in jobs]
+    if not job_ids:
+        return 0
+    db.query(SummaryJob).filter(SummaryJob.id.in_(job_ids)).update(
+        {"status": JOB_CANCELLED, "finished_at": datetime.utcnow()}, synchronize_session=False
+    )
+    with _cancelled_lock:
+        _cancelled_jobs.update(job_ids)
+    logger.info(f"요약 작업 취소 - 북마크 ID: {bookmark_id}, {len(job_ids)}건")
+    return len(job_ids)
+
+
+def is_job_cancelled_locally(job_id) -> bool:
+    """이 프로세스에서 취소 요청된 작업인지 (DB 조회 없음)"""
+    with _cancelled_lock:
+        return job_id in _cancelled_jobs
+
+
+def is_job_stale(db: Session, job_id) -> Optional[str]:
+    """
+    작업 결과를 저장하면 안 되는 경우 사유 반환 (저장해도 되면 None)
+    - JOB_CANCELLED: 작업이 취소되었거나 북마크 삭제로 작업 행이 사라짐
+    - JOB_SUPERSEDED: 같은 북마크에 더 나중에 적재된 작업이 대기/실행 중이거나 이미 완료됨
+    """
+    if is_job_cancelled_locally(job_id):
+        return JOB_CANCELLED
+    job = (
+        db.query(SummaryJob.bookmark_id, SummaryJob.created_at, SummaryJob.status)
+        .filter(SummaryJob.id == job_id)
+        .first()
+    )
+    if job is None or job.status == JOB_CANCELLED:
+        return JOB_CANCELLED
+    if job.status == JOB_SUPERSEDED:
+        return JOB_SUPERSEDED
+    newer = (
+        db.query(SummaryJob.id)
+        .filter(
+            SummaryJob.bookmark_id == job.bookmark_id,
+            SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING, JOB_DONE]),
+            or_(
+                SummaryJob.created_at > job.created_at,
+                and_(SummaryJob.created_at == job.created_at, SummaryJob.id > job_id),
+            ),
+        )
+        .first()
+    )
+    return JOB_SUPERSEDED if newer else None
+
+
+def finish_job(job_id, success: bool, error: Optional[str] = None, status: Optional[str] = None):
+    """작업 완료/실패 기록 (status 지정 시 그 상태로 기록, 예: JOB_SUPERSEDED)"""
+    with _cancelled_lock:
+        _cancelled_jobs.discard(job_id)
+    db = SessionLocal()
+    try:
+        job = db.query(SummaryJob).filter(SummaryJob.id == job_id).first()
+        if not job:
+            return
+        # 실행 중 취소된 작업은 cancelled 유지
+        if job.status != JOB_CANCELLED:
+            job.status = status or (JOB_DONE if success else JOB_FAILED)
+        job.error = error
+        job.partial_summary = None  # 최종 요약은 북마크에 저장되므로 중간 결과는 비움
+        job.map_slots = 0
+        job.finished_at = datetime.utcnow()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"요약 작업 상태 기록 실패 - job: {job_id}, 오류: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,163 @@
+"""
+요약 복구 스위퍼
+
+'요약 생성 중...' 상태로 남은 북마크(요약 실패, 워커 비정상 종료 등)를 찾아
+배치 단위로 요약 큐에 다시 적재합니다.
+- 북마크별 시도 횟수 = 실패한 summary_jobs 수 (대체/취소된 작업은 제외). SUMMARY_RECOVERY_MAX_ATTEMPTS에 도달하면 더 이상 재시도하지 않음
+- 워커가 SUMMARY_JOB_TIMEOUT 동안 heartbeat를 갱신하지 않은 running 작업은 실패 처리 후 재적재 대상
+- 삭제된 북마크는 재적재하지 않음
+- 재시도 간격은 SUMMARY_RECOVERY_BACKOFF * 2^(시도 횟수-1)초
+- 여러 프로세스(API, 워커 레플리카)에서 동시에 실행돼도 advisory lock으로 한 곳에서만 스위프
+- 재적재 작업은 bulk 레인 (새 북마크 요약보다 뒤, 사용자별 공정 분배는 동일)
+- 같은 주기로 번역 대기 상태로 남은 북마크 제목도 다시 번역 (title_translation.sweep_pending_titles)
+- 같은 주기로 현재 모델 임베딩이 없는 북마크도 임베딩 (embedding_tasks.sweep_missing_embeddings)
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+import logging
+import threading
+
+from sqlalchemy import case, func, text
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..models.summary_job import SummaryJob
+from .fair_scheduler import LANE_BULK
+from .embedding_tasks import sweep_missing_embeddings
+from .title_translation import sweep_pending_titles
+from .summary_queue import (
+    JOB_FAILED, JOB_PENDING, JOB_RUNNING, SUMMARY_PLACEHOLDER, enqueue_summary_job, notify_workers,
+)
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock 키 (요약 복구 스위퍼 전용)
+_SWEEP_LOCK_KEY = 7_302_026
+
+
+def fail_stale_jobs(db, now: datetime) -> int:
+    """
+    SUMMARY_JOB_TIMEOUT 동안 heartbeat가 없는 running 작업을 실패 처리 (죽은 워커가 잡고 있던 작업).
+    살아 있는 워커는 실행 시간과 관계없이 heartbeat를 갱신하므로 긴 문서/재시도로 오래 걸리는 작업은 유지
+    """
+    cutoff = now - timedelta(seconds=settings.SUMMARY_JOB_TIMEOUT)
+    count = (
+        db.query(SummaryJob)
+        .filter(
+            SummaryJob.status == JOB_RUNNING,
+            func.coalesce(SummaryJob.heartbeat_at, SummaryJob.started_at) < cutoff,
+        )
+        .update(
+            {"status": JOB_FAILED, "error": "작업 시간 초과 (heartbeat 없음)", "finished_at": now, "map_slots": 0},
+            synchronize_session=False,
+        )
+    )
+    return count
+
+
+def stranded_bookmarks_query(db, now: datetime):
+    """
+    재적재 대상 북마크 (id, 실패 횟수) 조회 쿼리.
+    요약이 없고, 삭제되지 않았고, 대기/실행 중 작업이 없고, 실패 횟수가 상한 미만이며 백오프가 지난 북마크
+    """
+    job_stats = (
+        db.query(
+            SummaryJob.bookmark_id.label("bookmark_id"),
+            func.sum(case((SummaryJob.status == JOB_FAILED, 1), else_=0)).label("attempts"),
+            func.max(func.coalesce(SummaryJob.finished_at, SummaryJob.created_at)).label("last_at"),
+            func.sum(
+                case((SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING]), 1), else_=0)
+            ).label("active"),
+        )
+        .group_by(SummaryJob.bookmark_id)
+        .subquery()
+    )
+    attempts = func.coalesce(job_stats.c.attempts, 0)
+    backoff_seconds = settings.SUMMARY_RECOVERY_BACKOFF * func.power(2, func.greatest(attempts - 1, 0))
+    deadline = now - timedelta(seconds=settings.SUMMARY_RECOVERY_DEADLINE)
+    return (
+        db.query(Bookmark.id, attempts.label("attempts"))
+        .outerjoin(job_stats, job_stats.c.bookmark_id == Bookmark.id)
+        .filter(
+            Bookmark.summary == SUMMARY_PLACEHOLDER,
+            Bookmark.is_deleted == False,
+            Bookmark.created_at < deadline,
+            func.coalesce(job_stats.c.active, 0) == 0,
+            attempts < settings.SUMMARY_RECOVERY_MAX_ATTEMPTS,
+            (job_stats.c.last_at.is_(None))
+            | (func.extract("epoch", now - job_stats.c.last_at) >= backoff_seconds),
+        )
+        .order_by(Bookmark.created_at)
+    )
+
+
+def sweep_stranded_bookmarks() -> int:
+    """요약이 남아 있지 않은 북마크를 재적재하고 재적재한 수를 반환"""
+    db = SessionLocal()
+    try:
+        locked = db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _SWEEP_LOCK_KEY}).scalar()
+        if not locked:
+            logger.debug("다른 프로세스에서 요약 복구 스위프 진행 중 - 건너뜀")
+            return 0
+
+        now = datetime.utcnow()
+        stale = fail_stale_jobs(db, now)
+        if stale:
+            logger.warning(f"시간 초과된 요약 작업 {stale}건 실패 처리")
+
+        rows = stranded_bookmarks_query(db, now).limit(settings.SUMMARY_RECOVERY_BATCH_SIZE).all()
+        for bookmark_id, prev_attempts in rows:
+            model = _last_job_model(db, bookmark_id)
+            enqueue_summary_job(db, bookmark_id, model=model, commit=False, lane=LANE_BULK)
+            logger.info(f"요약 복구 재적재 - 북마크 ID: {bookmark_id}, 이전 실패: {prev_attempts}회")
+
+        # 재적재까지 한 트랜잭션으로 커밋 (커밋 시 advisory lock 해제)
+        db.commit()
+        if rows:
+            notify_workers()
+            logger.info(f"요약 복구 스위프 완료 - 재적재 {len(rows)}건")
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"요약 복구 스위프 실패: {str(e)}")
+        return 0
+    finally:
+        db.close()
+
+
+def _last_job_model(db, bookmark_id) -> Optional[str]:
+    """직전 작업에서 사용한 모델 (없으면 None → 기본 모델)"""
+    last = (
+        db.query(SummaryJob.model)
+        .filter(SummaryJob.bookmark_id == bookmark_id)
+        .order_by(SummaryJob.created_at.desc())
+        .first()
+    )
+    return last[0] if last else None
+
+
+class SummaryRecoverySweeper:
+    """시작 시 1회, 이후 SUMMARY_RECOVERY_INTERVAL마다 스위프를 실행하는 백그라운드 쓰레드"""
+
+    def __init__(self, interval: Optional[int] = None):
+        self.interval = interval or settings.SUMMARY_RECOVERY_INTERVAL
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="summary-recovery", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        logger.info(f"요약 복구 스위퍼 시작 - 주기: {self.interval}초")
+        while not self._stop.is_set():
+            sweep_stranded_bookmarks()
+            sweep_pending_titles()
+            sweep_missing_embeddings()
+            self._stop.wait(self.interval)
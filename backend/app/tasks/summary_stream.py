@@ -0,0 +1,155 @@
+"""
+요약 스트리밍 중계
+
+워커가 스트리밍으로 받은 중간 요약을 같은 프로세스의 SSE 구독자(GET /api/bookmarks/{id}/summary/stream)에게 전달합니다.
+다른 프로세스의 워커(python -m app.worker)가 처리 중이면 SSE 엔드포인트가 summary_jobs.partial_summary를 폴링합니다.
+
+이벤트 형식:
+- {"type": "partial", "text": 지금까지 생성된 전체 텍스트}
+- {"type": "done", "summary": 최종 요약, "title": 번역된 제목(요약과 함께 제목을 번역한 경우)}
+- {"type": "failed"}
+- {"type": "title", "title": 번역된 제목} (제목 번역 보강 작업 완료, 스트림은 계속)
+"""
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+import queue
+import threading
+import time
+import uuid as uuid_module
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..models.summary_job import SummaryJob
+from .summary_queue import JOB_PENDING, JOB_RUNNING, SUMMARY_PLACEHOLDER
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryStreamBroker:
+    def __init__(self):
+        self._subscribers: Dict[str, List[queue.Queue]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, bookmark_id: str) -> queue.Queue:
+        q: queue.Queue = queue.Queue(maxsize=1000)
+        with self._lock:
+            self._subscribers[str(bookmark_id)].append(q)
+        return q
+
+    def unsubscribe(self, bookmark_id: str, q: queue.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(str(bookmark_id))
+            if not subscribers:
+                return
+            if q in subscribers:
+                subscribers.remove(q)
+            if not subscribers:
+                del self._subscribers[str(bookmark_id)]
+
+    def has_subscribers(self, bookmark_id: str) -> bool:
+        with self._lock:
+            return bool(self._subscribers.get(str(bookmark_id)))
+
+    def publish(self, bookmark_id: str, event: dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(bookmark_id), []))
+        for q in subscribers:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                # 느린 구독자: partial 이벤트는 누적 텍스트이므로 버려도 다음 이벤트로 따라잡음
+                logger.debug(f"요약 스트림 구독자 큐 가득 참 - 북마크 ID: {bookmark_id}")
+
+
+# 프로세스 전역 브로커
+summary_stream_broker = SummaryStreamBroker()
+
+
+def _load_summary_state(bookmark_id: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """DB에서 (북마크 요약, 실행 중 작업의 중간 요약, 대기/실행 중 작업 존재 여부) 조회"""
+    db = SessionLocal()
+    try:
+        bid = uuid_module.UUID(bookmark_id)
+        bookmark = db.query(Bookmark.summary).filter(Bookmark.id == bid).first()
+        if bookmark is None:
+            return None, None, False
+        job = (
+            db.query(SummaryJob.status, SummaryJob.partial_summary)
+            .filter(SummaryJob.bookmark_id == bid, SummaryJob.status.in_([JOB_PENDING, JOB_RUNNING]))
+            .order_by(SummaryJob.created_at.desc())
+            .first()
+        )
+        return bookmark.summary, (job.partial_summary if job else None), job is not None
+    finally:
+        db.close()
+
+
+def iter_summary_events(bookmark_id: str, poll_interval: float = 0.5, heartbeat: float = 15.0) -> Iterator[Optional[Tuple[str, dict]]]:
+    """
+    요약 진행 이벤트 제너레이터 (SSE 엔드포인트용).
+    ("delta", {"text": 추가 텍스트}), ("reset", {"text": 전체 텍스트}), ("done", {"summary": ..., "title": ...}), ("failed", {}), ("title", {"title": ...})를 반환하고,
+    heartbeat초 동안 이벤트가 없으면 None(연결 유지용)을 반환.
+    같은 프로세스 워커의 토큰은 즉시 받고, 그 외에는 poll_interval마다 DB를 확인.
+    요약이 아직 없는데 대기/실행 중 작업도 없으면 failed로 종료 (다른 프로세스 워커의 실패 알림을 받지 못한 경우).
+    재요약 중(이전 요약이 남아 있고 작업이 대기/실행 중)에는 요약이 바뀌거나 작업이 끝날 때까지 중간 결과를 계속 전송.
+    """
+    bookmark_id = str(bookmark_id)
+    q = summary_stream_broker.subscribe(bookmark_id)
+    try:
+        sent = ""
+        # 재요약 중에는 새 요약이 저장될 때까지 이전 요약이 남아 있으므로, 처음 본 요약과 비교해 변경 여부 판단
+        initial_summary = None
+        deadline = time.monotonic() + settings.SUMMARY_STREAM_MAX_SECONDS
+        last_emit = time.monotonic()
+        while time.monotonic() < deadline:
+            try:
+                event = q.get(timeout=poll_interval)
+            except queue.Empty:
+                event = None
+
+            text = None
+            if event is not None:
+                if event["type"] == "done":
+                    yield "done", {key: event[key] for key in ("summary", "title") if key in event}
+                    return
+                if event["type"] == "failed":
+                    yield "failed", {}
+                    return
+                if event["type"] == "title":
+                    yield "title", {"title": event["title"]}
+                    last_emit = time.monotonic()
+                    continue
+                text = event.get("text")
+            else:
+                summary, partial, active = _load_summary_state(bookmark_id)
+                if summary is None:
+                    yield "failed", {}
+                    return
+                if initial_summary is None:
+                    initial_summary = summary
+                has_summary = summary != SUMMARY_PLACEHOLDER
+                if has_summary and (not active or summary != initial_summary):
+                    # 작업이 없거나(요약 완료) 스트림 시작 후 요약이 바뀜(새 요약 저장)
+                    yield "done", {"summary": summary}
+                    return
+                if not active:
+                    # 대기/실행 중 작업 없이 요약이 비어 있음 → 다른 프로세스 워커에서 실패 (복구 스위퍼가 나중에 재시도)
+                    yield "failed", {}
+                    return
+                text = partial
+
+            if text and text != sent:
+                if text.startswith(sent):
+                    yield "delta", {"text": text[len(sent):]}
+                else:
+                    # 재시도 등으로 처음부터 다시 생성된 경우
+                    yield "reset", {"text": text}
+                sent = text
+                last_emit = time.monotonic()
+            elif time.monotonic() - last_emit >= heartbeat:
+                yield None
+                last_emit = time.monotonic()
+    finally:
+        summary_stream_broker.unsubscribe(bookmark_id, q)
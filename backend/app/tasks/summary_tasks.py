@@ -1,18 +1,31 @@
-from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
+from typing import Optional
+from ..core.config import settings
 from ..db.session import SessionLocal
 from ..models.bookmark import Bookmark
+from ..models.summary_job import SummaryJob
 from ..services.scraping_service import generate_summary
+from ..services.summary_cache import CachedSummary, make_cache_key, summary_cache
+from ..utils.structured_summary import parse_structured_summary, partial_summary_field, to_markdown
+from ..utils.summerise_openai import get_prompt_version, structured_output_enabled
+from ..utils.translate import bilingual_title, detect_language, translate_text
+from .summary_queue import (
+    JOB_CANCELLED, SUMMARY_PLACEHOLDER, SummaryJobCancelled, borrow_map_slots,
+    enqueue_summary_job, get_queue_stats, is_job_cancelled_locally, is_job_stale, release_map_slots,
+)
+from .embedding_tasks import submit_embedding
+from .model_router import route_summary_model
+from .summary_stream import summary_stream_broker
 import logging
 import re
+import time
 import uuid as uuid_module
+from contextlib import contextmanager
+from functools import partial
 from html import unescape
 
 logger = logging.getLogger(__name__)
 
-# 쓰레드 풀 생성
-executor = ThreadPoolExecutor(max_workers=3)
-
 def clean_html_tags_from_text(text: str) -> str:
     """
     키워드/분류에서 HTML 태그만 제거하는 함수
@@ -109,8 +122,178 @@ def fix_markdown_heading_duplicates(text: str) -> str:
 
     return re.sub(r'^(\s*)((?:#{1,6}\s*)+)', replace_heading, text, flags=re.MULTILINE)
 
-def update_bookmark_summary(bookmark_id: str, content: str, model: str = None):
-    """쓰레드에서 북마크 요약을 생성하고 업데이트하는 함수 (model 미지정 시 기본 모델 사용)."""
+def keywords_to_tags(keywords: str) -> list:
+    """'a, b, c' 형식 키워드 문자열을 태그 리스트로 변환 (마크다운 기호/공백 제거)"""
+    if not keywords:
+        return []
+    return [t for k in keywords.split(',') if (t := k.strip().replace('*', '').replace('`', '').replace(':', '').replace(' ', '').strip())]
+
+def build_summary_result(raw: str, structured: bool) -> Optional[CachedSummary]:
+    """
+    LLM 응답을 저장용 요약/분류/태그로 변환.
+    구조화(JSON) 응답은 한 번에 파싱하고, 구형 모델 응답이나 JSON 파싱 실패 시 정규식 추출로 대체.
+    """
+    if structured:
+        parsed = parse_structured_summary(raw)
+        if parsed is not None:
+            summary = fix_markdown_heading_duplicates(to_markdown(parsed))
+            return CachedSummary(summary, clean_html_tags_from_text(parsed.category)[:100], keywords_to_tags(",".join(parsed.keywords)))
+        logger.warning("구조화 요약 JSON 파싱 실패 - 정규식 추출로 대체")
+        if raw.lstrip().startswith("{"):
+            # 잘린 JSON이면 summary 값만이라도 살림
+            raw = partial_summary_field(raw)
+            if not raw.strip():
+                return None
+
+    # 요약 본문에서도 마크다운 헤딩 중복 보정 (LLM이 ### ### 등으로 출력한 경우)
+    summary = fix_markdown_heading_duplicates(raw)
+    category, keywords = extract_category_keywords(summary)
+    return CachedSummary(summary, category, keywords_to_tags(keywords))
+
+def _translated_title(original: str, raw: Optional[str] = None, structured: bool = False) -> str:
+    """
+    요약 응답(JSON)의 title 반환 (요약과 함께 제목 번역을 요청한 경우).
+    title이 없으면(구조화 출력 미사용 모델, 캐시 적중, 파싱 실패) 번역 모델로 따로 번역
+    """
+    parsed = parse_structured_summary(raw) if structured and raw else None
+    if parsed is not None and parsed.title:
+        return parsed.title
+    return translate_text(original, source_lang=detect_language(original), target_lang='ko')
+
+def _apply_summary(bookmark: Bookmark, result: CachedSummary, prompt_version: str, model: str):
+    """요약/분류/태그와 프롬프트 버전, 모델을 북마크에 반영 (커밋은 호출 측에서)"""
+    bookmark.summary = result.summary
+    bookmark.summary_prompt_version = prompt_version
+    bookmark.summary_model = model
+    bookmark.category = result.category
+    bookmark.tags = list(result.tags)
+
+class PartialSummaryPublisher:
+    """
+    스트리밍 중간 요약 처리: 토큰마다 같은 프로세스의 SSE 구독자에게 전달하고,
+    SUMMARY_STREAM_FLUSH_INTERVAL마다 summary_jobs.partial_summary에 저장 (다른 프로세스의 SSE용).
+    작업이 취소/대체되면 SummaryJobCancelled를 발생시켜 스트리밍(LLM 생성)을 중단.
+    """
+
+    def __init__(self, bookmark_id, job_id=None):
+        self.bookmark_id = str(bookmark_id)
+        self.job_id = job_id
+        self._last_flush = 0.0
+        self._last_check = 0.0
+
+    def check_cancelled(self):
+        """
+        긴 문서 map 단계용 취소 확인 (중간 결과는 전달하지 않음).
+        같은 프로세스의 취소 표시는 매번, DB 상태는 SUMMARY_STREAM_FLUSH_INTERVAL마다 확인.
+        """
+        if self.job_id is None:
+            return
+        if is_job_cancelled_locally(self.job_id):
+            raise SummaryJobCancelled(JOB_CANCELLED)
+        now = time.monotonic()
+        if now - self._last_check < settings.SUMMARY_STREAM_FLUSH_INTERVAL:
+            return
+        self._last_check = now
+        stale = None
+        db = SessionLocal()
+        try:
+            stale = is_job_stale(db, self.job_id)
+        except Exception as e:
+            logger.debug(f"작업 취소 확인 실패 - job: {self.job_id}, 오류: {e}")
+        finally:
+            db.close()
+        if stale:
+            raise SummaryJobCancelled(stale)
+
+    def __call__(self, text: str):
+        if self.job_id is None:
+            summary_stream_broker.publish(self.bookmark_id, {"type": "partial", "text": text})
+            return
+        if is_job_cancelled_locally(self.job_id):
+            raise SummaryJobCancelled(JOB_CANCELLED)
+        summary_stream_broker.publish(self.bookmark_id, {"type": "partial", "text": text})
+        now = time.monotonic()
+        if now - self._last_flush < settings.SUMMARY_STREAM_FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+        stale = None
+        db = SessionLocal()
+        try:
+            # 다른 프로세스에서 취소/대체된 경우도 저장 시점에 확인
+            stale = is_job_stale(db, self.job_id)
+            if stale is None:
+                db.query(SummaryJob).filter(SummaryJob.id == self.job_id).update(
+                    {"partial_summary": text}, synchronize_session=False
+                )
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.debug(f"중간 요약 저장 실패 - job: {self.job_id}, 오류: {e}")
+        finally:
+            db.close()
+        if stale:
+            raise SummaryJobCancelled(stale)
+
+
+@contextmanager
+def _job_map_slots(job_id, model: str, wanted: int):
+    """요약 작업의 map 단계 추가 슬롯을 모델별 동시 요청 예산에서 빌리고, 끝나면 반납"""
+    granted = borrow_map_slots(job_id, model, wanted)
+    try:
+        yield granted
+    finally:
+        if granted:
+            release_map_slots(job_id)
+
+
+def _save_result(
+    db: Session, bid, job_id, result: CachedSummary, prompt_version: str, model: str,
+    translated_title: Optional[str] = None,
+) -> Optional[str]:
+    """
+    북마크 행을 잠근 뒤 작업이 여전히 유효할 때만 요약 저장 (오래된 작업 결과가 새 결과를 덮어쓰지 않도록).
+    북마크가 삭제되었거나 같은 북마크의 새 작업이 있으면 SummaryJobCancelled.
+    translated_title: 제목 번역 대기 중인 북마크면 '한글(English)' 형태로 제목 변경 (변경된 제목 반환).
+        비었거나 현재 제목과 같으면(번역 실패) 제목을 바꾸지 않고 번역 대기 상태 유지
+    """
+    # 요약 생성 동안 열려 있던 트랜잭션을 끝내고 최신 상태로 다시 조회
+    db.rollback()
+    bookmark = db.query(Bookmark).filter(Bookmark.id == bid).with_for_update().first()
+    if not bookmark or bookmark.is_deleted:
+        db.rollback()
+        raise SummaryJobCancelled(JOB_CANCELLED)
+    if job_id is not None:
+        stale = is_job_stale(db, job_id)
+        if stale:
+            db.rollback()
+            raise SummaryJobCancelled(stale)
+    _apply_summary(bookmark, result, prompt_version, model)
+    title = None
+    # 요약 중에 사용자가 제목을 수정했으면 title_translation_pending이 False (덮어쓰지 않음).
+    # 번역 결과가 비었거나 원문 그대로면(translate_text는 오류 시 원문 반환) 대기 상태로 남겨 스위퍼가 다시 번역
+    translated_title = (translated_title or "").strip()
+    if translated_title and translated_title != bookmark.title.strip() and bookmark.title_translation_pending:
+        bookmark.title = bilingual_title(bookmark.title, translated_title)[:255]
+        bookmark.title_translation_pending = False
+        title = bookmark.title
+    db.commit()
+    return title
+
+
+def _done_event(summary: str, title: Optional[str]) -> dict:
+    event = {"type": "done", "summary": summary}
+    if title:
+        event["title"] = title
+    return event
+
+
+def update_bookmark_summary(bookmark_id: str, content: Optional[str] = None, model: str = None, job_id=None) -> bool:
+    """
+    워커 쓰레드에서 북마크 요약을 생성하고 업데이트하는 함수 (model 미지정 시 기본 모델 사용).
+    content 미지정 시 북마크에 저장된 content로 요약. 요약이 저장되면 True 반환.
+    요약은 스트리밍으로 받아 중간 결과를 SSE 구독자에게 전달 (job_id 지정 시 작업 행에도 주기적으로 저장).
+    job_id 작업이 취소(북마크 삭제)되거나 새 작업으로 대체되면 저장하지 않고 SummaryJobCancelled 발생.
+    """
     db = None
     try:
         # Bookmark.id는 UUID 타입이므로 문자열을 UUID로 변환 (조회 실패 방지)
@@ -118,49 +301,108 @@ def update_bookmark_summary(bookmark_id: str, content: str, model: str = None):
             bid = uuid_module.UUID(bookmark_id) if isinstance(bookmark_id, str) else bookmark_id
         except (ValueError, TypeError) as e:
             logger.error(f"요약 태스크 bookmark_id 변환 실패: bookmark_id={bookmark_id!r}, 오류: {e}")
-            return
+            return False
 
         # 새로운 DB 세션 생성
         db = SessionLocal()
 
         # DB에서 북마크 조회 (UUID로 조회)
         bookmark = db.query(Bookmark).filter(Bookmark.id == bid).first()
-        if not bookmark:
+        if not bookmark or bookmark.is_deleted:
             logger.warning(f"요약 업데이트할 북마크를 찾을 수 없음: id={bid}")
-            return
+            if job_id is not None:
+                raise SummaryJobCancelled(JOB_CANCELLED)
+            return False
+        if job_id is not None:
+            stale = is_job_stale(db, job_id)
+            if stale:
+                raise SummaryJobCancelled(stale)
+
+        if content is None:
+            content = bookmark.content or ""
+        # 영어 제목 번역 대기 중이면 요약 호출(JSON title)에서 함께 번역
+        pending_title = bookmark.title if bookmark.title_translation_pending else None
+
+        # 같은 본문/모델/프롬프트로 만든 요약이 있으면 LLM 호출 없이 재사용
+        cache_key = None
+        use_model = (model or "").strip() or settings.OLLAMA_MODEL
+        structured = structured_output_enabled(use_model)
+        prompt_version = get_prompt_version(structured)
+        if settings.SUMMARY_CACHE_ENABLED and content.strip():
+            cache_key = make_cache_key(content, use_model, prompt_version)
+            cached = summary_cache.get(db, cache_key)
+            if cached is not None:
+                logger.info(f"요약 캐시 적중 - 북마크 ID: {bid}, 모델: {use_model}")
+                translated = _translated_title(pending_title) if pending_title else None
+                title = _save_result(db, bid, job_id, cached, prompt_version, use_model, translated)
+                summary_stream_broker.publish(str(bid), _done_event(cached.summary, title))
+                submit_embedding(bid)
+                return True
 
         # OpenAI 요약 생성 (지정된 모델 또는 기본 모델 사용)
-        summary = generate_summary(content, model=model)
+        publisher = PartialSummaryPublisher(bid, job_id)
+        raw = generate_summary(
+            content, model=use_model, on_partial=publisher, structured=structured,
+            translate_title=pending_title if structured else None,
+            cancel_check=publisher.check_cancelled if job_id is not None else None,
+            map_slots=partial(_job_map_slots, job_id) if job_id is not None else None,
+        )
 
         # 요약 생성 실패 시 오류 문구를 DB에 저장하지 않음 (기존 '요약 생성 중...' 유지)
-        if not summary or not summary.strip():
+        if not raw or not raw.strip():
             logger.warning(f"요약 생성 실패 - 북마크 ID: {bid}, summary 컬럼은 갱신하지 않음")
-            return
+            return False
 
-        # 요약 본문에서도 마크다운 헤딩 중복 보정 (LLM이 ### ### 등으로 출력한 경우)
-        summary = fix_markdown_heading_duplicates(summary)
+        result = build_summary_result(raw, structured)
+        if result is None:
+            logger.warning(f"요약 응답 해석 실패 - 북마크 ID: {bid}, summary 컬럼은 갱신하지 않음")
+            return False
+        summary = result.summary
+        logger.info(f"분류: {result.category}, 키워드: {', '.join(result.tags)}")
 
-        category, keywords = extract_category_keywords(summary)
-        logger.info(f"분류: {category}, 키워드: {keywords}")
+        translated = _translated_title(pending_title, raw, structured) if pending_title else None
 
         # DB 업데이트 (성공한 경우만)
-        bookmark.summary = summary
-        bookmark.category = category
-        if keywords:
-            keyword_list = [t for k in keywords.split(',') if (t := k.strip().replace('*', '').replace('`', '').replace(':', '').replace(' ', '').strip())]
-            bookmark.tags = keyword_list
-        else:
-            bookmark.tags = []
-        db.commit()
-        db.refresh(bookmark)
-        logger.info(f"북마크 요약 업데이트 완료 - ID: {bid}")
+        title = _save_result(db, bid, job_id, result, prompt_version, use_model, translated)
+        logger.info(f"북마크 요약 업데이트 완료 - ID: {bid}" + (f", 제목: {title}" if title else ""))
+        summary_stream_broker.publish(str(bid), _done_event(summary, title))
+        submit_embedding(bid)
+        if cache_key:
+            summary_cache.put(db, cache_key, use_model, prompt_version, result)
+        return True
+    except SummaryJobCancelled as e:
+        logger.info(f"요약 작업 중단 - 북마크 ID: {bookmark_id}, job: {job_id}, 사유: {e.status}")
+        raise
     except Exception as e:
         logger.error(f"북마크 요약 업데이트 실패: {str(e)}")
         logger.exception("상세:")
+        return False
     finally:
         if db:
             db.close()
 
-def submit_summary_task(bookmark_id: str, content: str, model: str = None):
-    """요약 태스크를 쓰레드 풀에 제출 (model 미지정 시 기본 모델 사용)."""
-    return executor.submit(update_bookmark_summary, bookmark_id, content, model) 
\ No newline at end of file
+def _enqueue_routed(db: Session, bookmark_id: str, model: Optional[str]):
+    bid = uuid_module.UUID(bookmark_id) if isinstance(bookmark_id, str) else bookmark_id
+    content = db.query(Bookmark.content).filter(Bookmark.id == bid).scalar()
+    queue_stats = get_queue_stats(db) if not model else None
+    decision = route_summary_model(content, requested_model=model, queue_stats=queue_stats)
+    logger.info(
+        f"요약 모델 선택 - 북마크 ID: {bid}, 모델: {decision.model}, 이유: {decision.reason}, "
+        f"본문 길이: {len(content or '')}"
+    )
+    return enqueue_summary_job(db, bid, model=decision.model, route_reason=decision.reason)
+
+
+def submit_summary_task(bookmark_id: str, model: str = None, db: Optional[Session] = None):
+    """
+    요약 작업을 큐(summary_jobs)에 적재.
+    model 미지정 시 본문 길이/언어/큐 적체로 모델 자동 선택 (model_router).
+    실제 요약은 워커(API 내장 워커 또는 python -m app.worker)가 북마크의 content로 수행.
+    """
+    if db is not None:
+        return _enqueue_routed(db, bookmark_id, model)
+    session = SessionLocal()
+    try:
+        return _enqueue_routed(session, bookmark_id, model)
+    finally:
+        session.close()
@@ -0,0 +1,135 @@
+"""
+요약 워커
+
+summary_jobs 큐에서 작업을 가져와 쓰레드 풀에서 update_bookmark_summary를 실행합니다.
+API 프로세스 내장 워커(main.py startup)와 독립 워커 프로세스(python -m app.worker)가 같은 클래스를 사용합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import logging
+import os
+import socket
+import threading
+import uuid as uuid_module
+
+from ..core.config import settings
+from ..utils.llm_telemetry import llm_call_context
+from .summary_queue import (
+    ClaimedJob, SummaryJobCancelled, claim_jobs, finish_job, heartbeat_jobs, notify_workers, wait_for_jobs,
+)
+from .summary_stream import summary_stream_broker
+from .summary_tasks import update_bookmark_summary
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryWorker:
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        worker_id: Optional[str] = None,
+    ):
+        self.concurrency = max(1, concurrency or settings.SUMMARY_WORKER_CONCURRENCY)
+        self.poll_interval = poll_interval or settings.SUMMARY_WORKER_POLL_INTERVAL
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid_module.uuid4().hex[:6]}"
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="summary-worker")
+        self._in_flight = 0
+        self._running = set()  # 실행 중 작업 ID (heartbeat 대상)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    def start(self):
+        """백그라운드 쓰레드에서 워커 루프 시작 (API 내장 워커용)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self.run_forever, name="summary-worker-loop", daemon=True)
+        self._thread.start()
+
+    def _start_heartbeat(self):
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name="summary-worker-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self):
+        """
+        SUMMARY_JOB_HEARTBEAT_INTERVAL마다 실행 중 작업의 heartbeat_at 갱신.
+        종료 요청 후에도 실행 중 작업이 끝날 때까지 계속 (긴 작업이 시간 초과로 실패 처리되지 않도록)
+        """
+        interval = max(1, settings.SUMMARY_JOB_HEARTBEAT_INTERVAL)
+        while True:
+            stopping = self._stop.wait(interval)
+            with self._lock:
+                job_ids = list(self._running)
+            if stopping and not job_ids:
+                return
+            heartbeat_jobs(self.worker_id, job_ids)
+
+    def request_stop(self):
+        """워커 루프에 종료 요청 (시그널 핸들러에서 호출 가능)"""
+        self._stop.set()
+        notify_workers()
+
+    def stop(self, wait: bool = True):
+        """새 작업 수신을 멈추고, wait=True면 실행 중인 작업 완료까지 대기"""
+        self.request_stop()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.poll_interval * 2)
+        self._executor.shutdown(wait=wait)
+
+    def run_forever(self):
+        logger.info(f"요약 워커 시작 - worker: {self.worker_id}, 동시 작업 수: {self.concurrency}")
+        self._start_heartbeat()
+        while not self._stop.is_set():
+            free = self.concurrency - self.in_flight
+            claimed = []
+            if free > 0:
+                try:
+                    claimed = claim_jobs(self.worker_id, free)
+                except Exception as e:
+                    logger.error(f"요약 작업 조회 실패: {str(e)}")
+            for job in claimed:
+                self._dispatch(job)
+            if not claimed:
+                wait_for_jobs(self.poll_interval)
+        logger.info(f"요약 워커 종료 - worker: {self.worker_id}")
+
+    def _dispatch(self, job: ClaimedJob):
+        with self._lock:
+            self._in_flight += 1
+            self._running.add(job.id)
+        self._executor.submit(self._run, job)
+
+    def _run(self, job: ClaimedJob):
+        ok = False
+        try:
+            # 이 작업의 LLM 호출 지표에 작업 ID와 큐 대기 시간 기록
+            with llm_call_context(job_id=job.id, queue_wait_seconds=job.queue_wait_seconds):
+                ok = update_bookmark_summary(str(job.bookmark_id), None, model=job.model, job_id=job.id)
+            finish_job(job.id, success=ok, error=None if ok else "요약 생성 실패")
+        except SummaryJobCancelled as e:
+            # 북마크 삭제 또는 새 작업으로 대체 → 결과를 버리고 실패 알림도 보내지 않음 (새 작업이 알림)
+            ok = True
+            finish_job(job.id, success=False, status=e.status)
+        except Exception as e:
+            logger.exception(f"요약 작업 실행 실패 - job: {job.id}")
+            ok = False
+            finish_job(job.id, success=False, error=str(e))
+        finally:
+            if not ok:
+                summary_stream_broker.publish(str(job.bookmark_id), {"type": "failed"})
+            with self._lock:
+                self._in_flight -= 1
+                self._running.discard(job.id)
+            # 빈 슬롯이 생겼으므로 워커 루프를 깨움
+            notify_workers()
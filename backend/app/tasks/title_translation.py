@@ -0,0 +1,237 @@
+"""
+제목 번역 보강 작업 (북마크 생성 경로 밖에서 실행)
+
+- 북마크는 스크랩한 영어 제목 그대로 즉시 저장(title_translation_pending=true)
+- SUMMARY_TRANSLATE_TITLE=False면 생성 직후 이 모듈의 쓰레드 풀(TITLE_TRANSLATION_CONCURRENCY)에서 번역하고,
+  True면 요약 호출에서 함께 번역 (summary_tasks)
+- 번역이 끝나면 북마크 행을 잠근 뒤 여전히 대기 중이고 제목이 바뀌지 않았을 때만 '한글(English)' 형태로 변경하고
+  요약 스트림(SSE)에 title 이벤트 전송
+- 번역 실패(빈 결과/원문 그대로)는 반영하지 않고 대기 상태로 남겨 다시 번역
+- 복구 스위퍼가 TITLE_TRANSLATION_SWEEP_AGE초가 지나도 대기 중인 북마크(프로세스 재시작, 요약/번역 실패 등)를
+  (created_at, id) 순으로 이어서 다시 번역 (끝까지 가면 처음부터, 계속 실패하는 제목이 뒤 북마크를 막지 않도록)
+- 여러 제목(스위퍼 재시도, python -m app.translate_titles 백필)은 translate_batch로 묶어서 번역
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import logging
+import threading
+import uuid as uuid_module
+
+from sqlalchemy import and_, or_, text
+
+from ..core.config import settings
+from ..db.session import SessionLocal
+from ..models.bookmark import Bookmark
+from ..utils.translate import bilingual_title, detect_language, translate_batch, translate_text
+from .embedding_tasks import submit_embedding
+from .summary_stream import summary_stream_broker
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock 키 (제목 번역 스위프 전용)
+_SWEEP_LOCK_KEY = 7_302_045
+
+
+def apply_translated_title(bookmark_id, original: str, translated: str) -> Optional[str]:
+    """
+    번역 제목 반영. 북마크가 삭제/수정되었거나 이미 번역된 경우 반영하지 않음.
+    번역 결과가 비었거나 원문과 같으면(translate_text는 오류 시 원문 반환) 대기 상태로 남겨 다시 번역.
+    변경된 제목 반환 (반영하지 않았으면 None)
+    """
+    translated = (translated or "").strip()
+    if not translated or translated == original.strip():
+        return None
+    db = SessionLocal()
+    try:
+        bookmark = db.query(Bookmark).filter(Bookmark.id == bookmark_id).with_for_update().first()
+        if (
+            not bookmark or bookmark.is_deleted
+            or not bookmark.title_translation_pending or bookmark.title != original
+        ):
+            db.rollback()
+            return None
+        bookmark.title = bilingual_title(original, translated)[:255]
+        bookmark.title_translation_pending = False
+        db.commit()
+        return bookmark.title
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def translate_bookmark_title(bookmark_id) -> Optional[str]:
+    """대기 중인 북마크 제목을 번역해 반영하고 변경된 제목 반환"""
+    bid = uuid_module.UUID(bookmark_id) if isinstance(bookmark_id, str) else bookmark_id
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Bookmark.title)
+            .filter(Bookmark.id == bid, Bookmark.title_translation_pending == True, Bookmark.is_deleted == False)
+            .first()
+        )
+    finally:
+        db.close()
+    if row is None:
+        return None
+    original = row.title
+    translated = translate_text(original, source_lang=detect_language(original), target_lang='ko')
+    return _publish_title(bid, original, translated)
+
+
+def _publish_title(bookmark_id, original: str, translated: str) -> Optional[str]:
+    title = apply_translated_title(bookmark_id, original, translated)
+    if title is not None:
+        logger.info(f"제목 번역 반영 - 북마크 ID: {bookmark_id}, 제목: {title}")
+        summary_stream_broker.publish(str(bookmark_id), {"type": "title", "title": title})
+        submit_embedding(bookmark_id)
+    return title
+
+
+def translate_titles_batch(rows: Sequence[Tuple], batch_size: Optional[int] = None) -> int:
+    """(북마크 ID, 원문 제목, ...) 목록을 원문 언어별로 일괄 번역해 반영하고 반영된 수 반환"""
+    if not rows:
+        return 0
+    by_lang: Dict[str, List[Tuple]] = {}
+    for row in rows:
+        by_lang.setdefault(detect_language(row[1]), []).append(row)
+    results: List[Tuple] = []
+    for lang, group in by_lang.items():
+        translations = translate_batch(
+            [row[1] for row in group], source_lang=lang, target_lang='ko', batch_size=batch_size,
+        )
+        results.extend(zip(group, translations))
+    applied = 0
+    for row, translated in results:
+        bookmark_id, original = row[0], row[1]
+        try:
+            if _publish_title(bookmark_id, original, translated) is not None:
+                applied += 1
+        except Exception as e:
+            logger.error(f"제목 번역 반영 실패 - 북마크 ID: {bookmark_id}, 오류: {e}")
+    return applied
+
+
+def pending_title_rows(
+    db, limit: int, created_before: Optional[datetime] = None, after: Optional[Tuple] = None,
+) -> List[Tuple]:
+    """
+    번역 대기 중인 (북마크 ID, 제목, 생성 시각) 목록 ((created_at, id) 순).
+    after: 이전 페이지 마지막 행의 (생성 시각, 북마크 ID). 지정하면 그 다음 행부터
+    """
+    query = db.query(Bookmark.id, Bookmark.title, Bookmark.created_at).filter(
+        Bookmark.title_translation_pending == True,
+        Bookmark.is_deleted == False,
+    )
+    if created_before is not None:
+        query = query.filter(Bookmark.created_at < created_before)
+    if after is not None:
+        created_at, bookmark_id = after
+        query = query.filter(or_(
+            Bookmark.created_at > created_at,
+            and_(Bookmark.created_at == created_at, Bookmark.id > bookmark_id),
+        ))
+    rows = query.order_by(Bookmark.created_at, Bookmark.id).limit(limit).all()
+    return [(row.id, row.title, row.created_at) for row in rows]
+
+
+def page_cursor(rows: Sequence[Tuple]) -> Optional[Tuple]:
+    """pending_title_rows 결과의 다음 페이지 커서 (마지막 행의 (생성 시각, 북마크 ID))"""
+    return (rows[-1][2], rows[-1][0]) if rows else None
+
+
+class TitleTranslator:
+    """제목 번역 쓰레드 풀 (같은 북마크는 동시에 한 번만 실행)"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.TITLE_TRANSLATION_CONCURRENCY),
+                    thread_name_prefix="title-translate",
+                )
+            return self._executor
+
+    def submit(self, bookmark_id) -> bool:
+        """번역 작업 제출 (이미 진행 중이면 False)"""
+        key = str(bookmark_id)
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+        self._get_executor().submit(self._run, key)
+        return True
+
+    def submit_batch(self, rows: Sequence[Tuple]) -> int:
+        """(북마크 ID, 제목) 목록을 한 작업으로 제출 (이미 진행 중인 북마크 제외). 제출 수 반환"""
+        with self._lock:
+            rows = [row for row in rows if str(row[0]) not in self._in_flight]
+            self._in_flight.update(str(row[0]) for row in rows)
+        if rows:
+            self._get_executor().submit(self._run_batch, rows)
+        return len(rows)
+
+    def _run(self, bookmark_id: str):
+        try:
+            translate_bookmark_title(bookmark_id)
+        except Exception as e:
+            logger.error(f"제목 번역 실패 - 북마크 ID: {bookmark_id}, 오류: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(bookmark_id)
+
+    def _run_batch(self, rows: List[Tuple]):
+        try:
+            translate_titles_batch(rows)
+        except Exception as e:
+            logger.error(f"제목 일괄 번역 실패 ({len(rows)}건): {e}")
+        finally:
+            with self._lock:
+                self._in_flight.difference_update(str(row[0]) for row in rows)
+
+
+# 프로세스 전역 번역기
+title_translator = TitleTranslator()
+
+
+def submit_title_translation(bookmark_id) -> bool:
+    return title_translator.submit(bookmark_id)
+
+
+# 스위프 커서 (프로세스 단위): 번역이 계속 실패하는 제목이 맨 앞에 남아도 다음 스위프는 그 뒤부터
+_sweep_cursor: Optional[Tuple] = None
+
+
+def sweep_pending_titles() -> int:
+    """TITLE_TRANSLATION_SWEEP_AGE초가 지나도 번역 대기 중인 북마크를 일괄 번역 작업으로 제출하고 제출 수 반환"""
+    global _sweep_cursor
+    db = SessionLocal()
+    try:
+        locked = db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _SWEEP_LOCK_KEY}).scalar()
+        if not locked:
+            return 0
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.TITLE_TRANSLATION_SWEEP_AGE)
+        size = settings.TITLE_TRANSLATION_SWEEP_BATCH_SIZE
+        rows = pending_title_rows(db, size, created_before=cutoff, after=_sweep_cursor)
+        if not rows and _sweep_cursor is not None:
+            # 끝까지 확인했으면 처음부터 다시
+            rows = pending_title_rows(db, size, created_before=cutoff)
+        _sweep_cursor = page_cursor(rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"제목 번역 스위프 실패: {str(e)}")
+        return 0
+    finally:
+        db.close()
+    submitted = title_translator.submit_batch(rows)
+    if submitted:
+        logger.info(f"제목 번역 재시도 제출 - {submitted}건")
+    return submitted
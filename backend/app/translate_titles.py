@@ -0,0 +1,107 @@
+"""
+영어 제목 일괄 번역(백필) CLI
+
+실행 방법 (backend 디렉터리에서):
+  # 번역 대기(title_translation_pending) 중인 제목을 모두 번역
+  python -m app.translate_titles
+  # 한글이 없는 기존 URL 북마크 제목도 번역 대기로 표시한 뒤 번역 (대상 수만 확인: --dry-run)
+  python -m app.translate_titles --scan --dry-run
+  python -m app.translate_titles --scan --limit 500
+
+제목은 TRANSLATE_BATCH_SIZE(또는 --batch-size)개씩 묶어 번역 모델 1회 호출로 번역하고(translate_batch),
+번역 캐시에 있는 제목은 호출하지 않습니다. 번역 결과는 '한글(English)' 형태로 저장됩니다.
+"""
+import argparse
+import logging
+import sys
+from typing import Tuple
+
+from sqlalchemy import func, text
+
+from app.core.config import settings
+from app.core.logging import setup_root_logger
+from app.db.schema_updates import apply_column_updates
+from app.db.session import SessionLocal, engine
+from app.models import Base
+from app.models.bookmark import Bookmark
+from app.tasks.title_translation import page_cursor, pending_title_rows, translate_titles_batch
+
+logger = logging.getLogger("app.translate_titles")
+
+# 한글이 없고 영문자가 있는 제목 (URL로 등록한 북마크만, 직접 입력 컨텐츠 제외)
+_ENGLISH_TITLE = text("bookmarks.title !~ '[가-힣]' AND bookmarks.title ~ '[A-Za-z]' AND bookmarks.url <> ''")
+
+
+def _scan_query(db):
+    return db.query(Bookmark).filter(
+        Bookmark.is_deleted == False,
+        Bookmark.title_translation_pending == False,
+        _ENGLISH_TITLE,
+    )
+
+
+def translate_pending(batch_size: int, limit: int = 0, pending: int = 0) -> Tuple[int, int]:
+    """
+    번역 대기 제목을 (created_at, id) 순으로 batch_size개씩 번역. (처리 수, 반영 수) 반환.
+    번역에 실패해 대기 상태로 남은 제목은 커서 뒤로 넘어가므로 다시 조회하지 않음
+    """
+    processed = applied = 0
+    cursor = None
+    while not limit or processed < limit:
+        size = batch_size if not limit else min(batch_size, limit - processed)
+        db = SessionLocal()
+        try:
+            rows = pending_title_rows(db, size, after=cursor)
+        finally:
+            db.close()
+        if not rows:
+            break
+        cursor = page_cursor(rows)
+        applied += translate_titles_batch(rows, batch_size=batch_size)
+        processed += len(rows)
+        logger.info(f"제목 번역 진행: {processed}/{pending}건 (반영 {applied}건)")
+    return processed, applied
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LinkDigest 영어 제목 일괄 번역")
+    parser.add_argument("--scan", action="store_true", help="한글이 없는 기존 제목을 번역 대기로 표시")
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.TRANSLATE_BATCH_SIZE,
+        help=f"번역 모델 1회 호출에 묶을 제목 수 (기본값: {settings.TRANSLATE_BATCH_SIZE})",
+    )
+    parser.add_argument("--limit", type=int, default=0, help="최대 처리 수 (0이면 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="대상 수만 출력")
+    args = parser.parse_args(argv)
+
+    setup_root_logger()
+    Base.metadata.create_all(bind=engine)
+    apply_column_updates(engine)
+
+    db = SessionLocal()
+    try:
+        pending = db.query(func.count(Bookmark.id)).filter(
+            Bookmark.title_translation_pending == True, Bookmark.is_deleted == False,
+        ).scalar() or 0
+        if args.scan:
+            scan_count = _scan_query(db).count()
+            if args.dry_run:
+                print(f"번역 대기: {pending}건, 새로 표시할 영어 제목: {scan_count}건")
+                return 0
+            marked = _scan_query(db).update({"title_translation_pending": True}, synchronize_session=False)
+            db.commit()
+            pending += marked
+            print(f"영어 제목 {marked}건을 번역 대기로 표시")
+        elif args.dry_run:
+            print(f"번역 대기: {pending}건")
+            return 0
+    finally:
+        db.close()
+
+    processed, applied = translate_pending(max(1, args.batch_size), args.limit, pending)
+    print(f"제목 번역 완료: 처리 {processed}건, 반영 {applied}건")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+긴 문서 분할 (map-reduce 요약용)
+
+- 문단(빈 줄) 경계를 우선으로 max_chars 이하 청크로 묶음
+- 한 문단이 max_chars를 넘으면 문장 경계(. ? ! 。 및 '다.' 등)로, 그래도 넘으면 글자 수로 자름
+"""
+from typing import List
+import re
+
+# 문장 끝: 마침표/물음표/느낌표(한·중·일 포함) 뒤 공백 또는 줄바꿈
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _split_long_block(block: str, max_chars: int) -> List[str]:
+    """max_chars를 넘는 문단을 문장 단위로, 문장도 넘으면 글자 수로 분할"""
+    pieces: List[str] = []
+    for sentence in _SENTENCE_END.split(block):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+
+def split_into_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    텍스트를 의미 경계(문단 → 문장)를 지키며 max_chars 이하 청크 목록으로 분할
+
+    Args:
+        text: 원문
+        max_chars: 청크 최대 글자 수
+
+    Returns:
+        List[str]: 청크 목록 (빈 텍스트면 빈 리스트)
+    """
+    if not text or not text.strip():
+        return []
+    max_chars = max(1, max_chars)
+
+    units: List[tuple] = []  # (텍스트, 앞 청크와 이을 때 구분자)
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            units.append((paragraph, "\n\n"))
+            continue
+        for i, piece in enumerate(_split_long_block(paragraph, max_chars)):
+            units.append((piece, "\n\n" if i == 0 else " "))
+
+    chunks: List[str] = []
+    current = ""
+    for unit, sep in units:
+        if not current:
+            current = unit
+        elif len(current) + len(sep) + len(unit) <= max_chars:
+            current = current + sep + unit
+        else:
+            chunks.append(current)
+            current = unit
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,100 @@
+"""
+북마크 임베딩 계산
+
+- EMBEDDING_PROVIDER=ollama: Ollama /api/embed (EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE개씩 한 번에 요청)
+- EMBEDDING_PROVIDER=local: 단어/문자 3-gram 특징 해싱으로 만든 로컬 임베딩 (Ollama/모델 없이 개발·테스트용,
+  의미보다는 어휘 겹침을 반영)
+- 모든 벡터는 L2 정규화된 float32 (내적 = 코사인 유사도). DB에는 리틀 엔디언 float32 바이트로 저장
+- 임베딩 입력은 제목 + 태그 + 요약(📌 항목 라벨 제외), EMBEDDING_MAX_CHARS까지
+"""
+from functools import lru_cache
+from typing import List, Optional, Sequence
+import hashlib
+import re
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.ollama_client import ollama_client
+
+_DTYPE = np.dtype("<f4")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_SUMMARY_LABEL = re.compile(r"📌️?\s*\**\s*(분류|키워드|핵심요약)\s*\**\s*:?", re.UNICODE)
+
+
+def embedding_model_id() -> str:
+    """저장/인덱스 구분용 임베딩 모델 식별자 (모델이 바뀌면 다시 임베딩)"""
+    if settings.EMBEDDING_PROVIDER == "local":
+        return f"local:hash-{settings.EMBEDDING_LOCAL_DIM}"
+    return f"ollama:{settings.EMBEDDING_MODEL}"
+
+
+def bookmark_embedding_text(title: Optional[str], tags: Optional[Sequence[str]], summary: Optional[str]) -> str:
+    parts = [title or "", ", ".join(tags or []), _SUMMARY_LABEL.sub(" ", summary or "")]
+    text = "\n".join(part.strip() for part in parts if part and part.strip())
+    return text[:settings.EMBEDDING_MAX_CHARS]
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def to_bytes(vector) -> bytes:
+    return np.asarray(vector, dtype=_DTYPE).tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=_DTYPE)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행별 L2 정규화 (영벡터는 그대로)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _feature_index(feature: str, dim: int):
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dim, 1.0 if digest >> 63 else -1.0
+
+
+def local_embed(texts: Sequence[str], dim: Optional[int] = None) -> np.ndarray:
+    """
+    특징 해싱 임베딩: 소문자 단어와 단어별 문자 3-gram(한국어 어절 변화 흡수)을 부호 있는 해시로 dim 차원에 누적.
+    같은 입력은 항상 같은 벡터 (프로세스/재시작과 무관)
+    """
+    dim = dim or settings.EMBEDDING_LOCAL_DIM
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in _TOKEN.findall((text or "").lower()):
+            index, sign = _feature_index(word, dim)
+            matrix[row, index] += 2.0 * sign
+            padded = f"<{word}>"
+            for start in range(len(padded) - 2):
+                index, sign = _feature_index(padded[start:start + 3], dim)
+                matrix[row, index] += sign
+    return normalize_rows(matrix)
+
+
+def embed_texts(texts: Sequence[str]) -> np.ndarray:
+    """텍스트 목록을 정규화된 임베딩 행렬(len(texts) x dim, float32)로 변환. Ollama 요청 오류는 예외로 전달"""
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    if settings.EMBEDDING_PROVIDER == "local":
+        return local_embed(texts)
+    size = max(1, settings.EMBEDDING_BATCH_SIZE)
+    rows: List[List[float]] = []
+    for start in range(0, len(texts), size):
+        rows.extend(ollama_client.embed(settings.EMBEDDING_MODEL, list(texts[start:start + size])))
+    return normalize_rows(np.asarray(rows, dtype=np.float32))
+
+
+@lru_cache(maxsize=256)
+def _embed_query_bytes(model_id: str, query: str) -> bytes:
+    return to_bytes(embed_texts([query])[0])
+
+
+def embed_query(query: str) -> np.ndarray:
+    """검색어 임베딩 (같은 검색어/모델은 프로세스 안에서 재사용)"""
+    return from_bytes(_embed_query_bytes(embedding_model_id(), query))
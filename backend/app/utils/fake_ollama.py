@@ -0,0 +1,406 @@
+"""
+부하/지연 테스트용 가짜 Ollama 서버 (표준 라이브러리만 사용)
+
+실제 Ollama 없이 요약/번역 파이프라인을 돌려 보기 위한 대역 서버입니다.
+- POST /api/chat: 스트리밍(NDJSON)/비스트리밍, format(JSON 스키마) 지정 시 구조화 요약 JSON 응답
+  빈 messages는 워밍업(모델 로드)으로 처리
+- GET /api/tags, GET /api/version: 헬스 체크/보유 모델 조회용
+- GET /fake/stats, POST /fake/reset: 요청 수/오류 수 등 테스트 확인용 카운터
+- 응답 지연: 첫 토큰까지 지연(분포 지정) + 초당 토큰 수, 모델별 첫 요청은 콜드 로드 시간 추가
+- 오류 주입: HTTP 500, 스트림 중간 오류, 응답 없이 대기(타임아웃 테스트)
+- 요약은 prompt.conf 형식(📌 분류 / 📌 키워드 / 📌 핵심요약), 번역 요청은 번역문 형태로 응답
+
+실행 방법 (backend 디렉터리에서):
+  python -m app.utils.fake_ollama --port 11435 --latency lognormal:-0.5,0.4 --tokens-per-second 80 --error-rate 0.02
+  # 백엔드/워커는 OLLAMA_API_URL=http://127.0.0.1:11435/api/chat 로 실행
+
+테스트/벤치마크 코드에서:
+  with FakeOllamaServer(FakeOllamaConfig(tokens_per_second=0)) as server:
+      requests.post(server.chat_url, json={...})
+"""
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_NS = 1_000_000_000
+_TOKEN = re.compile(r"\S+\s*|\s+")
+_WORD = re.compile(r"[가-힣A-Za-z][가-힣A-Za-z0-9\-]{1,}")
+
+DEFAULT_MODELS = ["gpt-oss:120b-cloud", "emma3:27b-cloud", "translategemma:4b"]
+
+
+def parse_latency(spec: str) -> Tuple[str, List[float]]:
+    """
+    지연 분포 문자열 파싱 (초 단위).
+    fixed:0.5 | uniform:0.2,1.5 | normal:1.0,0.2 | lognormal:mu,sigma (random.lognormvariate 인자)
+    """
+    kind, _, args = (spec or "fixed:0").partition(":")
+    kind = kind.strip().lower()
+    values = [float(v) for v in args.split(",") if v.strip()]
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+    if kind not in expected or len(values) != expected[kind]:
+        raise ValueError(f"지연 분포 형식 오류: {spec!r} (예: fixed:0.5, uniform:0.2,1.5, lognormal:-0.5,0.4)")
+    return kind, values
+
+
+def sample_latency(spec: Tuple[str, List[float]], rng: random.Random) -> float:
+    kind, values = spec
+    if kind == "fixed":
+        value = values[0]
+    elif kind == "uniform":
+        value = rng.uniform(values[0], values[1])
+    elif kind == "normal":
+        value = rng.gauss(values[0], values[1])
+    else:
+        value = rng.lognormvariate(values[0], values[1])
+    return max(0.0, value)
+
+
+def split_tokens(text: str) -> List[str]:
+    """응답 텍스트를 스트리밍 단위(단어+뒤 공백)로 분할"""
+    return _TOKEN.findall(text)
+
+
+def _keywords(text: str, limit: int = 6) -> List[str]:
+    words = list(dict.fromkeys(w for w in _WORD.findall(text) if len(w) > 2))
+    return words[:limit] or ["테스트"]
+
+
+def canned_summary(source: str, body_lines: int = 8) -> Tuple[str, str, List[str]]:
+    """입력 본문으로 (분류, 키워드, 요약 본문) 생성. 본문 길이는 body_lines로 조절"""
+    keywords = _keywords(source)
+    lines = ["📌 핵심요약"]
+    lines += [f"{i}. {keywords[(i - 1) % len(keywords)]} 관련 핵심 내용을 정리한 문장입니다." for i in range(1, 6)]
+    lines += ["", "## 📝 본문 정리"]
+    lines += [f"- 가짜 Ollama 응답 본문 {i}번째 줄: {', '.join(keywords[:3])}" for i in range(1, body_lines + 1)]
+    return "기사", keywords, "\n".join(lines)
+
+
+@dataclass
+class FakeOllamaConfig:
+    models: List[str] = field(default_factory=lambda: list(DEFAULT_MODELS))
+    latency: str = "fixed:0"  # 첫 토큰까지 지연 분포 (parse_latency 형식)
+    tokens_per_second: float = 0.0  # 0이면 토큰 간 지연 없음
+    cold_load_seconds: float = 0.0  # 모델별 첫 요청(또는 워밍업)에 추가되는 로딩 시간
+    error_rate: float = 0.0  # HTTP 500 응답 비율
+    stream_error_rate: float = 0.0  # 스트리밍 도중 {"error": ...} 청크를 보내는 비율
+    hang_rate: float = 0.0  # 응답 없이 hang_seconds 동안 대기하는 비율
+    hang_seconds: float = 600.0
+    body_lines: int = 8  # 요약 본문 줄 수 (출력 토큰 수 조절)
+    summary_text: Optional[str] = None  # 지정 시 요약 응답을 이 텍스트로 고정
+    translation_text: Optional[str] = None  # 지정 시 번역 응답을 이 텍스트로 고정
+    seed: Optional[int] = None
+
+
+class FakeOllamaState:
+    """서버 전역 카운터와 난수 (핸들러 쓰레드 간 공유)"""
+
+    def __init__(self, config: FakeOllamaConfig):
+        self.config = config
+        self.latency = parse_latency(config.latency)
+        self.rng = random.Random(config.seed)
+        self.loaded = set()
+        self.lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def count(self, key: str, n: int = 1):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    def roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self.lock:
+            return self.rng.random() < rate
+
+    def first_token_delay(self) -> float:
+        with self.lock:
+            return sample_latency(self.latency, self.rng)
+
+    def load_model(self, model: str) -> float:
+        """처음 요청된 모델이면 콜드 로드 시간 반환"""
+        with self.lock:
+            if model in self.loaded:
+                return 0.0
+            self.loaded.add(model)
+        return self.config.cold_load_seconds
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "counters": dict(self.counters),
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "loaded_models": sorted(self.loaded),
+            }
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.loaded.clear()
+            self.max_in_flight = self.in_flight
+
+
+def build_reply(state: FakeOllamaState, payload: dict) -> str:
+    """요청 메시지를 보고 번역/요약(마크다운 또는 JSON) 응답 텍스트 생성"""
+    messages = payload.get("messages") or []
+    system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system")
+    user = "\n".join(m.get("content", "") for m in messages if m.get("role") == "user")
+    config = state.config
+    if "translator" in system.lower() or "translate" in system.lower():
+        if config.translation_text is not None:
+            return config.translation_text
+        source = user.split("\n\n", 1)[-1].strip()
+        return f"[번역] {source}"
+    category, keywords, body = canned_summary(user, config.body_lines)
+    if config.summary_text is not None:
+        body = config.summary_text
+    if payload.get("format") is not None:
+        return json.dumps({"category": category, "keywords": keywords, "summary": body}, ensure_ascii=False)
+    return f"📌 분류: {category}\n📌 키워드: {', '.join(keywords)}\n\n{body}"
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    server_version = "FakeOllama/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> FakeOllamaState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logger.debug(f"fake-ollama {self.address_string()} {format % args}")
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw or b"{}")
+
+    def do_GET(self):
+        if self.path.startswith("/api/tags"):
+            models = [{"name": m, "model": m} for m in self.state.config.models]
+            self._send_json(200, {"models": models})
+        elif self.path.startswith("/api/version"):
+            self._send_json(200, {"version": "0.0.0-fake"})
+        elif self.path.startswith("/fake/stats"):
+            self._send_json(200, self.state.stats())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.startswith("/fake/reset"):
+            self._read_json()
+            self.state.reset()
+            self._send_json(200, {"ok": True})
+            return
+        if not self.path.startswith("/api/chat"):
+            self._send_json(404, {"error": "not found"})
+            return
+        state = self.state
+        with state.lock:
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            self._chat(self._read_json())
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 요청을 취소(연결 종료)한 경우
+            state.count("client_disconnects")
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _chat(self, payload: dict):
+        state = self.state
+        config = state.config
+        model = payload.get("model") or ""
+        state.count("requests")
+        if model not in config.models:
+            state.count("unknown_model")
+            self._send_json(404, {"error": f"model '{model}' not found"})
+            return
+        started = time.monotonic()
+        load_seconds = state.load_model(model)
+        if not payload.get("messages"):
+            # 워밍업: 모델 로드만 수행
+            state.count("warmups")
+            time.sleep(load_seconds)
+            self._send_json(200, {
+                "model": model, "message": {"role": "assistant", "content": ""}, "done": True,
+                "done_reason": "load", "load_duration": int(load_seconds * _NS),
+                "total_duration": int((time.monotonic() - started) * _NS),
+            })
+            return
+        if state.roll(config.hang_rate):
+            state.count("hangs")
+            time.sleep(config.hang_seconds)
+            return
+        if state.roll(config.error_rate):
+            state.count("errors")
+            self._send_json(500, {"error": "fake ollama injected error"})
+            return
+
+        reply = build_reply(state, payload)
+        tokens = split_tokens(reply)
+        prompt_chars = sum(len(m.get("content", "")) for m in payload.get("messages") or [])
+        token_delay = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        time.sleep(load_seconds + state.first_token_delay())
+        eval_started = time.monotonic()
+
+        def metrics() -> dict:
+            now = time.monotonic()
+            return {
+                "load_duration": int(load_seconds * _NS),
+                "prompt_eval_count": max(1, prompt_chars // 4),
+                "prompt_eval_duration": int((eval_started - started - load_seconds) * _NS),
+                "eval_count": len(tokens),
+                "eval_duration": int((now - eval_started) * _NS),
+                "total_duration": int((now - started) * _NS),
+            }
+
+        if not payload.get("stream", True):
+            time.sleep(token_delay * len(tokens))
+            state.count("completed")
+            self._send_json(200, {
+                "model": model, "message": {"role": "assistant", "content": reply},
+                "done": True, "done_reason": "stop", **metrics(),
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        fail_at = state.rng.randrange(len(tokens)) if tokens and state.roll(config.stream_error_rate) else None
+        for index, token in enumerate(tokens):
+            if fail_at is not None and index == fail_at:
+                state.count("stream_errors")
+                self._write_chunk({"error": "fake ollama injected stream error"})
+                self._end_chunks()
+                return
+            self._write_chunk({"model": model, "message": {"role": "assistant", "content": token}, "done": False})
+            if token_delay:
+                time.sleep(token_delay)
+        self._write_chunk({
+            "model": model, "message": {"role": "assistant", "content": ""},
+            "done": True, "done_reason": "stop", **metrics(),
+        })
+        self._end_chunks()
+        state.count("completed")
+
+    def _write_chunk(self, body: dict):
+        data = (json.dumps(body, ensure_ascii=False) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_chunks(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class FakeOllamaServer:
+    """백그라운드 쓰레드에서 실행되는 가짜 Ollama 서버 (port=0이면 빈 포트 자동 선택)"""
+
+    def __init__(self, config: Optional[FakeOllamaConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.state = FakeOllamaState(config or FakeOllamaConfig())
+        self.httpd = ThreadingHTTPServer((host, port), FakeOllamaHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def chat_url(self) -> str:
+        """OLLAMA_API_URL(S)에 넣을 주소"""
+        return f"{self.base_url}/api/chat"
+
+    def start(self) -> "FakeOllamaServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-ollama", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        return self.state.stats()
+
+    def __enter__(self) -> "FakeOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="부하/지연 테스트용 가짜 Ollama 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--models", default=",".join(DEFAULT_MODELS), help="보유 모델 (쉼표 구분)")
+    parser.add_argument("--latency", default="fixed:0", help="첫 토큰까지 지연 분포 (fixed:0.5, uniform:a,b, normal:mu,sd, lognormal:mu,sigma)")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0, help="초당 생성 토큰 수 (0이면 지연 없음)")
+    parser.add_argument("--cold-load", type=float, default=0.0, help="모델별 첫 요청 로딩 시간(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율")
+    parser.add_argument("--stream-error-rate", type=float, default=0.0, help="스트리밍 중간 오류 비율")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="응답 없이 대기하는 요청 비율")
+    parser.add_argument("--hang-seconds", type=float, default=600.0)
+    parser.add_argument("--body-lines", type=int, default=8, help="요약 본문 줄 수")
+    parser.add_argument("--responses", help="고정 응답 JSON 파일 ({\"summary\": ..., \"translation\": ...})")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    canned = {}
+    if args.responses:
+        with open(args.responses, encoding="utf-8") as f:
+            canned = json.load(f)
+    config = FakeOllamaConfig(
+        models=[m.strip() for m in args.models.split(",") if m.strip()],
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        cold_load_seconds=args.cold_load,
+        error_rate=args.error_rate,
+        stream_error_rate=args.stream_error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        body_lines=args.body_lines,
+        summary_text=canned.get("summary"),
+        translation_text=canned.get("translation"),
+        seed=args.seed,
+    )
+    logging.basicConfig(level=logging.INFO)
+    server = FakeOllamaServer(config, host=args.host, port=args.port)
+    print(f"가짜 Ollama 서버 실행 중: {server.chat_url} (Ctrl+C로 종료)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+"""
+문자 체계(유니코드 코드 포인트) 기반 언어 판별 (정규식/외부 의존성 없음)
+
+- 텍스트를 한 번만 순회하며 글자를 한글/가나/한자/라틴/기타 문자로 분류해 ko, en, ja, zh, other 중 하나와
+  신뢰도(판별 언어 문자가 전체 글자에서 차지하는 비율, 0~1)를 반환
+- 한자는 같은 텍스트의 가나(일본어) 또는 한글(국한문 혼용)에 붙이고, 둘 다 없으면 중국어로 판단
+- 한국어/일본어/중국어 글자가 전체 글자의 30%를 넘으면 해당 언어 (기사 본문의 영어 용어/고유명사 허용)
+- 순수 ASCII 텍스트는 순회 없이 str.isascii()로 바로 판별
+- 제목 등 짧은 문자열(_MEMO_MAX_CHARS 이하)은 결과를 메모이즈 (같은 제목의 스크랩/번역/라우팅 반복 판별)
+
+벤치마크 (backend 디렉터리에서, 이전 정규식 방식과 비교):
+  python -m app.utils.language --iterations 20000
+"""
+from functools import lru_cache
+from typing import NamedTuple
+import argparse
+import time
+
+LANG_KO = "ko"
+LANG_EN = "en"
+LANG_JA = "ja"
+LANG_ZH = "zh"
+LANG_OTHER = "other"
+
+# 한국어/일본어/중국어로 판단하는 최소 글자 비율 (기존 한국어 판별 기준과 동일)
+CJK_MIN_RATIO = 0.3
+
+# 메모이즈할 최대 텍스트 길이와 항목 수 (긴 본문은 매번 계산해 메모리에 쌓지 않음)
+_MEMO_MAX_CHARS = 512
+_MEMO_SIZE = 4096
+
+
+class LanguageGuess(NamedTuple):
+    lang: str
+    confidence: float
+
+
+_NO_LETTERS = LanguageGuess(LANG_OTHER, 0.0)
+
+
+def _classify(text: str) -> LanguageGuess:
+    hangul = kana = han = latin = other = 0
+    for ch in text:
+        cp = ord(ch)
+        if cp < 0x80:
+            # ASCII: 영문자만 세고 숫자/공백/기호는 무시
+            if 0x61 <= (cp | 0x20) <= 0x7A:
+                latin += 1
+        elif 0xAC00 <= cp <= 0xD7A3 or 0x1100 <= cp <= 0x11FF or 0x3130 <= cp <= 0x318F:
+            # 한글 음절, 한글 자모, 호환 자모(ㄱ-ㅎ, ㅏ-ㅣ)
+            hangul += 1
+        elif 0x3040 <= cp <= 0x30FF or 0x31F0 <= cp <= 0x31FF or 0xFF66 <= cp <= 0xFF9D:
+            # 히라가나, 가타카나(반각 포함). 장음 기호(ー)도 가나로 셈
+            kana += 1
+        elif 0x4E00 <= cp <= 0x9FFF or 0x3400 <= cp <= 0x4DBF or 0xF900 <= cp <= 0xFAFF:
+            # CJK 통합 한자, 확장 A, 호환 한자
+            han += 1
+        elif 0xC0 <= cp <= 0x24F or 0x1E00 <= cp <= 0x1EFF:
+            # 악센트가 있는 라틴 문자
+            if ch.isalpha():
+                latin += 1
+        elif ch.isalpha():
+            # 키릴/그리스/아랍 문자 등
+            other += 1
+
+    letters = hangul + kana + han + latin + other
+    if not letters:
+        return _NO_LETTERS
+    if kana and kana >= hangul:
+        cjk_lang, cjk = LANG_JA, kana + han
+    elif hangul:
+        cjk_lang, cjk = LANG_KO, hangul + han
+    else:
+        cjk_lang, cjk = LANG_ZH, han
+    if cjk / letters > CJK_MIN_RATIO:
+        return LanguageGuess(cjk_lang, round(cjk / letters, 3))
+    if latin >= other:
+        return LanguageGuess(LANG_EN, round(latin / letters, 3))
+    return LanguageGuess(LANG_OTHER, round(other / letters, 3))
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def _classify_memo(text: str) -> LanguageGuess:
+    return _classify(text)
+
+
+def detect_script(text: str) -> LanguageGuess:
+    """
+    텍스트의 주 언어와 신뢰도 반환.
+    글자가 없으면(빈 문자열, 숫자/기호만) ('other', 0.0)
+    """
+    if not text:
+        return _NO_LETTERS
+    if text.isascii():
+        # 영문자가 하나라도 있으면 영어 (라틴 문자 외 글자가 없으므로 신뢰도 1.0)
+        return LanguageGuess(LANG_EN, 1.0) if any(ch.isalpha() for ch in text) else _NO_LETTERS
+    if len(text) <= _MEMO_MAX_CHARS:
+        return _classify_memo(text)
+    return _classify(text)
+
+
+def memo_info():
+    """메모이즈 캐시 적중/미스 (functools 캐시 정보)"""
+    return _classify_memo.cache_info()
+
+
+def _legacy_detect(text: str) -> str:
+    """이전 detect_language (호출마다 정규식 컴파일 + findall 2회). 벤치마크 비교용"""
+    import re
+
+    if not text or not text.strip():
+        return 'en'
+    korean_pattern = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+    korean_count = len(korean_pattern.findall(text))
+    total_chars = len(re.findall(r'[가-힣ㄱ-ㅎㅏ-ㅣa-zA-Z]', text))
+    if total_chars > 0 and korean_count / total_chars > 0.3:
+        return 'ko'
+    return 'en'
+
+
+_BENCH_SAMPLES = {
+    "en_title": "OpenAI releases new reasoning model with improved tool use",
+    "ko_title": "오픈AI, 도구 사용이 개선된 새 추론 모델 공개",
+    "ja_title": "OpenAIが新しい推論モデルを発表、ツール利用を改善",
+    "zh_title": "OpenAI发布新的推理模型，改进工具使用能力",
+    "ko_body": "생성형 AI 보안 위협이 늘어나면서 기업들은 LLM 게이트웨이와 프롬프트 필터를 도입하고 있다. " * 25,
+}
+
+
+def _bench(func, samples, iterations: int) -> float:
+    """샘플 전체를 iterations회 판별한 호출당 평균 시간(마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in samples:
+            func(text)
+    return (time.perf_counter() - start) / (iterations * len(samples)) * 1_000_000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="언어 판별 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000, help="샘플별 반복 횟수")
+    args = parser.parse_args(argv)
+
+    iterations = max(1, args.iterations)
+    print(f"{'샘플':<10} {'결과':<16} {'이전(us)':>10} {'순회(us)':>10} {'메모(us)':>10}")
+    for name, text in _BENCH_SAMPLES.items():
+        guess = detect_script(text)
+        legacy = _bench(_legacy_detect, [text], iterations)
+        # 메모이즈 없이 매번 분류 (ASCII 빠른 경로 포함)
+        plain = _bench(lambda t: _classify(t) if not t.isascii() else detect_script(t), [text], iterations)
+        memo = _bench(detect_script, [text], iterations)
+        print(
+            f"{name:<10} {guess.lang + ' ' + format(guess.confidence, '.2f'):<16} "
+            f"{legacy:>10.2f} {plain:>10.2f} {memo:>10.2f}"
+        )
+    print(f"메모이즈: {memo_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""
+LLM 호출 마감 시간/재시도/헤지 기준
+
+- 마감 시간: 모델별 최근 응답 시간 p95 × LLM_DEADLINE_P95_MULTIPLIER(기록이 없으면 LLM_DEADLINE_BASE)에
+  입력 길이(LLM_DEADLINE_CHARS_PER_SECOND 기준)를 더하고 LLM_DEADLINE_MIN~MAX로 제한
+- 재시도: 연결 오류/타임아웃/5xx/스트림 오류만, full jitter 지수 백오프
+- 헤지: 첫 토큰까지 시간의 모델별 p95가 지나도록 응답이 없으면 다른 노드에 같은 요청 전송
+  (표본이 LLM_HEDGE_MIN_SAMPLES 미만이면 헤지하지 않음)
+지연 표본은 프로세스 단위로 모델별 최근 LATENCY_WINDOW건만 유지합니다.
+"""
+from collections import deque
+from typing import Deque, Dict, Optional
+import math
+import random
+import threading
+
+import requests
+
+from app.core.config import settings
+
+# 모델별로 유지하는 최근 표본 수
+LATENCY_WINDOW = 200
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """호출 마감 시간 초과 (타임아웃으로 집계/재시도)"""
+
+
+class OllamaStreamError(RuntimeError):
+    """스트리밍 응답 중 Ollama가 보낸 오류 청크"""
+
+
+def percentile(values, q: float) -> Optional[float]:
+    """최근접 순위 백분위수 (q: 0~100). 값이 없으면 None"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = min(len(ordered), max(1, math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+class LatencyTracker:
+    """모델별 첫 토큰까지 시간(ttft)과 전체 응답 시간(total) 표본"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._window = window
+        self._samples: Dict[tuple, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, first_token_seconds: Optional[float], total_seconds: float):
+        with self._lock:
+            if first_token_seconds is not None:
+                self._samples.setdefault((model, "ttft"), deque(maxlen=self._window)).append(first_token_seconds)
+            self._samples.setdefault((model, "total"), deque(maxlen=self._window)).append(total_seconds)
+
+    def _values(self, model: str, kind: str):
+        with self._lock:
+            return list(self._samples.get((model, kind), ()))
+
+    def p95(self, model: str, kind: str = "total", min_samples: int = 1) -> Optional[float]:
+        values = self._values(model, kind)
+        if len(values) < max(1, min_samples):
+            return None
+        return percentile(values, 95)
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            keys = list(self._samples.keys())
+        result: Dict[str, dict] = {}
+        for model, kind in keys:
+            values = self._values(model, kind)
+            result.setdefault(model, {})[kind] = {
+                "samples": len(values),
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+            }
+        return result
+
+
+def compute_deadline(tracker: LatencyTracker, model: str, input_chars: int) -> float:
+    """입력 길이와 모델의 관측 지연으로 호출 마감 시간(초) 계산"""
+    observed = tracker.p95(model, "total")
+    expected = settings.LLM_DEADLINE_BASE
+    if observed is not None:
+        expected = max(settings.LLM_DEADLINE_MIN, observed * settings.LLM_DEADLINE_P95_MULTIPLIER)
+    if settings.LLM_DEADLINE_CHARS_PER_SECOND > 0:
+        expected += input_chars / settings.LLM_DEADLINE_CHARS_PER_SECOND
+    return max(settings.LLM_DEADLINE_MIN, min(settings.LLM_DEADLINE_MAX, expected))
+
+
+def hedge_delay(tracker: LatencyTracker, model: str) -> Optional[float]:
+    """헤지 요청을 보낼 대기 시간 (첫 토큰까지 시간 p95). 헤지 비활성/표본 부족이면 None"""
+    if not settings.LLM_HEDGE_ENABLED:
+        return None
+    return tracker.p95(model, "ttft", min_samples=settings.LLM_HEDGE_MIN_SAMPLES)
+
+
+def backoff_delay(attempt: int, rng: Optional[random.Random] = None) -> float:
+    """attempt번째(0부터) 재시도 전 대기 시간: 0 ~ min(MAX, BASE × 2^attempt) 사이 균등 분포 (full jitter)"""
+    cap = min(settings.LLM_RETRY_BACKOFF_MAX, settings.LLM_RETRY_BACKOFF_BASE * (2 ** attempt))
+    return (rng or random).uniform(0, cap)
+
+
+def is_retryable(error: Exception) -> bool:
+    """일시적 오류만 재시도 (연결 실패, 타임아웃, 5xx/429, 스트림 오류). 4xx/취소는 재시도 안 함"""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, OllamaStreamError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return False
@@ -0,0 +1,226 @@
+"""
+LLM 호출 지표 수집 (llm_calls 테이블)
+
+- ollama_client.chat/warmup이 호출마다 모델, 노드, 토큰 수, 생성/로딩 시간, 전체 지연, 결과를 기록
+- 요약 작업에서 호출한 경우 작업 ID와 큐 대기 시간(적재 → 실행 시작)을 함께 기록 (llm_call_context)
+- 요청 경로에서 DB를 쓰지 않도록 메모리 버퍼에 모았다가 백그라운드 쓰레드가 일괄 저장
+  (LLM_TELEMETRY_FLUSH_INTERVAL초 또는 LLM_TELEMETRY_BATCH_SIZE건마다)
+- LLM_TELEMETRY_RETENTION_DAYS가 지난 행은 저장 쓰레드가 주기적으로 삭제
+- 집계: 모델별 호출 수, 오류 수, 초당 토큰 수, p50/p95 지연, 평균 큐 대기 (GET /api/summary-jobs/llm-stats)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+import logging
+import re
+import threading
+import time
+
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.llm_call import LlmCall
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CANCELLED = "cancelled"
+
+_WINDOW = re.compile(r"^\s*(\d+)\s*([smhd])\s*$")
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# 집계 구간 최대 길이(초). 이보다 길면 datetime 계산이 넘칠 수 있으므로 형식 오류로 처리
+_MAX_WINDOW_SECONDS = 366 * 86400
+# 삭제 주기(초)
+_PURGE_INTERVAL = 3600
+
+# 현재 쓰레드(요약 작업)의 호출 문맥: {"job_id": ..., "queue_wait_ms": ...}
+_call_context: ContextVar[Optional[dict]] = ContextVar("llm_call_context", default=None)
+
+
+@contextmanager
+def llm_call_context(job_id=None, queue_wait_seconds: Optional[float] = None) -> Iterator[None]:
+    """블록 안의 LLM 호출에 작업 ID/큐 대기 시간을 기록 (다른 쓰레드로 넘길 때는 contextvars.copy_context 사용)"""
+    token = _call_context.set({
+        "job_id": job_id,
+        "queue_wait_ms": int(queue_wait_seconds * 1000) if queue_wait_seconds is not None else None,
+    })
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def parse_window(value: str) -> timedelta:
+    """'15m', '1h', '7d' 형식의 집계 구간 파싱 (형식 오류 또는 366일 초과 시 ValueError)"""
+    match = _WINDOW.match(value or "")
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"집계 구간 형식 오류: {value!r} (예: 15m, 1h, 24h, 7d)")
+    seconds = int(match.group(1)) * _WINDOW_UNITS[match.group(2)]
+    if seconds > _MAX_WINDOW_SECONDS:
+        raise ValueError(f"집계 구간이 너무 깁니다: {value!r} (최대 366d)")
+    return timedelta(seconds=seconds)
+
+
+def _ms(seconds: Optional[float]) -> Optional[int]:
+    return int(seconds * 1000) if seconds is not None else None
+
+
+class LlmTelemetry:
+    """호출 지표 버퍼 + 백그라운드 일괄 저장"""
+
+    def __init__(self):
+        self._buffer: List[dict] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_purge = 0.0
+        self.dropped = 0
+
+    def record(
+        self,
+        model: str,
+        purpose: str,
+        latency_seconds: float,
+        outcome: str,
+        endpoint: Optional[str] = None,
+        result=None,
+        error: Optional[str] = None,
+    ):
+        """호출 1건 기록. result는 ollama_client.ChatResult (실패 시 None)"""
+        if not settings.LLM_TELEMETRY_ENABLED:
+            return
+        context = _call_context.get() or {}
+        row = {
+            "created_at": datetime.utcnow(),
+            "model": model,
+            "endpoint": (endpoint or "")[:255] or None,
+            "purpose": purpose,
+            "job_id": context.get("job_id"),
+            "queue_wait_ms": context.get("queue_wait_ms"),
+            "prompt_eval_count": result.prompt_eval_count if result else None,
+            "eval_count": result.eval_count if result else None,
+            "eval_duration_ms": _ms(result.eval_duration) if result else None,
+            "load_duration_ms": _ms(result.load_duration) if result else None,
+            "latency_ms": _ms(latency_seconds),
+            "outcome": outcome,
+            "error": error[:255] if error else None,
+        }
+        with self._lock:
+            self._buffer.append(row)
+            # DB 장애로 저장이 밀리면 오래된 지표부터 버림 (메모리 보호)
+            overflow = len(self._buffer) - settings.LLM_TELEMETRY_MAX_BUFFER
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self.dropped += overflow
+            full = len(self._buffer) >= settings.LLM_TELEMETRY_BATCH_SIZE
+        self._ensure_writer()
+        if full:
+            self._wakeup.set()
+
+    def _ensure_writer(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._writer_loop, name="llm-telemetry", daemon=True)
+            self._thread.start()
+
+    def _writer_loop(self):
+        while True:
+            self._wakeup.wait(settings.LLM_TELEMETRY_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """버퍼의 지표를 일괄 저장 (실패 시 버퍼로 되돌림). 저장 건수 반환"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+        db = SessionLocal()
+        try:
+            db.execute(insert(LlmCall), rows)
+            if time.monotonic() - self._last_purge >= _PURGE_INTERVAL:
+                self._purge(db)
+            db.commit()
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"LLM 호출 지표 저장 실패 ({len(rows)}건): {e}")
+            with self._lock:
+                self._buffer[:0] = rows
+            return 0
+        finally:
+            db.close()
+
+    def _purge(self, db: Session):
+        self._last_purge = time.monotonic()
+        if settings.LLM_TELEMETRY_RETENTION_DAYS <= 0:
+            return
+        cutoff = datetime.utcnow() - timedelta(days=settings.LLM_TELEMETRY_RETENTION_DAYS)
+        deleted = db.query(LlmCall).filter(LlmCall.created_at < cutoff).delete(synchronize_session=False)
+        if deleted:
+            logger.info(f"오래된 LLM 호출 지표 삭제: {deleted}건")
+
+    def aggregate(self, db: Session, window: timedelta, model: Optional[str] = None) -> List[Dict]:
+        """
+        최근 window 구간의 모델·용도별 집계. 지연 백분위는 성공 호출 기준,
+        초당 토큰 수는 Ollama eval_count / eval_duration 합계 기준 (워밍업 제외)
+        """
+        since = datetime.utcnow() - window
+        ok_latency = case((LlmCall.outcome == OUTCOME_OK, LlmCall.latency_ms))
+        query = (
+            db.query(
+                LlmCall.model,
+                LlmCall.purpose,
+                func.count(LlmCall.id),
+                func.sum(case((LlmCall.outcome == OUTCOME_OK, 0), else_=1)),
+                func.sum(case((LlmCall.outcome == OUTCOME_TIMEOUT, 1), else_=0)),
+                func.coalesce(func.sum(LlmCall.prompt_eval_count), 0),
+                func.coalesce(func.sum(LlmCall.eval_count), 0),
+                func.coalesce(func.sum(LlmCall.eval_duration_ms), 0),
+                func.percentile_cont(0.5).within_group(ok_latency),
+                func.percentile_cont(0.95).within_group(ok_latency),
+                func.avg(LlmCall.queue_wait_ms),
+                func.sum(case(
+                    (LlmCall.load_duration_ms >= int(settings.OLLAMA_COLD_LOAD_THRESHOLD * 1000), 1), else_=0,
+                )),
+            )
+            .filter(LlmCall.created_at >= since, LlmCall.purpose != "warmup")
+            .group_by(LlmCall.model, LlmCall.purpose)
+            .order_by(LlmCall.model, LlmCall.purpose)
+        )
+        if model:
+            query = query.filter(LlmCall.model == model)
+        results = []
+        for (model_name, purpose, calls, failed, timeouts, prompt_tokens, output_tokens,
+             eval_ms, p50, p95, queue_wait, cold_loads) in query.all():
+            results.append({
+                "model": model_name,
+                "purpose": purpose,
+                "calls": calls,
+                "errors": int(failed or 0),
+                "timeouts": int(timeouts or 0),
+                "prompt_tokens": int(prompt_tokens),
+                "output_tokens": int(output_tokens),
+                "tokens_per_second": round(output_tokens / (eval_ms / 1000), 2) if eval_ms else 0.0,
+                "latency_p50_ms": round(p50) if p50 is not None else None,
+                "latency_p95_ms": round(p95) if p95 is not None else None,
+                "avg_queue_wait_ms": round(float(queue_wait)) if queue_wait is not None else None,
+                "cold_loads": int(cold_loads or 0),
+            })
+        return results
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"buffered": len(self._buffer), "dropped": self.dropped}
+
+
+# 프로세스 전역 수집기
+llm_telemetry = LlmTelemetry()
@@ -0,0 +1,518 @@
+"""
+공용 Ollama 클라이언트 (요약/번역 공용)
+
+- requests.Session 하나를 프로세스 전체에서 재사용해 TCP 연결을 풀링 (OLLAMA_HTTP_POOL_SIZE)
+- 모든 요청에 keep_alive(OLLAMA_KEEP_ALIVE)를 보내 호출 사이에 모델이 언로드되지 않도록 유지
+- 서버/워커 시작 시 기본 요약 모델과 번역 모델을 미리 로드 (OLLAMA_WARMUP_ON_STARTUP)
+- Ollama 응답의 load_duration(모델 로딩)과 eval_duration(생성)을 분리해 로그와 통계에 기록
+- 호출마다 토큰 수/시간/지연/결과를 llm_calls 테이블에 기록 (llm_telemetry)
+- 입력 길이와 모델 관측 지연으로 정한 마감 시간, 지터 백오프 재시도, 느린 요청의 다른 노드 헤지 (llm_deadline)
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Dict, List, Optional
+import contextvars
+import json
+import logging
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.utils.llm_telemetry import (
+    OUTCOME_CANCELLED, OUTCOME_ERROR, OUTCOME_OK, OUTCOME_TIMEOUT, llm_telemetry,
+)
+from app.utils.llm_deadline import (
+    DeadlineExceeded, LatencyTracker, OllamaStreamError, backoff_delay, compute_deadline, hedge_delay,
+    is_retryable,
+)
+from app.utils.ollama_pool import OllamaEndpoint, RequestCancelled, ollama_pool
+
+logger = logging.getLogger(__name__)
+
+_NS = 1_000_000_000
+
+
+@dataclass
+class ChatResult:
+    """Ollama /api/chat 응답 본문과 시간 지표 (duration은 초 단위)"""
+    content: str
+    model: str
+    endpoint: str
+    load_duration: float = 0.0
+    prompt_eval_count: int = 0
+    eval_count: int = 0
+    eval_duration: float = 0.0
+    total_duration: float = 0.0
+    raw: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def cold_load(self) -> bool:
+        return self.load_duration >= settings.OLLAMA_COLD_LOAD_THRESHOLD
+
+    @classmethod
+    def from_response(cls, content: str, model: str, endpoint: str, data: dict) -> "ChatResult":
+        return cls(
+            content=content,
+            model=model,
+            endpoint=endpoint,
+            load_duration=(data.get("load_duration") or 0) / _NS,
+            prompt_eval_count=data.get("prompt_eval_count") or 0,
+            eval_count=data.get("eval_count") or 0,
+            eval_duration=(data.get("eval_duration") or 0) / _NS,
+            total_duration=(data.get("total_duration") or 0) / _NS,
+            raw=data,
+        )
+
+
+def _outcome(error: Exception) -> str:
+    if isinstance(error, RequestCancelled):
+        return OUTCOME_CANCELLED
+    if isinstance(error, requests.exceptions.Timeout):
+        return OUTCOME_TIMEOUT
+    return OUTCOME_ERROR
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=settings.OLLAMA_HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _read_chat_stream(
+    response,
+    on_partial: Optional[Callable[[str], None]],
+    deadline_at: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+) -> tuple:
+    """
+    Ollama 스트리밍 응답(NDJSON: 줄마다 {"message": {"content": "토큰"}, "done": false})을 읽어
+    누적 텍스트를 on_partial로 전달. (최종 텍스트, 마지막 done 청크, 첫 토큰 도착 시각) 반환.
+    deadline_at(time.monotonic 기준)을 넘기면 DeadlineExceeded, cancel이 설정되면 RequestCancelled
+    """
+    parts = []
+    final = {}
+    first_token_at = None
+    for line in response.iter_lines():
+        if cancel is not None and cancel.is_set():
+            raise RequestCancelled("hedged request lost")
+        if deadline_at is not None and time.monotonic() > deadline_at:
+            raise DeadlineExceeded("LLM 호출 마감 시간 초과")
+        if not line:
+            continue
+        chunk = json.loads(line)
+        if chunk.get("error"):
+            raise OllamaStreamError(chunk["error"])
+        delta = chunk.get("message", {}).get("content", "")
+        if delta:
+            if first_token_at is None:
+                first_token_at = time.monotonic()
+            parts.append(delta)
+            if on_partial is not None:
+                on_partial("".join(parts))
+        if chunk.get("done"):
+            final = chunk
+            break
+    return "".join(parts), final, first_token_at
+
+
+def _close_response(response):
+    """
+    스트리밍 응답을 다른 쓰레드에서 강제로 닫음. 소켓 읽기에서 대기 중인 쓰레드는 close()만으로는 깨어나지 않으므로
+    소켓을 먼저 shutdown해 읽기를 즉시 끝냄 (연결은 풀로 돌아가지 않고 버려짐)
+    """
+    sock = getattr(getattr(getattr(response, "raw", None), "_connection", None), "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    try:
+        response.close()
+    except Exception as e:
+        logger.debug(f"헤지 요청 응답 닫기 실패: {e}")
+
+
+class _Attempt:
+    """헤지 경쟁 중인 요청 1건 (별도 쓰레드에서 실행)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cancel = threading.Event()
+        self.endpoint: Optional[str] = None
+        self.response = None
+        self.done = False
+        self.result: Optional[ChatResult] = None
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def set_response(self, response):
+        """진행 중인 응답 등록 (이미 취소됐으면 바로 닫음)"""
+        with self._lock:
+            self.response = response
+            cancelled = self.cancel.is_set()
+        if cancelled:
+            _close_response(response)
+
+    def abort(self):
+        """취소 표시 후 진행 중인 응답을 닫아 소켓 대기 중인 쓰레드와 연결, 노드 슬롯을 바로 반환"""
+        with self._lock:
+            self.cancel.set()
+            response = self.response
+        if response is not None:
+            _close_response(response)
+
+
+class _HedgeRace:
+    """
+    원 요청과 헤지 요청 중 먼저 끝난 쪽을 사용하고 나머지는 취소.
+    스트리밍 호출은 먼저 첫 토큰을 보낸 요청이 결과를 가져가고(on_partial 전달), 나머지는 즉시 취소
+    """
+
+    def __init__(self, on_partial: Optional[Callable[[str], None]]):
+        self.on_partial = on_partial
+        self.attempts: List[_Attempt] = []
+        self.owner: Optional[_Attempt] = None
+        self._cond = threading.Condition()
+
+    def partial_for(self, attempt: _Attempt) -> Callable[[str], None]:
+        """
+        요청별 첫 토큰 콜백: 먼저 토큰을 받은 요청이 결과를 가져가고 나머지는 취소.
+        on_partial이 없는 호출도 첫 토큰 도착을 알아야 헤지 대기가 끝나므로 항상 콜백을 붙임 (텍스트 전달만 생략)
+        """
+        def forward(text: str):
+            losers = []
+            with self._cond:
+                if self.owner is None:
+                    self.owner = attempt
+                    losers = self._losers(attempt)
+                    self._cond.notify_all()
+                owner = self.owner is attempt
+            for loser in losers:
+                loser.abort()
+            if owner and self.on_partial is not None:
+                self.on_partial(text)
+        return forward
+
+    def _losers(self, winner: _Attempt) -> List[_Attempt]:
+        """취소할 나머지 요청 (응답 닫기는 잠금 밖에서 abort로 수행)"""
+        return [other for other in self.attempts if other is not winner and not other.done]
+
+    def launch(self, name: str, run: Callable[[_Attempt], ChatResult]) -> _Attempt:
+        attempt = _Attempt(name)
+        with self._cond:
+            self.attempts.append(attempt)
+        context = contextvars.copy_context()
+
+        def target():
+            try:
+                attempt.result = context.run(run, attempt)
+            except BaseException as e:
+                attempt.error = e
+            with self._cond:
+                attempt.done = True
+                self._cond.notify_all()
+        threading.Thread(target=target, name=f"ollama-{name}", daemon=True).start()
+        return attempt
+
+    def first_token_or_done(self, timeout: float) -> bool:
+        """timeout 안에 첫 토큰이 오거나 요청이 끝나면 True"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self.owner is not None or any(a.done for a in self.attempts), timeout=timeout,
+            )
+
+    def wait(self) -> ChatResult:
+        """결과 확정까지 대기. 결과를 가져간 요청(또는 먼저 성공한 요청)의 결과 반환, 모두 실패하면 첫 오류"""
+        with self._cond:
+            while True:
+                if self.owner is not None and self.owner.done:
+                    winner = self.owner
+                    break
+                succeeded = [a for a in self.attempts if a.done and a.error is None]
+                if self.owner is None and succeeded:
+                    winner = succeeded[0]
+                    break
+                if all(a.done for a in self.attempts):
+                    winner = self.owner or self.attempts[0]
+                    break
+                self._cond.wait()
+            losers = self._losers(winner)
+        for loser in losers:
+            loser.abort()
+        if winner.error is not None:
+            raise winner.error
+        return winner.result
+
+
+class OllamaClient:
+    """연결 풀링 + keep_alive + 로딩/생성 시간 분리 집계 + 적응형 마감 시간/재시도/헤지"""
+
+    def __init__(self):
+        self.session = _build_session()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, dict] = {}
+        self._hedges = {"sent": 0, "won": 0}
+        self.latency = LatencyTracker()
+        self.warmup_results: List[dict] = []
+
+    def _record(self, result: ChatResult):
+        with self._lock:
+            entry = self._stats.setdefault(result.model, {
+                "requests": 0, "cold_loads": 0, "load_seconds": 0.0,
+                "eval_seconds": 0.0, "eval_count": 0, "prompt_eval_count": 0,
+            })
+            entry["requests"] += 1
+            entry["load_seconds"] += result.load_duration
+            entry["eval_seconds"] += result.eval_duration
+            entry["eval_count"] += result.eval_count
+            entry["prompt_eval_count"] += result.prompt_eval_count
+            if result.cold_load:
+                entry["cold_loads"] += 1
+        if result.cold_load:
+            logger.info(
+                f"Ollama 모델 콜드 로드: {result.model} @ {result.endpoint} "
+                f"(로딩 {result.load_duration:.2f}s, 생성 {result.eval_duration:.2f}s)"
+            )
+
+    def _post(self, endpoint: OllamaEndpoint, payload: dict, timeout, stream: bool):
+        response = self.session.post(endpoint.chat_url, json=payload, timeout=timeout, stream=stream)
+        response.raise_for_status()
+        return response
+
+    def _attempt(
+        self,
+        model: str,
+        payload: dict,
+        on_partial: Optional[Callable[[str], None]],
+        deadline: float,
+        purpose: str,
+        attempt: Optional[_Attempt] = None,
+        exclude: Collection[str] = (),
+    ) -> ChatResult:
+        """
+        노드 하나에 요청 1회. Ollama에는 항상 스트리밍으로 요청해 토큰 사이마다 마감 시간/취소를 확인.
+        첫 바이트 대기는 마감 시간을 읽기 타임아웃으로 사용
+        """
+        started = time.monotonic()
+        endpoint = None
+        first_token_at = None
+        try:
+            # 모델을 가진 노드 중 처리 중 요청이 가장 적은 노드로 전송
+            with ollama_pool.acquire(model, exclude=exclude) as endpoint:
+                if attempt is not None:
+                    attempt.endpoint = endpoint.chat_url
+                response = self._post(
+                    endpoint, payload, timeout=(settings.LLM_CONNECT_TIMEOUT, deadline), stream=True,
+                )
+                if attempt is not None:
+                    attempt.set_response(response)
+                with response:
+                    try:
+                        content, data, first_token_at = _read_chat_stream(
+                            response, on_partial, deadline_at=started + deadline,
+                            cancel=attempt.cancel if attempt is not None else None,
+                        )
+                    except RequestCancelled:
+                        raise
+                    except Exception as e:
+                        # 헤지에서 져서 응답이 강제로 닫힌 경우는 노드 실패로 집계하지 않음
+                        if attempt is not None and attempt.cancel.is_set():
+                            raise RequestCancelled("hedged request lost") from e
+                        raise
+        except Exception as e:
+            llm_telemetry.record(
+                model, purpose, time.monotonic() - started, _outcome(e),
+                endpoint=endpoint.chat_url if endpoint else None, error=str(e),
+            )
+            raise
+        elapsed = time.monotonic() - started
+        result = ChatResult.from_response(content, model, endpoint.chat_url, data)
+        self._record(result)
+        self.latency.observe(model, first_token_at - started if first_token_at else None, elapsed)
+        llm_telemetry.record(model, purpose, elapsed, OUTCOME_OK, endpoint=endpoint.chat_url, result=result)
+        return result
+
+    def _hedged(
+        self,
+        model: str,
+        payload: dict,
+        on_partial: Optional[Callable[[str], None]],
+        deadline: float,
+        purpose: str,
+    ) -> ChatResult:
+        """
+        첫 토큰까지 시간의 p95가 지나도록 응답이 없고 다른 노드가 비어 있으면 같은 요청을 그 노드에도 보냄.
+        헤지 조건(다중 노드, 표본 충분)이 안 되면 호출 쓰레드에서 바로 요청
+        """
+        delay = hedge_delay(self.latency, model) if ollama_pool.is_multi else None
+        if delay is None:
+            return self._attempt(model, payload, on_partial, deadline, purpose)
+        race = _HedgeRace(on_partial)
+        primary = race.launch(
+            "primary",
+            lambda attempt: self._attempt(model, payload, race.partial_for(attempt), deadline, purpose, attempt),
+        )
+        if not race.first_token_or_done(delay):
+            exclude = [primary.endpoint] if primary.endpoint else []
+            idle = ollama_pool.idle_endpoint(model, exclude=exclude)
+            if idle is not None:
+                logger.info(
+                    f"Ollama 헤지 요청: {model} - {delay:.2f}s 동안 응답 없음 "
+                    f"({primary.endpoint} → {idle.chat_url})"
+                )
+                with self._lock:
+                    self._hedges["sent"] += 1
+                race.launch(
+                    "hedge",
+                    lambda attempt: self._attempt(
+                        model, payload, race.partial_for(attempt), deadline, purpose, attempt, exclude,
+                    ),
+                )
+        result = race.wait()
+        if len(race.attempts) > 1 and result is not primary.result:
+            with self._lock:
+                self._hedges["won"] += 1
+        return result
+
+    def chat(
+        self,
+        model: str,
+        messages: List[dict],
+        on_partial: Optional[Callable[[str], None]] = None,
+        timeout: Optional[float] = None,
+        purpose: str = "chat",
+        **extra,
+    ) -> ChatResult:
+        """
+        /api/chat 호출 (on_partial 지정 시 토큰마다 누적 텍스트 전달). 요청 오류는 예외로 전달.
+        일시적 오류는 LLM_MAX_RETRIES회까지 지터 백오프로 재시도 (취소/4xx는 재시도 안 함).
+
+        Args:
+            model: 모델명
+            messages: [{"role": ..., "content": ...}]
+            on_partial: 스트리밍 누적 텍스트 콜백
+            timeout: 호출 마감 시간(초). 미지정 시 입력 길이와 모델 관측 지연으로 계산 (compute_deadline)
+            purpose: 호출 용도 (llm_calls 집계 구분: summary, summary_map, translate 등)
+            extra: format, options 등 요청 본문에 그대로 추가할 필드
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": True,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
+            **extra,
+        }
+        input_chars = sum(len(m.get("content") or "") for m in messages)
+        deadline = timeout or compute_deadline(self.latency, model, input_chars)
+        retries = max(0, settings.LLM_MAX_RETRIES)
+        for retry in range(retries + 1):
+            try:
+                return self._hedged(model, payload, on_partial, deadline, purpose)
+            except RequestCancelled:
+                raise
+            except Exception as e:
+                if retry >= retries or not is_retryable(e):
+                    raise
+                wait = backoff_delay(retry)
+                logger.warning(
+                    f"Ollama 요청 재시도 {retry + 1}/{retries}: {model} ({purpose}) - {e} "
+                    f"({wait:.1f}s 후, 마감 {deadline:.0f}s)"
+                )
+                time.sleep(wait)
+
+    def embed(self, model: str, inputs: List[str], timeout: Optional[float] = None) -> List[List[float]]:
+        """
+        /api/embed 호출 (여러 입력을 한 번에 임베딩). 요청 오류는 예외로 전달 (재시도는 호출 측 스위프에서).
+        반환: 입력 순서대로의 임베딩 벡터 목록
+        """
+        payload = {"model": model, "input": inputs, "keep_alive": settings.OLLAMA_KEEP_ALIVE}
+        deadline = timeout or compute_deadline(self.latency, model, sum(len(text) for text in inputs))
+        started = time.monotonic()
+        endpoint = None
+        try:
+            with ollama_pool.acquire(model) as endpoint:
+                response = self.session.post(
+                    f"{endpoint.base_url}/api/embed", json=payload,
+                    timeout=(settings.LLM_CONNECT_TIMEOUT, deadline),
+                )
+                response.raise_for_status()
+                data = response.json()
+            embeddings = data.get("embeddings") or []
+            if len(embeddings) != len(inputs):
+                raise ValueError(f"임베딩 수 불일치: 입력 {len(inputs)}건, 응답 {len(embeddings)}건")
+        except Exception as e:
+            llm_telemetry.record(
+                model, "embed", time.monotonic() - started, _outcome(e),
+                endpoint=endpoint.chat_url if endpoint else None, error=str(e),
+            )
+            raise
+        elapsed = time.monotonic() - started
+        self.latency.observe(model, None, elapsed)
+        llm_telemetry.record(
+            model, "embed", elapsed, OUTCOME_OK, endpoint=endpoint.chat_url,
+            result=ChatResult.from_response("", model, endpoint.chat_url, data),
+        )
+        return embeddings
+
+    def warmup(self, models: List[str]) -> List[dict]:
+        """
+        모델을 미리 메모리에 로드 (빈 messages로 /api/chat 호출 → Ollama가 로드만 수행).
+        모델을 가진(또는 보유 정보가 없는) 모든 노드에 요청하고 노드별 로딩 시간을 기록.
+        """
+        if ollama_pool.is_multi:
+            ollama_pool.check_all()
+        results = []
+        for model in dict.fromkeys(m for m in models if m):
+            targets = [e for e in ollama_pool.endpoints if e.available and e.has_model(model)] or \
+                [e for e in ollama_pool.endpoints if e.available]
+            for endpoint in targets:
+                started = time.monotonic()
+                entry = {"model": model, "endpoint": endpoint.chat_url}
+                try:
+                    payload = {"model": model, "messages": [], "keep_alive": settings.OLLAMA_KEEP_ALIVE, "stream": False}
+                    data = self._post(endpoint, payload, timeout=settings.OLLAMA_WARMUP_TIMEOUT, stream=False).json()
+                    entry.update(ok=True, load_seconds=round((data.get("load_duration") or 0) / _NS, 3))
+                    logger.info(f"Ollama 모델 워밍업 완료: {model} @ {endpoint.chat_url} (로딩 {entry['load_seconds']}s)")
+                    llm_telemetry.record(
+                        model, "warmup", time.monotonic() - started, OUTCOME_OK, endpoint=endpoint.chat_url,
+                        result=ChatResult.from_response("", model, endpoint.chat_url, data),
+                    )
+                except Exception as e:
+                    entry.update(ok=False, error=str(e))
+                    logger.warning(f"Ollama 모델 워밍업 실패: {model} @ {endpoint.chat_url} - {e}")
+                    llm_telemetry.record(
+                        model, "warmup", time.monotonic() - started, _outcome(e),
+                        endpoint=endpoint.chat_url, error=str(e),
+                    )
+                entry["elapsed_seconds"] = round(time.monotonic() - started, 3)
+                results.append(entry)
+        with self._lock:
+            self.warmup_results = results
+        return results
+
+    def warmup_in_background(self):
+        """기본 요약 모델과 번역 모델 워밍업을 백그라운드 쓰레드로 실행 (서버 시작을 막지 않음)"""
+        models = [settings.OLLAMA_MODEL, settings.TRANSLATE_MODEL]
+        threading.Thread(target=self.warmup, args=(models,), name="ollama-warmup", daemon=True).start()
+
+    def stats(self) -> dict:
+        """모델별 요청 수, 콜드 로드 횟수, 로딩/생성 누적 시간, 지연 p50/p95, 헤지 횟수와 마지막 워밍업 결과"""
+        with self._lock:
+            models = {}
+            for model, entry in self._stats.items():
+                models[model] = {
+                    **{k: round(v, 3) if isinstance(v, float) else v for k, v in entry.items()},
+                    "tokens_per_second": round(entry["eval_count"] / entry["eval_seconds"], 2) if entry["eval_seconds"] else 0.0,
+                }
+            hedges = dict(self._hedges)
+            warmup = list(self.warmup_results)
+        return {"models": models, "latency": self.latency.stats(), "hedges": hedges, "warmup": warmup}
+
+
+# 프로세스 전역 클라이언트
+ollama_client = OllamaClient()
@@ -0,0 +1,188 @@
+"""
+Ollama 엔드포인트 풀 (로드밸런서)
+
+- OLLAMA_API_URLS(쉼표 구분)에 여러 Ollama /api/chat 주소를 두면 요약·번역 요청을 분산
+  (미설정 시 OLLAMA_API_URL 하나만 사용 → 기존 동작과 동일)
+- 라우팅: 해당 모델이 있는(/api/tags 기준) 정상 노드 중 처리 중 요청 수가 가장 적은 노드 선택
+- 헬스 체크: OLLAMA_HEALTH_CHECK_INTERVAL마다 /api/tags 호출
+- 연속 실패 OLLAMA_EJECT_FAILURES회 시 최소 OLLAMA_EJECT_SECONDS 동안 제외. 기간이 지나도 바로 재투입하지 않고
+  그 이후의 /api/tags 헬스 체크가 성공해야 재투입
+"""
+from contextlib import contextmanager
+from typing import Collection, Iterator, List, Optional, Set
+import logging
+import threading
+import time
+
+import requests
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCancelled(Exception):
+    """호출 측에서 요청을 중단한 경우 (노드 실패로 집계하지 않음)"""
+
+
+class OllamaEndpoint:
+    """Ollama 노드 하나의 상태"""
+
+    def __init__(self, chat_url: str):
+        self.chat_url = chat_url.strip()
+        # http://host:11434/api/chat → http://host:11434
+        self.base_url = self.chat_url.split("/api/")[0].rstrip("/")
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.healthy = True
+        self.models: Set[str] = set()
+        self.last_checked = 0.0
+
+    @property
+    def ejected(self) -> bool:
+        """제외 중 (제외 기간이 지나도 헬스 체크 성공 전까지 유지)"""
+        return self.ejected_until > 0
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and not self.ejected
+
+    def has_model(self, model: Optional[str]) -> bool:
+        if not model:
+            return True
+        # 태그 없이 지정된 모델(예: llama3)은 llama3:latest로 등록됨
+        return model in self.models or f"{model}:latest" in self.models
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.chat_url,
+            "healthy": self.healthy,
+            "ejected": self.ejected,
+            "outstanding": self.outstanding,
+            "consecutive_failures": self.consecutive_failures,
+            "models": sorted(self.models),
+        }
+
+
+class OllamaPool:
+    def __init__(self, urls: List[str]):
+        self.endpoints = [OllamaEndpoint(u) for u in urls if u.strip()]
+        self._lock = threading.Lock()
+        self._checker: Optional[threading.Thread] = None
+
+    @property
+    def is_multi(self) -> bool:
+        return len(self.endpoints) > 1
+
+    def _choose(self, model: Optional[str], exclude: Collection[str] = ()) -> OllamaEndpoint:
+        available = [e for e in self.endpoints if e.available and e.chat_url not in exclude] or \
+            [e for e in self.endpoints if e.available]
+        if not available:
+            # 전부 제외된 경우에도 요청은 보내 봄 (가장 먼저 재투입될 노드)
+            logger.warning("사용 가능한 Ollama 엔드포인트가 없어 제외된 노드로 요청합니다.")
+            available = sorted(self.endpoints, key=lambda e: e.ejected_until)[:1]
+        with_model = [e for e in available if e.has_model(model)]
+        if not with_model:
+            if self.is_multi and model:
+                logger.debug(f"모델 {model}을 가진 노드 정보 없음 - 정상 노드 전체에서 선택")
+            with_model = available
+        return min(with_model, key=lambda e: e.outstanding)
+
+    def idle_endpoint(self, model: Optional[str], exclude: Collection[str] = ()) -> Optional[OllamaEndpoint]:
+        """처리 중 요청이 없는 정상 노드 (헤지 요청 대상, exclude의 노드 제외). 없으면 None"""
+        with self._lock:
+            for endpoint in self.endpoints:
+                if (endpoint.available and endpoint.outstanding == 0 and endpoint.chat_url not in exclude
+                        and (not endpoint.models or endpoint.has_model(model))):
+                    return endpoint
+        return None
+
+    @contextmanager
+    def acquire(self, model: Optional[str] = None, exclude: Collection[str] = ()) -> Iterator[OllamaEndpoint]:
+        """
+        요청을 보낼 엔드포인트를 선택 (exclude의 노드는 가능하면 제외). 블록 안에서 예외가 나면 실패로 집계.
+
+        사용 예:
+            with ollama_pool.acquire(model) as endpoint:
+                session.post(endpoint.chat_url, ...)
+        """
+        self._ensure_health_checker()
+        with self._lock:
+            endpoint = self._choose(model, exclude)
+            endpoint.outstanding += 1
+        try:
+            yield endpoint
+        except RequestCancelled:
+            self._record(endpoint, success=True)
+            raise
+        except Exception:
+            self._record(endpoint, success=False)
+            raise
+        else:
+            self._record(endpoint, success=True)
+
+    def _record(self, endpoint: OllamaEndpoint, success: bool):
+        with self._lock:
+            endpoint.outstanding -= 1
+            if success:
+                endpoint.consecutive_failures = 0
+                return
+            endpoint.consecutive_failures += 1
+            if self.is_multi and endpoint.consecutive_failures >= settings.OLLAMA_EJECT_FAILURES:
+                endpoint.ejected_until = time.monotonic() + settings.OLLAMA_EJECT_SECONDS
+                logger.warning(
+                    f"Ollama 엔드포인트 제외: {endpoint.chat_url} "
+                    f"(연속 실패 {endpoint.consecutive_failures}회, {settings.OLLAMA_EJECT_SECONDS}초)"
+                )
+
+    def check(self, endpoint: OllamaEndpoint):
+        """/api/tags로 노드 상태와 보유 모델 갱신"""
+        try:
+            response = requests.get(f"{endpoint.base_url}/api/tags", timeout=5)
+            response.raise_for_status()
+            models = {m.get("name") or m.get("model") for m in response.json().get("models", [])}
+            with self._lock:
+                was_down = not endpoint.available
+                endpoint.models = {m for m in models if m}
+                endpoint.healthy = True
+                endpoint.last_checked = time.monotonic()
+                # 제외 기간이 지난 뒤 헬스 체크에 성공했을 때만 재투입
+                if endpoint.ejected and time.monotonic() >= endpoint.ejected_until:
+                    endpoint.ejected_until = 0.0
+                    endpoint.consecutive_failures = 0
+            if was_down and endpoint.available:
+                logger.info(f"Ollama 엔드포인트 재투입: {endpoint.chat_url}")
+        except Exception as e:
+            with self._lock:
+                if endpoint.healthy:
+                    logger.warning(f"Ollama 헬스 체크 실패: {endpoint.chat_url} - {e}")
+                endpoint.healthy = False
+                endpoint.last_checked = time.monotonic()
+
+    def check_all(self):
+        for endpoint in self.endpoints:
+            self.check(endpoint)
+
+    def _ensure_health_checker(self):
+        """다중 엔드포인트일 때만 첫 요청 시 헬스 체크 쓰레드 시작"""
+        if not self.is_multi or self._checker is not None:
+            return
+        with self._lock:
+            if self._checker is not None:
+                return
+            self._checker = threading.Thread(target=self._health_loop, name="ollama-health", daemon=True)
+            self._checker.start()
+
+    def _health_loop(self):
+        while True:
+            self.check_all()
+            time.sleep(settings.OLLAMA_HEALTH_CHECK_INTERVAL)
+
+    def status(self) -> List[dict]:
+        with self._lock:
+            return [e.to_dict() for e in self.endpoints]
+
+
+# 프로세스 전역 풀 (summerise_openai, translate 공용)
+ollama_pool = OllamaPool(settings.OLLAMA_API_URL_LIST)
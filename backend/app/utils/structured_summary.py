@@ -0,0 +1,119 @@
+"""
+구조화(JSON) 요약 출력
+
+Ollama /api/chat의 format에 JSON 스키마를 넘겨 category, keywords, summary를 한 번에 받고,
+저장용 마크다운은 기존 형식(📌 분류 / 📌 키워드 / 본문)으로 재구성합니다.
+정규식 기반 추출(extract_category_keywords)은 format 미지원 모델과 파싱 실패 시에만 사용.
+영어 제목 번역이 필요한 북마크는 같은 호출에서 title(한국어 제목)도 함께 받음 (별도 번역 호출 생략).
+"""
+from typing import List, NamedTuple, Optional
+import json
+import re
+
+# 스트리밍 중 summary 필드를 먼저 보여줄 수 있도록 category, keywords를 앞에 둠
+SUMMARY_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "category": {"type": "string"},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "summary": {"type": "string"},
+    },
+    "required": ["category", "keywords", "summary"],
+}
+
+# 제목 번역을 함께 요청할 때의 스키마 (title을 summary 앞에 두어 스트리밍 중 summary 추출에 영향 없음)
+SUMMARY_WITH_TITLE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "category": {"type": "string"},
+        "keywords": {"type": "array", "items": {"type": "string"}},
+        "title": {"type": "string"},
+        "summary": {"type": "string"},
+    },
+    "required": ["category", "keywords", "title", "summary"],
+}
+
+# prompt.conf system 프롬프트 뒤에 붙이는 JSON 응답 안내
+STRUCTURED_OUTPUT_INSTRUCTION = (
+    "\n\n응답은 반드시 JSON 객체 하나로 작성하세요. "
+    "category: 분류 값 하나(예: 기사, 블로그, 논문, 리포트, 기타), "
+    "keywords: 키워드 5~8개 문자열 배열, "
+    "summary: 분류/키워드 줄을 제외한 나머지 마크다운 본문(📌 핵심요약부터)."
+)
+
+# 제목 번역을 함께 요청할 때 system 프롬프트에 추가로 붙이는 안내
+TITLE_OUTPUT_INSTRUCTION = (
+    " title: 사용자 메시지 끝의 '원문 제목'을 자연스러운 한국어로 번역한 제목 한 줄(설명/따옴표 없이)."
+)
+
+# 제목 번역을 함께 요청할 때 user 프롬프트 끝에 붙이는 원문 제목
+TITLE_INPUT_TEMPLATE = "\n\n원문 제목: {title}\n"
+
+_META_LINE = re.compile(r"^\s*📌️?\s*\**\s*(분류|키워드)\b[^\n]*\n?", re.MULTILINE)
+_SUMMARY_FIELD = re.compile(r'"summary"\s*:\s*"')
+
+
+class StructuredSummary(NamedTuple):
+    summary: str
+    category: str
+    keywords: List[str]
+    title: str = ""  # 제목 번역을 함께 요청한 경우 한국어 제목
+
+
+def _clean_keyword(value) -> str:
+    return str(value).strip().strip("#").strip()
+
+
+def parse_structured_summary(raw: str) -> Optional[StructuredSummary]:
+    """JSON 응답 파싱. summary가 없거나 JSON이 아니면 None (호출 측에서 정규식 추출로 대체)."""
+    if not raw or not raw.strip():
+        return None
+    text = raw.strip()
+    # 일부 모델은 ```json ... ``` 코드 블록으로 감싸서 응답
+    if text.startswith("```"):
+        text = re.sub(r"^```(?:json)?\s*|\s*```$", "", text)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    summary = data.get("summary")
+    if not isinstance(summary, str) or not summary.strip():
+        return None
+    keywords = data.get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = keywords.split(",")
+    keywords = [k for k in (_clean_keyword(k) for k in keywords) if k]
+    category = str(data.get("category") or "").strip()
+    # 모델이 summary 안에도 분류/키워드 줄을 넣은 경우 제거 (재구성 시 중복 방지)
+    summary = _META_LINE.sub("", summary).strip()
+    title = " ".join(str(data.get("title") or "").split())
+    return StructuredSummary(summary, category, keywords, title)
+
+
+def partial_summary_field(buffer: str) -> str:
+    """
+    스트리밍 중인 JSON 문자열에서 지금까지 도착한 summary 값만 추출 (SSE 중간 결과용).
+    아직 summary 필드가 시작되지 않았으면 빈 문자열.
+    """
+    match = _SUMMARY_FIELD.search(buffer)
+    if not match:
+        return ""
+    body = buffer[match.end():]
+    # 닫는 따옴표 이전까지 (이스케이프된 따옴표 제외)
+    end = re.search(r'(?<!\\)(?:\\\\)*"', body)
+    if end:
+        body = body[:end.end() - 1]
+    # 끝이 잘린 이스케이프 시퀀스(\, \u12 등) 제거 후 JSON 문자열로 디코딩
+    body = re.sub(r"\\u[0-9a-fA-F]{0,3}$|\\$", "", body)
+    try:
+        return json.loads(f'"{body}"')
+    except ValueError:
+        return ""
+
+
+def to_markdown(result: StructuredSummary) -> str:
+    """기존 저장 형식의 마크다운으로 재구성 (상세 화면/검색에서 그대로 사용)"""
+    lines = [f"📌 분류: {result.category}", f"📌 키워드: {', '.join(result.keywords)}", "", result.summary]
+    return "\n".join(lines)
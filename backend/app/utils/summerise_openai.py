@@ -1,16 +1,31 @@
 import os
 import json
+import hashlib
 import requests
 from dotenv import load_dotenv
 import logging
-from typing import Optional
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Optional
 from app.core.config import settings
+from app.utils.chunking import split_into_chunks
+from app.utils.ollama_client import ollama_client
+from app.utils.ollama_pool import RequestCancelled, ollama_pool
+from app.utils.structured_summary import (
+    STRUCTURED_OUTPUT_INSTRUCTION,
+    SUMMARY_JSON_SCHEMA,
+    SUMMARY_WITH_TITLE_JSON_SCHEMA,
+    TITLE_INPUT_TEMPLATE,
+    TITLE_OUTPUT_INSTRUCTION,
+    partial_summary_field,
+)
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# Ollama API 설정 (config.py의 settings에서 가져옴)
-OLLAMA_API_URL = settings.OLLAMA_API_URL
+# Ollama API 설정 (config.py의 settings에서 가져옴, 요청은 ollama_client를 통해 전송)
 OLLAMA_MODEL = settings.OLLAMA_MODEL
 
 # 프롬프트 설정 파일 경로 (이 모듈과 같은 디렉터리의 prompt.conf)
@@ -24,60 +39,261 @@ def _normalize_prompt(value):  # str | list -> str (newline 유지)
     return value if isinstance(value, str) else ""
 
 
-def _load_prompts() -> dict:
-    """prompt.conf(JSON)에서 system/user_template 로드. 실패 시 기본 문자열 반환."""
+# 긴 문서 map 단계(청크별 정리) 기본 프롬프트 (prompt.conf의 map_system/map_user_template로 변경 가능)
+_DEFAULT_MAP_SYSTEM = (
+    "당신은 긴 문서의 일부를 받아 이후 전체 요약에 쓸 메모를 작성하는 편집자입니다. "
+    "원문에 없는 내용은 추가하지 말고, 사실·수치·인용문·고유명사·참조 링크·이미지 URL은 빠짐없이 남기세요."
+)
+_DEFAULT_MAP_USER_TEMPLATE = (
+    "다음은 긴 문서의 {index}/{total} 부분입니다. 한글이 아니면 한글로 번역하고, "
+    "핵심 내용을 마크다운 리스트로 정리하세요. 분류/키워드/핵심요약은 쓰지 마세요:\n\n{text}\n"
+)
+
+
+def _read_prompt_file() -> dict:
+    """prompt.conf(JSON)에서 system/user_template(+ 긴 문서용 map 프롬프트) 읽기. 실패 시 기본 문자열 반환."""
     try:
         with open(_PROMPT_CONF_PATH, "r", encoding="utf-8") as f:
             raw = json.load(f)
         return {
             "system": _normalize_prompt(raw.get("system", "")),
             "user_template": _normalize_prompt(raw.get("user_template", "{text}")),
+            "map_system": _normalize_prompt(raw.get("map_system", _DEFAULT_MAP_SYSTEM)),
+            "map_user_template": _normalize_prompt(raw.get("map_user_template", _DEFAULT_MAP_USER_TEMPLATE)),
         }
     except Exception as e:
         logger.warning(f"prompt.conf 로드 실패, 기본 프롬프트 사용: {e}")
         return {
             "system": "당신은 입력한 웹 컨텐츠를 핵심만 추출하여 가독성 높은 마크다운 형식으로 정리하는 전문 편집자입니다.",
             "user_template": "다음 컨텐츠를 위 규칙에 맞게 정리하세요:\n\n{text}\n\n",
+            "map_system": _DEFAULT_MAP_SYSTEM,
+            "map_user_template": _DEFAULT_MAP_USER_TEMPLATE,
         }
 
 
-def summarize_article(text: str, model: Optional[str] = None) -> str:
+def _prompt_version(prompts: dict) -> str:
+    """프롬프트 전체(map 프롬프트 포함) 내용 해시 12자리"""
+    raw = json.dumps([prompts.get(k, "") for k in ("system", "user_template", "map_system", "map_user_template")], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
+
+# prompt.conf 메모리 캐시: 파일 mtime/크기가 바뀌면 다시 읽음 (서버 재시작 없이 프롬프트 교체)
+_prompt_cache = {"stamp": None, "prompts": None, "version": None}
+_prompt_lock = threading.Lock()
+
+
+def _cached_prompts() -> tuple:
+    """(prompts, version) 반환. 파일이 바뀐 경우에만 다시 파싱."""
+    try:
+        st = os.stat(_PROMPT_CONF_PATH)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    with _prompt_lock:
+        if _prompt_cache["prompts"] is None or _prompt_cache["stamp"] != stamp:
+            prompts = _read_prompt_file()
+            version = _prompt_version(prompts)
+            if _prompt_cache["version"] not in (None, version):
+                logger.info(f"prompt.conf 변경 감지 - 프롬프트 버전 {_prompt_cache['version']} → {version}")
+            _prompt_cache.update(stamp=stamp, prompts=prompts, version=version)
+        return _prompt_cache["prompts"], _prompt_cache["version"]
+
+
+def _load_prompts() -> dict:
+    """현재 프롬프트 (메모리 캐시, prompt.conf 변경 시 자동 재로딩)"""
+    return _cached_prompts()[0]
+
+
+def get_prompt_version(structured: bool = False) -> str:
+    """
+    현재 프롬프트 버전 (prompt.conf 내용 해시 12자리). 북마크별로 저장되며 요약 캐시 키에도 사용.
+    구조화(JSON) 출력 모드는 응답 형식이 달라 '-json'을 붙여 구분.
+    """
+    version = _cached_prompts()[1]
+    return f"{version}-json" if structured else version
+
+
+def current_prompt_versions() -> List[str]:
+    """현재 prompt.conf로 만든 요약의 버전 목록 (정규식 추출 모드, 구조화 출력 모드)"""
+    return [get_prompt_version(False), get_prompt_version(True)]
+
+
+def structured_output_enabled(model: Optional[str]) -> bool:
+    """모델에 구조화(JSON) 출력 모드를 사용할지 여부 (OLLAMA_STRUCTURED_OUTPUT_EXCLUDE_MODELS는 정규식 추출 사용)"""
+    use_model = (model or "").strip() or OLLAMA_MODEL
+    return settings.OLLAMA_STRUCTURED_OUTPUT and use_model not in settings.OLLAMA_STRUCTURED_OUTPUT_EXCLUDE_MODEL_LIST
+
+
+def _chat(
+    model: str,
+    system_content: str,
+    user_content: str,
+    on_partial: Optional[Callable[[str], None]] = None,
+    fmt: Optional[dict] = None,
+    purpose: str = "summary",
+) -> str:
+    """
+    Ollama /api/chat 1회 호출 (on_partial 지정 시 스트리밍, fmt 지정 시 JSON 스키마 출력).
+    응답 텍스트 반환, 요청 오류는 예외로 전달.
+    """
+    extra = {"format": fmt} if fmt else {}
+    result = ollama_client.chat(
+        model,
+        [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": user_content},
+        ],
+        on_partial=on_partial,
+        purpose=purpose,  # 마감 시간은 입력 길이와 모델 관측 지연으로 계산 (llm_deadline)
+        **extra,
+    )
+    logger.info(
+        f"Ollama 응답 ({model}): 로딩 {result.load_duration:.2f}s, 생성 {result.eval_duration:.2f}s "
+        f"(입력 {result.prompt_eval_count} / 출력 {result.eval_count} 토큰)"
+    )
+    return result.content
+
+
+def _chunk_concurrency(model: str) -> int:
+    """map 단계 동시 요청 수: 해당 모델을 처리할 수 있는 사용 가능 노드 수 × SUMMARY_CHUNK_CONCURRENCY"""
+    nodes = [e for e in ollama_pool.endpoints if e.available and e.has_model(model)] or \
+        [e for e in ollama_pool.endpoints if e.available]
+    return max(1, len(nodes) * settings.SUMMARY_CHUNK_CONCURRENCY)
+
+
+def _map_chunks(
+    chunks: List[str],
+    model: str,
+    prompts: dict,
+    cancel_check: Optional[Callable[[], None]] = None,
+    map_slots: Optional[Callable[[str, int], ContextManager[int]]] = None,
+) -> List[str]:
+    """
+    청크별 정리(map)를 병렬 수행. 하나라도 실패하면 RuntimeError.
+    cancel_check: 작업이 취소/대체되었으면 예외(RequestCancelled)를 내는 함수. 청크 시작 전과 토큰마다 호출하고,
+        예외가 나면 시작하지 않은 청크는 취소
+    map_slots: (모델, 원하는 추가 동시 요청 수) → 실제로 빌린 추가 슬롯 수를 주는 컨텍스트 매니저.
+        지정하면 동시 요청 수 = 1(작업 자신의 슬롯) + 빌린 슬롯 (모델별 동시 요청 상한 유지)
+    """
+    total = len(chunks)
+    on_partial = (lambda _text: cancel_check()) if cancel_check is not None else None
+
+    def summarize_chunk(index: int) -> str:
+        if cancel_check is not None:
+            cancel_check()
+        user_content = prompts["map_user_template"].format(text=chunks[index], index=index + 1, total=total)
+        note = _chat(model, prompts["map_system"], user_content, on_partial, purpose="summary_map")
+        if not note or not note.strip():
+            raise RuntimeError(f"청크 {index + 1}/{total} 요약 결과 없음")
+        return note.strip()
+
+    wanted = min(total, _chunk_concurrency(model))
+    slots = map_slots(model, wanted - 1) if map_slots is not None else nullcontext(wanted - 1)
+    with slots as extra:
+        workers = 1 + max(0, extra)
+        logger.info(f"긴 문서 map 단계 시작: 청크 {total}개, 동시 {workers}개 (모델: {model})")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summary-map") as executor:
+            # 청크 호출에도 작업 ID 등 호출 문맥(llm_call_context)이 기록되도록 문맥을 복사해 실행
+            futures = [executor.submit(contextvars.copy_context().run, summarize_chunk, i) for i in range(total)]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # 실패/취소 시 아직 시작하지 않은 청크는 실행하지 않음
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+def _reduce_input(
+    text: str,
+    model: str,
+    prompts: dict,
+    cancel_check: Optional[Callable[[], None]] = None,
+    map_slots: Optional[Callable[[str, int], ContextManager[int]]] = None,
+) -> str:
     """
-    Ollama 모델을 사용하여 텍스트를 마크다운 형식으로 편집하는 함수
+    긴 문서를 청크별 메모로 줄여 reduce 단계 입력 생성.
+    메모를 합쳐도 SUMMARY_CHUNK_THRESHOLD를 넘으면 메모를 다시 map (최대 SUMMARY_CHUNK_MAX_DEPTH단계).
+    """
+    for depth in range(1, settings.SUMMARY_CHUNK_MAX_DEPTH + 1):
+        chunks = split_into_chunks(text, settings.SUMMARY_CHUNK_SIZE)
+        notes = _map_chunks(chunks, model, prompts, cancel_check, map_slots)
+        text = "\n\n".join(f"### 부분 {i}/{len(notes)}\n{note}" for i, note in enumerate(notes, 1))
+        logger.info(f"map 단계 {depth} 완료: {len(chunks)}개 청크 → {len(text)}자")
+        if len(text) < settings.SUMMARY_CHUNK_THRESHOLD:
+            break
+    return text
+
+
+def _json_partial_adapter(on_partial: Callable[[str], None]) -> Callable[[str], None]:
+    """스트리밍 중인 JSON 버퍼에서 summary 값만 뽑아 on_partial에 전달 (summary 시작 전에는 전달 안 함)"""
+    def forward(buffer: str):
+        summary = partial_summary_field(buffer)
+        if summary:
+            on_partial(summary)
+    return forward
+
+
+def summarize_article(
+    text: str,
+    model: Optional[str] = None,
+    on_partial: Optional[Callable[[str], None]] = None,
+    structured: bool = False,
+    translate_title: Optional[str] = None,
+    cancel_check: Optional[Callable[[], None]] = None,
+    map_slots: Optional[Callable[[str, int], ContextManager[int]]] = None,
+) -> str:
+    """
+    Ollama 모델을 사용하여 텍스트를 마크다운 형식으로 편집하는 함수.
+    SUMMARY_CHUNK_THRESHOLD 이상인 긴 문서는 청크별로 병렬 정리(map)한 뒤
+    prompt.conf 형식으로 최종 요약(reduce)
     
     Args:
         text (str): 편집할 텍스트 내용
         model (str, optional): 사용할 모델명. 미지정 시 OLLAMA_MODEL 사용
+        on_partial (callable, optional): 지정 시 스트리밍으로 요청하고, 토큰이 도착할 때마다
+            지금까지 생성된 전체 텍스트를 인자로 호출 (OLLAMA_STREAM_SUMMARY=False면 사용 안 함).
+            긴 문서는 최종(reduce) 단계만 스트리밍
+        structured (bool): True면 JSON 스키마(format)로 category/keywords/summary를 요청하고
+            JSON 문자열을 그대로 반환 (파싱은 structured_summary.parse_structured_summary).
+            스트리밍 시 on_partial에는 summary 필드 값만 전달
+        translate_title (str, optional): structured=True일 때 함께 번역할 영어 제목.
+            JSON 응답의 title 필드로 한국어 제목을 받음 (번역 모델 별도 호출 생략)
+        cancel_check (callable, optional): 긴 문서 map 단계에서 청크마다 호출하는 작업 취소 확인 함수
+        map_slots (callable, optional): 긴 문서 map 단계의 추가 동시 요청 슬롯을 빌리는 컨텍스트 매니저
+            (요약 작업은 summary_queue.borrow_map_slots 기반, 미지정 시 노드 수 × SUMMARY_CHUNK_CONCURRENCY)
         
     Returns:
-        str: 편집된 텍스트. 오류 발생 시 빈 문자열 반환
+        str: 편집된 텍스트(structured=True면 JSON 문자열). 오류 발생 시 빈 문자열 반환
     """
     try:
         use_model = (model or "").strip() or OLLAMA_MODEL
-        logger.info(f"Ollama API 요청 시작: 텍스트 편집 (모델: {use_model})")
+        stream = on_partial is not None and settings.OLLAMA_STREAM_SUMMARY
+        long_document = settings.SUMMARY_CHUNK_THRESHOLD > 0 and len(text) >= settings.SUMMARY_CHUNK_THRESHOLD
+        logger.info(
+            f"Ollama API 요청 시작: 텍스트 편집 (모델: {use_model}, 스트리밍: {stream}, "
+            f"길이: {len(text)}자, 긴 문서 모드: {long_document}, JSON 출력: {structured}, "
+            f"제목 번역 포함: {bool(structured and translate_title)})"
+        )
         prompts = _load_prompts()
+        if long_document:
+            text = _reduce_input(text, use_model, prompts, cancel_check, map_slots)
         system_content = prompts.get("system", "")
         user_content = (prompts.get("user_template", "{text}")).format(text=text)
 
-        # Ollama API 요청
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": use_model,
-                "messages": [
-                    {"role": "system", "content": system_content},
-                    {"role": "user", "content": user_content},
-                ],
-                "stream": False,
-            },
-            timeout=300  # 5분 타임아웃 (대용량 텍스트 처리 고려)
-        )
-        
-        response.raise_for_status()
-        result = response.json()
-        
-        # Ollama 응답 형식: {"message": {"content": "..."}}
-        edited_content = result.get('message', {}).get('content', '')
+        partial = on_partial if stream else None
+        fmt = None
+        if structured:
+            system_content += STRUCTURED_OUTPUT_INSTRUCTION
+            fmt = SUMMARY_JSON_SCHEMA
+            if translate_title:
+                system_content += TITLE_OUTPUT_INSTRUCTION
+                user_content += TITLE_INPUT_TEMPLATE.format(title=translate_title)
+                fmt = SUMMARY_WITH_TITLE_JSON_SCHEMA
+            if partial is not None:
+                partial = _json_partial_adapter(partial)
+
+        edited_content = _chat(use_model, system_content, user_content, partial, fmt)
         
         if not edited_content:
             logger.warning("Ollama API 응답에 컨텐츠가 없습니다.")
@@ -86,6 +302,9 @@ def summarize_article(text: str, model: Optional[str] = None) -> str:
         logger.info("텍스트 편집 완료")
         return edited_content
         
+    except RequestCancelled:
+        # 작업 취소/대체는 호출 측(워커)에서 처리
+        raise
     except requests.exceptions.RequestException as e:
         logger.error(f"Ollama API 요청 실패: {str(e)}", exc_info=True)
         return ""
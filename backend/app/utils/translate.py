@@ -1,44 +1,38 @@
 import os
+import json
 import requests
 import logging
-import re
-from typing import Optional
+from typing import Dict, List, Optional
 from app.core.config import settings
+from app.services.translation_cache import translation_cache
+from app.utils.language import LANG_OTHER, detect_script
+from app.utils.ollama_client import ollama_client
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# Ollama API 설정 (config.py의 settings에서 가져옴)
-OLLAMA_API_URL = settings.OLLAMA_API_URL
+# Ollama API 설정 (config.py의 settings에서 가져옴, 요청은 ollama_client를 통해 전송)
 TRANSLATE_MODEL = settings.TRANSLATE_MODEL
 
+# 번역 프롬프트에 쓰는 언어 이름
+LANGUAGE_NAMES = {"ko": "Korean", "en": "English", "ja": "Japanese", "zh": "Chinese"}
+
 
 def detect_language(text: str) -> str:
     """
-    텍스트의 언어를 자동으로 감지하는 함수
+    텍스트의 언어를 자동으로 감지하는 함수 (문자 체계 기반, app.utils.language.detect_script)
     
     Args:
         text: 감지할 텍스트
         
     Returns:
-        str: 'ko' (한글) 또는 'en' (영어)
+        str: 'ko', 'en', 'ja', 'zh' 또는 'other'(키릴/아랍 문자 등).
+        글자가 없는 텍스트(빈 문자열, 숫자/기호만)는 기존과 같이 'en'
     """
-    if not text or not text.strip():
+    guess = detect_script(text)
+    if guess.lang == LANG_OTHER and guess.confidence == 0.0:
         return 'en'  # 기본값은 영어
-    
-    # 한글 유니코드 범위 확인
-    # 한글: 가-힣 (0xAC00-0xD7A3), ㄱ-ㅎ (0x3131-0x318E), ㅏ-ㅣ (0x314F-0x3163)
-    korean_pattern = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
-    
-    # 텍스트에서 한글이 포함되어 있는지 확인
-    korean_count = len(korean_pattern.findall(text))
-    total_chars = len(re.findall(r'[가-힣ㄱ-ㅎㅏ-ㅣa-zA-Z]', text))
-    
-    # 한글이 30% 이상이면 한글로 판단
-    if total_chars > 0 and korean_count / total_chars > 0.3:
-        return 'ko'
-    else:
-        return 'en'
+    return guess.lang
 
 
 def translate_text(text: str, source_lang: Optional[str] = None, target_lang: Optional[str] = None) -> str:
@@ -47,11 +41,12 @@ def translate_text(text: str, source_lang: Optional[str] = None, target_lang: Op
     
     Args:
         text: 번역할 텍스트
-        source_lang: 원본 언어 ('ko' 또는 'en'). None이면 자동 감지
-        target_lang: 목표 언어 ('ko' 또는 'en'). None이면 자동 결정 (영어->한글, 한글->영어)
+        source_lang: 원본 언어 ('ko', 'en', 'ja', 'zh', 'other'). None이면 자동 감지
+        target_lang: 목표 언어 ('ko' 또는 'en'). None이면 자동 결정 (한글->영어, 그 외->한글)
         
     Returns:
         str: 번역된 텍스트. 오류 발생 시 원본 텍스트 반환
+        (TRANSLATION_CACHE_ENABLED면 같은 원문/언어/모델 번역은 translation_cache에서 재사용)
     """
     if not text or not text.strip():
         return text
@@ -75,48 +70,42 @@ def translate_text(text: str, source_lang: Optional[str] = None, target_lang: Op
             logger.info(f"원본 언어와 목표 언어가 동일하여 번역하지 않습니다: {source_lang}")
             return text
         
+        # 같은 원문/언어/모델 번역 결과가 있으면 번역 모델 호출 없이 재사용
+        if settings.TRANSLATION_CACHE_ENABLED:
+            cached = translation_cache.get(text, source_lang, target_lang, TRANSLATE_MODEL)
+            if cached is not None:
+                logger.info(f"번역 캐시 적중: {source_lang} -> {target_lang}")
+                return cached
+
         logger.info(f"번역 시작: {source_lang} -> {target_lang}")
         
-        # 번역 방향에 따른 프롬프트 설정
-        if source_lang == 'en' and target_lang == 'ko':
-            system_prompt = "You are a professional translator. Translate the given English text into Korean. Provide only the translated text without any additional explanations or notes."
-            user_prompt = f"Translate the following English text to Korean:\n\n{text}"
-        else:  # ko -> en
-            system_prompt = "You are a professional translator. Translate the given Korean text into English. Provide only the translated text without any additional explanations or notes."
-            user_prompt = f"Translate the following Korean text to English:\n\n{text}"
+        # 번역 방향에 따른 프롬프트 설정 (원본 언어를 모르면(other) 언어 이름 없이 요청)
+        source_name = LANGUAGE_NAMES.get(source_lang)
+        target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        source_text = f"{source_name} text" if source_name else "text"
+        system_prompt = f"You are a professional translator. Translate the given {source_text} into {target_name}. Provide only the translated text without any additional explanations or notes."
+        user_prompt = f"Translate the following {source_text} to {target_name}:\n\n{text}"
         
-        # Ollama API 요청
-        response = requests.post(
-            OLLAMA_API_URL,
-            json={
-                "model": TRANSLATE_MODEL,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ],
-                "stream": False
-            },
-            timeout=300  # 5분 타임아웃
+        # Ollama API 요청 (공용 클라이언트: 연결 재사용 + keep_alive로 번역 모델 상주)
+        result = ollama_client.chat(
+            TRANSLATE_MODEL,
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            purpose="translate",  # 마감 시간은 입력 길이와 모델 관측 지연으로 계산
         )
-        
-        response.raise_for_status()
-        result = response.json()
-        
-        # Ollama 응답 형식: {"message": {"content": "..."}}
-        translated_text = result.get('message', {}).get('content', '')
+        translated_text = result.content
         
         if not translated_text:
             logger.warning("Ollama API 응답에 번역된 텍스트가 없습니다.")
             return text
         
         logger.info(f"번역 완료: {source_lang} -> {target_lang}")
-        return translated_text.strip()
+        translated_text = translated_text.strip()
+        if settings.TRANSLATION_CACHE_ENABLED:
+            translation_cache.put(text, source_lang, target_lang, TRANSLATE_MODEL, translated_text)
+        return translated_text
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Ollama API 요청 실패: {str(e)}", exc_info=True)
@@ -126,6 +115,133 @@ def translate_text(text: str, source_lang: Optional[str] = None, target_lang: Op
         return text
 
 
+# 일괄 번역 응답 스키마: 입력 순번(index)별 번역문
+BATCH_TRANSLATION_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "translations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"index": {"type": "integer"}, "text": {"type": "string"}},
+                "required": ["index", "text"],
+            },
+        },
+    },
+    "required": ["translations"],
+}
+
+
+def parse_batch_translations(raw: str, count: int) -> Dict[int, str]:
+    """
+    일괄 번역 응답에서 {index: 번역문} 추출. 범위를 벗어난 index, 중복 index(첫 값 사용),
+    빈 번역문은 버림 (빠진 항목은 호출 측에서 개별 번역으로 대체)
+    """
+    try:
+        data = json.loads((raw or "").strip())
+    except ValueError:
+        return {}
+    items = data.get("translations") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return {}
+    result: Dict[int, str] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index, value = item.get("index"), item.get("text")
+        if isinstance(index, bool) or not isinstance(index, int) or not 0 <= index < count or index in result:
+            continue
+        if isinstance(value, str) and value.strip():
+            result[index] = value.strip()
+    return result
+
+
+def _translate_chunk(texts: List[str], source_lang: str, target_lang: str) -> Dict[int, str]:
+    """번역 모델 1회 호출로 여러 문장 번역 ({index: 번역문}, 실패 시 빈 dict)"""
+    source_name = LANGUAGE_NAMES.get(source_lang)
+    target_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+    source_item = f"{source_name} item" if source_name else "item"
+    system_prompt = (
+        f"You are a professional translator. Translate each {source_item} into {target_name}. "
+        'Respond with JSON {"translations": [{"index": <same index>, "text": <translation>}]} '
+        "containing every item exactly once, without any additional explanations or notes."
+    )
+    items = [{"index": i, "text": text} for i, text in enumerate(texts)]
+    user_prompt = f"Translate the following items:\n\n{json.dumps(items, ensure_ascii=False)}"
+    try:
+        result = ollama_client.chat(
+            TRANSLATE_MODEL,
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            purpose="translate_batch",
+            format=BATCH_TRANSLATION_JSON_SCHEMA,
+        )
+    except Exception as e:
+        logger.warning(f"일괄 번역 요청 실패 ({len(texts)}건), 개별 번역으로 대체: {e}")
+        return {}
+    return parse_batch_translations(result.content, len(texts))
+
+
+def translate_batch(
+    texts: List[str],
+    source_lang: str = 'en',
+    target_lang: str = 'ko',
+    batch_size: Optional[int] = None,
+) -> List[str]:
+    """
+    여러 문장을 TRANSLATE_BATCH_SIZE개씩 묶어 번역 모델 1회 호출로 번역 (입력과 같은 순서의 리스트 반환).
+    번역 캐시에 있는 문장과 중복 문장은 요청하지 않고, 응답에서 빠지거나 잘못된 항목은 translate_text로 개별 번역.
+    개별 번역도 실패한 항목은 원문 그대로 반환 (translate_text와 같음)
+    """
+    results: List[Optional[str]] = [None if text and text.strip() else text for text in texts]
+    pending: Dict[str, List[int]] = {}
+    for i, text in enumerate(texts):
+        if results[i] is not None:
+            continue
+        cached = translation_cache.get(text, source_lang, target_lang, TRANSLATE_MODEL) \
+            if settings.TRANSLATION_CACHE_ENABLED else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(text, []).append(i)
+
+    unique = list(pending.keys())
+    size = max(1, batch_size or settings.TRANSLATE_BATCH_SIZE)
+    fallback: List[str] = []
+    for start in range(0, len(unique), size):
+        chunk = unique[start:start + size]
+        translated = _translate_chunk(chunk, source_lang, target_lang) if len(chunk) > 1 else {}
+        for offset, text in enumerate(chunk):
+            value = translated.get(offset)
+            if value is None:
+                fallback.append(text)
+                continue
+            if settings.TRANSLATION_CACHE_ENABLED:
+                translation_cache.put(text, source_lang, target_lang, TRANSLATE_MODEL, value)
+            for i in pending[text]:
+                results[i] = value
+    if unique:
+        logger.info(
+            f"일괄 번역 완료: {source_lang} -> {target_lang}, 요청 {len(unique)}건 "
+            f"(캐시/중복 제외 {len(texts) - len(unique)}건), 개별 번역 대체 {len(fallback)}건"
+        )
+    for text in fallback:
+        value = translate_text(text, source_lang=source_lang, target_lang=target_lang)
+        for i in pending[text]:
+            results[i] = value
+    return results
+
+
+def bilingual_title(original: str, translated: Optional[str]) -> str:
+    """번역된 제목을 '한글(English)' 형태로 결합 (번역 실패/원문과 같으면 원문 그대로)"""
+    translated = (translated or "").strip()
+    if not translated or translated == original:
+        return original
+    return f"{translated}({original})"
+
+
 def translate_to_korean(text: str) -> str:
     """
     영어 텍스트를 한글로 번역하는 함수
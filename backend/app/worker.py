@@ -0,0 +1,80 @@
+"""
+요약 워커 프로세스 진입점
+
+실행 방법 (backend 디렉터리에서):
+  python -m app.worker
+  python -m app.worker --concurrency 4
+
+API 서버와 같은 DB의 summary_jobs 테이블을 큐로 사용하므로 워커 레플리카를 N개 띄워도
+작업이 중복 실행되지 않습니다. 워커를 별도로 운영할 때는 API 서버 .env에
+SUMMARY_EMBEDDED_WORKER=False 를 두어 API 프로세스 내장 워커를 끄세요.
+
+Docker:
+  docker compose --profile worker up -d --scale worker=3
+"""
+import argparse
+import logging
+import signal
+import sys
+
+from app.core.config import settings
+from app.core.logging import setup_root_logger
+from app.db.session import engine
+from app.db.schema_updates import apply_column_updates
+from app.models import Base
+from app.tasks.summary_worker import SummaryWorker
+from app.tasks.summary_recovery import SummaryRecoverySweeper
+from app.utils.ollama_client import ollama_client
+from app.utils.llm_telemetry import llm_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LinkDigest 요약 워커")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.SUMMARY_WORKER_CONCURRENCY,
+        help=f"동시 요약 작업 수 (기본값: SUMMARY_WORKER_CONCURRENCY={settings.SUMMARY_WORKER_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=settings.SUMMARY_WORKER_POLL_INTERVAL,
+        help="대기 작업이 없을 때 큐 폴링 간격(초)",
+    )
+    args = parser.parse_args(argv)
+
+    setup_root_logger()
+
+    # API 서버보다 먼저 기동되는 경우를 대비해 테이블 생성
+    try:
+        Base.metadata.create_all(bind=engine)
+        apply_column_updates(engine)
+    except Exception as e:
+        logger.warning(f"데이터베이스 테이블 생성 실패 (워커는 계속 시작됩니다): {str(e)}")
+
+    worker = SummaryWorker(concurrency=args.concurrency, poll_interval=args.poll_interval)
+
+    def handle_signal(signum, frame):
+        logger.info(f"종료 신호 수신 ({signum}) - 실행 중인 작업 완료 후 종료합니다.")
+        worker.request_stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    if settings.OLLAMA_WARMUP_ON_STARTUP:
+        ollama_client.warmup_in_background()
+
+    sweeper = SummaryRecoverySweeper() if settings.SUMMARY_RECOVERY_ENABLED else None
+    if sweeper:
+        sweeper.start()
+
+    worker.run_forever()
+    if sweeper:
+        sweeper.stop()
+    # 실행 중인 작업이 끝날 때까지 대기
+    worker.stop(wait=True)
+    llm_telemetry.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
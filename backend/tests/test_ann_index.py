@@ -0,0 +1,113 @@
+import uuid
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.semantic_index import SemanticIndex
+from app.utils.embeddings import normalize_rows
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+MODEL = "local:hash-32"
+
+
+def _clustered_vectors(count: int, clusters: int = 20, dim: int = 32, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = normalize_rows(rng.normal(size=(clusters, dim)))
+    labels = rng.integers(0, clusters, size=count)
+    return normalize_rows(centers[labels] + 0.15 * rng.normal(size=(count, dim)))
+
+
+def _index(monkeypatch, vectors, owner, min_size=100):
+    monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "local")
+    monkeypatch.setattr(settings, "EMBEDDING_LOCAL_DIM", 32)
+    monkeypatch.setattr(settings, "ANN_IVF_MIN_SIZE", min_size)
+    monkeypatch.setattr(settings, "ANN_IVF_LISTS", 0)
+    monkeypatch.setattr(settings, "ANN_IVF_NPROBE", 4)
+    monkeypatch.setattr(settings, "ANN_IVF_ITERATIONS", 10)
+    index = SemanticIndex()
+    index._reset(MODEL)
+    ids = [uuid.uuid4() for _ in range(len(vectors))]
+    for bid, vector in zip(ids, vectors):
+        index.upsert(bid, vector, owner, True)
+    index._maybe_train()
+    return index, ids
+
+
+def _exact_related(vectors, row, limit):
+    scores = vectors @ vectors[row]
+    scores[row] = -np.inf
+    return set(np.argsort(-scores)[:limit].tolist())
+
+
+def test_ivf_related_recall_close_to_exact(monkeypatch):
+    owner = uuid.uuid4()
+    vectors = _clustered_vectors(2000)
+    index, ids = _index(monkeypatch, vectors, owner)
+    assert index.stats()["ivf"]["trained"]
+    assert index.stats()["ivf"]["lists"] == 45
+
+    row_of = {bid: row for row, bid in enumerate(ids)}
+    recalls = []
+    for row in range(0, 2000, 40):
+        hits = index.related(ids[row], owner, limit=10)
+        assert ids[row] not in [bid for bid, _ in hits]
+        found = {row_of[bid] for bid, _ in hits}
+        recalls.append(len(found & _exact_related(vectors, row, 10)) / 10)
+    assert np.mean(recalls) >= 0.9
+
+
+def test_related_respects_visibility_and_incremental_updates(monkeypatch):
+    me, other = uuid.uuid4(), uuid.uuid4()
+    vectors = _clustered_vectors(400, clusters=8)
+    index, ids = _index(monkeypatch, vectors, me)
+    assert index.stats()["ivf"]["trained"]
+
+    near = ids[int(np.argsort(-(vectors @ vectors[0]))[1])]
+    assert near in [bid for bid, _ in index.related(ids[0], me, limit=5)]
+    # 다른 사용자의 비공개 북마크는 제외
+    index.upsert(near, vectors[list(ids).index(near)], other, False)
+    assert near not in [bid for bid, _ in index.related(ids[0], me, limit=5)]
+    # 학습 후 추가된 벡터도 가까운 중심에 배정되어 조회됨
+    added = uuid.uuid4()
+    index.upsert(added, vectors[0], me, False)
+    assert index.related(ids[0], me, limit=1)[0][0] == added
+    # 삭제 후 제외, 삭제로 옮겨진 행도 계속 조회됨
+    index.remove(added)
+    index.remove(ids[1])
+    assert added not in [bid for bid, _ in index.related(ids[0], me, limit=50)]
+    assert index.related(ids[-1], me, limit=1)
+    assert index.related(uuid.uuid4(), me, limit=5) == []
+
+
+def test_small_index_uses_exact_scan(monkeypatch):
+    owner = uuid.uuid4()
+    vectors = _clustered_vectors(50)
+    index, ids = _index(monkeypatch, vectors, owner, min_size=1000)
+    assert not index.stats()["ivf"]["trained"]
+    hits = index.related(ids[3], owner, limit=5)
+    assert {ids[row] for row in _exact_related(vectors, 3, 5)} == {bid for bid, _ in hits}
+
+
+def test_save_and_restore_roundtrip(monkeypatch, tmp_path):
+    owner = uuid.uuid4()
+    vectors = _clustered_vectors(300, clusters=6)
+    index, ids = _index(monkeypatch, vectors, owner)
+    index.upsert(ids[5], vectors[5], uuid.uuid4(), False)
+    path = str(tmp_path / "index" / "semantic_index.npz")
+    assert index.save(path)
+    assert not index.stats()["unsaved_changes"]
+
+    restored = SemanticIndex()
+    restored._reset(MODEL)
+    assert restored._restore_locked(MODEL, path)
+    assert len(restored) == 300
+    assert restored.stats()["ivf"] == index.stats()["ivf"]
+    assert restored.related(ids[0], owner, limit=10) == index.related(ids[0], owner, limit=10)
+    # 소유자/공개 여부도 복원 (다른 사용자의 비공개 북마크 제외)
+    assert ids[5] not in [bid for bid, _ in restored.related(ids[6], owner, limit=300)]
+    # 다른 모델의 저장 파일은 복원하지 않음
+    other = SemanticIndex()
+    other._reset("local:hash-64")
+    assert not other._restore_locked("local:hash-64", path)
+    assert len(other) == 0
@@ -0,0 +1,31 @@
+from app.utils.chunking import split_into_chunks
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_short_text_single_chunk():
+    assert split_into_chunks("첫 문단입니다.\n\n둘째 문단입니다.", 100) == ["첫 문단입니다.\n\n둘째 문단입니다."]
+
+
+def test_empty_text():
+    assert split_into_chunks("  \n\n ", 100) == []
+
+
+def test_paragraph_boundaries_respected():
+    """문단을 중간에서 자르지 않고 max_chars 이하로 묶음"""
+    paragraphs = [f"문단 {i} " + "가" * 30 for i in range(10)]
+    chunks = split_into_chunks("\n\n".join(paragraphs), 80)
+    assert all(len(c) <= 80 for c in chunks)
+    assert "\n\n".join(chunks) == "\n\n".join(paragraphs)
+
+
+def test_long_paragraph_split_by_sentence():
+    sentence = "This is a sentence that is fairly long. "
+    chunks = split_into_chunks(sentence * 10, 100)
+    assert all(len(c) <= 100 for c in chunks)
+    assert all(c.endswith(".") for c in chunks)
+
+
+def test_oversized_sentence_hard_split():
+    chunks = split_into_chunks("x" * 250, 100)
+    assert [len(c) for c in chunks] == [100, 100, 50]
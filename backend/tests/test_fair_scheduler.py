@@ -0,0 +1,76 @@
+from collections import Counter
+
+from app.core.config import settings
+from app.tasks.fair_scheduler import (
+    LANE_BULK, LANE_INTERACTIVE, DeficitRoundRobin, estimate_job_cost, lane_rank, lane_slot_limit,
+)
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_drr_alternates_users():
+    """대량 적재한 사용자가 있어도 다른 사용자 작업이 번갈아 처리됨"""
+    drr = DeficitRoundRobin(quantum=1)
+    heads = {"bulk-user": 1, "other": 1}
+    picks = [drr.pick(heads) for _ in range(6)]
+    assert Counter(picks) == {"bulk-user": 3, "other": 3}
+    assert picks[0] != picks[1]
+
+
+def test_drr_cost_share():
+    """비용이 큰 작업(긴 문서)을 가진 사용자는 비용 비율만큼 덜 선택됨"""
+    drr = DeficitRoundRobin(quantum=2)
+    heads = {"long": 4, "short": 1}
+    picks = [drr.pick(heads) for _ in range(10)]
+    counts = Counter(picks)
+    # 사용자별 처리 비용 합이 같아짐 (long 2건 x 4 == short 8건 x 1)
+    assert counts["long"] * 4 == counts["short"] * 1
+
+
+def test_drr_new_user_and_empty():
+    drr = DeficitRoundRobin(quantum=1)
+    assert drr.pick({}) is None
+    assert drr.pick({"a": 1}) == "a"
+    # 새 사용자가 합류하면 바로 차례가 돌아옴
+    picks = [drr.pick({"a": 1, "b": 1}) for _ in range(2)]
+    assert "b" in picks
+
+
+def test_lane_priority_and_reserved_slots(monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_BULK_RESERVED_SLOTS", 1)
+    assert sorted([LANE_BULK, LANE_INTERACTIVE], key=lane_rank) == [LANE_INTERACTIVE, LANE_BULK]
+    assert lane_slot_limit(LANE_INTERACTIVE, 3) == 3
+    assert lane_slot_limit(LANE_BULK, 3) == 2
+    # 상한이 1이어도 bulk가 멈추지는 않음
+    assert lane_slot_limit(LANE_BULK, 1) == 1
+
+
+def test_estimate_job_cost(monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_CHUNK_SIZE", 8000)
+    assert estimate_job_cost(None) == 1
+    assert estimate_job_cost(500) == 1
+    assert estimate_job_cost(24000) == 4
+
+
+def test_drr_user_without_owner():
+    """등록 사용자가 없는 작업(user_id None)도 다른 사용자와 번갈아 선택"""
+    drr = DeficitRoundRobin(quantum=1)
+    # 차례 표식과 키(None)를 혼동하면 무한 루프
+    assert drr.pick({None: 1}) is None
+    picks = [drr.pick({None: 1, "a": 1}) for _ in range(4)]
+    assert Counter(picks) == {None: 2, "a": 2}
+
+
+def test_drr_peek_charges_only_on_commit():
+    """peek은 차감하지 않고, 거절(skip)된 사용자는 deficit을 유지한 채 차례만 넘김"""
+    drr = DeficitRoundRobin(quantum=1)
+    heads = {"a": 1, "b": 1}
+    assert drr.peek(heads) == "a"
+    assert drr.peek(heads) == "a"
+    assert drr.peek(heads, skip={"a"}) == "b"
+    drr.charge("b", 1)
+    assert drr.snapshot() == {"a": 1, "b": 0}
+    assert drr.peek(heads, skip={"a", "b"}) is None
+    # 거절됐던 a는 남은 deficit에 이번 차례 quantum을 더해 처리
+    assert drr.pick(heads) == "a"
+    assert drr.snapshot() == {"a": 1, "b": 0}
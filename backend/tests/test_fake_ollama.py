@@ -0,0 +1,57 @@
+import json
+
+import pytest
+import requests
+
+from app.utils.fake_ollama import FakeOllamaConfig, FakeOllamaServer, parse_latency
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+MODEL = "gpt-oss:120b-cloud"
+
+
+def _messages(text: str, system: str = "요약 편집자"):
+    return [{"role": "system", "content": system}, {"role": "user", "content": text}]
+
+
+def test_parse_latency():
+    assert parse_latency("fixed:0.5") == ("fixed", [0.5])
+    assert parse_latency("lognormal:-0.5,0.4") == ("lognormal", [-0.5, 0.4])
+    with pytest.raises(ValueError):
+        parse_latency("uniform:1")
+
+
+def test_chat_stream_and_summary_format():
+    """스트리밍 응답을 이어 붙이면 📌 분류/키워드 형식 요약이 되고 마지막 청크에 토큰 지표 포함"""
+    with FakeOllamaServer(FakeOllamaConfig(cold_load_seconds=0.01)) as server:
+        payload = {"model": MODEL, "messages": _messages("Kubernetes autoscaling latency report"), "stream": True}
+        with requests.post(server.chat_url, json=payload, stream=True, timeout=10) as response:
+            chunks = [json.loads(line) for line in response.iter_lines() if line]
+        text = "".join(c["message"]["content"] for c in chunks)
+        assert text.startswith("📌 분류: 기사\n📌 키워드: Kubernetes")
+        final = chunks[-1]
+        assert final["done"] and final["eval_count"] == len(chunks) - 1
+        assert final["load_duration"] > 0
+        assert server.stats()["counters"]["completed"] == 1
+
+
+def test_chat_structured_and_translation():
+    with FakeOllamaServer() as server:
+        payload = {"model": MODEL, "messages": _messages("본문 내용"), "stream": False, "format": {"type": "object"}}
+        data = requests.post(server.chat_url, json=payload, timeout=10).json()
+        parsed = json.loads(data["message"]["content"])
+        assert set(parsed) == {"category", "keywords", "summary"}
+
+        system = "You are a professional translator."
+        payload = {"model": "translategemma:4b", "messages": _messages("Translate:\n\nHello", system), "stream": False}
+        data = requests.post(server.chat_url, json=payload, timeout=10).json()
+        assert data["message"]["content"] == "[번역] Hello"
+
+
+def test_error_injection_and_tags():
+    with FakeOllamaServer(FakeOllamaConfig(error_rate=1.0, models=[MODEL])) as server:
+        tags = requests.get(f"{server.base_url}/api/tags", timeout=10).json()
+        assert [m["name"] for m in tags["models"]] == [MODEL]
+        response = requests.post(server.chat_url, json={"model": MODEL, "messages": _messages("x"), "stream": False}, timeout=10)
+        assert response.status_code == 500
+        assert server.stats()["counters"]["errors"] == 1
@@ -0,0 +1,28 @@
+from app.utils.language import LanguageGuess, detect_script
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_detect_script_languages():
+    assert detect_script("OpenAI releases new model").lang == "en"
+    assert detect_script("오픈AI, 새 추론 모델 공개").lang == "ko"
+    assert detect_script("OpenAIが新しい推論モデルを発表").lang == "ja"
+    assert detect_script("OpenAI发布新的推理模型").lang == "zh"
+    assert detect_script("Привет, мир").lang == "other"
+
+
+def test_detect_script_han_follows_hangul_or_kana():
+    # 국한문 혼용은 한국어, 가나가 섞인 한자는 일본어
+    assert detect_script("漢字 문화권 연구").lang == "ko"
+    assert detect_script("東京で会議").lang == "ja"
+
+
+def test_detect_script_confidence_and_no_letters():
+    assert detect_script("Hello world") == LanguageGuess("en", 1.0)
+    assert detect_script("") == LanguageGuess("other", 0.0)
+    assert detect_script("2026-10-19 !!") == LanguageGuess("other", 0.0)
+    # 한국어 기사 속 영어 용어: 한글 비율이 30%를 넘으면 한국어, 신뢰도는 한글 비율
+    guess = detect_script("LLM 게이트웨이 도입 확대")
+    assert guess.lang == "ko" and 0.3 < guess.confidence < 1.0
+    # 한글이 30% 이하이면 영어
+    assert detect_script("안녕 hello").lang == "en"
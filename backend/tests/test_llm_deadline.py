@@ -0,0 +1,69 @@
+import random
+
+import requests
+
+from app.core.config import settings
+from app.utils.llm_deadline import (
+    DeadlineExceeded, LatencyTracker, backoff_delay, compute_deadline, hedge_delay, is_retryable, percentile,
+)
+from app.utils.ollama_pool import RequestCancelled
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _deadline_settings(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_DEADLINE_BASE", 120.0)
+    monkeypatch.setattr(settings, "LLM_DEADLINE_P95_MULTIPLIER", 2.0)
+    monkeypatch.setattr(settings, "LLM_DEADLINE_CHARS_PER_SECOND", 400.0)
+    monkeypatch.setattr(settings, "LLM_DEADLINE_MIN", 30.0)
+    monkeypatch.setattr(settings, "LLM_DEADLINE_MAX", 600.0)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([], 95) is None
+
+
+def test_deadline_scales_with_input_and_observed_latency(monkeypatch):
+    _deadline_settings(monkeypatch)
+    tracker = LatencyTracker()
+    # 관측 지연이 없으면 기본값 + 입력 길이 보정
+    assert compute_deadline(tracker, "m", 0) == 120.0
+    assert compute_deadline(tracker, "m", 40000) == 220.0
+    # 빠른 모델은 p95 × 2 (최소값 이상)로 줄어듦
+    for _ in range(20):
+        tracker.observe("m", 0.5, 10.0)
+    assert compute_deadline(tracker, "m", 0) == 30.0
+    assert compute_deadline(tracker, "m", 400000) == 600.0
+
+
+def test_hedge_delay_needs_samples(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_HEDGE_MIN_SAMPLES", 5)
+    tracker = LatencyTracker()
+    for value in (1.0, 1.0, 1.0, 1.0):
+        tracker.observe("m", value, 5.0)
+    assert hedge_delay(tracker, "m") is None
+    tracker.observe("m", 3.0, 5.0)
+    assert hedge_delay(tracker, "m") == 3.0
+    monkeypatch.setattr(settings, "LLM_HEDGE_ENABLED", False)
+    assert hedge_delay(tracker, "m") is None
+
+
+def test_backoff_and_retryable(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_RETRY_BACKOFF_BASE", 1.0)
+    monkeypatch.setattr(settings, "LLM_RETRY_BACKOFF_MAX", 4.0)
+    rng = random.Random(0)
+    assert all(0 <= backoff_delay(0, rng) <= 1.0 for _ in range(50))
+    assert all(0 <= backoff_delay(5, rng) <= 4.0 for _ in range(50))
+
+    assert is_retryable(DeadlineExceeded("late"))
+    assert is_retryable(requests.exceptions.ConnectionError())
+    assert not is_retryable(RequestCancelled())
+    response = requests.Response()
+    response.status_code = 404
+    assert not is_retryable(requests.exceptions.HTTPError(response=response))
+    response.status_code = 503
+    assert is_retryable(requests.exceptions.HTTPError(response=response))
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.utils.llm_telemetry import OUTCOME_OK, LlmTelemetry, llm_call_context, parse_window
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_parse_window():
+    assert parse_window("15m") == timedelta(minutes=15)
+    assert parse_window(" 24h ") == timedelta(hours=24)
+    assert parse_window("7d") == timedelta(days=7)
+    assert parse_window("366d") == timedelta(days=366)
+    for invalid in ("", "0m", "1w", "h1", "367d", "99999999999d"):
+        with pytest.raises(ValueError):
+            parse_window(invalid)
+
+
+def test_record_uses_call_context_and_caps_buffer(monkeypatch):
+    """작업 문맥(작업 ID, 큐 대기)이 기록되고, 버퍼 상한을 넘으면 오래된 지표부터 버림"""
+    monkeypatch.setattr(settings, "LLM_TELEMETRY_MAX_BUFFER", 2)
+    monkeypatch.setattr(settings, "LLM_TELEMETRY_BATCH_SIZE", 100)
+    telemetry = LlmTelemetry()
+    # 저장 쓰레드 없이 버퍼만 확인
+    monkeypatch.setattr(telemetry, "_ensure_writer", lambda: None)
+    with llm_call_context(job_id="job-1", queue_wait_seconds=1.5):
+        telemetry.record("m", "summary", 0.25, OUTCOME_OK)
+    telemetry.record("m", "translate", 0.1, OUTCOME_OK)
+    telemetry.record("m", "translate", 0.2, OUTCOME_OK)
+    assert telemetry.stats() == {"buffered": 2, "dropped": 1}
+    first = telemetry._buffer[0]
+    assert first["job_id"] is None and first["latency_ms"] == 100
+
+
+def test_summary_job_endpoints_are_admin_only():
+    """내부 노드 주소와 호출 지표를 노출하는 상태 API는 관리자만 조회 가능"""
+    from app.api.endpoints.summary_jobs import router
+    from app.core.security import get_current_admin_user, get_current_user
+
+    for route in router.routes:
+        calls = [dep.call for dep in route.dependant.dependencies]
+        assert get_current_admin_user in calls, route.path
+        assert get_current_user not in calls, route.path
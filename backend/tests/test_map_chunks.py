@@ -0,0 +1,86 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+import app.utils.summerise_openai as summarizer
+from app.utils.ollama_pool import RequestCancelled
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+PROMPTS = {"map_system": "map", "map_user_template": "{index}/{total}: {text}"}
+
+
+class _ConcurrencyProbe:
+    """동시에 실행 중인 _chat 호출 수의 최댓값 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def __call__(self, model, system_content, user_content, on_partial=None, fmt=None, purpose="summary"):
+        with self.lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05)
+            if on_partial is not None:
+                on_partial("메모")
+            return f"메모 {user_content}"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_map_concurrency_limited_to_borrowed_slots(monkeypatch):
+    """노드 수 × 청크 동시 수가 커도 빌린 슬롯(+작업 자신의 1개)만큼만 동시에 호출"""
+    probe = _ConcurrencyProbe()
+    monkeypatch.setattr(summarizer, "_chat", probe)
+    monkeypatch.setattr(summarizer, "_chunk_concurrency", lambda model: 8)
+    requests = []
+
+    @contextmanager
+    def map_slots(model, wanted):
+        requests.append(wanted)
+        yield 1
+
+    notes = summarizer._map_chunks([f"청크{i}" for i in range(6)], "m", PROMPTS, map_slots=map_slots)
+
+    assert len(notes) == 6
+    assert requests == [5]
+    assert probe.peak == 2
+
+
+def test_map_without_free_slots_runs_sequentially(monkeypatch):
+    probe = _ConcurrencyProbe()
+    monkeypatch.setattr(summarizer, "_chat", probe)
+    monkeypatch.setattr(summarizer, "_chunk_concurrency", lambda model: 4)
+
+    @contextmanager
+    def map_slots(model, wanted):
+        yield 0
+
+    summarizer._map_chunks(["a", "b", "c"], "m", PROMPTS, map_slots=map_slots)
+    assert probe.peak == 1
+
+
+def test_map_stops_remaining_chunks_on_cancel(monkeypatch):
+    """작업이 취소되면 시작하지 않은 청크는 호출하지 않음"""
+    probe = _ConcurrencyProbe()
+    monkeypatch.setattr(summarizer, "_chat", probe)
+    monkeypatch.setattr(summarizer, "_chunk_concurrency", lambda model: 1)
+    cancelled = threading.Event()
+
+    def cancel_check():
+        if cancelled.is_set():
+            raise RequestCancelled("cancelled")
+        if probe.calls >= 2:
+            cancelled.set()
+
+    with pytest.raises(RequestCancelled):
+        summarizer._map_chunks([f"청크{i}" for i in range(10)], "m", PROMPTS, cancel_check=cancel_check)
+    assert probe.calls == 2
@@ -0,0 +1,58 @@
+from app.core.config import settings
+from app.tasks.model_router import (
+    ROUTE_DEFAULT, ROUTE_KOREAN, ROUTE_LONG, ROUTE_QUEUE, ROUTE_SHORT, ROUTE_USER, route_summary_model,
+)
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+BIG = "gpt-oss:120b-cloud"
+SMALL = "emma3:27b-cloud"
+
+
+def _configure(monkeypatch, **overrides):
+    values = {
+        "SUMMARY_ROUTING_ENABLED": True,
+        "OLLAMA_MODEL": BIG,
+        "OLLAMA_MODEL_LISTS": f"{BIG},{SMALL}",
+        "SUMMARY_ROUTING_SMALL_MODEL": SMALL,
+        "SUMMARY_ROUTING_SHORT_CHARS": 100,
+        "SUMMARY_ROUTING_KOREAN_MAX_CHARS": 500,
+        "SUMMARY_ROUTING_QUEUE_THRESHOLD": 4,
+        "SUMMARY_ROUTING_OFFLOAD_MAX_CHARS": 1000,
+    }
+    values.update(overrides)
+    for name, value in values.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+def test_user_choice_wins(monkeypatch):
+    _configure(monkeypatch)
+    assert route_summary_model("짧은 메모", requested_model=BIG) == (BIG, ROUTE_USER)
+
+
+def test_short_and_korean_go_to_small_model(monkeypatch):
+    _configure(monkeypatch)
+    assert route_summary_model("short note").reason == ROUTE_SHORT
+    decision = route_summary_model("한국어 본문입니다. " * 20)
+    assert (decision.model, decision.reason) == (SMALL, ROUTE_KOREAN)
+    assert route_summary_model("english text " * 20) == (BIG, ROUTE_DEFAULT)
+    assert route_summary_model("english text " * 200).reason == ROUTE_LONG
+
+
+def test_queue_offload(monkeypatch):
+    """기본 모델이 밀려 있고 소형 모델이 덜 밀려 있을 때만 중간 길이 본문을 분산"""
+    _configure(monkeypatch)
+    content = "english text " * 20
+    busy = {BIG: {"queued": 3, "in_flight": 1}, SMALL: {"queued": 1, "in_flight": 0}}
+    assert route_summary_model(content, queue_stats=busy) == (SMALL, ROUTE_QUEUE)
+    both_busy = {BIG: {"queued": 3, "in_flight": 1}, SMALL: {"queued": 4, "in_flight": 2}}
+    assert route_summary_model(content, queue_stats=both_busy).model == BIG
+    # 긴 문서는 적체와 관계없이 기본 모델
+    assert route_summary_model("english text " * 200, queue_stats=busy).model == BIG
+
+
+def test_disabled_or_unknown_small_model(monkeypatch):
+    _configure(monkeypatch, SUMMARY_ROUTING_ENABLED=False)
+    assert route_summary_model("short") == (BIG, ROUTE_DEFAULT)
+    _configure(monkeypatch, OLLAMA_MODEL_LISTS=BIG)
+    assert route_summary_model("short") == (BIG, ROUTE_DEFAULT)
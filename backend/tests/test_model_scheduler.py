@@ -0,0 +1,28 @@
+from collections import Counter
+
+import pytest
+
+from app.core.config import settings, _parse_model_int_map
+from app.tasks.model_scheduler import WeightedModelScheduler
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_parse_model_int_map():
+    """모델명에 ':'가 포함돼도 '=' 기준으로 파싱"""
+    parsed = _parse_model_int_map("gpt-oss:120b-cloud=2, emma3:27b-cloud=4, invalid, bad=x")
+    assert parsed == {"gpt-oss:120b-cloud": 2, "emma3:27b-cloud": 4}
+
+
+def test_weighted_pick_ratio(monkeypatch):
+    """가중치 비율대로 모델이 분배되고, 낮은 가중치 모델도 굶지 않음"""
+    monkeypatch.setattr(settings, "OLLAMA_MODEL_WEIGHTS", "big=1,small=3")
+    scheduler = WeightedModelScheduler()
+    picks = [scheduler.pick(["big", "small"]) for _ in range(8)]
+    assert Counter(picks) == {"big": 2, "small": 6}
+    # smooth WRR: 연속 4개 안에 big이 반드시 한 번은 포함
+    assert "big" in picks[:4]
+
+
+def test_pick_without_candidates():
+    assert WeightedModelScheduler().pick([]) is None
@@ -0,0 +1,68 @@
+import pytest
+
+import app.utils.ollama_client as ollama_client_module
+from app.core.config import settings
+from app.utils.fake_ollama import FakeOllamaConfig, FakeOllamaServer
+from app.utils.ollama_client import OllamaClient
+from app.utils.ollama_pool import OllamaPool
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+MODEL = "gpt-oss:120b-cloud"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_TELEMETRY_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 0)
+    monkeypatch.setattr(settings, "OLLAMA_COLD_LOAD_THRESHOLD", 0.01)
+    with FakeOllamaServer(FakeOllamaConfig(cold_load_seconds=0.05)) as server:
+        monkeypatch.setattr(ollama_client_module, "ollama_pool", OllamaPool([server.chat_url]))
+        yield server
+
+
+def _connections(client: OllamaClient, url: str) -> int:
+    """세션 연결 풀이 지금까지 새로 연 TCP 연결 수"""
+    return client.session.get_adapter(url).poolmanager.connection_from_url(url).num_connections
+
+
+def test_session_reuses_connection(server):
+    """연속 요청은 공용 세션의 keep-alive 연결 하나를 재사용"""
+    client = OllamaClient()
+    for text in ("첫 번째 본문", "두 번째 본문", "세 번째 본문"):
+        result = client.chat(MODEL, [{"role": "user", "content": text}], timeout=10)
+        assert result.content
+    assert _connections(client, server.chat_url) == 1
+    assert server.stats()["counters"]["completed"] == 3
+
+
+def test_requests_send_keep_alive_and_split_load_time(server, monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_KEEP_ALIVE", "30m")
+    client = OllamaClient()
+    sent = []
+    post = client._post
+
+    def record_post(endpoint, payload, timeout, stream):
+        sent.append(payload)
+        return post(endpoint, payload, timeout, stream)
+    monkeypatch.setattr(client, "_post", record_post)
+
+    first = client.chat(MODEL, [{"role": "user", "content": "본문"}], timeout=10)
+    second = client.chat(MODEL, [{"role": "user", "content": "본문"}], timeout=10)
+    assert all(payload["keep_alive"] == "30m" for payload in sent)
+    # 첫 요청만 모델 로딩 시간이 포함됨 (콜드 로드)
+    assert first.cold_load and not second.cold_load
+    stats = client.stats()["models"][MODEL]
+    assert stats["requests"] == 2 and stats["cold_loads"] == 1
+
+
+def test_warmup_loads_models_and_records_results(server):
+    client = OllamaClient()
+    results = client.warmup([MODEL, MODEL, "", "missing-model:7b"])
+
+    assert [(r["model"], r["ok"]) for r in results] == [(MODEL, True), ("missing-model:7b", False)]
+    assert results[0]["endpoint"] == server.chat_url and results[0]["load_seconds"] > 0
+    assert server.stats()["counters"]["warmups"] == 1
+    assert client.stats()["warmup"] == results
+    # 워밍업 후 첫 요약 요청은 콜드 로드가 아님
+    assert not client.chat(MODEL, [{"role": "user", "content": "본문"}], timeout=10).cold_load
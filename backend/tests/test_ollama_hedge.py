@@ -0,0 +1,193 @@
+import json
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+
+import app.utils.ollama_client as ollama_client_module
+from app.core.config import settings
+from app.utils.ollama_client import OllamaClient
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+MODEL = "gpt-oss:120b-cloud"
+
+
+class _Endpoint:
+    def __init__(self, name: str):
+        self.chat_url = f"http://{name}:11434/api/chat"
+        self.base_url = f"http://{name}:11434"
+
+
+class _Response:
+    """첫 토큰을 first_token_after초 뒤에 보내고 done_after초 뒤에 끝나는 스트리밍 응답"""
+
+    def __init__(self, first_token_after: float, done_after: float):
+        self.first_token_after = first_token_after
+        self.done_after = done_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_lines(self):
+        time.sleep(self.first_token_after)
+        yield json.dumps({"message": {"content": "번역"}, "done": False}).encode()
+        time.sleep(self.done_after - self.first_token_after)
+        yield json.dumps({"message": {"content": ""}, "done": True, "eval_count": 1}).encode()
+
+
+class _BlockingResponse:
+    """헤더만 보내고 멈춘 노드의 응답: close() 전까지 iter_lines가 토큰 없이 대기"""
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self.closed.set()
+
+    def iter_lines(self):
+        if not self.closed.wait(10):
+            raise TimeoutError("응답이 닫히지 않음")
+        raise ConnectionError("connection closed")
+        yield b""
+
+
+class _FakePool:
+    """노드 2개짜리 풀: 원 요청은 node-a, 헤지 요청은 node-b. 노드별 처리 중 요청 수 기록"""
+    is_multi = True
+
+    def __init__(self):
+        self.hedge_targets = 0
+        self.outstanding = {}
+        self.failures = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, model=None, exclude=()):
+        endpoint = _Endpoint("node-b" if exclude else "node-a")
+        with self._lock:
+            self.outstanding[endpoint.chat_url] = self.outstanding.get(endpoint.chat_url, 0) + 1
+        try:
+            yield endpoint
+        except ollama_client_module.RequestCancelled:
+            raise
+        except Exception:
+            self.failures.append(endpoint.chat_url)
+            raise
+        finally:
+            with self._lock:
+                self.outstanding[endpoint.chat_url] -= 1
+
+    def idle_endpoint(self, model, exclude=()):
+        self.hedge_targets += 1
+        return _Endpoint("node-b")
+
+
+def _client(monkeypatch, first_token_after: float, done_after: float):
+    monkeypatch.setattr(settings, "LLM_TELEMETRY_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 0)
+    pool = _FakePool()
+    monkeypatch.setattr(ollama_client_module, "ollama_pool", pool)
+    monkeypatch.setattr(ollama_client_module, "hedge_delay", lambda tracker, model: 0.1)
+    client = OllamaClient()
+    posts = []
+
+    def post(endpoint, payload, timeout, stream):
+        posts.append(endpoint.chat_url)
+        return _Response(first_token_after, done_after)
+    monkeypatch.setattr(client, "_post", post)
+    return client, pool, posts
+
+
+def test_no_hedge_when_first_token_arrives_before_delay_without_on_partial(monkeypatch):
+    # 첫 토큰은 헤지 대기(0.1초) 전에 오고 전체 호출은 그보다 오래 걸리는 비스트리밍 호출 (번역/맵 요약 등)
+    client, pool, posts = _client(monkeypatch, first_token_after=0.01, done_after=0.4)
+    result = client.chat(MODEL, [{"role": "user", "content": "Hello"}], purpose="translate")
+    assert result.content == "번역"
+    assert pool.hedge_targets == 0
+    assert posts == ["http://node-a:11434/api/chat"]
+    assert client.stats()["hedges"]["sent"] == 0
+
+
+def test_hedge_sent_when_first_token_is_late(monkeypatch):
+    client, pool, posts = _client(monkeypatch, first_token_after=0.3, done_after=0.35)
+    partials = []
+    result = client.chat(MODEL, [{"role": "user", "content": "Hello"}], on_partial=partials.append)
+    assert result.content == "번역"
+    assert pool.hedge_targets == 1
+    assert sorted(posts) == ["http://node-a:11434/api/chat", "http://node-b:11434/api/chat"]
+    assert client.stats()["hedges"]["sent"] == 1
+    # 결과를 가져간 요청 하나의 텍스트만 전달
+    assert partials == ["번역"]
+
+
+def test_losing_request_is_closed_and_releases_its_node(monkeypatch):
+    """첫 토큰 없이 멈춘 원 요청은 헤지가 이기면 응답을 닫아 쓰레드/연결/노드 슬롯을 바로 반환"""
+    client, pool, posts = _client(monkeypatch, first_token_after=0.01, done_after=0.02)
+    stuck = _BlockingResponse()
+
+    def post(endpoint, payload, timeout, stream):
+        posts.append(endpoint.chat_url)
+        return stuck if "node-a" in endpoint.chat_url else _Response(0.01, 0.02)
+    monkeypatch.setattr(client, "_post", post)
+
+    started = time.monotonic()
+    result = client.chat(MODEL, [{"role": "user", "content": "Hello"}], on_partial=lambda text: None)
+    assert result.content == "번역"
+    assert stuck.closed.wait(1)
+    deadline = time.monotonic() + 1
+    while pool.outstanding.get("http://node-a:11434/api/chat") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.outstanding == {"http://node-a:11434/api/chat": 0, "http://node-b:11434/api/chat": 0}
+    # 취소로 닫힌 요청은 노드 실패로 집계하지 않음
+    assert pool.failures == []
+    assert time.monotonic() - started < 2
+
+
+def test_close_response_unblocks_socket_read():
+    """실제 연결에서 헤더 이후 멈춘 스트림도 다른 쓰레드의 _close_response로 읽기가 즉시 끝남"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    release = threading.Event()
+
+    def serve():
+        conn, _ = server.accept()
+        conn.recv(65536)
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n")
+        release.wait(10)
+        conn.close()
+    threading.Thread(target=serve, daemon=True).start()
+
+    try:
+        response = requests.post(
+            f"http://127.0.0.1:{server.getsockname()[1]}/api/chat", json={}, stream=True, timeout=(3, 10),
+        )
+        finished = threading.Event()
+
+        def read():
+            try:
+                for _ in response.iter_lines():
+                    pass
+            except Exception:
+                pass
+            finished.set()
+        threading.Thread(target=read, daemon=True).start()
+        time.sleep(0.1)
+        ollama_client_module._close_response(response)
+        assert finished.wait(2)
+    finally:
+        release.set()
+        server.close()
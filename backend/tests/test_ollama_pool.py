@@ -0,0 +1,88 @@
+import pytest
+
+import app.utils.ollama_pool as ollama_pool_module
+from app.core.config import settings
+from app.utils.ollama_pool import OllamaPool
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+URLS = ["http://node-a:11434/api/chat", "http://node-b:11434/api/chat"]
+
+
+class _TagsResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"models": [{"name": "gemma3:27b"}]}
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_EJECT_FAILURES", 2)
+    pool = OllamaPool(URLS)
+    pool._checker = object()  # 테스트에서는 헬스 체크 쓰레드를 띄우지 않음
+    return pool
+
+
+def _fail(pool, times: int):
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            with pool.acquire("gemma3:27b"):
+                raise ConnectionError("연결 실패")
+
+
+def _health(monkeypatch, ok: bool):
+    def fake_get(url, timeout=None):
+        if not ok:
+            raise ConnectionError("tags 실패")
+        return _TagsResponse()
+    monkeypatch.setattr(ollama_pool_module.requests, "get", fake_get)
+
+
+def test_consecutive_failures_eject_endpoint(pool, monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_EJECT_SECONDS", 60)
+    # 처리 중 요청이 가장 적은 노드 선택 → 실패는 node-a에 누적
+    with pool.acquire("gemma3:27b") as endpoint:
+        assert endpoint is pool.endpoints[0]
+    _fail(pool, 2)
+    node_a, node_b = pool.endpoints
+    assert node_a.ejected and not node_a.available
+    with pool.acquire("gemma3:27b") as endpoint:
+        assert endpoint is node_b
+    assert pool.status()[0]["ejected"]
+
+
+def test_ejected_endpoint_waits_for_health_check_after_period(pool, monkeypatch):
+    """제외 기간이 지나도 헬스 체크가 성공하기 전에는 재투입하지 않음"""
+    monkeypatch.setattr(settings, "OLLAMA_EJECT_SECONDS", 0)
+    _fail(pool, 2)
+    node_a = pool.endpoints[0]
+    assert not node_a.available
+
+    _health(monkeypatch, ok=False)
+    pool.check(node_a)
+    assert not node_a.available
+
+    _health(monkeypatch, ok=True)
+    pool.check(node_a)
+    assert node_a.available and node_a.consecutive_failures == 0
+    assert node_a.models == {"gemma3:27b"}
+
+
+def test_health_check_during_ejection_period_keeps_endpoint_out(pool, monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_EJECT_SECONDS", 60)
+    _fail(pool, 2)
+    node_a = pool.endpoints[0]
+    _health(monkeypatch, ok=True)
+    pool.check(node_a)
+    assert node_a.ejected and not node_a.available
+
+
+def test_success_resets_failure_count(pool, monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_EJECT_SECONDS", 60)
+    _fail(pool, 1)
+    with pool.acquire("gemma3:27b"):
+        pass
+    _fail(pool, 1)
+    assert not any(e.ejected for e in pool.endpoints)
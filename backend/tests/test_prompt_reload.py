@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+import app.utils.summerise_openai as summarizer
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _write(path, system: str, mtime_ns: int):
+    path.write_text(json.dumps({"system": system, "user_template": "{text}"}, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def prompt_conf(tmp_path, monkeypatch):
+    path = tmp_path / "prompt.conf"
+    _write(path, "첫 번째 프롬프트", 1_000_000_000)
+    monkeypatch.setattr(summarizer, "_PROMPT_CONF_PATH", str(path))
+    monkeypatch.setattr(summarizer, "_prompt_cache", {"stamp": None, "prompts": None, "version": None})
+    return path
+
+
+def test_prompt_cached_until_file_changes(prompt_conf, monkeypatch):
+    reads = []
+    original = summarizer._read_prompt_file
+    monkeypatch.setattr(summarizer, "_read_prompt_file", lambda: reads.append(1) or original())
+
+    assert summarizer._load_prompts()["system"] == "첫 번째 프롬프트"
+    version = summarizer.get_prompt_version()
+    summarizer._load_prompts()
+    assert len(reads) == 1
+
+    # 서버 재시작 없이 수정된 prompt.conf 반영 (mtime 변경 감지)
+    _write(prompt_conf, "두 번째 프롬프트", 2_000_000_000)
+    assert summarizer._load_prompts()["system"] == "두 번째 프롬프트"
+    assert len(reads) == 2
+    assert summarizer.get_prompt_version() != version
+    assert summarizer.get_prompt_version(True) == f"{summarizer.get_prompt_version()}-json"
+
+
+def test_same_content_keeps_version(prompt_conf):
+    """파일을 다시 저장해도 내용이 같으면 버전 유지 (요약 캐시/재요약 대상에 영향 없음)"""
+    version = summarizer.get_prompt_version()
+    _write(prompt_conf, "첫 번째 프롬프트", 3_000_000_000)
+    assert summarizer.get_prompt_version() == version
+
+
+def test_missing_file_falls_back_to_default(prompt_conf):
+    version = summarizer.get_prompt_version()
+    prompt_conf.unlink()
+    prompts = summarizer._load_prompts()
+    assert prompts["system"] and "{text}" in prompts["user_template"]
+    assert summarizer.get_prompt_version() != version
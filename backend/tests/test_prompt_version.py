@@ -0,0 +1,37 @@
+from app.api.endpoints.summary_jobs import get_prompt_versions
+from app.utils.summerise_openai import current_prompt_versions, get_prompt_version
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+class _FakeQuery:
+    """버전별 북마크 수 집계(query().filter().group_by().all())만 흉내 내는 세션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def group_by(self, *columns):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def test_structured_summaries_count_as_current_prompt_version():
+    plain, structured = get_prompt_version(False), get_prompt_version(True)
+    assert structured == f"{plain}-json"
+    assert current_prompt_versions() == [plain, structured]
+
+    rows = [(structured, 5), (plain, 2), ("0123456789ab-json", 3), (None, 1)]
+    result = get_prompt_versions(db=_FakeQuery(rows), current_user=None)
+    current = {v["prompt_version"]: v["current"] for v in result["versions"]}
+    assert current == {structured: True, plain: True, "0123456789ab-json": False, None: False}
+    assert result["outdated"] == 4
+    assert result["current"] == plain
+    assert result["current_versions"] == sorted([plain, structured])
@@ -0,0 +1,191 @@
+import threading
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.sql import operators
+
+import app.tasks.resummarize as resummarize_module
+from app.api.endpoints.resummarize import create_resummarize_run
+from app.core.config import settings
+from app.resummarize import main as resummarize_main
+from app.schemas.resummarize import ResummarizeRequest
+from app.tasks.resummarize import RUN_DONE, RUN_PAUSED, RUN_RUNNING, _enqueue_batch, build_run, run_resummarize
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _evaluate(clause, row) -> bool:
+    """cursor 조건(or_/and_, >, ==)을 북마크 행에 적용"""
+    if clause.operator is operators.or_:
+        return any(_evaluate(c, row) for c in clause.clauses)
+    if clause.operator is operators.and_:
+        return all(_evaluate(c, row) for c in clause.clauses)
+    left, right = getattr(row, clause.left.key), clause.right.value
+    if clause.operator is operators.gt:
+        return left > right
+    return left == right
+
+
+class _TargetQuery:
+    def __init__(self, rows):
+        self.rows = rows
+        self.criteria = []
+        self.size = None
+
+    def filter(self, criterion):
+        self.criteria.append(criterion)
+        return self
+
+    def with_entities(self, *entities):
+        return self
+
+    def order_by(self, *clauses):
+        return self
+
+    def limit(self, size):
+        self.size = size
+        return self
+
+    def all(self):
+        rows = [r for r in self.rows if all(_evaluate(c, r) for c in self.criteria)]
+        rows.sort(key=lambda r: (r.created_at, r.id))
+        return [(r.id, r.created_at, "m") for r in rows[:self.size]]
+
+
+class _CommitSession:
+    def commit(self):
+        pass
+
+
+def _bookmarks():
+    # 같은 등록 시각(created_at)의 북마크도 id 순으로 빠짐없이 이어서 적재되는지 확인
+    same = datetime(2026, 10, 1, 9, 0)
+    ids = sorted(uuid.uuid4() for _ in range(3))
+    rows = [SimpleNamespace(id=i, created_at=same) for i in ids]
+    rows += [SimpleNamespace(id=uuid.uuid4(), created_at=datetime(2026, 10, d, 9, 0)) for d in (2, 3)]
+    return rows
+
+
+def test_batches_resume_from_cursor(monkeypatch):
+    rows = _bookmarks()
+    enqueued = []
+    monkeypatch.setattr(resummarize_module, "_target_query", lambda db, run: _TargetQuery(rows))
+    monkeypatch.setattr(
+        resummarize_module, "enqueue_summary_job",
+        lambda db, bookmark_id, model=None, commit=True, run_id=None: enqueued.append(bookmark_id),
+    )
+    monkeypatch.setattr(resummarize_module, "notify_workers", lambda: None)
+
+    run = build_run(batch_size=2, target_model="new-model")
+    run.id = uuid.uuid4()
+    assert _enqueue_batch(_CommitSession(), run) == 2
+    assert (run.cursor_created_at, run.cursor_id) == (rows[1].created_at, rows[1].id)
+
+    # 중단 후 재시작: 저장된 cursor만 가진 새 실행 객체로 이어서 적재
+    resumed = build_run(batch_size=2)
+    resumed.id, resumed.enqueued = run.id, run.enqueued
+    resumed.cursor_created_at, resumed.cursor_id = run.cursor_created_at, run.cursor_id
+    while _enqueue_batch(_CommitSession(), resumed):
+        pass
+    assert enqueued == [r.id for r in rows]
+    assert resumed.enqueued == len(rows)
+
+
+class _RunSession:
+    """run_resummarize의 실행 행 조회/최종 상태 갱신만 흉내 내는 세션"""
+
+    def __init__(self, run):
+        self.run = run
+        self.final = None
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return self.run
+
+    def update(self, values, synchronize_session=None):
+        self.final = values
+        return 1
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _RecordingEvent(threading.Event):
+    """wait() 호출 시간만 기록하고 바로 반환"""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        return self.is_set()
+
+
+def test_enqueue_throttled_by_rate_and_backlog(monkeypatch):
+    monkeypatch.setattr(settings, "RESUMMARIZE_BACKLOG_WAIT", 7)
+    run = build_run(rate=2.0, batch_size=4, max_pending=10)
+    run.id, run.status, run.enqueued, run.total = uuid.uuid4(), RUN_RUNNING, 0, 8
+    db = _RunSession(run)
+    batches = [4, 4, 0]
+    pending = iter([0, 10, 3, 0])
+    monkeypatch.setattr(resummarize_module, "SessionLocal", lambda: db)
+    monkeypatch.setattr(resummarize_module, "_acquire_run", lambda db, run_id: True)
+    monkeypatch.setattr(resummarize_module, "_pending_count", lambda db, run_id: next(pending))
+    monkeypatch.setattr(resummarize_module, "_enqueue_batch", lambda db, run: batches.pop(0))
+    stop_event = _RecordingEvent()
+
+    assert run_resummarize(run.id, stop_event) == RUN_DONE
+    # 배치마다 count/rate초 대기, 이 실행의 대기 작업이 max_pending 이상이면 적재 없이 RESUMMARIZE_BACKLOG_WAIT 대기
+    assert stop_event.waits == [2.0, 7, 2.0]
+    assert batches == [] and db.final["status"] == RUN_DONE
+
+
+def test_stop_event_pauses_before_next_batch(monkeypatch):
+    run = build_run(rate=1.0, batch_size=1)
+    run.id, run.status, run.enqueued = uuid.uuid4(), RUN_RUNNING, 0
+    db = _RunSession(run)
+    stop_event = _RecordingEvent()
+    calls = []
+
+    def enqueue_once(db, run):
+        calls.append(1)
+        stop_event.set()
+        return 1
+
+    monkeypatch.setattr(resummarize_module, "SessionLocal", lambda: db)
+    monkeypatch.setattr(resummarize_module, "_acquire_run", lambda db, run_id: True)
+    monkeypatch.setattr(resummarize_module, "_pending_count", lambda db, run_id: 0)
+    monkeypatch.setattr(resummarize_module, "_enqueue_batch", enqueue_once)
+
+    assert run_resummarize(run.id, stop_event) == RUN_PAUSED
+    assert calls == [1] and db.final["status"] == RUN_PAUSED
+
+
+def test_api_rejects_unknown_target_model(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_MODEL_LISTS", "m1,m2")
+    with pytest.raises(HTTPException) as exc:
+        create_resummarize_run(ResummarizeRequest(target_model="nope", dry_run=True), db=None, current_user=None)
+    assert exc.value.status_code == 400
+
+
+def test_cli_rejects_unknown_target_model(monkeypatch, capsys):
+    monkeypatch.setattr(settings, "OLLAMA_MODEL_LISTS", "m1,m2")
+    with pytest.raises(SystemExit) as exc:
+        resummarize_main(["--target-model", "nope", "--dry-run"])
+    assert exc.value.code == 2
+    assert "--target-model" in capsys.readouterr().err
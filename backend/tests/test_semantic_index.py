@@ -0,0 +1,75 @@
+import uuid
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.semantic_index import SemanticIndex
+from app.utils.embeddings import from_bytes, local_embed, to_bytes
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _index(monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "local")
+    monkeypatch.setattr(settings, "EMBEDDING_LOCAL_DIM", 64)
+    index = SemanticIndex()
+    index._reset("local:hash-64")
+    return index
+
+
+def test_local_embed_is_normalized_and_deterministic():
+    vectors = local_embed(["LLM 보안 게이트웨이", "LLM 보안 게이트웨이", ""], dim=64)
+    assert vectors.dtype == np.float32 and vectors.shape == (3, 64)
+    assert np.allclose(np.linalg.norm(vectors[0]), 1.0)
+    assert np.array_equal(vectors[0], vectors[1])
+    assert not vectors[2].any()
+
+
+def test_vector_bytes_roundtrip():
+    vector = local_embed(["벡터 저장"], dim=64)[0]
+    data = to_bytes(vector)
+    assert len(data) == 64 * 4
+    assert np.array_equal(from_bytes(data), vector)
+
+
+def test_search_ranks_by_similarity_and_respects_visibility(monkeypatch):
+    index = _index(monkeypatch)
+    me, other = uuid.uuid4(), uuid.uuid4()
+    texts = {
+        "mine": "LLM 프롬프트 인젝션 보안 위협",
+        "public": "프롬프트 인젝션 방어 가이드",
+        "private": "프롬프트 인젝션 보안 위협 사례",
+        "unrelated": "주말 캠핑 장비 추천",
+    }
+    vectors = dict(zip(texts, local_embed(list(texts.values()), dim=64)))
+    index.upsert("mine", vectors["mine"], me, False)
+    index.upsert("public", vectors["public"], other, True)
+    index.upsert("private", vectors["private"], other, False)
+    index.upsert("unrelated", vectors["unrelated"], other, True)
+
+    query = local_embed(["프롬프트 인젝션 보안"], dim=64)[0]
+    hits = index.search(query, me, limit=10)
+    ids = [bid for bid, _ in hits]
+    assert "private" not in ids
+    assert ids[0] == "mine"
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+    # 최소 점수 미만 제외
+    assert "unrelated" not in [bid for bid, _ in index.search(query, me, limit=10, min_score=0.2)]
+
+
+def test_upsert_replaces_and_remove_keeps_rows_consistent(monkeypatch):
+    index = _index(monkeypatch)
+    owner = uuid.uuid4()
+    vectors = local_embed([f"문서 {i}" for i in range(300)], dim=64)
+    for i, vector in enumerate(vectors):
+        index.upsert(i, vector, owner, True)
+    assert len(index) == 300
+    index.remove(0)
+    index.remove(150)
+    index.upsert(5, vectors[7], owner, True)
+    assert len(index) == 298
+    hits = dict(index.search(vectors[299], owner, limit=3))
+    assert np.isclose(hits[299], 1.0)
+    assert 0 not in dict(index.search(vectors[0], owner, limit=300))
+    # 교체된 행은 새 벡터로 검색됨
+    assert np.isclose(dict(index.search(vectors[7], owner, limit=300))[5], 1.0)
@@ -0,0 +1,52 @@
+import json
+
+from app.utils.structured_summary import parse_structured_summary, partial_summary_field, to_markdown
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_parse_structured_summary():
+    raw = json.dumps({
+        "category": "블로그",
+        "keywords": ["Docker", " Kubernetes ", ""],
+        "summary": "📌 분류: 블로그\n📌 키워드: Docker\n📌 핵심요약\n1. 내용",
+    }, ensure_ascii=False)
+    result = parse_structured_summary(raw)
+    assert result.category == "블로그"
+    assert result.keywords == ["Docker", "Kubernetes"]
+    # summary 안의 분류/키워드 줄은 제거 (to_markdown에서 다시 붙임)
+    assert result.summary == "📌 핵심요약\n1. 내용"
+    assert to_markdown(result).startswith("📌 분류: 블로그\n📌 키워드: Docker, Kubernetes\n\n📌 핵심요약")
+
+
+def test_parse_code_fenced_json():
+    raw = '```json\n{"category": "기사", "keywords": "a, b", "summary": "본문"}\n```'
+    result = parse_structured_summary(raw)
+    assert result.keywords == ["a", "b"]
+    assert result.summary == "본문"
+
+
+def test_parse_invalid_returns_none():
+    assert parse_structured_summary("📌 분류: 기사\n본문") is None
+    assert parse_structured_summary('{"category": "기사"}') is None
+
+
+def test_partial_summary_field():
+    assert partial_summary_field('{"category": "기사", "keywo') == ""
+    assert partial_summary_field('{"category": "기사", "summary": "## 제목\\n줄 \\"인용') == '## 제목\n줄 "인용'
+    # 끝이 잘린 이스케이프 시퀀스는 버림
+    assert partial_summary_field('{"summary": "가나\\u12') == "가나"
+    assert partial_summary_field('{"summary": "완료", "x": 1}') == "완료"
+
+
+def test_parse_translated_title():
+    raw = json.dumps({
+        "category": "기사",
+        "keywords": ["AI"],
+        "title": " 새로운 \n언어 모델 공개 ",
+        "summary": "📌 핵심요약\n1. 내용",
+    }, ensure_ascii=False)
+    assert parse_structured_summary(raw).title == "새로운 언어 모델 공개"
+    # 제목 번역을 요청하지 않은 응답은 빈 문자열, 스트리밍 중 summary 추출에도 영향 없음
+    assert parse_structured_summary('{"category": "기사", "keywords": [], "summary": "본문"}').title == ""
+    assert partial_summary_field('{"category": "기사", "keywords": [], "title": "제목", "summary": "요') == "요"
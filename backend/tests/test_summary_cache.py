@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from app.services.summary_cache import CachedSummary, SummaryCacheStore, make_cache_key
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+VALUE = CachedSummary(summary="📌 핵심요약: 요약", category="기사", tags=["LLM"])
+
+
+class _FakeSession:
+    """summary_cache 행을 dict로 흉내 내는 세션 (put의 INSERT ... ON CONFLICT는 파라미터만 읽음)"""
+
+    def __init__(self):
+        self.rows = {}
+        self.lookups = 0
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, criterion):
+        self._key = criterion.right.value
+        return self
+
+    def first(self):
+        self.lookups += 1
+        return self.rows.get(self._key)
+
+    def execute(self, stmt):
+        params = stmt.compile().params
+        self.rows[params["key"]] = SimpleNamespace(**params, last_hit_at=None)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_key_ignores_whitespace_but_not_content():
+    base = make_cache_key("첫 줄\n\n둘째  줄", "m", "v1")
+    assert make_cache_key("  첫 줄 둘째 줄 ", "m", "v1") == base
+    assert make_cache_key("첫 줄 셋째 줄", "m", "v1") != base
+
+
+def test_prompt_version_or_model_change_invalidates():
+    """프롬프트(prompt.conf)나 모델이 바뀌면 이전 요약을 재사용하지 않음"""
+    base = make_cache_key("본문", "m", "v1")
+    assert make_cache_key("본문", "m", "v2") != base
+    assert make_cache_key("본문", "other", "v1") != base
+
+
+def test_miss_then_store_then_hit():
+    store = SummaryCacheStore(max_size=8)
+    db = _FakeSession()
+    key = make_cache_key("본문", "m", "v1")
+
+    assert store.get(db, key) is None
+    store.put(db, key, "m", "v1", VALUE)
+    assert store.get(db, key) == VALUE
+    # 저장 시 LRU에도 적재되어 DB를 다시 조회하지 않음
+    assert db.lookups == 1
+    assert store.get(db, make_cache_key("본문", "m", "v2")) is None
+    stats = store.stats()
+    assert (stats["lru_hits"], stats["db_hits"], stats["misses"], stats["stores"]) == (1, 0, 2, 1)
+
+
+def test_db_hit_from_other_process_fills_lru():
+    db = _FakeSession()
+    key = make_cache_key("본문", "m", "v1")
+    SummaryCacheStore(max_size=8).put(db, key, "m", "v1", VALUE)
+
+    store = SummaryCacheStore(max_size=8)
+    assert store.get(db, key) == VALUE
+    assert db.rows[key].hit_count == 1
+    assert store.get(db, key) == VALUE
+    assert (store.db_hits, store.lru_hits) == (1, 1)
+
+
+def test_lru_evicts_oldest():
+    store = SummaryCacheStore(max_size=2)
+    db = _FakeSession()
+    keys = [make_cache_key(f"본문 {i}", "m", "v1") for i in range(3)]
+    for key in keys:
+        store.put(db, key, "m", "v1", VALUE)
+    assert list(store._lru) == keys[1:]
@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy.sql import operators
+
+import app.tasks.summary_queue as summary_queue_module
+from app.models.summary_job import SummaryJob
+from app.tasks.summary_queue import (
+    JOB_CANCELLED, JOB_DONE, JOB_PENDING, JOB_RUNNING, JOB_SUPERSEDED,
+    cancel_bookmark_jobs, enqueue_summary_job, is_job_cancelled_locally,
+)
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _matches(row, criterion) -> bool:
+    value = criterion.right.value
+    if criterion.operator is operators.in_op:
+        return getattr(row, criterion.left.key) in value
+    return getattr(row, criterion.left.key) == value
+
+
+class _Query:
+    def __init__(self, session, entities):
+        self.session = session
+        self.entities = entities
+        self.criteria = []
+
+    def filter(self, *criteria):
+        self.criteria.extend(criteria)
+        return self
+
+    def _rows(self):
+        return [job for job in self.session.jobs if all(_matches(job, c) for c in self.criteria)]
+
+    def update(self, values, synchronize_session=None):
+        rows = self._rows()
+        for job in rows:
+            for key, value in values.items():
+                setattr(job, key, value)
+        return len(rows)
+
+    def all(self):
+        return [tuple(getattr(job, e.key) for e in self.entities) for job in self._rows()]
+
+    def first(self):
+        # 북마크 소유자 조회 (user_id, 본문 길이)
+        return (self.session.user_id, 1000)
+
+
+class _FakeSession:
+    """summary_jobs 행을 메모리 목록으로 흉내 내는 세션 (advisory lock 호출은 기록만)"""
+
+    def __init__(self, jobs=None):
+        self.jobs = list(jobs or [])
+        self.user_id = uuid.uuid4()
+        self.locks = []
+
+    def execute(self, statement, params=None):
+        self.locks.append(params)
+
+    def query(self, *entities):
+        return _Query(self, entities)
+
+    def add(self, job):
+        job.id = job.id or uuid.uuid4()
+        job.created_at = job.created_at or datetime.utcnow()
+        self.jobs.append(job)
+
+    def flush(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def refresh(self, obj):
+        pass
+
+
+def _job(bookmark_id, status):
+    return SummaryJob(id=uuid.uuid4(), bookmark_id=bookmark_id, status=status, created_at=datetime.utcnow())
+
+
+def test_double_enqueue_leaves_one_pending_job():
+    db = _FakeSession()
+    bookmark_id = uuid.uuid4()
+    first = enqueue_summary_job(db, bookmark_id, model="m")
+    second = enqueue_summary_job(db, bookmark_id, model="m")
+
+    pending = [job for job in db.jobs if job.status == JOB_PENDING]
+    assert pending == [second]
+    assert first.status == JOB_SUPERSEDED
+    # 같은 북마크의 적재는 북마크별 advisory lock으로 직렬화
+    assert db.locks == [{"key": f"summary_bookmark:{bookmark_id}"}] * 2
+
+
+def test_enqueue_keeps_other_bookmarks_pending():
+    other = _job(uuid.uuid4(), JOB_PENDING)
+    db = _FakeSession([other])
+    enqueue_summary_job(db, uuid.uuid4(), model="m")
+    assert other.status == JOB_PENDING
+
+
+def test_cancel_on_delete_marks_active_jobs_cancelled():
+    bookmark_id = uuid.uuid4()
+    pending, running, done = (_job(bookmark_id, s) for s in (JOB_PENDING, JOB_RUNNING, JOB_DONE))
+    other = _job(uuid.uuid4(), JOB_RUNNING)
+    db = _FakeSession([pending, running, done, other])
+    try:
+        assert cancel_bookmark_jobs(db, bookmark_id) == 2
+        assert pending.status == running.status == JOB_CANCELLED
+        assert done.status == JOB_DONE and other.status == JOB_RUNNING
+        # 같은 프로세스에서 실행 중인 작업은 DB 조회 없이 다음 토큰에서 중단
+        assert is_job_cancelled_locally(running.id)
+        assert not is_job_cancelled_locally(other.id)
+    finally:
+        with summary_queue_module._cancelled_lock:
+            summary_queue_module._cancelled_jobs.difference_update({pending.id, running.id})
@@ -0,0 +1,88 @@
+import threading
+import uuid
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.tasks.summary_worker as summary_worker_module
+from app.core.config import settings
+from app.tasks.summary_queue import ClaimedJob
+from app.tasks.summary_recovery import fail_stale_jobs, stranded_bookmarks_query
+from app.tasks.summary_worker import SummaryWorker
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _sql(query) -> str:
+    return str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_sweep_skips_deleted_bookmarks():
+    sql = _sql(stranded_bookmarks_query(Session(), datetime(2026, 10, 1)))
+    assert "bookmarks.is_deleted = false" in sql
+
+
+def test_sweep_counts_only_failed_jobs_as_attempts():
+    """대체/취소된 작업은 재시도 횟수에 포함하지 않음"""
+    sql = _sql(stranded_bookmarks_query(Session(), datetime(2026, 10, 1)))
+    assert "count(summary_jobs.id)" not in sql
+    assert "summary_jobs.status = 'failed'" in sql
+
+
+class _UpdateSession:
+    """query().filter().update() 호출 기록용 가짜 세션"""
+
+    def __init__(self):
+        self.criteria = []
+        self.values = None
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        self.criteria.extend(criteria)
+        return self
+
+    def update(self, values, synchronize_session=None):
+        self.values = values
+        return 1
+
+
+def test_stale_jobs_judged_by_heartbeat(monkeypatch):
+    """시작 시각이 아니라 마지막 heartbeat(없으면 시작 시각) 기준으로 시간 초과 판단"""
+    monkeypatch.setattr(settings, "SUMMARY_JOB_TIMEOUT", 300)
+    db = _UpdateSession()
+    assert fail_stale_jobs(db, datetime(2026, 10, 1, 12, 0, 0)) == 1
+    rendered = [str(c.compile(dialect=postgresql.dialect())) for c in db.criteria]
+    assert any("coalesce(summary_jobs.heartbeat_at, summary_jobs.started_at)" in sql for sql in rendered)
+    assert db.values["status"] == "failed"
+    assert db.values["map_slots"] == 0
+
+
+def test_worker_heartbeats_running_jobs(monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_JOB_HEARTBEAT_INTERVAL", 1)
+    beats = []
+    beat = threading.Event()
+
+    def fake_heartbeat(worker_id, job_ids):
+        beats.append((worker_id, sorted(job_ids)))
+        beat.set()
+        return len(job_ids)
+
+    monkeypatch.setattr(summary_worker_module, "heartbeat_jobs", fake_heartbeat)
+    worker = SummaryWorker(concurrency=1, worker_id="w-1")
+    job = ClaimedJob(uuid.uuid4(), uuid.uuid4(), "m", 1, 0.0)
+    with worker._lock:
+        worker._running.add(job.id)
+    worker._start_heartbeat()
+    try:
+        assert beat.wait(3)
+        assert beats[0] == ("w-1", [job.id])
+    finally:
+        with worker._lock:
+            worker._running.clear()
+        worker._stop.set()
+        worker._heartbeat_thread.join(timeout=3)
+        worker._executor.shutdown(wait=False)
+    assert not worker._heartbeat_thread.is_alive()
@@ -0,0 +1,60 @@
+import uuid
+
+import app.tasks.summary_stream as summary_stream_module
+from app.tasks.summary_queue import SUMMARY_PLACEHOLDER
+from app.tasks.summary_stream import iter_summary_events
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def _events(monkeypatch, states):
+    """_load_summary_state가 states를 차례로 반환할 때의 이벤트 목록"""
+    states = iter(states)
+    monkeypatch.setattr(summary_stream_module, "_load_summary_state", lambda bookmark_id: next(states))
+    return list(iter_summary_events(str(uuid.uuid4()), poll_interval=0.01))
+
+
+def test_failed_when_no_active_job_and_summary_missing(monkeypatch):
+    """다른 프로세스 워커가 실패해 알림을 못 받아도 작업이 없으면 failed로 종료"""
+    events = _events(monkeypatch, [
+        (SUMMARY_PLACEHOLDER, "부분", True),
+        (SUMMARY_PLACEHOLDER, None, False),
+    ])
+    assert events == [("delta", {"text": "부분"}), ("failed", {})]
+
+
+def test_done_when_summary_saved(monkeypatch):
+    events = _events(monkeypatch, [
+        (SUMMARY_PLACEHOLDER, None, True),
+        ("최종 요약", None, False),
+    ])
+    assert events == [("done", {"summary": "최종 요약"})]
+
+
+def test_keeps_waiting_while_job_active(monkeypatch):
+    events = _events(monkeypatch, [
+        (SUMMARY_PLACEHOLDER, None, True),
+        (SUMMARY_PLACEHOLDER, "가", True),
+        (SUMMARY_PLACEHOLDER, "가나", True),
+        ("가나다", None, False),
+    ])
+    assert events == [("delta", {"text": "가"}), ("delta", {"text": "나"}), ("done", {"summary": "가나다"})]
+
+
+def test_resummarize_streams_new_tokens_instead_of_old_summary(monkeypatch):
+    """재요약 중에는 이전 요약이 남아 있어도 done을 보내지 않고 새 토큰을 전송"""
+    events = _events(monkeypatch, [
+        ("이전 요약", None, True),
+        ("이전 요약", "새", True),
+        ("이전 요약", "새 요약", True),
+        ("새 요약 완료", None, True),
+    ])
+    assert events == [("delta", {"text": "새"}), ("delta", {"text": " 요약"}), ("done", {"summary": "새 요약 완료"})]
+
+
+def test_resummarize_done_when_job_finishes_without_change(monkeypatch):
+    events = _events(monkeypatch, [
+        ("이전 요약", "부분", True),
+        ("이전 요약", None, False),
+    ])
+    assert events == [("delta", {"text": "부분"}), ("done", {"summary": "이전 요약"})]
@@ -0,0 +1,79 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import app.tasks.summary_tasks as summary_tasks_module
+from app.services.summary_cache import CachedSummary
+from app.tasks.summary_queue import JOB_SUPERSEDED, SummaryJobCancelled
+from app.tasks.summary_tasks import _save_result
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+RESULT = CachedSummary(summary="📌 분류: 기사\n📌 키워드: LLM\n📌 핵심요약: 요약", category="기사", tags=["LLM"])
+
+
+class _FakeSession:
+    """북마크 행 잠금 조회(query().filter().with_for_update().first())만 흉내 내는 세션"""
+
+    def __init__(self, bookmark):
+        self.bookmark = bookmark
+        self.commits = 0
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def with_for_update(self):
+        return self
+
+    def first(self):
+        return self.bookmark
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _bookmark(title: str):
+    return SimpleNamespace(
+        id=uuid.uuid4(), title=title, is_deleted=False, title_translation_pending=True,
+        summary="요약 생성 중...", summary_prompt_version=None, summary_model=None, category=None, tags=[],
+    )
+
+
+def test_failed_title_translation_keeps_title_pending():
+    # _translated_title의 번역 모델 대체 경로(translate_text)는 오류 시 원문을 그대로 반환
+    for failed in ("Scaling LLM inference", "", None):
+        bookmark = _bookmark("Scaling LLM inference")
+        db = _FakeSession(bookmark)
+        title = _save_result(db, bookmark.id, None, RESULT, "v1", "m", failed)
+        assert title is None
+        assert bookmark.title == "Scaling LLM inference"
+        assert bookmark.title_translation_pending
+        # 요약은 그대로 저장
+        assert bookmark.summary == RESULT.summary and db.commits == 1
+
+
+def test_translated_title_is_applied_with_summary():
+    bookmark = _bookmark("Scaling LLM inference")
+    title = _save_result(_FakeSession(bookmark), bookmark.id, None, RESULT, "v1", "m", "LLM 추론 확장")
+    assert title == bookmark.title == "LLM 추론 확장(Scaling LLM inference)"
+    assert not bookmark.title_translation_pending
+
+
+def test_superseded_job_does_not_overwrite_summary(monkeypatch):
+    """같은 북마크의 새 작업이 있으면 오래된 작업 결과는 저장하지 않음"""
+    monkeypatch.setattr(summary_tasks_module, "is_job_stale", lambda db, job_id: JOB_SUPERSEDED)
+    bookmark = _bookmark("Scaling LLM inference")
+    db = _FakeSession(bookmark)
+    with pytest.raises(SummaryJobCancelled) as exc:
+        _save_result(db, bookmark.id, uuid.uuid4(), RESULT, "v1", "m", "LLM 추론 확장")
+    assert exc.value.status == JOB_SUPERSEDED
+    assert bookmark.summary == "요약 생성 중..."
+    assert bookmark.title == "Scaling LLM inference"
+    assert db.commits == 0
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from app.services import summary_translation
+from app.services.summary_translation import (
+    SummaryTranslationError,
+    SummaryTranslator,
+    summary_version,
+)
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+SUMMARY = "📌 분류: 보안\n📌 키워드: AI, 보안\n\n- 생성형 AI 보안 위협이 늘고 있다."
+
+
+def test_summary_version_ignores_whitespace_only_changes():
+    assert summary_version(SUMMARY) == summary_version(SUMMARY.replace("\n", "\n\n") + "  ")
+    assert summary_version(SUMMARY) != summary_version(SUMMARY + " 추가")
+    assert len(summary_version(SUMMARY)) == 32
+
+
+def _patch_storage(monkeypatch, store):
+    monkeypatch.setattr(summary_translation, "_load_translation", lambda bid, lang, version: store.get((bid, lang, version)))
+    monkeypatch.setattr(
+        summary_translation, "_store_translation",
+        lambda bid, lang, version, text: store.__setitem__((bid, lang, version), text),
+    )
+
+
+def test_concurrent_requests_are_translated_once(monkeypatch):
+    store = {}
+    calls = []
+    _patch_storage(monkeypatch, store)
+
+    def fake_translate(summary, source_lang, target_lang):
+        calls.append((source_lang, target_lang))
+        time.sleep(0.05)
+        return "Generative AI security threats are rising."
+
+    monkeypatch.setattr(summary_translation, "_translate_summary", fake_translate)
+    translator = SummaryTranslator()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(translator.translate("b1", SUMMARY, "en")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [("ko", "en")]
+    assert {r.summary for r in results} == {"Generative AI security threats are rising."}
+    # 저장 후 요청은 저장된 번역 사용
+    assert translator.translate("b1", SUMMARY, "en").cached is True
+    assert translator.stats()["in_flight"] == 0
+
+
+def test_failed_translation_is_not_stored_and_propagates(monkeypatch):
+    store = {}
+    _patch_storage(monkeypatch, store)
+
+    def failing(summary, source_lang, target_lang):
+        raise SummaryTranslationError("empty")
+
+    monkeypatch.setattr(summary_translation, "_translate_summary", failing)
+    translator = SummaryTranslator()
+    with pytest.raises(SummaryTranslationError):
+        translator.translate("b1", SUMMARY, "en")
+    assert store == {}
+    assert translator.stats()["failures"] == 1
+
+
+def test_same_language_returns_summary_without_translation(monkeypatch):
+    monkeypatch.setattr(summary_translation, "_load_translation", lambda *args: pytest.fail("조회하지 않아야 함"))
+    result = SummaryTranslator().translate("b1", SUMMARY, "ko")
+    assert result.summary == SUMMARY and result.cached is True
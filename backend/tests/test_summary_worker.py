@@ -0,0 +1,144 @@
+import threading
+import uuid
+from datetime import datetime
+
+import app.tasks.summary_queue as summary_queue_module
+import app.tasks.summary_worker as summary_worker_module
+from app.core.config import settings
+from app.models.summary_job import SummaryJob
+from app.tasks.fair_scheduler import FairShareScheduler
+from app.tasks.summary_queue import (
+    JOB_PENDING, JOB_RUNNING, JOB_SUPERSEDED, ClaimedJob, SummaryJobCancelled, _claim_one,
+)
+from app.tasks.summary_worker import SummaryWorker
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+class _ClaimSession:
+    """_claim_one의 작업 조회(... with_for_update().first())만 흉내 내는 세션"""
+
+    def __init__(self, job):
+        self.job = job
+        self.lock_kwargs = None
+        self.commits = 0
+        self.rollbacks = 0
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def order_by(self, *clauses):
+        return self
+
+    def with_for_update(self, **kwargs):
+        self.lock_kwargs = kwargs
+        return self
+
+    def first(self):
+        return self.job
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _patch_claim(monkeypatch, in_use: int, limit: int = 2):
+    monkeypatch.setattr(summary_queue_module, "_lock_model", lambda db, model: None)
+    monkeypatch.setattr(summary_queue_module, "_model_slots_in_use", lambda db, model: in_use)
+    monkeypatch.setattr(summary_queue_module, "max_in_flight", lambda model: limit)
+    monkeypatch.setattr(
+        summary_queue_module, "_fair_candidates", lambda db, model, running, limit: {"interactive": {None: 1}}
+    )
+    monkeypatch.setattr(summary_queue_module, "_lock_user", lambda db, user_id: True)
+    monkeypatch.setattr(summary_queue_module, "_user_running_count", lambda db, user_id: 0)
+
+
+def test_claim_skips_rows_locked_by_other_workers(monkeypatch):
+    """다른 워커가 잠근 작업은 건너뛰고(SKIP LOCKED) 가져간 작업은 running으로 전환"""
+    _patch_claim(monkeypatch, in_use=0)
+    job = SummaryJob(
+        id=uuid.uuid4(), bookmark_id=uuid.uuid4(), model="m", status=JOB_PENDING, attempts=0,
+        created_at=datetime.utcnow(),
+    )
+    db = _ClaimSession(job)
+    claimed = _claim_one(db, "worker-1", "m")
+
+    assert db.lock_kwargs == {"skip_locked": True}
+    assert claimed.id == job.id and claimed.attempts == 1
+    assert job.status == JOB_RUNNING and job.worker_id == "worker-1"
+    assert job.started_at is not None and job.heartbeat_at == job.started_at
+    assert db.commits == 1
+
+
+def test_claim_stops_at_model_limit(monkeypatch):
+    _patch_claim(monkeypatch, in_use=2, limit=2)
+    db = _ClaimSession(None)
+    assert _claim_one(db, "worker-1", "m") is None
+    assert db.lock_kwargs is None and db.rollbacks == 1
+
+
+def test_claim_charges_deficit_only_for_claimed_user(monkeypatch):
+    """사용자 상한으로 거절되거나 잠긴 작업뿐인 사용자는 deficit을 잃지 않음"""
+    _patch_claim(monkeypatch, in_use=0)
+    monkeypatch.setattr(settings, "SUMMARY_FAIR_QUANTUM", 1)
+    monkeypatch.setattr(settings, "SUMMARY_USER_MAX_IN_FLIGHT", 1)
+    scheduler = FairShareScheduler()
+    monkeypatch.setattr(summary_queue_module, "fair_scheduler", scheduler)
+    monkeypatch.setattr(
+        summary_queue_module, "_fair_candidates", lambda db, model, running, limit: {"interactive": {"a": 1, "b": 1}}
+    )
+    monkeypatch.setattr(summary_queue_module, "_user_running_count", lambda db, user_id: 1 if user_id == "a" else 0)
+    job = SummaryJob(
+        id=uuid.uuid4(), bookmark_id=uuid.uuid4(), model="m", status=JOB_PENDING, attempts=0,
+        created_at=datetime.utcnow(),
+    )
+    assert _claim_one(_ClaimSession(job), "worker-1", "m").id == job.id
+    # a는 상한으로 거절되어 차감 없음, b만 작업 비용만큼 차감
+    assert scheduler.snapshot()["interactive"] == {"a": 1, "b": 0}
+
+    # 다른 워커가 모두 잠가 가져온 작업이 없으면 차감하지 않음 (계속 거절되는 a의 deficit은 상한에서 멈춤)
+    for _ in range(3):
+        assert _claim_one(_ClaimSession(None), "worker-1", "m") is None
+    assert scheduler.snapshot()["interactive"] == {"a": 2, "b": 2}
+
+
+def test_worker_runs_claimed_jobs_and_records_results(monkeypatch):
+    ok_job = ClaimedJob(uuid.uuid4(), uuid.uuid4(), "m", 1)
+    stale_job = ClaimedJob(uuid.uuid4(), uuid.uuid4(), "m", 1)
+    batches = [[ok_job, stale_job]]
+    finished = {}
+    done = threading.Event()
+
+    def fake_claim(worker_id, limit):
+        return batches.pop(0) if batches else []
+
+    def fake_update(bookmark_id, content, model=None, job_id=None):
+        if job_id == stale_job.id:
+            raise SummaryJobCancelled(JOB_SUPERSEDED)
+        return True
+
+    def fake_finish(job_id, success, error=None, status=None):
+        finished[job_id] = (success, status)
+        if len(finished) == 2:
+            done.set()
+
+    monkeypatch.setattr(summary_worker_module, "claim_jobs", fake_claim)
+    monkeypatch.setattr(summary_worker_module, "update_bookmark_summary", fake_update)
+    monkeypatch.setattr(summary_worker_module, "finish_job", fake_finish)
+    monkeypatch.setattr(summary_worker_module, "heartbeat_jobs", lambda worker_id, job_ids: 0)
+
+    worker = SummaryWorker(concurrency=2, poll_interval=0.01, worker_id="worker-1")
+    worker.start()
+    try:
+        assert done.wait(3)
+    finally:
+        worker.stop()
+    assert finished[ok_job.id] == (True, None)
+    # 대체된 작업은 결과 없이 superseded로 기록
+    assert finished[stale_job.id] == (False, JOB_SUPERSEDED)
+    assert worker.in_flight == 0
@@ -0,0 +1,78 @@
+import uuid
+from types import SimpleNamespace
+
+from app.tasks import title_translation
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+class _FakeSession:
+    """북마크 행 잠금 조회(query.filter(Bookmark.id == ...).with_for_update().first())만 흉내 내는 세션"""
+
+    def __init__(self, bookmarks):
+        self.bookmarks = bookmarks
+        self.commits = 0
+        self._id = None
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, criterion):
+        self._id = criterion.right.value
+        return self
+
+    def with_for_update(self):
+        return self
+
+    def first(self):
+        return self.bookmarks.get(self._id)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _bookmark(title: str):
+    return SimpleNamespace(id=uuid.uuid4(), title=title, is_deleted=False, title_translation_pending=True)
+
+
+def _patch(monkeypatch, *bookmarks):
+    session = _FakeSession({b.id: b for b in bookmarks})
+    monkeypatch.setattr(title_translation, "SessionLocal", lambda: session)
+    monkeypatch.setattr(title_translation.summary_stream_broker, "publish", lambda *args, **kwargs: None)
+    monkeypatch.setattr(title_translation, "submit_embedding", lambda bookmark_id: False)
+    return session
+
+
+def test_failed_translation_keeps_title_pending(monkeypatch):
+    bookmark = _bookmark("Scaling LLM inference")
+    session = _patch(monkeypatch, bookmark)
+    # translate_text는 오류 시 원문을 그대로 반환
+    for failed in ("Scaling LLM inference", " Scaling LLM inference ", "", None):
+        assert title_translation.apply_translated_title(bookmark.id, bookmark.title, failed) is None
+    assert bookmark.title == "Scaling LLM inference"
+    assert bookmark.title_translation_pending
+    assert session.commits == 0
+
+    title = title_translation.apply_translated_title(bookmark.id, bookmark.title, "LLM 추론 확장")
+    assert title == "LLM 추론 확장(Scaling LLM inference)"
+    assert not bookmark.title_translation_pending
+
+
+def test_batch_applies_only_real_translations(monkeypatch):
+    ok, failed = _bookmark("Vector search basics"), _bookmark("Rust async runtime")
+    _patch(monkeypatch, ok, failed)
+    translations = {"Vector search basics": "벡터 검색 기초", "Rust async runtime": "Rust async runtime"}
+    monkeypatch.setattr(
+        title_translation, "translate_batch",
+        lambda titles, **kwargs: [translations[title] for title in titles],
+    )
+    applied = title_translation.translate_titles_batch([(b.id, b.title, None) for b in (ok, failed)])
+    assert applied == 1
+    assert ok.title == "벡터 검색 기초(Vector search basics)" and not ok.title_translation_pending
+    assert failed.title == "Rust async runtime" and failed.title_translation_pending
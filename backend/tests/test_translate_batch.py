@@ -0,0 +1,33 @@
+import json
+
+from app.utils.translate import parse_batch_translations
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_parse_batch_translations_maps_by_index():
+    raw = json.dumps({"translations": [
+        {"index": 1, "text": " 두 번째 "},
+        {"index": 0, "text": "첫 번째"},
+    ]}, ensure_ascii=False)
+    assert parse_batch_translations(raw, 2) == {0: "첫 번째", 1: "두 번째"}
+
+
+def test_parse_batch_translations_drops_invalid_items():
+    raw = json.dumps({"translations": [
+        {"index": 0, "text": "정상"},
+        {"index": 0, "text": "중복"},
+        {"index": 5, "text": "범위 밖"},
+        {"index": True, "text": "불리언"},
+        {"index": "1", "text": "문자열 index"},
+        {"index": 2, "text": "  "},
+        "not an object",
+    ]}, ensure_ascii=False)
+    # 빠진 1, 2번은 호출 측에서 개별 번역
+    assert parse_batch_translations(raw, 3) == {0: "정상"}
+
+
+def test_parse_batch_translations_invalid_json():
+    assert parse_batch_translations("번역 결과입니다", 2) == {}
+    assert parse_batch_translations('["a", "b"]', 2) == {}
+    assert parse_batch_translations('{"translations": "a"}', 1) == {}
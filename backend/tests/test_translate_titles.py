@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime, timedelta
+
+import app.translate_titles as translate_titles_module
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+class _Session:
+    def close(self):
+        pass
+
+
+def _patch(monkeypatch, rows, failing):
+    """rows: 번역 대기 (id, 제목, 생성 시각). failing의 제목은 번역 실패로 대기 상태 유지"""
+    pending = {row[0]: row for row in rows}
+    pages = []
+
+    def fake_pending_rows(db, limit, created_before=None, after=None):
+        ordered = sorted(pending.values(), key=lambda r: (r[2], r[0]))
+        if after is not None:
+            ordered = [r for r in ordered if (r[2], r[0]) > after]
+        pages.append([r[1] for r in ordered[:limit]])
+        return ordered[:limit]
+
+    def fake_translate(rows, batch_size=None):
+        applied = [r for r in rows if r[1] not in failing]
+        for row in applied:
+            pending.pop(row[0])
+        return len(applied)
+
+    monkeypatch.setattr(translate_titles_module, "SessionLocal", _Session)
+    monkeypatch.setattr(translate_titles_module, "pending_title_rows", fake_pending_rows)
+    monkeypatch.setattr(translate_titles_module, "translate_titles_batch", fake_translate)
+    return pending, pages
+
+
+def _rows(count: int):
+    base = datetime(2026, 10, 1)
+    return [(uuid.uuid4(), f"Title {i}", base + timedelta(minutes=i)) for i in range(count)]
+
+
+def test_failed_titles_do_not_stop_backfill(monkeypatch):
+    """첫 페이지 번역이 모두 실패해도 다음 페이지로 넘어가 나머지 제목을 번역"""
+    rows = _rows(5)
+    pending, pages = _patch(monkeypatch, rows, failing={"Title 0", "Title 1"})
+
+    processed, applied = translate_titles_module.translate_pending(batch_size=2)
+
+    assert (processed, applied) == (5, 3)
+    assert set(pending) == {rows[0][0], rows[1][0]}
+    assert pages == [["Title 0", "Title 1"], ["Title 2", "Title 3"], ["Title 4"], []]
+
+
+def test_limit_caps_processed_titles(monkeypatch):
+    _patch(monkeypatch, _rows(5), failing=set())
+    assert translate_titles_module.translate_pending(batch_size=2, limit=3) == (3, 3)
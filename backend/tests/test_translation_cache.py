@@ -0,0 +1,24 @@
+from app.services.translation_cache import TranslationCacheStore, make_translation_key
+
+# pytest.ini 설정을 활용하여 pythonpath와 asyncio_mode가 자동 적용됨
+
+
+def test_translation_key_normalizes_whitespace():
+    a = make_translation_key("OpenAI  releases\nnew model ", "en", "ko", "translategemma:4b")
+    b = make_translation_key("OpenAI releases new model", "en", "ko", "translategemma:4b")
+    assert a == b
+    # 언어 방향/모델이 다르면 다른 키
+    assert a != make_translation_key("OpenAI releases new model", "ko", "en", "translategemma:4b")
+    assert a != make_translation_key("OpenAI releases new model", "en", "ko", "other:1b")
+
+
+def test_lru_hit_without_db():
+    store = TranslationCacheStore(max_size=2)
+    key = make_translation_key("Hello", "en", "ko", "m")
+    store._remember(key, "안녕하세요")
+    assert store.get("Hello", "en", "ko", "m") == "안녕하세요"
+    assert store.stats()["lru_hits"] == 1
+    # 최대 크기를 넘으면 오래된 항목부터 제거
+    store._remember("k2", "b")
+    store._remember("k3", "c")
+    assert key not in store._lru
@@ -10,6 +10,7 @@ const AddBookmark = ({ onClose, onAdd, onDuplicateError }) => {
         summary_model: ''    // 요약에 사용할 모델 (선택)
     });
     const [modelList, setModelList] = useState([]);
+    const [autoRouting, setAutoRouting] = useState(false);  // 모델 미선택 시 서버가 본문 길이/언어로 자동 선택
     const [error, setError] = useState('');
     const [loading, setLoading] = useState(false);
     const [duplicateError, setDuplicateError] = useState('');
@@ -20,7 +21,8 @@ const AddBookmark = ({ onClose, onAdd, onDuplicateError }) => {
                 const res = await api.bookmarks.getSummaryModels();
                 const models = res?.models || [];
                 setModelList(models);
-                if (models.length > 0) {
+                setAutoRouting(!!res?.auto_routing);
+                if (models.length > 0 && !res?.auto_routing) {
                     setFormData(prev => ({ ...prev, summary_model: prev.summary_model || models[0] }));
                 }
             } catch (e) {
@@ -181,10 +183,13 @@ const AddBookmark = ({ onClose, onAdd, onDuplicateError }) => {
                                 <select
                                     name="summary_model"
                                     id="summary_model"
-                                    value={formData.summary_model || modelList[0]}
+                                    value={formData.summary_model || (autoRouting ? '' : modelList[0])}
                                     onChange={handleChange}
                                     className="mt-1 block w-full rounded-md border-gray-300 shadow-sm focus:border-blue-500 focus:ring-blue-500 sm:text-sm"
                                 >
+                                    {autoRouting && (
+                                        <option value="">자동 선택 (본문 길이·언어 기준)</option>
+                                    )}
                                     {modelList.map((m) => (
                                         <option key={m} value={m}>{m}</option>
                                     ))}
@@ -7,7 +7,7 @@ import api from '../utils/api';
 import { useAuth } from '../contexts/AuthContext';
 import LoadingSpinner from './LoadingSpinner';
 
-const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChange, readOnly = false }) => {
+const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChange, onSelectBookmark, readOnly = false }) => {
     const { user: currentUser } = useAuth();
     // showContent: readOnly면 항상 요약만, 아니면 요약/컨텐츠 토글
     const [showContent, setShowContent] = useState(() => {
@@ -19,6 +19,7 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
     const [currentBookmark, setCurrentBookmark] = useState(bookmark);
     const isOwner = !readOnly && currentUser && currentBookmark && String(currentBookmark.user_id) === String(currentUser.id);
     const [isLoading, setIsLoading] = useState(false);
+    const [streamingSummary, setStreamingSummary] = useState(''); // 스트리밍 중인 요약 (SSE)
     const [isInitialLoading, setIsInitialLoading] = useState(true);
     const readCountIncreasedRef = useRef(null); // 현재 조회수 증가한 북마크 ID
     const isIncreasingRef = useRef(false); // 조회수 증가 중인지 추적 (중복 실행 방지)
@@ -31,6 +32,61 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
     const [shareError, setShareError] = useState('');
     const [isSharing, setIsSharing] = useState(false);
 
+    // 영어 요약 보기: 요약이 바뀌면 다시 요청
+    const [showEnglish, setShowEnglish] = useState(false);
+    const [englishSummary, setEnglishSummary] = useState('');
+    const [isTranslating, setIsTranslating] = useState(false);
+    const [translateError, setTranslateError] = useState('');
+
+    useEffect(() => {
+        setShowEnglish(false);
+        setEnglishSummary('');
+        setTranslateError('');
+    }, [currentBookmark?.id, currentBookmark?.summary]);
+
+    const summaryReady = !!currentBookmark?.summary && currentBookmark.summary !== '요약 생성 중...';
+
+    const handleEnglishToggle = async () => {
+        if (showEnglish) {
+            setShowEnglish(false);
+            return;
+        }
+        if (!englishSummary) {
+            setIsTranslating(true);
+            setTranslateError('');
+            try {
+                const data = await api.bookmarks.getTranslatedSummary(currentBookmark.id, 'en');
+                setEnglishSummary(data.summary);
+            } catch (error) {
+                console.error('요약 번역 실패:', error);
+                setTranslateError(error.response?.data?.detail || '요약 번역에 실패했습니다.');
+                return;
+            } finally {
+                setIsTranslating(false);
+            }
+        }
+        setShowEnglish(true);
+    };
+
+    // 관련 글: 요약이 준비된 뒤 임베딩 기준으로 가까운 북마크 조회 (실패 시 표시하지 않음)
+    const [relatedBookmarks, setRelatedBookmarks] = useState([]);
+
+    useEffect(() => {
+        setRelatedBookmarks([]);
+        if (readOnly || !currentBookmark?.id || !summaryReady) return;
+        let cancelled = false;
+        api.bookmarks.getRelated(currentBookmark.id, 5)
+            .then((data) => {
+                if (!cancelled) setRelatedBookmarks(data.items || []);
+            })
+            .catch((error) => {
+                console.error('관련 글 조회 실패:', error);
+            });
+        return () => {
+            cancelled = true;
+        };
+    }, [readOnly, currentBookmark?.id, summaryReady]);
+
     // bookmark prop이 변경될 때 currentBookmark 업데이트
     useEffect(() => {
         if (bookmark && bookmark.id !== currentBookmark?.id) {
@@ -61,32 +117,73 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
     }, [readOnly, bookmark?.id]);
 
     // 요약 상태 확인 및 업데이트 (readOnly일 때는 폴링 없이 전달된 bookmark만 사용)
+    // 요약 스트림(SSE)으로 생성 중인 요약을 실시간 표시하고, 스트림 연결 실패 시 2초 폴링으로 대체
     useEffect(() => {
         if (readOnly) return;
+        if (!currentBookmark?.id) return;
+        if (currentBookmark.summary && currentBookmark.summary !== '요약 생성 중...') return;
         let intervalId;
+        let cancelled = false;
+        let finished = false;
+        const controller = new AbortController();
+        const bookmarkId = currentBookmark.id;
+
         const checkSummary = async () => {
-            if (!currentBookmark?.summary || currentBookmark.summary === '요약 생성 중...') {
-                setIsLoading(true);
-                try {
-                    const response = await api.bookmarks.getBookmark(currentBookmark.id);
-                    if (!response) return;
-                    setCurrentBookmark(response);
-                    if (response.summary && response.summary !== '요약 생성 중...') {
-                        clearInterval(intervalId);
-                        setIsLoading(false);
-                        setShowContent(false);
-                    }
-                } catch (error) {
-                    console.error('요약 상태 확인 실패:', error);
+            setIsLoading(true);
+            try {
+                const response = await api.bookmarks.getBookmark(bookmarkId);
+                if (!response || cancelled) return;
+                setCurrentBookmark(response);
+                if (response.summary && response.summary !== '요약 생성 중...') {
+                    clearInterval(intervalId);
                     setIsLoading(false);
+                    setShowContent(false);
                 }
+            } catch (error) {
+                console.error('요약 상태 확인 실패:', error);
+                setIsLoading(false);
             }
         };
-        if (currentBookmark?.id) {
+        const startPolling = () => {
+            if (cancelled || finished) return;
             checkSummary();
             intervalId = setInterval(checkSummary, 2000);
-        }
+        };
+
+        setIsLoading(true);
+        api.bookmarks.streamSummary(bookmarkId, (event, data) => {
+            if (event === 'delta') {
+                setStreamingSummary(prev => prev + data.text);
+                setShowContent(false);
+            } else if (event === 'reset') {
+                setStreamingSummary(data.text);
+            } else if (event === 'title') {
+                // 영어 제목 번역 완료 (요약 생성과 별도로 도착)
+                setCurrentBookmark(prev => (prev ? { ...prev, title: data.title, title_translation_pending: false } : prev));
+            } else if (event === 'done') {
+                finished = true;
+                setStreamingSummary('');
+                setIsLoading(false);
+                setShowContent(false);
+                // 영어 제목은 요약과 함께 번역되어 done 이벤트로 전달됨
+                setCurrentBookmark(prev => (prev ? { ...prev, summary: data.summary, ...(data.title && { title: data.title }) } : prev));
+                // 분류/태그까지 반영된 최신 북마크로 갱신 (summary 변경으로 이 effect가 정리된 뒤에도 반영)
+                api.bookmarks.getBookmark(bookmarkId)
+                    .then(response => { if (response) setCurrentBookmark(response); })
+                    .catch(error => console.error('북마크 갱신 실패:', error));
+            }
+        }, controller.signal)
+            .then(() => startPolling())
+            .catch((error) => {
+                if (!cancelled) {
+                    console.error('요약 스트림 실패, 폴링으로 대체:', error);
+                    startPolling();
+                }
+            });
+
         return () => {
+            cancelled = true;
+            controller.abort();
             if (intervalId) clearInterval(intervalId);
         };
     }, [readOnly, currentBookmark?.id, currentBookmark?.summary]);
@@ -285,6 +382,22 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
                                     </button>
                                 </div>
                             )}
+                            {!readOnly && !showContent && summaryReady && (
+                                <button
+                                    onClick={handleEnglishToggle}
+                                    className={`px-2 sm:px-3 py-1 text-[10px] sm:text-xs font-medium rounded-lg border
+                                        ${showEnglish
+                                            ? 'bg-blue-50 text-blue-600 border-blue-600'
+                                            : 'bg-white text-gray-700 border-gray-300 hover:bg-gray-50'}`}
+                                    disabled={isTranslating}
+                                    title="영어 요약 보기"
+                                >
+                                    {isTranslating ? '번역중...' : 'EN'}
+                                </button>
+                            )}
+                            {translateError && !showContent && (
+                                <span className="text-[10px] sm:text-xs text-red-500">{translateError}</span>
+                            )}
 
                             {isOwner && (
                                 <>
@@ -371,7 +484,9 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
                             ? (currentBookmark.summary || '요약이 없습니다.')
                             : (showContent 
                                 ? (currentBookmark.content || '컨텐츠가 없습니다.') 
-                                : (currentBookmark.summary || '요약이 생성중입니다...'))}
+                                : (showEnglish && englishSummary
+                                    ? englishSummary
+                                    : (streamingSummary || currentBookmark.summary || '요약이 생성중입니다...')))}
                     </ReactMarkdown>
                 </div>
             </div>
@@ -379,6 +494,24 @@ const BookmarkDetail = ({ bookmark, onClose, currentPage, totalPages, onPageChan
             {/* 하단 섹션 */}
             <div className="flex-none px-3 sm:px-6 lg:px-8 xl:px-10 py-3 sm:py-4 border-t border-gray-200">
                 <div className="space-y-2">
+                    {/* 관련 글 */}
+                    {!readOnly && relatedBookmarks.length > 0 && (
+                        <div className="flex flex-col sm:flex-row items-start gap-1 sm:gap-2 text-xs sm:text-sm text-gray-500">
+                            <span className="font-medium flex-shrink-0">관련 글:</span>
+                            <div className="flex flex-wrap gap-1 sm:gap-2">
+                                {relatedBookmarks.map((item) => (
+                                    <button
+                                        key={item.id}
+                                        onClick={() => onSelectBookmark && onSelectBookmark(item)}
+                                        className="px-2 py-0.5 rounded-lg border border-gray-200 bg-white text-gray-700 hover:bg-gray-50 hover:text-blue-600 truncate max-w-[240px] sm:max-w-[320px]"
+                                        title={`${item.title} (유사도 ${item.score})`}
+                                    >
+                                        {item.title}
+                                    </button>
+                                ))}
+                            </div>
+                        </div>
+                    )}
                     {/* 첫 번째 줄: 목록으로 돌아가기 아이콘, 출처, URL */}
                     <div className="flex flex-col sm:flex-row items-start sm:items-center gap-2 sm:gap-4 text-xs sm:text-sm text-gray-500">
                         {/* 목록으로 돌아가기 아이콘 */}
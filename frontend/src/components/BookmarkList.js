@@ -250,6 +250,7 @@ const BookmarkList = ({ isPublicMode = false } = {}) => {
                         currentPage={currentPage}
                         totalPages={totalPages}
                         onPageChange={handlePageChange}
+                        onSelectBookmark={setSelectedBookmark}
                         readOnly={isPublicMode}
                     />
                 </div>
@@ -207,6 +207,17 @@ const api = {
             return response.data;
         },
 
+        // 요약 번역 (요약 버전별로 서버에서 한 번만 번역해 저장)
+        getTranslatedSummary: async (id, lang) => {
+            const response = await axiosInstance.get(`/bookmarks/${id}/summary`, { params: { lang } });
+            return response.data;
+        },
+
+        getRelated: async (id, limit = 5) => {
+            const response = await axiosInstance.get(`/bookmarks/${id}/related`, { params: { limit } });
+            return response.data;
+        },
+
         getList: async ({ page, per_page, tags }) => {
             const params = { page, per_page };
             if (tags && tags.length > 0) {
@@ -284,6 +295,43 @@ const api = {
             }
         },
 
+        /**
+         * 요약 생성 과정 스트리밍 (Server-Sent Events)
+         * EventSource는 Authorization 헤더를 보낼 수 없어 fetch 스트림으로 읽음.
+         * onEvent(event, data): delta(추가 텍스트) / reset(전체 텍스트) / done(최종 요약) / failed / title(번역된 제목)
+         */
+        streamSummary: async (bookmarkId, onEvent, signal) => {
+            const token = localStorage.getItem('token');
+            const response = await fetch(`${getApiBaseURL()}/bookmarks/${bookmarkId}/summary/stream`, {
+                headers: token ? { Authorization: `Bearer ${token}` } : {},
+                credentials: 'include',
+                signal
+            });
+            if (!response.ok || !response.body) {
+                throw new Error(`요약 스트림 연결 실패: ${response.status}`);
+            }
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+                    const raw = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    let event = 'message';
+                    let data = '';
+                    raw.split('\n').forEach((line) => {
+                        if (line.startsWith('event:')) event = line.slice(6).trim();
+                        else if (line.startsWith('data:')) data += line.slice(5).trim();
+                    });
+                    if (data) onEvent(event, JSON.parse(data));
+                }
+            }
+        },
+
         share: async (bookmarkId, target, publicValue = undefined) => {
             const body = { target };
             if (target === 'users' && publicValue !== undefined) body.public = publicValue;